@@ -0,0 +1,59 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from nodedge.dats.dats_window import DatsWindow
+
+
+def closeDatsWindow(window: DatsWindow) -> None:
+    # Close without asking to save the configuration.
+    window.modifiedConfig = False
+    for log in window.logsWidget.logsListWidget.logs.values():
+        log.close()
+    window.close()
+    # Delete the plots now, rather than when the interpreter exits.
+    window.deleteLater()
+    QApplication.processEvents()
+
+
+@pytest.fixture
+def datsWindow(qapp):
+    window = DatsWindow()
+
+    yield window
+    closeDatsWindow(window)
+
+
+def test_openLog(benchmark, qapp, logFile):
+    windows = []
+
+    def setup():
+        windows.append(DatsWindow())
+        return (logFile,), {}
+
+    def openLog(filename):
+        assert windows[-1].openLog(filename)
+
+    benchmark.pedantic(openLog, setup=setup, rounds=5)
+
+    for window in windows:
+        closeDatsWindow(window)
+
+
+def test_plotCurves(benchmark, datsWindow, logFile):
+    datsWindow.openLog(logFile)
+    logsListWidget = datsWindow.logsWidget.logsListWidget
+    logsListWidget.setCurrentRow(0)
+    logsListWidget.item(0).setSelected(True)
+    log = logsListWidget.logs[logsListWidget.item(0).text()]
+    channelNames = [name for name in log.channels_db if name != "time"]
+
+    def setup():
+        # Plot in a new worksheet, where none of the curves is plotted yet.
+        workbooksTabWidget = datsWindow.workbooksTabWidget
+        workbooksTabWidget.setCurrentWidget(workbooksTabWidget.addWorkbook())
+        return (channelNames,), {}
+
+    benchmark.pedantic(datsWindow.plotCurves, setup=setup, rounds=5)
+
+    worksheet = datsWindow.workbooksTabWidget.currentWidget().currentWidget()
+    assert len(worksheet.plotItems[0].vb.curves) == len(channelNames)
@@ -0,0 +1,58 @@
+import sys
+import tracemalloc
+
+from conftest import generateScene
+
+# Number of blocks of the scene whose memory is measured.
+MEMORY_BLOCKS_COUNT = 1_000
+# Upper bound of the Python memory allocated per block. Most of it is allocated by
+# the Qt widgets of the blocks, about 16.6 kB per block when the bound was set.
+MAX_BYTES_PER_NODE = 18_000
+
+
+def modelBytes(scene) -> int:
+    """
+    Size of the nodes, sockets and edges of a scene, without their graphics items.
+    The model classes are slotted, so they do not have instance dictionaries.
+    """
+    objects = list(scene.nodes) + list(scene.edges)
+    for node in scene.nodes:
+        objects += node.inputSockets + node.outputSockets
+    return sum(
+        sys.getsizeof(obj)
+        + (sys.getsizeof(obj.__dict__) if hasattr(obj, "__dict__") else 0)
+        for obj in objects
+    )
+
+
+def test_bytesPerNode(benchmark, editor):
+    """
+    Python memory allocated per block of a generated scene, including its sockets
+    and edges. The value is saved with the benchmark, in ``extra_info``, to be
+    compared between runs, and must stay below ``MAX_BYTES_PER_NODE``.
+    """
+    scene = editor.scene
+
+    def createScene():
+        tracemalloc.start()
+        try:
+            generateScene(scene, MEMORY_BLOCKS_COUNT)
+            allocatedBytes, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return allocatedBytes
+
+    allocatedBytes = benchmark.pedantic(
+        createScene, setup=scene.clear, rounds=3, iterations=1
+    )
+
+    socketsCount = sum(
+        len(node.inputSockets) + len(node.outputSockets) for node in scene.nodes
+    )
+    bytesPerNode = allocatedBytes / len(scene.nodes)
+    benchmark.extra_info["bytesPerNode"] = bytesPerNode
+    benchmark.extra_info["modelBytesPerNode"] = modelBytes(scene) / len(scene.nodes)
+    benchmark.extra_info["socketsPerNode"] = socketsCount / len(scene.nodes)
+    benchmark.extra_info["edgesPerNode"] = len(scene.edges) / len(scene.nodes)
+    assert len(scene.nodes) == MEMORY_BLOCKS_COUNT
+    assert bytesPerNode < MAX_BYTES_PER_NODE
@@ -0,0 +1,32 @@
+# Each simulation runs FINAL_TIME / TIME_STEP steps, a few are enough.
+SIMULATION_ROUNDS = 10
+
+
+def test_loadScene(benchmark, editor, sceneFiles, sceneName):
+    filename = sceneFiles(sceneName)
+
+    benchmark(editor.scene.loadFromFile, filename)
+
+    assert editor.scene.nodes
+
+
+def test_simulate(benchmark, loadedScene):
+    benchmark.pedantic(
+        loadedScene.simulator.run, kwargs={"blocking": True}, rounds=SIMULATION_ROUNDS
+    )
+
+
+def test_generateCode(benchmark, loadedScene):
+    code = benchmark(loadedScene.coder.generateCode)
+
+    assert code
+
+
+def test_storeAndUndoHistory(benchmark, loadedScene):
+    history = loadedScene.history
+
+    def storeAndUndo():
+        history.store("Benchmark")
+        history.undo()
+
+    benchmark(storeAndUndo)
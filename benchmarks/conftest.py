@@ -0,0 +1,144 @@
+import os
+
+import numpy as np
+import pytest
+from asammdf import MDF, Signal
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.blocks.autogen.maths.add_block import NumpyAddBlock
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.blocks.custom.output_block import OutputBlock
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+from nodedge.mdi_widget import MdiWidget
+
+ROOT_PATH = os.path.join(os.path.dirname(__file__), "..")
+
+EXAMPLE_SCENES = {
+    "calculator": "examples/calculator/calculator.json",
+    "gravitational_force": "examples/gravitational_force/gravitational_force.json",
+    "discrete": "examples/discrete/discrete_transfer_function_example.json",
+    "rotor": "examples/quadcopter/rotor.json",
+}
+# Number of blocks of the generated scenes.
+SYNTHETIC_SCENE_SIZES = (100, 1_000, 10_000)
+
+# Simulation settings shared by every benchmarked scene.
+TIME_STEP = 0.01
+FINAL_TIME = 1.0
+
+# Size of the generated DATS log.
+LOG_CHANNELS_COUNT = 20
+LOG_SAMPLES_COUNT = 200_000
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Run the benchmarks using a scene on every example and generated scene.
+    """
+    if "sceneName" not in metafunc.fixturenames:
+        return
+    params = [pytest.param(name, id=name) for name in EXAMPLE_SCENES]
+    for size in SYNTHETIC_SCENE_SIZES:
+        marks = [pytest.mark.slow] if size >= 10_000 else []
+        params.append(pytest.param(size, id=f"synthetic_{size}", marks=marks))
+    metafunc.parametrize("sceneName", params)
+
+
+def generateScene(scene, blocksCount: int) -> None:
+    """
+    Fill a scene with a chain of additions of a constant, ending with an output.
+    """
+    constantBlock = ConstantBlock(scene)
+    constantBlock.content.edit.setText(str(1))
+    previousBlock = constantBlock
+    columnsCount = 50
+    for index in range(blocksCount - 2):
+        addBlock = NumpyAddBlock(scene)
+        addBlock.pos = (
+            (index % columnsCount) * 250.0,
+            (index // columnsCount) * 150.0,
+        )
+        Edge(scene, previousBlock.outputSockets[0], addBlock.inputSockets[0])
+        Edge(scene, constantBlock.outputSockets[0], addBlock.inputSockets[1])
+        previousBlock = addBlock
+    outputBlock = OutputBlock(scene)
+    Edge(scene, previousBlock.outputSockets[0], outputBlock.inputSockets[0])
+
+
+@pytest.fixture(scope="session")
+def sceneFiles(qapp, tmp_path_factory):
+    """
+    Paths of the benchmarked scenes. The synthetic scenes are generated on first use.
+    """
+    files = {
+        name: os.path.join(ROOT_PATH, path) for name, path in EXAMPLE_SCENES.items()
+    }
+    directory = tmp_path_factory.mktemp("scenes")
+
+    def sceneFile(sceneName):
+        if sceneName not in files:
+            window = QMainWindow()
+            editor = EditorWidget(window)
+            generateScene(editor.scene, sceneName)
+            filename = str(directory / f"synthetic_{sceneName}.json")
+            editor.scene.saveToFile(filename)
+            editor.scene.clear()
+            window.close()
+            files[sceneName] = filename
+        return files[sceneName]
+
+    return sceneFile
+
+
+@pytest.fixture
+def editor(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+    # Load the blocks of the scenes, rather than plain nodes.
+    editor.scene.setNodeClassSelector(MdiWidget.getNodeClassFromData)
+
+    yield editor
+    window.close()
+
+
+@pytest.fixture
+def loadedScene(editor, sceneFiles, sceneName):
+    scene = editor.scene
+    scene.loadFromFile(sceneFiles(sceneName))
+
+    config = scene.simulator.config
+    config.solver = "Basic solver"
+    config.solverName = ""
+    config.maxIterations = 1.0
+    config.tolerance = 0.0
+    config.timeStep = TIME_STEP
+    config.finalTime = FINAL_TIME
+    config.realTime = False
+
+    return scene
+
+
+@pytest.fixture(scope="session")
+def logFile(tmp_path_factory):
+    """
+    Path of a generated MDF log.
+    """
+    filename = str(tmp_path_factory.mktemp("logs") / "benchmark.mf4")
+    timestamps = np.arange(LOG_SAMPLES_COUNT) * 1e-3
+    log = MDF()
+    log.append(
+        [
+            Signal(
+                samples=np.sin(timestamps * (index + 1)),
+                timestamps=timestamps,
+                name=f"channel_{index}",
+            )
+            for index in range(LOG_CHANNELS_COUNT)
+        ]
+    )
+    log.save(filename, overwrite=True)
+    log.close()
+
+    return filename
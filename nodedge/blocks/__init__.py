@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
+"""
+Blocks package.
 
-from .autogen import *
-from .custom import *
+Block modules are not imported with the package: the available blocks are described
+by ``block_manifest.json`` and each block class is imported the first time it is
+used, see :func:`~nodedge.blocks.block_config.getClassFromOperationCode`.
+"""
 
-# modules = glob.glob(join(dirname(__file__), "*.py"))
-# __all__ = [basename(f)[:-3] for f in modules if isfile(f) and f.endswith('_block.py')]
+from .block import Block
+from .op_node import *
@@ -1,4 +1,5 @@
-from .advanced_maths import *
-from .logics import *
-from .maths import *
-from .units import *
+# -*- coding: utf-8 -*-
+"""
+Block modules are imported on first use, see
+:func:`~nodedge.blocks.block_config.getClassFromOperationCode`.
+"""
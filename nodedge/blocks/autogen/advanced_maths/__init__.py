@@ -1,19 +1,5 @@
-from .arccos_block import *
-from .arccosh_block import *
-from .arcsin_block import *
-from .arcsinh_block import *
-from .arctan2_block import *
-from .arctan_block import *
-from .arctanh_block import *
-from .cos_block import *
-from .cosh_block import *
-from .exp_block import *
-from .hypot_block import *
-from .log2_block import *
-from .log10_block import *
-from .log_block import *
-from .rint_block import *
-from .sin_block import *
-from .sinh_block import *
-from .tan_block import *
-from .tanh_block import *
+# -*- coding: utf-8 -*-
+"""
+Block modules are imported on first use, see
+:func:`~nodedge.blocks.block_config.getClassFromOperationCode`.
+"""
@@ -2,7 +2,7 @@
 import logging
 from typing import List
 
-from numpy import arcsinh, array
+from numpy import arcsinh
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
@@ -26,6 +26,8 @@ class NumpyArcsinhBlock(Block):
     contentLabel = ""
     contentLabelObjectName = "BlockBackground"
     evalString = "arcsinh"
+    isElementwise = True
+    isMemoized = True
     library = "numpy"
     libraryTitle = "advanced_maths"
     inputSocketTypes: List[SocketType] = [
@@ -35,17 +37,16 @@ class NumpyArcsinhBlock(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ()
+
     def evalImplementation(self):
         inputs = []
         for i in range(len(self.inputSockets)):
             inputs.append(self.inputNodeAt(i))
 
         try:
-            evaluatedInputs = [
-                currentInput.eval().__repr__() for currentInput in inputs
-            ]
-            operation = f"{NumpyArcsinhBlock.evalString}({', '.join(evaluatedInputs)})"
-            result = eval(operation)
+            evaluatedInputs = [currentInput.eval() for currentInput in inputs]
+            result = arcsinh(*evaluatedInputs)
         except TypeError as e:
             raise EvaluationError(e)
 
@@ -2,7 +2,7 @@
 import logging
 from typing import List
 
-from numpy import arctan2, array
+from numpy import arctan2
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
@@ -26,6 +26,8 @@ class NumpyArctan2Block(Block):
     contentLabel = ""
     contentLabelObjectName = "BlockBackground"
     evalString = "arctan2"
+    isElementwise = True
+    isMemoized = True
     library = "numpy"
     libraryTitle = "advanced_maths"
     inputSocketTypes: List[SocketType] = [
@@ -35,17 +37,16 @@ class NumpyArctan2Block(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ()
+
     def evalImplementation(self):
         inputs = []
         for i in range(len(self.inputSockets)):
             inputs.append(self.inputNodeAt(i))
 
         try:
-            evaluatedInputs = [
-                currentInput.eval().__repr__() for currentInput in inputs
-            ]
-            operation = f"{NumpyArctan2Block.evalString}({', '.join(evaluatedInputs)})"
-            result = eval(operation)
+            evaluatedInputs = [currentInput.eval() for currentInput in inputs]
+            result = arctan2(*evaluatedInputs)
         except TypeError as e:
             raise EvaluationError(e)
 
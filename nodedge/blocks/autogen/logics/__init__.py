@@ -1,9 +1,5 @@
-from .equal_block import *
-from .greater_block import *
-from .greater_equal_block import *
-from .isclose_block import *
-from .less_block import *
-from .less_equal_block import *
-from .maximum_block import *
-from .minimum_block import *
-from .not_equal_block import *
+# -*- coding: utf-8 -*-
+"""
+Block modules are imported on first use, see
+:func:`~nodedge.blocks.block_config.getClassFromOperationCode`.
+"""
@@ -2,7 +2,7 @@
 import logging
 from typing import List
 
-from numpy import array, greater_equal
+from numpy import greater_equal
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
@@ -26,6 +26,8 @@ class NumpyGreaterEqualBlock(Block):
     contentLabel = ">="
     contentLabelObjectName = "BlockBackground"
     evalString = "greater_equal"
+    isElementwise = True
+    isMemoized = True
     library = "numpy"
     libraryTitle = "logics"
     inputSocketTypes: List[SocketType] = [
@@ -36,19 +38,16 @@ class NumpyGreaterEqualBlock(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ()
+
     def evalImplementation(self):
         inputs = []
         for i in range(len(self.inputSockets)):
             inputs.append(self.inputNodeAt(i))
 
         try:
-            evaluatedInputs = [
-                currentInput.eval().__repr__() for currentInput in inputs
-            ]
-            operation = (
-                f"{NumpyGreaterEqualBlock.evalString}({', '.join(evaluatedInputs)})"
-            )
-            result = eval(operation)
+            evaluatedInputs = [currentInput.eval() for currentInput in inputs]
+            result = greater_equal(*evaluatedInputs)
         except TypeError as e:
             raise EvaluationError(e)
 
@@ -2,7 +2,7 @@
 import logging
 from typing import List
 
-from numpy import array, maximum
+from numpy import maximum
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
@@ -26,6 +26,8 @@ class NumpyMaximumBlock(Block):
     contentLabel = ""
     contentLabelObjectName = "BlockBackground"
     evalString = "maximum"
+    isElementwise = True
+    isMemoized = True
     library = "numpy"
     libraryTitle = "logics"
     inputSocketTypes: List[SocketType] = [
@@ -36,17 +38,16 @@ class NumpyMaximumBlock(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ()
+
     def evalImplementation(self):
         inputs = []
         for i in range(len(self.inputSockets)):
             inputs.append(self.inputNodeAt(i))
 
         try:
-            evaluatedInputs = [
-                currentInput.eval().__repr__() for currentInput in inputs
-            ]
-            operation = f"{NumpyMaximumBlock.evalString}({', '.join(evaluatedInputs)})"
-            result = eval(operation)
+            evaluatedInputs = [currentInput.eval() for currentInput in inputs]
+            result = maximum(*evaluatedInputs)
         except TypeError as e:
             raise EvaluationError(e)
 
@@ -1,17 +1,5 @@
-from .absolute_block import *
-from .add_block import *
-from .around_block import *
-from .ceil_block import *
-from .floor_divide_block import *
-from .mod_block import *
-from .multiply_block import *
-from .negative_block import *
-from .positive_block import *
-from .power_block import *
-from .reciprocal_block import *
-from .sign_block import *
-from .sqrt_block import *
-from .square_block import *
-from .subtract_block import *
-from .true_divide_block import *
-from .trunc_block import *
+# -*- coding: utf-8 -*-
+"""
+Block modules are imported on first use, see
+:func:`~nodedge.blocks.block_config.getClassFromOperationCode`.
+"""
@@ -2,7 +2,7 @@
 import logging
 from typing import List
 
-from numpy import array, ceil
+from numpy import ceil
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
@@ -26,6 +26,8 @@ class NumpyCeilBlock(Block):
     contentLabel = ""
     contentLabelObjectName = "BlockBackground"
     evalString = "ceil"
+    isElementwise = True
+    isMemoized = True
     library = "numpy"
     libraryTitle = "maths"
     inputSocketTypes: List[SocketType] = [
@@ -35,17 +37,16 @@ class NumpyCeilBlock(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ()
+
     def evalImplementation(self):
         inputs = []
         for i in range(len(self.inputSockets)):
             inputs.append(self.inputNodeAt(i))
 
         try:
-            evaluatedInputs = [
-                currentInput.eval().__repr__() for currentInput in inputs
-            ]
-            operation = f"{NumpyCeilBlock.evalString}({', '.join(evaluatedInputs)})"
-            result = eval(operation)
+            evaluatedInputs = [currentInput.eval() for currentInput in inputs]
+            result = ceil(*evaluatedInputs)
         except TypeError as e:
             raise EvaluationError(e)
 
@@ -2,7 +2,7 @@
 import logging
 from typing import List
 
-from numpy import array, true_divide
+from numpy import true_divide
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
@@ -26,6 +26,8 @@ class NumpyTrueDivideBlock(Block):
     contentLabel = "/"
     contentLabelObjectName = "BlockBackground"
     evalString = "true_divide"
+    isElementwise = True
+    isMemoized = True
     library = "numpy"
     libraryTitle = "maths"
     inputSocketTypes: List[SocketType] = [
@@ -36,19 +38,16 @@ class NumpyTrueDivideBlock(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ()
+
     def evalImplementation(self):
         inputs = []
         for i in range(len(self.inputSockets)):
             inputs.append(self.inputNodeAt(i))
 
         try:
-            evaluatedInputs = [
-                currentInput.eval().__repr__() for currentInput in inputs
-            ]
-            operation = (
-                f"{NumpyTrueDivideBlock.evalString}({', '.join(evaluatedInputs)})"
-            )
-            result = eval(operation)
+            evaluatedInputs = [currentInput.eval() for currentInput in inputs]
+            result = true_divide(*evaluatedInputs)
         except TypeError as e:
             raise EvaluationError(e)
 
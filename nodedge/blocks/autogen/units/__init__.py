@@ -1,2 +1,5 @@
-from .deg2rad_block import *
-from .rad2deg_block import *
+# -*- coding: utf-8 -*-
+"""
+Block modules are imported on first use, see
+:func:`~nodedge.blocks.block_config.getClassFromOperationCode`.
+"""
@@ -2,7 +2,7 @@
 import logging
 from typing import List
 
-from numpy import array, deg2rad
+from numpy import deg2rad
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
@@ -26,6 +26,8 @@ class NumpyDeg2RadBlock(Block):
     contentLabel = ""
     contentLabelObjectName = "BlockBackground"
     evalString = "deg2rad"
+    isElementwise = True
+    isMemoized = True
     library = "numpy"
     libraryTitle = "units"
     inputSocketTypes: List[SocketType] = [
@@ -35,17 +37,16 @@ class NumpyDeg2RadBlock(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ()
+
     def evalImplementation(self):
         inputs = []
         for i in range(len(self.inputSockets)):
             inputs.append(self.inputNodeAt(i))
 
         try:
-            evaluatedInputs = [
-                currentInput.eval().__repr__() for currentInput in inputs
-            ]
-            operation = f"{NumpyDeg2RadBlock.evalString}({', '.join(evaluatedInputs)})"
-            result = eval(operation)
+            evaluatedInputs = [currentInput.eval() for currentInput in inputs]
+            result = deg2rad(*evaluatedInputs)
         except TypeError as e:
             raise EvaluationError(e)
 
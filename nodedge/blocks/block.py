@@ -5,6 +5,7 @@ import logging
 from collections import OrderedDict
 from typing import List, Optional
 
+from nodedge.blocks.block_cache import CACHE_MISS, BlockCache
 from nodedge.blocks.block_exception import (
     EvaluationError,
     MissInputError,
@@ -34,6 +35,15 @@ class Block(Node):
     contentLabel = ""
     contentLabelObjectName = "blockBackground"
     evalString = ""
+    # Stateful blocks keep a state from one simulation step to the next.
+    isStateful: bool = False
+    # Vectorized blocks are evaluated once per simulation, on whole signals.
+    isVectorized: bool = False
+    # Elementwise blocks broadcast their inputs together, as numpy ufuncs do.
+    isElementwise: bool = False
+    # Memoized blocks are pure: their value only depends on their inputs and
+    # parameters, so the values of their last evaluations are reused.
+    isMemoized: bool = False
     library = ""
     libraryTitle = ""
     inputSocketTypes: List[SocketType] = [SocketType.Any, SocketType.Any]
@@ -44,6 +54,15 @@ class Block(Node):
     GraphicsNodeClass = GraphicsBlock
     GraphicsNodeContentClass = GraphicsBlockContent
 
+    __slots__ = (
+        "value",
+        "cache",
+        "_state",
+        "initialState",
+        "params",
+        "isHoldingOutput",
+    )
+
     def __init__(self, scene, inputSocketTypes=(0, 2), outputSocketTypes=(1,)):
         super().__init__(
             scene,
@@ -52,15 +71,15 @@ class Block(Node):
             self.__class__.outputSocketTypes,
         )
 
-        self.__logger = logging.getLogger(__file__)
-        self.__logger.setLevel(logging.INFO)
-
         self.value = None
+        self.cache: Optional[BlockCache] = BlockCache() if self.isMemoized else None
 
         # A fresh block has not been evaluated yet. It means it is dirty.
         self.isDirty = True
         self._state = None
         self.initialState = None
+        # A block breaking a feedback loop holds its output during a simulation step.
+        self.isHoldingOutput = False
 
         self.graphicsNode.content.updateIO()
 
@@ -93,10 +112,25 @@ class Block(Node):
         :param socket: the socket on which the input has changed
         :return: ``None``
         """
-        self.__logger.debug(f"New socket: {socket}")
+        logger.debug(f"New socket: {socket}")
+        self.isDirty = True
+        if self.scene.realTimeEval:
+            self.scene.evaluator.scheduleEvaluation(self)
+
+    def onParamChanged(self, param: BlockParam) -> None:
+        """
+        Called when the value of a parameter has been changed by the user or by
+        deserialization.
+
+        :param param: the changed parameter
+        :type param: :class:`~nodedge.blocks.block_param.BlockParam`
+        :return: ``None``
+        """
+        logger.debug(f"Param {param.name} changed to {param.value}")
         self.isDirty = True
+        self.markDescendantsDirty()
         if self.scene.realTimeEval:
-            self.eval()
+            self.scene.evaluator.scheduleEvaluation(self)
 
     def checkInputsValidity(self):
         for index in range(len(self.inputSockets)):
@@ -114,9 +148,48 @@ class Block(Node):
             f"evalImplementation has not been overridden by {self.__class__.__name__}"
         )
 
-    def eval(self, index=0):
-        if not self.isDirty and not self.isInvalid:
-            # self.__logger.debug(f"Returning cached value of {self}")
+    def evalOutput(self):
+        """
+        Compute the output of this stateful block from its state only. It is used
+        when the block breaks a feedback loop: its state is then updated from its
+        inputs at the end of the time step, by :meth:`evalImplementation`. See
+        :meth:`generateOutputCode`.
+
+        :return: value of the block
+        :raises: ``NotImplementedError`` if the block cannot break a feedback loop
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} cannot break a feedback loop"
+        )
+
+    def evalMemoized(self, cache: BlockCache):
+        """
+        Reuse the value of a previous evaluation with the same inputs and
+        parameters, or evaluate the block.
+
+        :param cache: values of the previous evaluations
+        :type cache: :class:`~nodedge.blocks.block_cache.BlockCache`
+        :return: value of the block
+        """
+        inputs = []
+        for index in range(len(self.inputSockets)):
+            inputNode = self.inputNodeAt(index)
+            inputs.append(
+                None if inputNode is None else inputNode.eval(evalChildren=False)
+            )
+        key = cache.key(inputs, [param.value for param in self.params])
+        if key is None:
+            return self.evalImplementation()
+
+        value = cache.get(key)
+        if value is CACHE_MISS:
+            value = self.evalImplementation()
+            cache.put(key, inputs, value)
+        return value
+
+    def eval(self, index=0, evalChildren: bool = True):
+        if self.isHoldingOutput or (not self.isDirty and not self.isInvalid):
+            # logger.debug(f"Returning cached value of {self}")
             return self.value
 
         try:
@@ -125,12 +198,19 @@ class Block(Node):
             # TODO: Implement checkInputsConsistency (to avoid division by 0, ...)
             # self.evalInputs()
             # self.checkInputsConsistency()
-            self.value = self.evalImplementation()
+            if self.cache is None:
+                self.value = self.evalImplementation()
+            else:
+                self.value = self.evalMemoized(self.cache)
+            if self.value is not None:
+                for socket in self.outputSockets:
+                    socket.setSignal(self.value)
             self.isDirty = False
             self.isInvalid = False
             self.graphicsNode.setToolTip("")
             self.markChildrenDirty()
-            self.evalChildren()
+            if evalChildren:
+                self.evalChildren()
             return self.value
         except (ValueError, EvaluationError, NotImplementedError) as e:
             self.isInvalid = True
@@ -173,7 +253,7 @@ class Block(Node):
         if hashmap is None:
             hashmap = {}
         res = super().deserialize(data, hashmap, restoreId)
-        self.__logger.debug(f"Deserialized block {self.__class__.__name__}: {res}")
+        logger.debug(f"Deserialized block {self.__class__.__name__}: {res}")
         if "params" in data:
             for param in self.params:
                 if param.name in data["params"]:
@@ -181,27 +261,99 @@ class Block(Node):
                     param.minValue = data["params"][param.name]["minValue"]
                     param.maxValue = data["params"][param.name]["maxValue"]
                     param.step = data["params"][param.name]["step"]
+                    self.onParamChanged(param)
 
         self.graphicsNode.content.updateIO()
         return res
 
-    def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
-        for index in range(len(self.inputSockets)):
-            inputNodes = self.inputNodesAt(index)
-            inputNodesLength = len(inputNodes)
-            if inputNodesLength > 1:
-                raise RedundantInputError(
-                    f"{inputNodesLength} inputs connected to input socket #{index}."
-                )
-            if inputNodesLength == 0:
-                raise MissInputError(f"No input connected to input socket #{index}.")
-        generatedCode: str = "var_" + self.title + " = " + str(self.evalString) + "("
-        generatedCode += ", ".join(
-            [
-                f"var_{self.inputNodeAt(index).title}"  # type: ignore
-                for index in range(len(self.inputSockets))
-            ]
+    def generateStateCode(self, currentVarIndex: int) -> str:
+        """
+        Generate the Python lines initializing the state of this block, executed
+        once before the first simulation step. The time step is available as
+        ``dt``.
+
+        :param currentVarIndex: index of the variable holding the output of this block
+        :type currentVarIndex: ``int``
+        :return: generated code, empty for stateless blocks
+        :rtype: ``str``
+        """
+        return ""
+
+    def generateOutputCode(self, currentVarIndex: int) -> str:
+        """
+        Generate the Python line computing the output of this stateful block from
+        its state only. It is used when the block breaks a feedback loop: its state
+        is then updated at the end of the time step, see :meth:`generateUpdateCode`.
+
+        :param currentVarIndex: index of the variable holding the output of this block
+        :type currentVarIndex: ``int``
+        :return: generated code
+        :rtype: ``str``
+        :raises: ``NotImplementedError`` if the block cannot break a feedback loop
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} cannot break a feedback loop"
         )
+
+    def generateUpdateCode(
+        self, currentVarIndex: int, inputVarIndexes: List[int]
+    ) -> str:
+        """
+        Generate the Python lines updating the state of this stateful block from its
+        inputs, at the end of the time step.
+
+        :param currentVarIndex: index of the variable holding the output of this block
+        :type currentVarIndex: ``int``
+        :param inputVarIndexes: indexes of the variables connected to each input
+            socket, in the order of the sockets
+        :type inputVarIndexes: ``List[int]``
+        :return: generated code
+        :rtype: ``str``
+        :raises: ``NotImplementedError`` if the block cannot break a feedback loop
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} cannot break a feedback loop"
+        )
+
+    def generateArrayCode(
+        self, currentVarIndex: int, inputVarIndexes: List[int]
+    ) -> str:
+        """
+        Generate the Python lines computing the output of this vectorized block over
+        all the time steps at once. The variables connected to each input socket
+        hold arrays whose first axis is the time.
+
+        :param currentVarIndex: index of the variable holding the output of this block
+        :type currentVarIndex: ``int``
+        :param inputVarIndexes: indexes of the variables connected to each input
+            socket, in the order of the sockets
+        :type inputVarIndexes: ``List[int]``
+        :return: generated code
+        :rtype: ``str``
+        :raises: ``NotImplementedError`` if the block is not vectorized
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} is not vectorized")
+
+    def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
+        """
+        Generate the Python line computing the output of this block.
+
+        :param currentVarIndex: index of the variable holding the output of this block
+        :type currentVarIndex: ``int``
+        :param inputVarIndexes: indexes of the variables connected to each input
+            socket, in the order of the sockets
+        :type inputVarIndexes: ``List[int]``
+        :return: generated code
+        :rtype: ``str``
+        :raises: ``NotImplementedError`` if the block has no function to call
+        """
+        self.checkInputsValidity()
+        if not self.evalString:
+            raise NotImplementedError(
+                f"Code generation is not supported by {self.__class__.__name__}"
+            )
+        generatedCode: str = f"var_{currentVarIndex} = {self.evalString}("
+        generatedCode += ", ".join([f"var_{index}" for index in inputVarIndexes])
         return generatedCode + ")\n"
 
     def resetState(self):
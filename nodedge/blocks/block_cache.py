@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Block cache module containing :class:`~nodedge.blocks.block_cache.BlockCache`
+class. """
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Number of evaluations remembered by each memoized block.
+BLOCK_CACHE_SIZE: int = 8
+
+# Writable arrays are fingerprinted by their content up to this size, in bytes.
+FINGERPRINT_MAX_BYTES: int = 4096
+
+#: returned by :meth:`BlockCache.get` when no value is cached, ``None`` being a value
+CACHE_MISS = object()
+
+
+def fingerprint(value) -> Optional[Hashable]:
+    """
+    Cheap hashable fingerprint of an input value.
+
+    Scalars are fingerprinted by their value. Read-only arrays owning their data,
+    such as the values of the constant blocks, cannot change, so they are
+    fingerprinted by their identity. Small writable arrays are fingerprinted by
+    their content.
+
+    :param value: value of an input
+    :return: fingerprint of the value, ``None`` if it cannot be fingerprinted
+        cheaply
+    :rtype: ``Optional[Hashable]``
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return type(value), value
+    if isinstance(value, np.generic):
+        return value.dtype.str, value.tobytes()
+    if isinstance(value, np.ndarray):
+        if not value.flags.writeable and value.flags.owndata:
+            return id(value)
+        if value.nbytes <= FINGERPRINT_MAX_BYTES:
+            return value.dtype.str, value.shape, value.tobytes()
+    return None
+
+
+def _copy(value):
+    return value.copy() if isinstance(value, np.ndarray) else value
+
+
+class BlockCache:
+    """
+    :class:`~nodedge.blocks.block_cache.BlockCache` class
+
+    Values of a pure block, by fingerprint of its inputs, with least recently used
+    eviction.
+
+    Arrays are copied in and out of the cache, so that the blocks using a value can
+    modify it in place.
+    """
+
+    def __init__(self, size: int = BLOCK_CACHE_SIZE):
+        self.size: int = size
+        self.hits: int = 0
+        self.misses: int = 0
+        # Entries keep a reference to the inputs, so that the identity of an array
+        # fingerprinted by its identity is not reused while the entry is alive.
+        self._entries: "OrderedDict[Hashable, Tuple[Sequence, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(inputs: Sequence, params: Sequence = ()) -> Optional[Hashable]:
+        """
+        :param inputs: values of the inputs of the block
+        :param params: values of the parameters of the block
+        :return: key of an evaluation, ``None`` if an input cannot be fingerprinted
+        :rtype: ``Optional[Hashable]``
+        """
+        fingerprints = []
+        for value in inputs:
+            valueFingerprint = fingerprint(value)
+            if valueFingerprint is None:
+                return None
+            fingerprints.append(valueFingerprint)
+        return tuple(fingerprints), tuple(params)
+
+    def get(self, key: Hashable):
+        """
+        Retrieve the value of an evaluation, counting hits and misses.
+
+        :param key: key of the evaluation, see :meth:`key`
+        :return: a copy of the cached value, :data:`CACHE_MISS` on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return CACHE_MISS
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return _copy(entry[1])
+
+    def put(self, key: Hashable, inputs: Sequence, value) -> None:
+        """
+        Store the value of an evaluation, evicting the least recently used one if
+        the cache is full.
+
+        :param key: key of the evaluation, see :meth:`key`
+        :param inputs: values of the inputs, kept alive with the entry
+        :param value: value of the block, copied in the cache
+        """
+        self._entries[key] = (inputs, _copy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove the entries and reset the counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def summary(self) -> str:
+        """
+        :return: hits, misses and entries of the cache
+        :rtype: ``str``
+        """
+        return (
+            f"{self.hits} hits, {self.misses} misses, "
+            f"{len(self)}/{self.size} entries"
+        )
@@ -1,12 +1,31 @@
 # -*- coding: utf-8 -*-
+import importlib
+import json
+import logging
 import os
-from typing import Dict
+import pkgutil
+import sys
+from importlib.metadata import entry_points
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
 
 # BlockType = TypeVar("BlockType", bound=Block)
 BLOCKS: Dict[int, "Block"] = {}  # type: ignore
 
 BLOCKS_ICONS_PATH: str = f"{os.path.dirname(__file__)}/../../resources/node_icons"
 
+# The manifest describes the built-in blocks, so that the palette can be filled
+# without importing them. It is generated by tools/block_generator.
+BLOCKS_MANIFEST_PATH: str = f"{os.path.dirname(__file__)}/block_manifest.json"
+BLOCKS_MANIFEST_VERSION: int = 1
+BLOCKS_PACKAGES: List[str] = ["nodedge.blocks.autogen", "nodedge.blocks.custom"]
+
+# Third party packages declare modules registering blocks in this entry point group.
+BLOCKS_ENTRY_POINT_GROUP: str = "nodedge.blocks"
+
+_manifest: Optional[Dict[int, dict]] = None
+
 
 # Way to register by function call
 # associateOperationCodeWithBlock(OP_NODE_ADD, AdditionBlock)
@@ -42,11 +61,152 @@ def registerNode(operationCode):
 
 
 def getClassFromOperationCode(operationCode):
+    if operationCode not in BLOCKS:
+        entry = blockManifest().get(operationCode)
+        if entry is not None:
+            # Importing the module registers its block.
+            importlib.import_module(entry["module"])
     if operationCode not in BLOCKS:
         raise OperationCodeNotRegistered(f"{operationCode} is not registered yet.")
     return BLOCKS[operationCode]
 
 
+def blockEntryFromClass(blockClass) -> dict:
+    """
+    Describe a block class as an entry of the block manifest.
+
+    :param blockClass: registered block class
+    :type blockClass: ``Type[Block]``
+    :return: operation code, title, library, icon and module of the block
+    :rtype: ``dict``
+    """
+    icon = blockClass.icon or ""
+    iconsPath = os.path.normpath(BLOCKS_ICONS_PATH)
+    if icon and os.path.normpath(os.path.dirname(icon)) == iconsPath:
+        icon = os.path.basename(icon)
+    return {
+        "operationCode": blockClass.operationCode,
+        "operationTitle": blockClass.operationTitle,
+        "library": blockClass.library,
+        "libraryTitle": blockClass.libraryTitle,
+        "icon": icon,
+        "module": blockClass.__module__,
+    }
+
+
+def importBlockModules(packages: Iterable[str] = BLOCKS_PACKAGES) -> None:
+    """
+    Import every block module of the given packages, registering all their blocks.
+
+    :param packages: names of the packages containing ``*_block`` modules
+    :type packages: ``Iterable[str]``
+    """
+    for packageName in packages:
+        package = importlib.import_module(packageName)
+        for moduleInfo in pkgutil.walk_packages(
+            package.__path__, prefix=f"{packageName}."
+        ):
+            if moduleInfo.name.endswith("_block"):
+                importlib.import_module(moduleInfo.name)
+
+
+def generateBlockManifest(path: str = BLOCKS_MANIFEST_PATH) -> List[dict]:
+    """
+    Import all the built-in blocks and write the manifest describing them.
+
+    :param path: path of the manifest file
+    :type path: ``str``
+    :return: entries of the manifest
+    :rtype: ``List[dict]``
+    """
+    importBlockModules()
+    entries = [
+        blockEntryFromClass(blockClass)
+        for _, blockClass in sorted(BLOCKS.items())
+        if blockClass.__module__.startswith(tuple(BLOCKS_PACKAGES))
+    ]
+    with open(path, "w") as file:
+        json.dump(
+            {"version": BLOCKS_MANIFEST_VERSION, "blocks": entries}, file, indent=4
+        )
+        file.write("\n")
+    return entries
+
+
+def loadBlockManifest(path: str = BLOCKS_MANIFEST_PATH) -> Dict[int, dict]:
+    """
+    Read a block manifest.
+
+    :param path: path of the manifest file
+    :type path: ``str``
+    :return: entries of the manifest, indexed by operation code
+    :rtype: ``Dict[int, dict]``
+    """
+    try:
+        with open(path) as file:
+            data = json.load(file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cannot read block manifest {path}: {e}")
+        return {}
+    if data.get("version") != BLOCKS_MANIFEST_VERSION:
+        logger.warning(f"Unsupported block manifest version in {path}")
+        return {}
+    return {entry["operationCode"]: entry for entry in data["blocks"]}
+
+
+def loadPluginBlocks() -> None:
+    """
+    Import the modules declared by installed packages in the ``nodedge.blocks``
+    entry point group, registering their blocks.
+    """
+    if sys.version_info >= (3, 10):
+        entryPoints = entry_points(group=BLOCKS_ENTRY_POINT_GROUP)
+    else:
+        entryPoints = entry_points().get(BLOCKS_ENTRY_POINT_GROUP, [])
+    for entryPoint in entryPoints:
+        try:
+            entryPoint.load()
+        except Exception as e:
+            logger.warning(f"Cannot load blocks of plugin {entryPoint.name}: {e}")
+
+
+def blockManifest() -> Dict[int, dict]:
+    """
+    Retrieve the manifest of the built-in blocks. Plugin blocks are discovered the
+    first time the manifest is needed.
+
+    :return: entries of the manifest, indexed by operation code
+    :rtype: ``Dict[int, dict]``
+    """
+    global _manifest
+    if _manifest is None:
+        _manifest = loadBlockManifest()
+        loadPluginBlocks()
+    return _manifest
+
+
+def availableBlocks() -> List[dict]:
+    """
+    Describe all the available blocks, without importing the ones which have not
+    been used yet.
+
+    :return: manifest entries sorted by operation code, with absolute icon paths
+    :rtype: ``List[dict]``
+    """
+    entries = dict(blockManifest())
+    for operationCode, blockClass in BLOCKS.items():
+        if operationCode not in entries:
+            entries[operationCode] = blockEntryFromClass(blockClass)
+
+    blocks = []
+    for operationCode in sorted(entries.keys()):
+        entry = dict(entries[operationCode])
+        if entry["icon"] and not os.path.isabs(entry["icon"]):
+            entry["icon"] = f"{BLOCKS_ICONS_PATH}/{entry['icon']}"
+        blocks.append(entry)
+    return blocks
+
+
 # Register blocks
 # from nodedge.blocks import *
 
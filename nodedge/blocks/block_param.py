@@ -14,6 +14,8 @@ class BlockParamType(IntEnum):
 
 
 class BlockParam:
+    __slots__ = ("name", "_value", "paramType", "minValue", "maxValue", "step")
+
     def __init__(self, name, value, paramType, minValue=None, maxValue=None, step=None):
         self.name = name
         self._value = value
@@ -1,6 +1,5 @@
-from .constant_block import *
-from .discrete_transfer_function_block import *
-from .gain_block import *
-from .integral_block import *
-from .output_block import *
-from .python_block import *
+# -*- coding: utf-8 -*-
+"""
+Block modules are imported on first use, see
+:func:`~nodedge.blocks.block_config.getClassFromOperationCode`.
+"""
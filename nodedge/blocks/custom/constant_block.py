@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
-from typing import List
+import ast
+from typing import List, Optional
 
 import numpy as np
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
+from nodedge.blocks.block_exception import EvaluationError
 from nodedge.blocks.graphics_block import GraphicsBlock
 from nodedge.blocks.graphics_input_block_content import GraphicsInputBlockContent
 from nodedge.blocks.op_node import OP_NODE_CUSTOM_CONSTANT
@@ -25,7 +27,14 @@ class ConstantBlock(Block):
         SocketType.Any,
     ]
 
+    __slots__ = ("_parsedText", "_literal", "_parsedValue")
+
     def __init__(self, scene):
+        # The text is parsed once, when it changes.
+        self._parsedText: Optional[str] = None
+        self._literal = None
+        self._parsedValue: Optional[np.ndarray] = None
+
         super().__init__(
             scene,
             inputSocketTypes=self.__class__.inputSocketTypes,
@@ -39,16 +48,31 @@ class ConstantBlock(Block):
         self.content = GraphicsInputBlockContent(self)
         self.graphicsNode = GraphicsBlock(self)
 
-        self.content.edit.textChanged.connect(self.onInputChanged)
+    def parseValue(self) -> np.ndarray:
+        """
+        Parse the text of the block as a Python literal, such as a number or a
+        nested list of numbers. The text is only parsed again when it changes.
+
+        :return: read-only array of the value
+        :rtype: ``np.ndarray``
+        :raises: :class:`~nodedge.blocks.block_exception.EvaluationError` if the text
+            is not a literal
+        """
+        text = self.content.edit.text()
+        if text == self._parsedText and self._parsedValue is not None:
+            return self._parsedValue
+        try:
+            literal = ast.literal_eval(text)
+            value = np.array(literal)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            raise EvaluationError(f"{text} is not a literal value")
+        # The cached array is shared by every evaluation.
+        value.flags.writeable = False
+        self._parsedText, self._literal, self._parsedValue = text, literal, value
+        return value
 
     def evalImplementation(self):
-        rawValue = self.content.edit.text()
-
-        rawValue = eval(rawValue)
-
-        convertedValue = np.array(rawValue)
-
-        self.value = convertedValue
+        self.value = self.parseValue()
 
         self.isDirty = False
         self.isInvalid = False
@@ -59,7 +83,6 @@ class ConstantBlock(Block):
         return self.value
 
     def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
-        generatedCode: str = (
-            f"var_{self.title.lower()} = {str(self.eval().__repr__())}\n"
-        )
+        self.parseValue()
+        generatedCode: str = f"var_{currentVarIndex} = array({self._literal!r})\n"
         return generatedCode
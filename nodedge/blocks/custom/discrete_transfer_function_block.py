@@ -3,8 +3,6 @@ import logging
 from typing import List
 
 import numpy as np
-from scipy import signal
-from scipy.signal import dlsim
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
@@ -26,13 +24,14 @@ except NameError:
 
 @registerNode(OP_NODE_CUSTOM_DISCRETE_TRANSFER_FUNCTION)
 class DiscreteTransferFunctionBlock(Block):
-    icon = f""
+    icon = ""
     operationCode = OP_NODE_CUSTOM_DISCRETE_TRANSFER_FUNCTION
     operationTitle = "Discrete TF"
     contentLabel = "Discrete TF"
     contentLabelObjectName = "DiscreteTransferFunctionBlockContent"
     library = "scipy"
     libraryTitle = "discrete"
+    isStateful = True
     inputSocketTypes: List[SocketType] = [
         SocketType.Number,
     ]
@@ -40,6 +39,8 @@ class DiscreteTransferFunctionBlock(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ("dt",)
+
     def __init__(self, scene: "Scene"):  # type: ignore
         super().__init__(
             scene,
@@ -62,6 +63,10 @@ class DiscreteTransferFunctionBlock(Block):
         self.eval()
 
     def evalImplementation(self):
+        # SciPy is only loaded when a scene is evaluated, not at startup.
+        from scipy import signal
+        from scipy.signal import dlsim
+
         my_input = self.inputNodeAt(0).eval()
 
         try:
@@ -71,8 +76,7 @@ class DiscreteTransferFunctionBlock(Block):
 
             # Integrated signal
 
-            num = eval("np.array(" + self.params[0].value + ")")
-            den = eval("np.array(" + self.params[1].value + ")")
+            num, den = self.coefficients()
 
             sys = signal.dlti(num, den, dt=self.dt)
             sys = sys._as_ss()
@@ -89,3 +93,68 @@ class DiscreteTransferFunctionBlock(Block):
         self.value = y[0][0]
 
         return self.value
+
+    def coefficients(self):
+        """
+        :return: numerator and denominator coefficients of the transfer function
+        :rtype: ``Tuple[np.ndarray, np.ndarray]``
+        """
+        num = eval("np.array(" + self.params[0].value + ")")
+        den = eval("np.array(" + self.params[1].value + ")")
+        return num, den
+
+    def evalOutput(self):
+        from scipy import signal
+
+        num, den = self.coefficients()
+        sys = signal.dlti(num, den, dt=self.dt)._as_ss()
+        if sys.D.any():
+            raise NotImplementedError(
+                f"{self.title} has a direct feedthrough, "
+                "it cannot break a feedback loop"
+            )
+        if self.state is None:
+            return 0.0
+        return (sys.C @ self.state)[0]
+
+    def generateStateCode(self, currentVarIndex: int) -> str:
+        from scipy.signal import tf2ss
+
+        # The state space realization is the one simulated by evalImplementation.
+        a, b, c, d = tf2ss(*self.coefficients())
+        index = currentVarIndex
+        generatedCode: str = (
+            f"a_{index} = array({a.astype(float).tolist()}).reshape({a.shape})\n"
+            f"b_{index} = array({b[:, 0].astype(float).tolist()})\n"
+            f"c_{index} = array({c[0].astype(float).tolist()})\n"
+            f"d_{index} = {float(d[0, 0]).__repr__()}\n"
+            f"x_{index} = array({[0.0] * a.shape[0]})\n"
+        )
+        return generatedCode
+
+    def generateOutputCode(self, currentVarIndex: int) -> str:
+        from scipy.signal import tf2ss
+
+        _, _, _, d = tf2ss(*self.coefficients())
+        if d.any():
+            raise NotImplementedError(
+                f"{self.title} has a direct feedthrough, "
+                "it cannot break a feedback loop"
+            )
+        return f"var_{currentVarIndex} = c_{currentVarIndex} @ x_{currentVarIndex}\n"
+
+    def generateUpdateCode(
+        self, currentVarIndex: int, inputVarIndexes: List[int]
+    ) -> str:
+        index = currentVarIndex
+        inputVar = f"var_{inputVarIndexes[0]}"
+        return f"x_{index} = a_{index} @ x_{index} + b_{index} * {inputVar}\n"
+
+    def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
+        self.checkInputsValidity()
+        index = currentVarIndex
+        inputVar = f"var_{inputVarIndexes[0]}"
+        generatedCode: str = (
+            f"var_{index} = c_{index} @ x_{index} + d_{index} * {inputVar}\n"
+        ) + self.generateUpdateCode(currentVarIndex, inputVarIndexes)
+        return generatedCode
@@ -21,6 +21,8 @@ class GainBlock(Block):
     inputSocketTypes: List[SocketType] = [SocketType.Number]
     outputSocketTypes: List[SocketType] = [SocketType.Number]
 
+    __slots__ = ()
+
     def __init__(self, scene):
         super().__init__(
             scene,
@@ -35,8 +37,6 @@ class GainBlock(Block):
         self.content = GraphicsInputBlockContent(self)
         self.graphicsNode = GraphicsBlock(self)
 
-        self.content.edit.textChanged.connect(self.onInputChanged)
-
     def evalImplementation(self):
         inputValue = self.inputNodeAt(0).eval()
         gain = float(self.content.edit.text())
@@ -52,5 +52,9 @@ class GainBlock(Block):
         return self.value
 
     def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
-        generatedCode: str = f"var_{str(currentVarIndex)} = {str(self.eval())}\n"
+        self.checkInputsValidity()
+        gain = float(self.content.edit.text())
+        generatedCode: str = (
+            f"var_{currentVarIndex} = var_{inputVarIndexes[0]} * {gain.__repr__()}\n"
+        )
         return generatedCode
@@ -2,8 +2,6 @@
 import logging
 from typing import List
 
-from scipy.integrate import quad
-
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import BLOCKS_ICONS_PATH, registerNode
 from nodedge.blocks.block_exception import EvaluationError
@@ -27,6 +25,7 @@ class IntegralBlock(Block):
     contentLabelObjectName = "IntegralBlockContent"
     library = "integration/derivation"
     libraryTitle = "integration/derivation"
+    isStateful = True
     inputSocketTypes: List[SocketType] = [
         SocketType.Number,
     ]
@@ -34,6 +33,8 @@ class IntegralBlock(Block):
         SocketType.Number,
     ]
 
+    __slots__ = ("dt",)
+
     def __init__(self, scene: "Scene"):  # type: ignore
         super().__init__(
             scene,
@@ -50,6 +51,9 @@ class IntegralBlock(Block):
         self.eval()
 
     def evalImplementation(self):
+        # SciPy is only loaded when a scene is evaluated, not at startup.
+        from scipy.integrate import quad
+
         my_input = self.inputNodeAt(0).eval()
 
         def my_func(x):
@@ -70,3 +74,28 @@ class IntegralBlock(Block):
         self.value = self.state[0]
 
         return self.value
+
+    def evalOutput(self):
+        return self.state[0]
+
+    def generateStateCode(self, currentVarIndex: int) -> str:
+        return f"state_{currentVarIndex} = {float(self.initialState[0]).__repr__()}\n"
+
+    def generateOutputCode(self, currentVarIndex: int) -> str:
+        return f"var_{currentVarIndex} = state_{currentVarIndex}\n"
+
+    def generateUpdateCode(
+        self, currentVarIndex: int, inputVarIndexes: List[int]
+    ) -> str:
+        # The input is held constant during the time step, as in evalImplementation.
+        return (
+            f"state_{currentVarIndex} = state_{currentVarIndex} "
+            f"+ var_{inputVarIndexes[0]} * dt\n"
+        )
+
+    def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
+        self.checkInputsValidity()
+        generatedCode: str = self.generateUpdateCode(
+            currentVarIndex, inputVarIndexes
+        ) + self.generateOutputCode(currentVarIndex)
+        return generatedCode
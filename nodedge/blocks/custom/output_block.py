@@ -14,6 +14,9 @@ from nodedge.socket_type import SocketType
 
 np.set_printoptions(precision=2)
 
+# Number of elements of the arrays displayed without summarization.
+OUTPUT_ARRAY_THRESHOLD = 16
+
 
 @registerNode(OP_NODE_CUSTOM_OUTPUT)
 class OutputBlock(Block):
@@ -29,6 +32,8 @@ class OutputBlock(Block):
     ]
     outputSocketTypes: List[SocketType] = []
 
+    __slots__ = ()
+
     def __init__(self, scene: "Scene"):  # type: ignore
         super().__init__(
             scene,
@@ -70,20 +75,35 @@ class OutputBlock(Block):
                 f"The result of the input {inputNode} evaluation is None."
             )
 
+        self.showValue(inputResult)
+
+        return True
+
+    def showValue(self, value) -> None:
+        """
+        Display a value according to the formatting parameters of the block.
+
+        :param value: value to display
+        """
         # TODO: Update label if a parameter has changed.
         digits = self.params[1].value
-        if self.params[0].value:
-            self.content.label.setText(f"{inputResult:.{digits}E}")
+        formatSpec = f".{digits}E" if self.params[0].value else f".{digits}f"
+        if np.ndim(value) == 0:
+            self.content.label.setText(format(value, formatSpec))
         else:
-            self.content.label.setText(f"{inputResult:.{digits}f}")
-
-        return True
+            # Arrays are summarized, so that large signals are shown quickly.
+            self.content.label.setText(
+                np.array2string(
+                    np.asarray(value),
+                    formatter={"float_kind": lambda x: format(x, formatSpec)},
+                    threshold=OUTPUT_ARRAY_THRESHOLD,
+                )
+            )
 
     def generateCode(
         self, currentVarIndex: int = 0, inputVarIndexes: Optional[List[int]] = None
     ):
-        inputNode = self.inputNodeAt(0)
-        if inputNode is not None:
-            return f"var_{inputNode.title}"
+        if inputVarIndexes:
+            return f"var_{inputVarIndexes[0]}"
         else:
             return ""
@@ -1,20 +1,36 @@
 # -*- coding: utf-8 -*-
-from typing import List
+import builtins
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from numpy import array
 
 from nodedge.blocks.block import Block
 from nodedge.blocks.block_config import registerNode
+from nodedge.blocks.block_exception import EvaluationError
 from nodedge.blocks.block_param import BlockParam, BlockParamType
 from nodedge.blocks.graphics_block import GraphicsBlock
 from nodedge.blocks.graphics_block_content import GraphicsBlockContent
 from nodedge.blocks.op_node import OP_NODE_CUSTOM_PYTHON
 from nodedge.socket_type import SocketType
 
+logger = logging.getLogger(__name__)
+
 
 @registerNode(OP_NODE_CUSTOM_PYTHON)
 class PythonBlock(Block):
-    icon = f""
+    """
+    :class:`~nodedge.blocks.custom.python_block.PythonBlock` class
+
+    Block applying user code to its input, the body of a function whose argument is
+    named after the input block.
+
+    In per-step mode, the function is called with the input value at every time
+    step. In vectorized mode, it is called once per simulation with the input
+    array over all the time steps, and returns the output array.
+    """
+
+    icon = ""
     operationCode = OP_NODE_CUSTOM_PYTHON
     operationTitle = "Python"
     contentLabel = "Python"
@@ -24,7 +40,15 @@ class PythonBlock(Block):
     inputSocketTypes: List[SocketType] = [SocketType.Number]
     outputSocketTypes: List[SocketType] = [SocketType.Number]
 
+    __slots__ = ("isVectorized", "_function", "_compileError", "_compiledKey")
+
     def __init__(self, scene):
+        # The user code is compiled once, when it or the name of the input changes.
+        self._function: Optional[Callable] = None
+        self._compiledKey: Optional[Tuple[str, str]] = None
+        self._compileError: str = ""
+        self.isVectorized: bool = False
+
         super().__init__(
             scene,
             inputSocketTypes=self.__class__.inputSocketTypes,
@@ -33,6 +57,7 @@ class PythonBlock(Block):
 
         self.params = [
             BlockParam("code", "", BlockParamType.LongText),
+            BlockParam("vectorized", False, BlockParamType.Bool),
         ]
 
         self.eval()
@@ -42,18 +67,61 @@ class PythonBlock(Block):
         self.content = GraphicsBlockContent(self)
         self.graphicsNode = GraphicsBlock(self)
 
-    def evalImplementation(self):
-        inputValue = self.inputNodeAt(0).eval()
-        inputNodeTitle = self.inputNodeAt(0).title
-        funcTitle = "function_" + self.title.lower()
-        text = self.params[0].value.replace("\n", "\n    ")
+    def onParamChanged(self, param: BlockParam) -> None:
+        if param.name == "code":
+            self.compileFunction()
+            if self._compileError:
+                self.isInvalid = True
+                self.graphicsNode.setToolTip(self._compileError)
+        elif param.name == "vectorized":
+            # The code is applied to whole signals.
+            self.isVectorized = bool(param.value)
+        super().onParamChanged(param)
+
+    def compileFunction(self) -> Optional[Callable]:
+        """
+        Compile the user code into a function taking the input value as argument,
+        named after the input block.
+
+        The function is defined in a namespace of its own, and is only compiled
+        again when the code or the name of the input changes.
+
+        :return: the compiled function, or ``None`` if the code is invalid
+        :rtype: ``Optional[Callable]``
+        """
+        inputNode = self.inputNodeAt(0)
+        inputName = inputNode.title if inputNode is not None else "x"
+        key = (self.params[0].value, inputName)
+        if key == self._compiledKey:
+            return self._function
 
-        inputFunction = f"def {funcTitle}({inputNodeTitle}):\n    {text}"
+        text = self.params[0].value.replace("\n", "\n    ")
+        source = f"def function({inputName}):\n    {text}"
+        namespace: Dict[str, Any] = {"__builtins__": builtins, "array": array}
+        try:
+            exec(compile(source, f"<{self.title}>", "exec"), namespace)
+        except SyntaxError as e:
+            self._function = None
+            self._compileError = f"Invalid code, line {e.lineno}: {e.msg}"
+            logger.warning(f"{self.title}: {self._compileError}")
+        else:
+            self._function = namespace["function"]
+            self._compileError = ""
+        self._compiledKey = key
+
+        return self._function
 
-        exec(inputFunction, globals())
+    def evalImplementation(self):
+        inputValue = self.inputNodeAt(0).eval()
+        function = self.compileFunction()
+        if function is None:
+            raise EvaluationError(self._compileError)
 
-        functionEvaluationStr = f"{funcTitle}({inputValue.__repr__()})"
-        self.value = eval(functionEvaluationStr)
+        if self.isVectorized:
+            # Out of a simulation, the input is a signal with a single sample.
+            self.value = function(array([inputValue]))[-1]
+        else:
+            self.value = function(inputValue)
 
         self.isDirty = False
         self.isInvalid = False
@@ -63,17 +131,28 @@ class PythonBlock(Block):
 
         return self.value
 
-    def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
+    def generateStateCode(self, currentVarIndex: int) -> str:
+        # The function is defined once, before the first time step.
         inputNode = self.inputNodeAt(0)
         if inputNode is None:
             return ""
-        inputValue = inputNode.eval()
-        inputNodeName = inputNode.title.lower()
         text = self.params[0].value.replace("\n", "\n    ")
-        funcTitle = "function_" + self.title
+        return f"def function_{currentVarIndex}({inputNode.title}):\n    {text}\n"
 
-        inputFunction = f"def {funcTitle}({inputNodeName}):\n    {text}"
-        generatedCode: str = (
-            f"var_{self.title.lower()} = {funcTitle}(var_{inputNodeName})\n"
-        )
-        return inputFunction + "\n" + generatedCode
+    def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
+        if self.inputNodeAt(0) is None:
+            return ""
+        funcTitle = f"function_{currentVarIndex}"
+        if self.isVectorized:
+            return (
+                f"var_{currentVarIndex} = "
+                f"{funcTitle}(array([var_{inputVarIndexes[0]}]))[-1]\n"
+            )
+        return f"var_{currentVarIndex} = {funcTitle}(var_{inputVarIndexes[0]})\n"
+
+    def generateArrayCode(
+        self, currentVarIndex: int, inputVarIndexes: List[int]
+    ) -> str:
+        self.checkInputsValidity()
+        funcTitle = f"function_{currentVarIndex}"
+        return f"var_{currentVarIndex} = {funcTitle}(var_{inputVarIndexes[0]})\n"
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+import logging
+import os
+from typing import Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+from nodedge.blocks.block import Block
+from nodedge.blocks.block_config import getClassFromOperationCode, registerNode
+from nodedge.blocks.block_exception import EvaluationError, RedundantInputError
+from nodedge.blocks.block_param import BlockParam, BlockParamType
+from nodedge.blocks.graphics_block import GraphicsBlock
+from nodedge.blocks.graphics_block_content import GraphicsBlockContent
+from nodedge.blocks.op_node import OP_NODE_CUSTOM_CONSTANT, OP_NODE_CUSTOM_SUBSYSTEM
+from nodedge.node import Node
+from nodedge.scene import InvalidFile, Scene
+from nodedge.socket_type import SocketType
+
+logger = logging.getLogger(__name__)
+
+# Name of the function compiled from the scene of a subsystem.
+SUBSYSTEM_FUNCTION_NAME = "subsystem"
+
+
+def nodeClassFromData(data: dict):
+    if "operationCode" not in data:
+        return Node
+    return getClassFromOperationCode(data["operationCode"])
+
+
+class SubsystemDefinition:
+    """
+    :class:`~nodedge.blocks.custom.subsystem_block.SubsystemDefinition` class
+
+    Scene saved in a file, compiled into a single function of its constant blocks
+    returning the value of its output block.
+
+    Definitions are shared by all the subsystem blocks referencing the same file,
+    see :meth:`fromFile`, and the file is only compiled again when it is modified.
+    """
+
+    _definitions: Dict[str, "SubsystemDefinition"] = {}
+    # Files being compiled, to detect the subsystems referencing themselves.
+    _compilingFilenames: Set[str] = set()
+
+    def __init__(self, filename: str):
+        self.filename: str = filename
+        self.modificationTime: float = os.path.getmtime(filename)
+
+        # The scene is only needed to generate the code, it is never shown.
+        scene = Scene()
+        scene.setNodeClassSelector(nodeClassFromData)
+        scene.loadFromFile(filename)
+
+        inputNodes = [
+            node
+            for node in scene.nodes
+            if getattr(node, "operationCode", None) == OP_NODE_CUSTOM_CONSTANT
+        ]
+        outputNodes = scene.coder.outputNodes()
+        if len(outputNodes) != 1:
+            raise EvaluationError(
+                f"{os.path.basename(filename)} must have a single connected output"
+            )
+
+        #: Titles of the constant blocks, which are the inputs of the subsystem.
+        self.inputTitles: List[str] = [node.title for node in inputNodes]
+        #: Values of the constant blocks, used for the unconnected inputs.
+        self.inputDefaults: list = [node.eval() for node in inputNodes]
+
+        self.source: str = scene.coder.generateFunctionCode(
+            SUBSYSTEM_FUNCTION_NAME, inputNodes
+        )
+        namespace: dict = {"__name__": "nodedge.generated"}
+        exec(
+            compile(self.source, f"<nodedge-subsystem-{filename}>", "exec"),
+            namespace,
+        )
+        #: Evaluate the scene, returning the list of the values of its outputs.
+        self.function: Callable[..., list] = namespace[SUBSYSTEM_FUNCTION_NAME]
+
+    @classmethod
+    def fromFile(cls, filename: str) -> "SubsystemDefinition":
+        """
+        Retrieve the definition of a subsystem, compiling its file on first use or
+        when the file has been modified.
+
+        :param filename: file of the scene of the subsystem
+        :type filename: ``str``
+        :return: compiled subsystem
+        :rtype: :class:`~nodedge.blocks.custom.subsystem_block.SubsystemDefinition`
+        :raises: ``OSError`` if the file cannot be read,
+            :class:`~nodedge.scene.InvalidFile` if it is not a scene file,
+            :class:`~nodedge.blocks.block_exception.EvaluationError` if the subsystem
+            references itself, directly or through other subsystems
+        """
+        filename = os.path.realpath(filename)
+        if filename in cls._compilingFilenames:
+            raise EvaluationError(f"Recursive subsystem {filename}")
+        definition = cls._definitions.get(filename)
+        modificationTime = os.path.getmtime(filename)
+        if definition is None or definition.modificationTime != modificationTime:
+            cls._compilingFilenames.add(filename)
+            try:
+                definition = cls(filename)
+            finally:
+                cls._compilingFilenames.discard(filename)
+            cls._definitions[filename] = definition
+            logger.debug(f"Compiled subsystem {filename}")
+        return definition
+
+
+@registerNode(OP_NODE_CUSTOM_SUBSYSTEM)
+class SubsystemBlock(Block):
+    """
+    :class:`~nodedge.blocks.custom.subsystem_block.SubsystemBlock` class
+
+    Block evaluating the scene of another file, referenced by its path. The
+    constant blocks of the scene are the inputs of the block, and its output block
+    is the output of the block.
+
+    The scene is compiled once into a single function, shared by all the blocks
+    referencing the file. The function is only called again when the values of the
+    inputs change. A modified file is compiled again when the parameter of the block
+    changes, or when the code of the scene is generated, not at every evaluation.
+    """
+
+    icon = ""
+    operationCode = OP_NODE_CUSTOM_SUBSYSTEM
+    operationTitle = "Subsystem"
+    contentLabel = "Subsystem"
+    contentLabelObjectName = "BlockContent"
+    library = "custom"
+    libraryTitle = "custom"
+    inputSocketTypes: List[SocketType] = []
+    outputSocketTypes: List[SocketType] = [SocketType.Any]
+
+    __slots__ = ("_definition", "_lastInputValues")
+
+    def __init__(self, scene):
+        self._definition: Optional[SubsystemDefinition] = None
+        # Values of the inputs when the function was last called.
+        self._lastInputValues: Optional[list] = None
+
+        super().__init__(
+            scene,
+            inputSocketTypes=self.__class__.inputSocketTypes,
+            outputSocketTypes=self.__class__.outputSocketTypes,
+        )
+
+        self.params = [
+            BlockParam("file", "", BlockParamType.ShortText),
+        ]
+
+    # noinspection PyAttributeOutsideInit
+    def initInnerClasses(self):
+        self.content = GraphicsBlockContent(self)
+        self.graphicsNode = GraphicsBlock(self)
+
+    @property
+    def filename(self) -> str:
+        """
+        :getter: path of the referenced file. A relative path is relative to the
+            file of the scene containing the block.
+        :rtype: ``str``
+        """
+        filename: str = self.params[0].value
+        if filename and not os.path.isabs(filename) and self.scene.filename:
+            filename = os.path.join(os.path.dirname(self.scene.filename), filename)
+        return filename
+
+    def onParamChanged(self, param: BlockParam) -> None:
+        if param.name == "file":
+            try:
+                self.loadDefinition()
+            except EvaluationError as e:
+                self.isInvalid = True
+                self.graphicsNode.setToolTip(str(e))
+        super().onParamChanged(param)
+
+    def loadDefinition(self) -> SubsystemDefinition:
+        """
+        Compile the referenced file if it has not been compiled yet or has been
+        modified, and create one input socket per constant block of its scene.
+
+        :return: compiled subsystem
+        :rtype: :class:`~nodedge.blocks.custom.subsystem_block.SubsystemDefinition`
+        :raises: :class:`~nodedge.blocks.block_exception.EvaluationError` if the
+            file cannot be compiled
+        """
+        filename = self.filename
+        if not filename:
+            raise EvaluationError("No file is referenced by the subsystem")
+        try:
+            definition = SubsystemDefinition.fromFile(filename)
+        except (OSError, InvalidFile, NotImplementedError) as e:
+            raise EvaluationError(f"Cannot compile {filename}: {e}")
+
+        if definition is not self._definition:
+            self._definition = definition
+            self._lastInputValues = None
+            self.updateInputSockets(len(definition.inputTitles))
+        return definition
+
+    def updateInputSockets(self, count: int) -> None:
+        """
+        Add or remove input sockets, keeping the edges of the remaining ones.
+
+        :param count: number of input sockets
+        :type count: ``int``
+        """
+        for socket in self.inputSockets[count:]:
+            socket.removeAllEdges()
+            self.scene.graphicsScene.removeItem(socket.graphicsSocket)
+        del self.inputSockets[count:]
+        for index in range(len(self.inputSockets), count):
+            socket = self.__class__.SocketClass(
+                node=self,
+                index=index,
+                location=self._inputSocketPosition,
+                socketType=SocketType.Any,
+                allowMultiEdges=self._inputAllowMultiEdges,
+                countOnThisNodeSide=count,
+                isInput=True,
+            )
+            self.inputSockets.append(socket)
+        for socket in self.inputSockets:
+            socket.countOnThisNodeSide = count
+            socket.updateSocketPos()
+        self.updateConnectedEdges()
+
+    def checkInputsValidity(self):
+        # Unconnected inputs take the value of their constant block.
+        for index in range(len(self.inputSockets)):
+            inputNodesLength = len(self.inputNodesAt(index))
+            if inputNodesLength > 1:
+                raise RedundantInputError(
+                    f"{inputNodesLength} inputs connected to input socket #{index}."
+                )
+
+    def inputValues(self, definition: SubsystemDefinition) -> list:
+        """
+        :param definition: compiled subsystem
+        :type definition: :class:`~nodedge.blocks.custom.subsystem_block.SubsystemDefinition`
+        :return: values of the inputs, the unconnected ones taking the values of
+            their constant block
+        :rtype: ``list``
+        """
+        values = []
+        for index, defaultValue in enumerate(definition.inputDefaults):
+            inputNode = self.inputNodeAt(index)
+            values.append(defaultValue if inputNode is None else inputNode.eval())
+        return values
+
+    @staticmethod
+    def _sameValues(values: list, otherValues: Optional[list]) -> bool:
+        if otherValues is None or len(values) != len(otherValues):
+            return False
+        for value, otherValue in zip(values, otherValues):
+            value, otherValue = np.asarray(value), np.asarray(otherValue)
+            if value.dtype != otherValue.dtype or not np.array_equal(value, otherValue):
+                return False
+        return True
+
+    def evalImplementation(self):
+        # The file is not checked for modifications at every evaluation.
+        definition = self._definition or self.loadDefinition()
+        inputValues = self.inputValues(definition)
+        if not self._sameValues(inputValues, self._lastInputValues):
+            self.value = definition.function(*inputValues)[0]
+            self._lastInputValues = inputValues
+
+        self.isDirty = False
+        self.isInvalid = False
+
+        self.markDescendantsInvalid(False)
+        self.markDescendantsDirty(True)
+
+        return self.value
+
+    def generateStateCode(self, currentVarIndex: int) -> str:
+        # The function is defined once, before the first time step.
+        definition = self.loadDefinition()
+        return (
+            definition.source
+            + f"subsystem_{currentVarIndex} = {SUBSYSTEM_FUNCTION_NAME}\n"
+        )
+
+    def generateCode(self, currentVarIndex: int, inputVarIndexes: List[int]):
+        definition = self.loadDefinition()
+        connectedVarIndexes = iter(inputVarIndexes)
+        arguments = []
+        for index, defaultValue in enumerate(definition.inputDefaults):
+            if self.inputNodeAt(index) is None:
+                arguments.append(repr(defaultValue))
+            else:
+                arguments.append(f"var_{next(connectedVarIndexes)}")
+        return (
+            f"var_{currentVarIndex} = "
+            f"subsystem_{currentVarIndex}({', '.join(arguments)})[0]\n"
+        )
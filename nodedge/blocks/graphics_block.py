@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 import os
+from typing import Optional
 
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtGui import QBrush, QColor, QImage, QPixmap
 
 from nodedge.graphics_node import GraphicsNode
 
@@ -23,6 +24,23 @@ class GraphicsBlock(GraphicsNode):
         self.icons = QImage(
             f"{os.path.dirname(__file__)}/../../resources/node_icons/status_icons.png"
         )
+        self._brushDefaultBackground: QBrush = self._brushBackground
+
+    def setHeat(self, heat: Optional[float]) -> None:
+        """
+        Color the background of the block according to its share of the simulation
+        time, from green to red, see :class:`~nodedge.scene_profiler.SceneProfiler`.
+
+        :param heat: share relative to the most expensive block, between 0 and 1,
+            or ``None`` to restore the default background
+        :type heat: ``Optional[float]``
+        """
+        if heat is None:
+            self._brushBackground = self._brushDefaultBackground
+        else:
+            hue = (1.0 - min(max(heat, 0.0), 1.0)) / 3.0
+            self._brushBackground = QBrush(QColor.fromHsvF(hue, 0.8, 0.5, 0.9))
+        self.update()
 
     def paint(self, painter, QStyleOptionGraphicsItem, widget=None):
         super().paint(painter, QStyleOptionGraphicsItem, widget)
@@ -6,11 +6,15 @@ Graphics input block content module containing
 
 from typing import Optional
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QLineEdit
 
 from nodedge.graphics_node_content import GraphicsNodeContent
 from nodedge.utils import dumpException
 
+# Delay before the edited value is evaluated, to coalesce keystrokes.
+EDIT_DELAY_MS = 300
+
 
 class GraphicsInputBlockContent(GraphicsNodeContent):
     """
@@ -25,6 +29,12 @@ class GraphicsInputBlockContent(GraphicsNodeContent):
         self.edit.editingFinished.connect(self.onEditingFinished)
         self.edit.returnPressed.connect(self.setFocus)
 
+        self.editTimer = QTimer(self)
+        self.editTimer.setSingleShot(True)
+        self.editTimer.setInterval(EDIT_DELAY_MS)
+        self.editTimer.timeout.connect(self.onEditPaused)
+        self.edit.textChanged.connect(self.onTextChanged)
+
     def mousePressEvent(self, event):
         self.setFocus()
         super().mousePressEvent(event)
@@ -57,7 +67,19 @@ class GraphicsInputBlockContent(GraphicsNodeContent):
 
         return res
 
+    def onTextChanged(self, text: str):
+        # The value is outdated at once, but only evaluated when the typing pauses.
+        self.node.isDirty = True
+        self.node.markDescendantsDirty()
+        self.editTimer.start()
+
+    def onEditPaused(self):
+        self.node.onInputChanged()
+
     def onEditingFinished(self):
+        if self.editTimer.isActive():
+            self.editTimer.stop()
+            self.onEditPaused()
         if (
             self.node is not None
             and self.node.scene is not None
@@ -51,3 +51,4 @@ OP_NODE_CUSTOM_INTEGRAL = 50
 OP_NODE_CUSTOM_GAIN = 51
 OP_NODE_CUSTOM_PYTHON = 52
 OP_NODE_CUSTOM_DISCRETE_TRANSFER_FUNCTION = 53
+OP_NODE_CUSTOM_SUBSYSTEM = 54
@@ -8,14 +8,21 @@ constants.
 import logging
 from collections import OrderedDict
 from enum import IntEnum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import numpy as np
 from PySide6.QtCore import QPointF
 
 from nodedge.graphics_socket import GraphicsSocket
 from nodedge.serializable import Serializable
 from nodedge.socket_type import SocketType
 
+logger = logging.getLogger(__name__)
+
+
+# Python scalars, whose shape and data type only depend on their type.
+SCALAR_TYPES = (bool, int, float, complex)
+
 
 class SocketLocation(IntEnum):
     LEFT_TOP = 1  #: Left top
@@ -33,6 +40,23 @@ class Socket(Serializable):
 
     GraphicsSocketClass = GraphicsSocket
 
+    # Scenes hold many sockets, so they do not have an instance dictionary.
+    __slots__ = (
+        "id",
+        "node",
+        "index",
+        "location",
+        "countOnThisNodeSide",
+        "isInput",
+        "_socketType",
+        "allowMultiEdges",
+        "_shape",
+        "_dtype",
+        "_valueType",
+        "graphicsSocket",
+        "edges",
+    )
+
     def __init__(
         self,
         node: "Node",  # type: ignore # noqa: F821
@@ -72,8 +96,11 @@ class Socket(Serializable):
         self._socketType: SocketType = socketType
         self.allowMultiEdges: bool = allowMultiEdges
 
-        self.__logger = logging.getLogger(__file__)
-        self.__logger.setLevel(logging.INFO)
+        # Shape and data type of the values carried by the socket, once known.
+        self._shape: Optional[Tuple[int, ...]] = None
+        self._dtype: Optional[str] = None
+        # Type of the last value whose shape and data type have been recorded.
+        self._valueType: Optional[type] = None
 
         self.graphicsSocket: GraphicsSocket = self.__class__.GraphicsSocketClass(self)
         self.updateSocketPos()
@@ -96,6 +123,54 @@ class Socket(Serializable):
             self._socketType = newValue
             self.graphicsSocket.updateSocketType()
 
+    @property
+    def shape(self) -> Optional[Tuple[int, ...]]:
+        """
+        :getter: shape of the values carried by this socket, ``None`` if unknown.
+            An input socket carries the values of the output socket it is
+            connected to.
+        :rtype: ``Optional[Tuple[int, ...]]``
+        """
+        return self._signalSocket()._shape
+
+    @property
+    def dtype(self) -> Optional[str]:
+        """
+        :getter: numpy data type of the values carried by this socket, ``None`` if
+            unknown. An input socket carries the values of the output socket it is
+            connected to.
+        :rtype: ``Optional[str]``
+        """
+        return self._signalSocket()._dtype
+
+    def setSignal(self, value) -> None:
+        """
+        Record the shape and the data type of a value carried by this socket.
+
+        It is called at every evaluation of the node: scalars of the same type as
+        the previous value are skipped, and arrays are not converted.
+
+        :param value: value produced by the node of this output socket
+        """
+        valueType = type(value)
+        if valueType is self._valueType and (
+            valueType in SCALAR_TYPES or issubclass(valueType, np.generic)
+        ):
+            # The shape and the data type of a scalar only depend on its type.
+            return
+        self._valueType = valueType
+        if not isinstance(value, np.ndarray):
+            value = np.asarray(value)
+        self._shape = value.shape
+        self._dtype = value.dtype.str
+
+    def _signalSocket(self) -> "Socket":
+        if self.isInput and self.edges:
+            otherSocket: Optional[Socket] = self.edges[0].getOtherSocket(self)
+            if otherSocket is not None:
+                return otherSocket
+        return self
+
     @property
     def isOutput(self):
         """
@@ -195,7 +270,7 @@ class Socket(Serializable):
         if edgeToRemove in self.edges:
             self.edges.remove(edgeToRemove)
         else:
-            self.__logger.debug(f"Trying to remove {edgeToRemove} from {self}.")
+            logger.debug(f"Trying to remove {edgeToRemove} from {self}.")
 
     # noinspection PyUnresolvedReferences
     def removeAllEdges(self, silent=False) -> None:
@@ -208,7 +283,7 @@ class Socket(Serializable):
         """
         while self.edges:
             edge: "Edge" = self.edges.pop(0)  # type: ignore # noqa: F821
-            self.__logger.debug(f"Removing {edge} from {self}")
+            logger.debug(f"Removing {edge} from {self}")
             if silent:
                 edge.remove(silent)
             else:
@@ -249,6 +324,8 @@ class Socket(Serializable):
                 ("allowMultiEdges", self.allowMultiEdges),
                 ("location", self.location),
                 ("socketType", self.socketType.value),
+                ("shape", None if self._shape is None else list(self._shape)),
+                ("dtype", self._dtype),
             ]
         )
 
@@ -268,6 +345,10 @@ class Socket(Serializable):
         self.allowMultiEdges = data["allowMultiEdges"]
         self.socketType = SocketType(data["socketType"])
         self.location = data["location"]
+        shape = data.get("shape")
+        self._shape = None if shape is None else tuple(shape)
+        self._dtype = data.get("dtype")
+        self._valueType = None
         hashmap[data["id"]] = self
 
         return True
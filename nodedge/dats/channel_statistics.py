@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+"""
+Channel statistics module containing
+:class:`~nodedge.dats.channel_statistics.ChannelStatistics` and
+:class:`~nodedge.dats.channel_statistics.ChannelStatisticsIndex` classes.
+"""
+
+import json
+import logging
+import math
+import os
+import sys
+import traceback
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import numpy as np
+from asammdf import MDF
+from asammdf import Signal as asammdfSignal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of records read at once from a log.
+CHUNK_RECORDS = 1_000_000
+# Statistics of a log are stored next to it, in a file with this suffix.
+SIDECAR_SUFFIX = ".stats.json"
+SIDECAR_VERSION = 1
+
+
+class ChannelStatistics:
+    """
+    :class:`~nodedge.dats.channel_statistics.ChannelStatistics` class
+
+    Summary of a channel: time range, min, max, mean, standard deviation, number of
+    NaN samples and sample rate. NaN samples are ignored in the other statistics.
+    """
+
+    FIELDS = ("tMin", "tMax", "min", "max", "mean", "std", "nanCount", "count")
+
+    def __init__(
+        self,
+        tMin: float = math.nan,
+        tMax: float = math.nan,
+        min: float = math.nan,
+        max: float = math.nan,
+        mean: float = math.nan,
+        std: float = math.nan,
+        nanCount: int = 0,
+        count: int = 0,
+    ):
+        self.tMin: float = tMin
+        self.tMax: float = tMax
+        self.min: float = min
+        self.max: float = max
+        self.mean: float = mean
+        self.std: float = std
+        self.nanCount: int = nanCount
+        self.count: int = count
+
+    @property
+    def sampleRate(self) -> float:
+        """
+        :return: mean sample rate, in Hz, or NaN if it cannot be computed
+        :rtype: ``float``
+        """
+        duration = self.tMax - self.tMin
+        if self.count < 2 or not duration > 0:
+            return math.nan
+        return (self.count - 1) / duration
+
+    def __repr__(self):
+        return (
+            f"<ChannelStatistics min={self.min} max={self.max} mean={self.mean} "
+            f"std={self.std} nanCount={self.nanCount} count={self.count}>"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, ChannelStatistics):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def as_dict(self) -> dict:
+        """
+        :return: the statistics as a JSON serializable dictionary, NaN being ``None``
+        :rtype: ``dict``
+        """
+        values = {}
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            values[field] = (
+                None if isinstance(value, float) and math.isnan(value) else value
+            )
+        return values
+
+    @classmethod
+    def from_dict(cls, values: dict) -> "ChannelStatistics":
+        """
+        :param values: dictionary created by
+            :func:`~nodedge.dats.channel_statistics.ChannelStatistics.as_dict`
+        :type values: ``dict``
+        :return: the statistics
+        :rtype: :class:`~nodedge.dats.channel_statistics.ChannelStatistics`
+        """
+        kwargs: Dict[str, Any] = {}
+        for field in cls.FIELDS:
+            value = values.get(field)
+            if field in ("nanCount", "count"):
+                kwargs[field] = int(value or 0)
+            else:
+                kwargs[field] = math.nan if value is None else float(value)
+        return cls(**kwargs)
+
+
+class _StatisticsAccumulator:
+    """
+    Accumulate the statistics of a channel read chunk by chunk.
+
+    The mean and the sum of the squared deviations from the mean of each chunk are
+    merged with the parallel algorithm of Chan et al., which keeps the standard
+    deviation accurate for channels with a large offset, e.g. timestamps.
+    """
+
+    def __init__(self):
+        self.tMin = math.nan
+        self.tMax = math.nan
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self.squaredDeviationsSum = 0.0
+        self.validCount = 0
+        self.nanCount = 0
+        self.count = 0
+
+    def add(self, timestamps: np.ndarray, samples: np.ndarray) -> None:
+        if len(samples) == 0:
+            return
+        if self.count == 0:
+            self.tMin = float(timestamps[0])
+        self.tMax = float(timestamps[-1])
+        self.count += len(samples)
+
+        samples = samples.astype(np.float64, copy=False)
+        valid = samples[~np.isnan(samples)]
+        self.nanCount += len(samples) - len(valid)
+        if len(valid) == 0:
+            return
+
+        self.min = min(self.min, float(valid.min()))
+        self.max = max(self.max, float(valid.max()))
+
+        chunkCount = len(valid)
+        chunkMean = float(valid.mean())
+        deviations = valid - chunkMean
+        chunkSquaredDeviationsSum = float(np.dot(deviations, deviations))
+
+        count = self.validCount + chunkCount
+        delta = chunkMean - self.mean
+        self.mean += delta * chunkCount / count
+        self.squaredDeviationsSum += (
+            chunkSquaredDeviationsSum
+            + delta * delta * self.validCount * chunkCount / count
+        )
+        self.validCount = count
+
+    def statistics(self) -> ChannelStatistics:
+        if self.validCount == 0:
+            return ChannelStatistics(
+                self.tMin, self.tMax, nanCount=self.nanCount, count=self.count
+            )
+
+        return ChannelStatistics(
+            self.tMin,
+            self.tMax,
+            self.min,
+            self.max,
+            self.mean,
+            math.sqrt(self.squaredDeviationsSum / self.validCount),
+            self.nanCount,
+            self.count,
+        )
+
+
+def computeStatistics(signal: asammdfSignal) -> Optional[ChannelStatistics]:
+    """
+    :param signal: signal already loaded in memory, e.g. a derived curve
+    :type signal: ``asammdfSignal``
+    :return: statistics of the signal, ``None`` if its samples are not numeric
+    :rtype: ``Optional[ChannelStatistics]``
+    """
+    if not np.issubdtype(signal.samples.dtype, np.number) or signal.samples.ndim != 1:
+        return None
+    accumulator = _StatisticsAccumulator()
+    accumulator.add(signal.timestamps, signal.samples)
+    return accumulator.statistics()
+
+
+def computeLogStatistics(
+    log: MDF, names: Iterable[str], isCancelled: Callable[[], bool] = lambda: False
+) -> Dict[str, ChannelStatistics]:
+    """
+    Compute the statistics of channels of a log, reading them chunk by chunk so that
+    the memory does not grow with the length of the log.
+
+    :param log: log containing the channels
+    :type log: ``MDF``
+    :param names: names of the channels
+    :type names: ``Iterable[str]``
+    :param isCancelled: function returning ``True`` when the computation must stop
+    :type isCancelled: ``Callable[[], bool]``
+    :return: statistics of the numeric channels, indexed by name
+    :rtype: ``Dict[str, ChannelStatistics]``
+    """
+    statistics: Dict[str, ChannelStatistics] = {}
+    for name in names:
+        if isCancelled():
+            break
+        try:
+            group, index = log.channels_db[name][0]
+            recordsCount = log.groups[group].channel_group.cycles_nr
+        except (KeyError, IndexError, AttributeError) as e:
+            logger.debug(f"No statistics for {name}: {e}")
+            continue
+
+        accumulator = _StatisticsAccumulator()
+        try:
+            for recordOffset in range(0, max(recordsCount, 1), CHUNK_RECORDS):
+                signal = log.get(
+                    name,
+                    group,
+                    index,
+                    record_offset=recordOffset,
+                    record_count=CHUNK_RECORDS,
+                )
+                samples = signal.samples
+                if not np.issubdtype(samples.dtype, np.number) or samples.ndim != 1:
+                    break
+                accumulator.add(signal.timestamps, samples)
+            else:
+                statistics[name] = accumulator.statistics()
+        except Exception as e:
+            logger.warning(f"No statistics for {name}: {e}")
+
+    return statistics
+
+
+def sidecarPath(log: MDF) -> Optional[Path]:
+    """
+    :param log: log to retrieve the statistics cache file of
+    :type log: ``MDF``
+    :return: path of the cache file, ``None`` if the log has not been read from a file
+    :rtype: ``Optional[Path]``
+    """
+    # Logs built in memory are named after a file which does not exist.
+    path = Path(log.original_name or log.name)
+    if not path.is_file():
+        return None
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def _fileSignature(path: Path) -> dict:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def readSidecar(log: MDF) -> Optional[Dict[str, ChannelStatistics]]:
+    """
+    Read the statistics of a log from its cache file.
+
+    :param log: log to read the statistics of
+    :type log: ``MDF``
+    :return: cached statistics, ``None`` if there is no up to date cache file
+    :rtype: ``Optional[Dict[str, ChannelStatistics]]``
+    """
+    path = sidecarPath(log)
+    if path is None or not path.is_file():
+        return None
+    try:
+        with open(path) as file:
+            data = json.load(file)
+        logPath = Path(log.original_name or log.name)
+        if data.get("version") != SIDECAR_VERSION or data.get("file") != _fileSignature(
+            logPath
+        ):
+            return None
+        return {
+            name: ChannelStatistics.from_dict(values)
+            for name, values in data["channels"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Cannot read statistics cache {path}: {e}")
+        return None
+
+
+def writeSidecar(log: MDF, statistics: Dict[str, ChannelStatistics]) -> None:
+    """
+    Write the statistics of a log in its cache file, if the log comes from a file.
+
+    :param log: log the statistics have been computed for
+    :type log: ``MDF``
+    :param statistics: statistics indexed by channel name
+    :type statistics: ``Dict[str, ChannelStatistics]``
+    """
+    path = sidecarPath(log)
+    if path is None:
+        return
+    data = {
+        "version": SIDECAR_VERSION,
+        "file": _fileSignature(Path(log.original_name or log.name)),
+        "channels": {name: s.as_dict() for name, s in statistics.items()},
+    }
+    try:
+        with open(path, "w") as file:
+            json.dump(data, file)
+    except OSError as e:
+        logger.warning(f"Cannot write statistics cache {path}: {e}")
+
+
+class StatisticsWorkerSignals(QObject):
+    """
+    Signals emitted by :class:`~nodedge.dats.channel_statistics.StatisticsWorker`.
+
+    result
+        log and statistics indexed by channel name
+
+    error
+        log and tuple (exctype, value, traceback.format_exc() )
+    """
+
+    result = Signal(object, object)
+    error = Signal(object, tuple)
+
+
+class StatisticsWorker(QRunnable):
+    """
+    :class:`~nodedge.dats.channel_statistics.StatisticsWorker` class
+
+    Compute the statistics of a log read from a file in a thread of the pool.
+
+    ``MDF`` objects are not thread safe, even to be read: the worker opens its own
+    instance of the file.
+    """
+
+    def __init__(self, log: MDF, names: Iterable[str]):
+        super().__init__()
+        self.log: MDF = log
+        self.names = list(names)
+        self.cancelled: bool = False
+        self.signals = StatisticsWorkerSignals()
+
+    @Slot()
+    def run(self):
+        try:
+            with MDF(self.log.original_name or self.log.name) as log:
+                statistics = computeLogStatistics(
+                    log, self.names, lambda: self.cancelled
+                )
+        except Exception:
+            traceback.print_exc()
+            exctype, value = sys.exc_info()[:2]
+            self.signals.error.emit(self.log, (exctype, value, traceback.format_exc()))
+        else:
+            if not self.cancelled:
+                self.signals.result.emit(self.log, statistics)
+
+
+class ChannelStatisticsIndex(QObject):
+    """
+    :class:`~nodedge.dats.channel_statistics.ChannelStatisticsIndex` class
+
+    Statistics of the channels of the opened logs.
+
+    Statistics are read from the cache file of the log when it is up to date.
+    Otherwise, they are computed once in a background pass and written to the cache
+    file. Logs built in memory, e.g. from CSV files, cannot be shared with a thread:
+    their statistics are computed in the calling thread, like the ones of the
+    derived curves, which are summarized on demand.
+    """
+
+    #: emitted with the log when its statistics are available
+    statisticsUpdated = Signal(object)
+
+    def __init__(self, parent=None, threadPool: Optional[QThreadPool] = None):
+        super().__init__(parent)
+        self.threadPool: QThreadPool = threadPool or QThreadPool.globalInstance()
+        self._statistics: (
+            "weakref.WeakKeyDictionary[MDF, Dict[str, ChannelStatistics]]"
+        ) = weakref.WeakKeyDictionary()
+        self._workers: "weakref.WeakKeyDictionary[MDF, StatisticsWorker]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self, log: Optional[MDF], name: str) -> Optional[ChannelStatistics]:
+        """
+        :param log: log containing the channel
+        :type log: ``Optional[MDF]``
+        :param name: name of the channel
+        :type name: ``str``
+        :return: statistics of the channel, ``None`` if they are not available yet
+        :rtype: ``Optional[ChannelStatistics]``
+        """
+        if log is None:
+            return None
+        return self._statistics.get(log, {}).get(name)
+
+    def statistics(self, log: Optional[MDF]) -> Dict[str, ChannelStatistics]:
+        """
+        :param log: log to retrieve the statistics of
+        :type log: ``Optional[MDF]``
+        :return: available statistics of the log, indexed by channel name
+        :rtype: ``Dict[str, ChannelStatistics]``
+        """
+        if log is None:
+            return {}
+        return self._statistics.get(log, {})
+
+    def setSignal(self, log: MDF, signal: asammdfSignal) -> Optional[ChannelStatistics]:
+        """
+        Summarize a signal which is already in memory, e.g. a derived curve.
+
+        :param log: log the signal belongs to
+        :type log: ``MDF``
+        :param signal: the signal
+        :type signal: ``asammdfSignal``
+        :return: statistics of the signal
+        :rtype: ``Optional[ChannelStatistics]``
+        """
+        statistics = computeStatistics(signal)
+        if statistics is not None:
+            self._statistics.setdefault(log, {})[signal.name] = statistics
+        return statistics
+
+    def invalidate(self, names: Iterable[str]) -> None:
+        """
+        Forget the statistics of the given signals in every log, e.g. when the
+        formula of a derived curve changes.
+
+        :param names: names of the signals
+        :type names: ``Iterable[str]``
+        """
+        names = set(names)
+        for statistics in self._statistics.values():
+            for name in names:
+                statistics.pop(name, None)
+
+    def update(self, log: Optional[MDF], names: Iterable[str]) -> bool:
+        """
+        Make the statistics of the given channels available.
+
+        :param log: log containing the channels
+        :type log: ``Optional[MDF]``
+        :param names: names of the raw channels
+        :type names: ``Iterable[str]``
+        :return: ``True`` if the statistics are available right away, ``False`` if
+            they are computed in background, only for logs read from a file
+        :rtype: ``bool``
+        """
+        if log is None:
+            return True
+        known = self._statistics.setdefault(log, {})
+        missingNames = [name for name in names if name not in known]
+        if not missingNames:
+            return True
+
+        cached = readSidecar(log)
+        if cached is not None:
+            known.update(cached)
+            missingNames = [name for name in missingNames if name not in known]
+            if not missingNames:
+                self.statisticsUpdated.emit(log)
+                return True
+
+        if sidecarPath(log) is None:
+            known.update(computeLogStatistics(log, missingNames))
+            self.statisticsUpdated.emit(log)
+            return True
+
+        if log in self._workers:
+            return False
+
+        worker = StatisticsWorker(log, missingNames)
+        worker.signals.result.connect(self.onWorkerResult)
+        worker.signals.error.connect(self.onWorkerError)
+        self._workers[log] = worker
+        self.threadPool.start(worker)
+        return False
+
+    def onWorkerResult(self, log: MDF, statistics: Dict[str, ChannelStatistics]):
+        self._workers.pop(log, None)
+        known = self._statistics.setdefault(log, {})
+        known.update(statistics)
+        # Derived curves depend on the configuration, they are not cached with the log.
+        writeSidecar(
+            log, {name: s for name, s in known.items() if name in log.channels_db}
+        )
+        self.statisticsUpdated.emit(log)
+
+    def onWorkerError(self, log: MDF, error: tuple):
+        # The statistics are computed again at the next update.
+        self._workers.pop(log, None)
+        logger.warning(f"Cannot compute the statistics of the channels: {error[1]}")
+
+    def waitForDone(self, msecs: int = -1) -> bool:
+        """
+        Wait for the background passes to finish.
+
+        :param msecs: timeout in milliseconds, -1 to wait without timeout
+        :type msecs: ``int``
+        :return: ``True`` if all the passes have finished
+        :rtype: ``bool``
+        """
+        return self.threadPool.waitForDone(msecs)
+
+    def cancel(self) -> None:
+        """
+        Stop the background passes.
+        """
+        for worker in self._workers.values():
+            worker.cancelled = True
+        self._workers = weakref.WeakKeyDictionary()
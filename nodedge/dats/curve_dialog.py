@@ -3,7 +3,7 @@ import logging
 import re
 from string import ascii_letters, digits
 
-from asammdf import MDF, Signal
+from asammdf import MDF
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -22,7 +22,6 @@ from PySide6.QtWidgets import (
 )
 
 from nodedge import utils
-from nodedge.dats.formula_evaluator import evaluateFormula
 from nodedge.dats.logs_list_widget import LogsListWidget
 from nodedge.dats.signals_list_widget import SignalsListWidget
 
@@ -49,7 +48,7 @@ class CurveLineEdit(QLineEdit):
         super().__init__(parent)
         self.parent = parent
         self.setPlaceholderText("Enter curve name")
-        self.signals = signals
+        self.signals = set(signals)
 
         self.textChanged.connect(self.updateTextFont)
 
@@ -129,7 +128,7 @@ class CurveDialog(QDialog):
         # signals = list(set(signals).difference(createdSignals))
 
         self.signalsWidget = SignalsListWidget(signals=signals)
-        self.signalsWidget.itemDoubleClicked.connect(self.onSignalDoubleClicked)
+        self.signalsWidget.doubleClicked.connect(self.onSignalDoubleClicked)
 
         self.logsWidget.logSelected.connect(self.signalsWidget.updateList)
 
@@ -182,6 +181,10 @@ class CurveDialog(QDialog):
         self.rateSpin.setValue(1)
         self.rateLayout.addWidget(self.rateSpin)
 
+        self.resampleCheck = QCheckBox("Resample at this rate")
+        self.resampleCheck.setChecked(False)
+        self.rateLayout.addWidget(self.resampleCheck)
+
         self.filterCheck = QCheckBox("Low pass filter")
         self.filterCheck.setChecked(False)
         self.filterCheck.stateChanged.connect(self.onFilterCheckChanged)
@@ -197,7 +200,8 @@ class CurveDialog(QDialog):
 
         self.filterOrderSpin = QSpinBox()
         self.filterOrderSpin.setPrefix("Order: ")
-        self.filterOrderSpin.setRange(0, 8)
+        # Filters are designed as second-order sections, stable at high orders.
+        self.filterOrderSpin.setRange(0, 16)
         self.filterOrderSpin.setSingleStep(1)
         self.filterOrderSpin.setValue(1)
         self.filterOrderSpin.setEnabled(False)
@@ -249,54 +253,38 @@ class CurveDialog(QDialog):
 
         log: MDF = self.logsWidget.logs[logName]
 
-        signals = self.signalsWidget.signals
-
-        newSignal: Signal = evaluateFormula(curveName, curveFormula, signals, log)
-
-        if self.filterCheck.isChecked():
-            newSignal.samples = utils.butterLowpassFilter(
-                newSignal.samples, curveFilter, curveRate, orderFilter
-            )
-        log.append([newSignal])
-        tupleSignals = [
-            (channel, group[0][0])
-            for channel, group in log.channels_db.items()
-            if channel != self.initialCurveName
-        ]
-
-        self.signalsWidget.signals.append(curveName)
-        if self.initialCurveName is not None:
-            log = log.filter(tupleSignals)
-
-        self.parent.logsWidget.logsListWidget.logs[logName] = log
-
         if self.initialCurveName is not None:
             del self.parent.curveConfig[self.initialCurveName]
-        self.parent.curveConfig.update(
-            {
-                curveName: {
-                    "formula": curveFormula,
-                    "unit": curveUnit,
-                    "rate": curveRate,
-                    "filter": curveFilter,
-                    "typeRate": curveTypeRate,
-                }
-            }
-        )
+        curveConfig = {
+            "formula": curveFormula,
+            "unit": curveUnit,
+            "rate": curveRate,
+            "filter": curveFilter,
+            "typeRate": curveTypeRate,
+        }
+        if self.resampleCheck.isChecked():
+            curveConfig["resample"] = True
+        if self.filterCheck.isChecked():
+            curveConfig["filterOrder"] = orderFilter
+        self.parent.curveConfig.update({curveName: curveConfig})
+
+        # Only the edited curve and the curves depending on it are recomputed.
+        self.parent.updateDerivedCurves(log)
         self.parent.signalsWidget.signalsTableWidget.updateItems(log)
         self.parent.replaceCurve(self.initialCurveName, curveName)
 
-    def onSignalDoubleClicked(self, item):
+    def onSignalDoubleClicked(self, index):
+        signalName = self.signalsWidget.signalsModel.nameAt(index.row())
         # Automatically set the name only if it is empty
         if self.curveNameEdit.text() == "":
-            curveName = item.text()
+            curveName = signalName
 
             alreadyExistingNames = self.signalsWidget.signals
             logger.debug(f"Already existing names: {alreadyExistingNames}")
             curveName = utils.setNewTitle(curveName, alreadyExistingNames)
 
             self.curveNameEdit.setText(curveName)
-        self.curveFormulaEdit.setText(self.curveFormulaEdit.toPlainText() + item.text())
+        self.curveFormulaEdit.setText(self.curveFormulaEdit.toPlainText() + signalName)
 
     def onUnitDomainChanged(self, text):
         self.unitCombo.clear()
@@ -23,10 +23,13 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from nodedge.dats.channel_statistics import ChannelStatisticsIndex
 from nodedge.dats.curve_dialog import CurveDialog
-from nodedge.dats.formula_evaluator import evaluateFormula
+from nodedge.dats.derived_curves_graph import DerivedCurvesGraph
+from nodedge.dats.log_comparison import LogComparison, TimeAlignment
 from nodedge.dats.logs_widget import LogsWidget
 from nodedge.dats.n_plot_data_item import NDataCurve
+from nodedge.dats.signals_table_model import channelNames
 from nodedge.dats.signals_widget import SignalsWidget
 from nodedge.dats.workbooks_tab_widget import WorkbooksTabWidget
 from nodedge.dats.worksheets_tab_widget import WorksheetsTabWidget
@@ -49,6 +52,9 @@ class DatsWindow(QMainWindow):
 
         self.recentFiles: List[str] = []
         self.curveConfig = {}
+        self.derivedCurves = DerivedCurvesGraph()
+        self.channelStatistics = ChannelStatisticsIndex(self)
+        self.channelStatistics.statisticsUpdated.connect(self.onStatisticsUpdated)
 
         self.workbooksTabWidget = WorkbooksTabWidget(self)
         self.mainWidget = QWidget()
@@ -66,7 +72,7 @@ class DatsWindow(QMainWindow):
         self.signalsDock.setWidget(self.signalsWidget)
         self.signalsDock.setWidget(self.signalsWidget)
         self.signalsWidget.plotSelectedSignals.connect(self.onPlotSelectedItems)
-        self.signalsWidget.signalsTableWidget.itemClicked.connect(
+        self.signalsWidget.signalsTableWidget.clicked.connect(
             self.onSignalTableItemClicked
         )
 
@@ -123,8 +129,9 @@ class DatsWindow(QMainWindow):
         self._configPath = path
         self.setConfigPathLabelText()
 
-    def onSignalTableItemClicked(self, item):
-        if item.text() in self.curveConfig:
+    def onSignalTableItemClicked(self, index):
+        signalName = self.signalsWidget.signalsTableWidget.signalNameAt(index)
+        if signalName in self.curveConfig:
             self.modifySignalAct.setEnabled(True)
         else:
             self.modifySignalAct.setEnabled(False)
@@ -192,6 +199,7 @@ class DatsWindow(QMainWindow):
         ret = self.maybeSave()
 
         if ret:
+            self.channelStatistics.cancel()
             event.accept()
         else:
             event.ignore()
@@ -241,6 +249,14 @@ class DatsWindow(QMainWindow):
 
         layoutConfig = config["layout"]
 
+        self.curveConfig = config["curves"]
+
+        if self.logsWidget.logsListWidget.logs:
+            item = self.logsWidget.logsListWidget.currentItem()
+            log = self.logsWidget.logsListWidget.logs[item.text()]
+            self.updateDerivedCurves(log)
+            self.signalsWidget.signalsTableWidget.updateItems(log)
+
         self.workbooksTabWidget.clear()
         # self.workbooksTabWidget.removeWorkbook(0)
         for workbookname, workbookConfig in layoutConfig.items():
@@ -280,20 +296,6 @@ class DatsWindow(QMainWindow):
                             worksheet.addDataItem(dataItem, signalName)
                 item = item + 1
 
-        self.curveConfig = config["curves"]
-
-        if self.logsWidget.logsListWidget.logs:
-            item = self.logsWidget.logsListWidget.currentItem()
-            log = self.logsWidget.logsListWidget.logs[item.text()]
-            for curveName in self.curveConfig:
-                formula = self.curveConfig[curveName]["formula"]
-                signals = self.signalsWidget.signalsTableWidget.signals
-
-                newSignal = evaluateFormula(curveName, formula, signals, log)
-
-                log.append(newSignal)
-            self.signalsWidget.signalsTableWidget.updateItems(log)
-
     def closeConfiguration(self):
         self.maybeSave()
         self.modifiedConfig = False
@@ -303,11 +305,7 @@ class DatsWindow(QMainWindow):
 
         self.workbooksTabWidget.addWorkbook()
 
-    def onPlotSelectedItems(self, items):
-        channelNames = []
-        for item in items:
-            channelNames.append(item.text())
-
+    def onPlotSelectedItems(self, channelNames):
         self.plotCurves(channelNames)
 
     def plotCurves(self, channelNames):
@@ -325,12 +323,63 @@ class DatsWindow(QMainWindow):
                 continue
 
             try:
-                channel: Channel = log.get(name)
+                channel: Channel = self.getChannel(log, name)
             except Exception as e:
                 channelIndex, channelGroup = log.channels_db[name][0]
                 channel: Channel = log.get(name, channelIndex, channelGroup)
 
-            w.addCurvePlot(channel.timestamps, channel.samples, channel.name)
+            w.addCurvePlot(
+                channel.timestamps,
+                channel.samples,
+                channel.name,
+                self.channelStatistics.get(log, name),
+            )
+
+    def getChannel(self, log: MDF, name: str):
+        """
+        Retrieve a channel of a log, or the derived curve computed for this log.
+
+        :param log: log containing the raw channels
+        :type log: ``MDF``
+        :param name: name of the channel or of the derived curve
+        :type name: ``str``
+        :return: the channel samples and timestamps
+        :rtype: ``Signal``
+        """
+        derivedCurve = self.derivedCurves.get(log, name)
+        if derivedCurve is not None:
+            return derivedCurve
+
+        return log.get(name)
+
+    def updateDerivedCurves(self, log: MDF) -> bool:
+        """
+        Compute the derived curves of the configuration for the given log.
+
+        Only the curves which have been modified since the last call, and the curves
+        depending on them, are recomputed. The other ones are taken from the cache.
+
+        :param log: log the curves are computed for
+        :type log: ``MDF``
+        :return: ``True`` if all the curves have been computed, ``False`` otherwise
+        :rtype: ``bool``
+        """
+        invalidatedNames = self.derivedCurves.setCurveConfig(self.curveConfig)
+        self.channelStatistics.invalidate(invalidatedNames)
+        errors = self.derivedCurves.update(log, log.get)
+        for name in self.derivedCurves.computedCurveNames(log):
+            if self.channelStatistics.get(log, name) is None:
+                self.channelStatistics.setSignal(log, self.derivedCurves.get(log, name))
+
+        if errors:
+            details = "\n".join(f"{name}: {error}" for name, error in errors.items())
+            QMessageBox.warning(
+                self,
+                "Error",
+                f"Error evaluating formula for curves:\n{details}",
+            )
+
+        return not errors
 
     # noinspection PyArgumentList, PyAttributeOutsideInit
     def createActions(self) -> None:
@@ -458,6 +507,28 @@ class DatsWindow(QMainWindow):
             QKeySequence("Ctrl+Shift+Delete"),
         )
 
+        self.compareLogsAct = self.createAction(
+            "&Compare logs",
+            self.compareLogs,
+            "Overlay the selected variables of the selected data files",
+            QKeySequence("Ctrl+Shift+C"),
+        )
+
+        self.alignStartTimeAct = self.createAction(
+            "&Align logs on start time",
+            self.onAlignStartTimeToggled,
+            "Align compared data files on their start time instead of their "
+            "first sample",
+            QKeySequence("Ctrl+Shift+A"),
+        )
+        self.alignStartTimeAct.setCheckable(True)
+
+        self.clearComparisonAct = self.createAction(
+            "C&lear comparison",
+            self.clearComparison,
+            "Remove the compared curves from the current plot",
+        )
+
         self.helpAct = self.createAction(
             "&Help", self.onHelp, "Help", QKeySequence("F1")
         )
@@ -483,6 +554,61 @@ class DatsWindow(QMainWindow):
             return
         nPlotWidget.plotItem.vb.closeCurrentSubPlot()
 
+    def currentPlotWidget(self):
+        worksheet = self.workbooksTabWidget.currentWidget()
+        if not worksheet:
+            return None
+        return worksheet.currentWidget()
+
+    @property
+    def timeAlignment(self) -> TimeAlignment:
+        if self.alignStartTimeAct.isChecked():
+            return TimeAlignment.StartTime
+        return TimeAlignment.Relative
+
+    def compareLogs(self):
+        """
+        Overlay the selected variables of all the selected data files in the current
+        plot, aligned in time.
+        """
+        nPlotWidget = self.currentPlotWidget()
+        if nPlotWidget is None:
+            return
+
+        logsListWidget = self.logsWidget.logsListWidget
+        logNames = [item.text() for item in logsListWidget.selectedItems()]
+        channelNames = self.signalsWidget.signalsTableWidget.selectedSignalNames()
+        if len(logNames) < 2 or not channelNames:
+            self.statusBar().showMessage(
+                "Select at least two data files and one variable to compare them",
+                timeout=5000,
+            )
+            return
+
+        comparison = getattr(nPlotWidget, "logComparison", None)
+        if comparison is None:
+            comparison = LogComparison(nPlotWidget, self.timeAlignment)
+            nPlotWidget.logComparison = comparison
+
+        for logName in logNames:
+            for channelName in channelNames:
+                comparison.addChannel(
+                    logsListWidget.logs[logName], logName, channelName
+                )
+
+    def onAlignStartTimeToggled(self):
+        for workbook in self.workbooksTabWidget.workbooks:
+            for worksheet in workbook.worksheets:
+                comparison = getattr(worksheet, "logComparison", None)
+                if comparison is not None:
+                    comparison.alignment = self.timeAlignment
+
+    def clearComparison(self):
+        nPlotWidget = self.currentPlotWidget()
+        comparison = getattr(nPlotWidget, "logComparison", None)
+        if comparison is not None:
+            comparison.clear()
+
     def closeLog(self):
         for item in self.logsWidget.logsListWidget.selectedItems():
             self.logsWidget.logsListWidget.logs.pop(item.text())
@@ -519,7 +645,7 @@ class DatsWindow(QMainWindow):
         self.modifiedConfig = True
 
     def modifySignal(self):
-        curveName = self.signalsWidget.signalsTableWidget.selectedItems()[0].text()
+        curveName = self.signalsWidget.signalsTableWidget.selectedSignalNames()[0]
         curveConfig = self.curveConfig[curveName]
         w: CurveDialog = CurveDialog(self, curveName, curveConfig)
         w.show()
@@ -620,6 +746,10 @@ class DatsWindow(QMainWindow):
         self.toolsMenu.addAction(self.delAct)
         self.toolsMenu.addAction(self.createSignalAct)
         self.toolsMenu.addAction(self.modifySignalAct)
+        self.toolsMenu.addSeparator()
+        self.toolsMenu.addAction(self.compareLogsAct)
+        self.toolsMenu.addAction(self.alignStartTimeAct)
+        self.toolsMenu.addAction(self.clearComparisonAct)
 
     # noinspection PyArgumentList, PyAttributeOutsideInit
     def createFileMenu(self):
@@ -780,30 +910,45 @@ class DatsWindow(QMainWindow):
             return
         self.openLog(sender.statusTip())
 
-    def updateDataItems(self, log: Optional[MDF]):
-        self.signalsWidget.signalsTableWidget.updateItems(log)
+    def onStatisticsUpdated(self, log: MDF):
+        """
+        Show the statistics computed in background, if their log is still the
+        current one.
 
-        if log is not None:
-            for curveName in self.curveConfig:
-                formula = self.curveConfig[curveName]["formula"]
-                signals = self.signalsWidget.signalsTableWidget.signals
-
-                newSignal = evaluateFormula(curveName, formula, signals, log)
-
-                if newSignal is None:
-                    ret = QMessageBox.warning(
-                        self,
-                        "Error",
-                        f"Error evaluating formula for curve {curveName}.\n Do you want to continue computing curves?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    )
-
-                    if ret == QMessageBox.StandardButton.No:
-                        break
-                    elif ret == QMessageBox.StandardButton.Yes:
-                        continue
-
-                log.append(newSignal)
+        :param log: log the statistics have been computed for
+        :type log: ``MDF``
+        """
+        signalsTableWidget = self.signalsWidget.signalsTableWidget
+        if signalsTableWidget.log is not log:
+            return
+        signalsTableWidget.signalsModel.setStatistics(
+            self.channelStatistics.statistics(log)
+        )
+        self.updateLimits(log)
+
+    def updateLimits(self, log: Optional[MDF]):
+        """
+        Update the axes limits of all the worksheets from the statistics of the
+        plotted channels.
+
+        :param log: log the plotted channels come from
+        :type log: ``Optional[MDF]``
+        """
+        for workbook in self.workbooksTabWidget.workbooks:
+            for worksheet in workbook.worksheets:
+                reset = True
+                for plotItem in worksheet.plotItems:
+                    for curveName, curve in plotItem.vb.curves.items():
+                        if not curve.isVisible():
+                            continue
+                        curve.statistics = self.channelStatistics.get(log, curveName)
+                        worksheet.updateLimitsFromOtherItem(curve, reset=reset)
+                        reset = False
+
+    def updateDataItems(self, log: Optional[MDF]):
+        if log is not None and log.channels_db:
+            self.updateDerivedCurves(log)
+            self.channelStatistics.update(log, channelNames(log))
         self.signalsWidget.signalsTableWidget.updateItems(log)
         lastFoundDataItem = NDataCurve()
         lastFoundDataItem.setData(x=[0, 1], y=[0, 1])
@@ -815,11 +960,14 @@ class DatsWindow(QMainWindow):
                     vb = plotItem.vb
                     for curveName, curve in vb.curves.items():
                         try:
-                            data = log.get(curveName)
+                            data = self.getChannel(log, curveName)
                             curve.show()
                             curve.setData(
                                 x=data.timestamps, y=data.samples, name=data.name
                             )
+                            curve.statistics = self.channelStatistics.get(
+                                log, curveName
+                            )
                             worksheet.updateLimitsFromOtherItem(curve)
                             lastFoundDataItem = curve
                         except (MdfException, AttributeError) as e:
@@ -889,7 +1037,11 @@ class DatsWindow(QMainWindow):
 
     def readSettings(self):
         settings = QSettings(self.companyName, self.productName)
-        self.recentFiles = list(settings.value("recent_files", []))
+        # An empty list is saved as an invalid value, read as None.
+        recentFiles = settings.value("recent_files", []) or []
+        if isinstance(recentFiles, str):
+            recentFiles = [recentFiles]
+        self.recentFiles = list(recentFiles)
 
     def writeSettings(self):
         self.writeRecentFilesSettings()
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Derived curves graph module containing
+:class:`~nodedge.dats.derived_curves_graph.DerivedCurvesGraph` class.
+"""
+
+import logging
+import os
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+from asammdf import MDF, Signal
+
+from nodedge.dats.formula_evaluator import FormulaError, computeFormula, formulaNames
+from nodedge.dats.signal_processing import processCurve
+
+logger = logging.getLogger(__name__)
+
+
+class DerivedCurvesGraph:
+    """
+    :class:`~nodedge.dats.derived_curves_graph.DerivedCurvesGraph` class
+
+    Dependency graph between derived curves (defined by a formula in the curve
+    configuration) and the raw channels of the logs.
+
+    Computed curves are cached per log, outside of the ``MDF`` object. When the
+    configuration of a curve changes, only this curve and the curves downstream of it
+    are invalidated. Curves which do not depend on each other are evaluated in
+    parallel.
+    """
+
+    def __init__(self, maxWorkers: Optional[int] = None):
+        self.maxWorkers: int = maxWorkers or os.cpu_count() or 1
+
+        self._definitions: Dict[str, dict] = {}
+        self._dependencies: Dict[str, List[str]] = {}
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+
+        # Logs are weakly referenced, so closing a log releases its cached curves.
+        self._cache: "weakref.WeakKeyDictionary[MDF, Dict[str, Signal]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def curveNames(self) -> List[str]:
+        """
+        :return: names of the derived curves, in configuration order
+        :rtype: ``List[str]``
+        """
+        return list(self._definitions.keys())
+
+    def dependencies(self, curveName: str) -> List[str]:
+        """
+        :param curveName: name of the derived curve
+        :type curveName: ``str``
+        :return: names of the channels and curves used in the curve formula
+        :rtype: ``List[str]``
+        """
+        return self._dependencies.get(curveName, [])
+
+    def setCurveConfig(self, curveConfig: Dict[str, dict]) -> Set[str]:
+        """
+        Synchronize the graph with the curve configuration of
+        :class:`~nodedge.dats.dats_window.DatsWindow`.
+
+        Curves whose definition has changed, has been added or removed are
+        invalidated, together with all the curves downstream of them.
+
+        :param curveConfig: curve configuration, indexed by curve name
+        :type curveConfig: ``Dict[str, dict]``
+        :return: names of the invalidated curves
+        :rtype: ``Set[str]``
+        """
+        changedNames: Set[str] = set()
+        for name in list(self._definitions.keys()):
+            if name not in curveConfig:
+                changedNames.add(name)
+        for name, definition in curveConfig.items():
+            if self._definitions.get(name) != definition:
+                changedNames.add(name)
+
+        if not changedNames:
+            return set()
+
+        # Invalidate with the old dependencies, so that the former dependents of a
+        # removed or renamed curve are recomputed too.
+        invalidatedNames = self.downstream(changedNames)
+
+        self._definitions = {name: dict(d) for name, d in curveConfig.items()}
+        self._dependencies = {
+            name: formulaNames(definition["formula"])
+            for name, definition in self._definitions.items()
+        }
+        self._dependents = defaultdict(set)
+        for name, dependencies in self._dependencies.items():
+            for dependency in dependencies:
+                self._dependents[dependency].add(name)
+
+        invalidatedNames |= self.downstream(changedNames)
+        self.invalidate(invalidatedNames)
+
+        return invalidatedNames
+
+    def downstream(self, names: Iterable[str]) -> Set[str]:
+        """
+        Retrieve the derived curves which depend, directly or not, on the given
+        channels or curves.
+
+        :param names: names of channels or curves
+        :type names: ``Iterable[str]``
+        :return: names of the given derived curves and of all their dependents
+        :rtype: ``Set[str]``
+        """
+        visited: Set[str] = set()
+        toVisit = list(names)
+        while toVisit:
+            name = toVisit.pop()
+            if name in visited:
+                continue
+            visited.add(name)
+            toVisit.extend(self._dependents.get(name, ()))
+
+        return {name for name in visited if name in self._definitions}
+
+    def invalidate(self, names: Iterable[str]) -> None:
+        """
+        Remove the given curves from the cache of every log.
+
+        :param names: names of the curves to invalidate
+        :type names: ``Iterable[str]``
+        """
+        names = set(names)
+        for curves in self._cache.values():
+            for name in names:
+                curves.pop(name, None)
+
+    def evaluationLevels(self, names: Iterable[str]) -> List[List[str]]:
+        """
+        Order the given derived curves in levels. All the curves of a level only
+        depend on raw channels and on curves of the previous levels, so they can be
+        evaluated in parallel.
+
+        Curves which are part of a dependency cycle are not returned.
+
+        :param names: names of the derived curves to order
+        :type names: ``Iterable[str]``
+        :return: curves names, grouped by level
+        :rtype: ``List[List[str]]``
+        """
+        names = set(names)
+        inDegrees: Dict[str, int] = {
+            name: sum(1 for d in self.dependencies(name) if d in names)
+            for name in names
+        }
+        level = sorted(name for name, degree in inDegrees.items() if degree == 0)
+        levels: List[List[str]] = []
+        while level:
+            levels.append(level)
+            nextLevel = []
+            for name in level:
+                for dependent in self._dependents.get(name, ()):
+                    if dependent not in inDegrees:
+                        continue
+                    inDegrees[dependent] -= 1
+                    if inDegrees[dependent] == 0:
+                        nextLevel.append(dependent)
+            level = sorted(nextLevel)
+
+        return levels
+
+    def get(self, log: MDF, curveName: str) -> Optional[Signal]:
+        """
+        :param log: log the curve has been computed for
+        :type log: ``MDF``
+        :param curveName: name of the derived curve
+        :type curveName: ``str``
+        :return: cached curve or ``None`` if it has not been computed for this log
+        :rtype: ``Optional[Signal]``
+        """
+        return self._cache.get(log, {}).get(curveName)
+
+    def computedCurveNames(self, log: MDF) -> List[str]:
+        """
+        :param log: log the curves have been computed for
+        :type log: ``MDF``
+        :return: names of the curves available in cache for this log
+        :rtype: ``List[str]``
+        """
+        return list(self._cache.get(log, {}).keys())
+
+    def update(self, log: MDF, getChannel: Callable[[str], Signal]) -> Dict[str, str]:
+        """
+        Compute the derived curves which are not in the cache of the given log.
+
+        Raw channels are fetched on the calling thread, since ``MDF`` objects are not
+        thread safe. Formulas of a same level are then evaluated in a thread pool.
+
+        :param log: log to compute the curves for
+        :type log: ``MDF``
+        :param getChannel: function retrieving a raw channel of the log by name
+        :type getChannel: ``Callable[[str], Signal]``
+        :return: error message of each curve which could not be computed
+        :rtype: ``Dict[str, str]``
+        """
+        curves = self._cache.setdefault(log, {})
+        errors: Dict[str, str] = {}
+        channels: Dict[str, Signal] = {}
+
+        missingNames = [name for name in self._definitions if name not in curves]
+        levels = self.evaluationLevels(missingNames)
+
+        orderedNames = {name for level in levels for name in level}
+        for name in missingNames:
+            if name not in orderedNames:
+                errors[name] = "Circular dependency between curves"
+
+        for level in levels:
+            toEvaluate: Dict[str, Dict[str, Signal]] = {}
+            for name in level:
+                inputs = {}
+                for dependency in self.dependencies(name):
+                    if dependency in self._definitions:
+                        if dependency not in curves:
+                            errors[name] = f"Curve {dependency} could not be computed"
+                            break
+                        inputs[dependency] = curves[dependency]
+                        continue
+
+                    if dependency not in channels:
+                        try:
+                            channels[dependency] = getChannel(dependency)
+                        except Exception as e:
+                            logger.warning(e)
+                            errors[name] = f"Signal {dependency} not found"
+                            break
+                    inputs[dependency] = channels[dependency]
+                else:
+                    toEvaluate[name] = inputs
+
+            results: Dict[str, Union[Signal, BaseException]] = {}
+            if len(toEvaluate) > 1 and self.maxWorkers > 1:
+                with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+                    futures = {
+                        name: executor.submit(self._evaluate, name, inputs)
+                        for name, inputs in toEvaluate.items()
+                    }
+                    for name, future in futures.items():
+                        error = future.exception()
+                        results[name] = error if error is not None else future.result()
+            else:
+                for name, inputs in toEvaluate.items():
+                    try:
+                        results[name] = self._evaluate(name, inputs)
+                    except Exception as e:
+                        results[name] = e
+
+            for name, result in results.items():
+                if isinstance(result, BaseException):
+                    errors[name] = str(result)
+                else:
+                    curves[name] = result
+
+        return errors
+
+    def _evaluate(self, curveName: str, channels: Dict[str, Signal]) -> Signal:
+        definition = self._definitions[curveName]
+        newSignal = computeFormula(curveName, definition["formula"], channels)
+
+        try:
+            return processCurve(newSignal, definition)
+        except ValueError as e:
+            raise FormulaError(f"Error filtering curve: {e}")
@@ -1,5 +1,6 @@
 import logging
 import re
+from typing import Dict, List
 
 from asammdf import Signal
 from asammdf.blocks.utils import MdfException
@@ -7,54 +8,98 @@ from asammdf.blocks.v4_blocks import Channel
 from PySide6.QtWidgets import QMessageBox
 
 
-def evaluateFormula(curveName, curveFormula, signals, log):
-    curveFormulaNames = re.findall(r"[a-zA-Z0-9_]+", curveFormula)
-    curveFormulaOperators = re.findall(r"[^a-zA-Z0-9_]+", curveFormula)
+class FormulaError(Exception):
+    """
+    :class:`~nodedge.dats.formula_evaluator.FormulaError` class
+
+    If a curve formula cannot be evaluated, raise this error.
+    """
+
+    pass
+
 
-    curveFormulaNames = [i for i in curveFormulaNames if i != ""]
+def formulaNames(curveFormula: str) -> List[str]:
+    """
+    Extract the names of the channels used in a curve formula.
 
-    for c in curveFormulaNames:
-        if c.isdigit():
-            curveFormulaNames.remove(c)
+    :param curveFormula: formula of the curve, e.g. ``signal1 + 2 * signal2``
+    :type curveFormula: ``str``
+    :return: names in order of appearance, without duplicates nor numbers
+    :rtype: ``List[str]``
+    """
+    names: List[str] = []
+    for name in re.findall(r"[a-zA-Z0-9_]+", curveFormula):
+        if name.isdigit() or name in names:
             continue
-        if c not in signals:
-            QMessageBox.warning(None, "Error", f"Signal {c} not found")
-            return
+        names.append(name)
+    return names
+
 
-    # evaluateFormula()
+def computeFormula(
+    curveName: str, curveFormula: str, channels: Dict[str, Signal]
+) -> Signal:
+    """
+    Evaluate a curve formula from already loaded channels.
 
-    # timestampsUnion = np.array([], dtype=np.float64)
-    # for name in curveFormulaNames:
-    #     channel: Channel = log.get(name)
-    #     channel.samples = channel.samples.astype(np.float64)
-    #     channel.timestamps = channel.timestamps.astype(np.float64)
-    #     timestampsUnion = np.union1d(timestampsUnion, channel.timestamps)
-    # timestampsUnion.sort()
+    This function does not touch the GUI, nor the log the channels come from,
+    so it can safely be called from a worker thread.
+
+    :param curveName: name of the resulting curve
+    :type curveName: ``str``
+    :param curveFormula: formula of the curve
+    :type curveFormula: ``str``
+    :param channels: channels used in the formula, indexed by name
+    :type channels: ``Dict[str, Signal]``
+    :return: the computed curve
+    :rtype: ``Signal``
+    :raises: :class:`~nodedge.dats.formula_evaluator.FormulaError` if a channel is
+        missing or the formula is invalid.
+    """
+    namespace = {}
+    for i, name in enumerate(formulaNames(curveFormula)):
+        if name not in channels:
+            raise FormulaError(f"Signal {name} not found")
+        channel = channels[name]
+        if i == 0:
+            channel = Signal(
+                samples=channel.samples[0:-2],
+                timestamps=channel.timestamps[0:-2],
+                name=channel.name,
+                unit=channel.unit,
+            )
+        namespace[name] = channel
+
+    try:
+        newSignal: Signal = eval(curveFormula, {}, namespace)
+    except Exception as e:
+        raise FormulaError(f"Error evaluating formula: {e}")
+
+    if not isinstance(newSignal, Signal):
+        raise FormulaError(f"Formula {curveFormula} does not result in a signal")
+
+    newSignal.name = curveName
+
+    return newSignal
+
+
+def evaluateFormula(curveName, curveFormula, signals, log):
+    channels = {}
+    for name in formulaNames(curveFormula):
+        if name not in signals:
+            QMessageBox.warning(None, "Error", f"Signal {name} not found")
+            return
 
-    # interpolatedSamples = np.zeros(
-    #     (len(timestampsUnion), len(curveFormulaNames)), dtype=np.float64
-    # )
-    for i, name in enumerate(curveFormulaNames):
         try:
             channel: Channel = log.get(name)
         except MdfException as e:
             logging.warning(e)
             return
-
-        # interpolatedSamples[:, i] = np.interp(
-        #     timestampsUnion, channel.timestamps, channel.samples
-        # )
-        if i == 0:
-            channel.samples = channel.samples[0:-2]
-            channel.timestamps = channel.timestamps[0:-2]
-        exec(f"{name} = channel")
+        channels[name] = channel
 
     try:
-        newSignal: Signal = eval(curveFormula)
-    except Exception as e:
-        QMessageBox.warning(None, "Error", f"Error evaluating formula: {e}")
+        newSignal = computeFormula(curveName, curveFormula, channels)
+    except FormulaError as e:
+        QMessageBox.warning(None, "Error", f"{e}")
         return
 
-    newSignal.name = curveName
-
     return newSignal
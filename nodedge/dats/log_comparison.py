@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Log comparison module containing
+:class:`~nodedge.dats.log_comparison.ChannelEnvelope` and
+:class:`~nodedge.dats.log_comparison.LogComparison` classes.
+"""
+import logging
+import math
+from enum import IntEnum
+from typing import List, Optional, Tuple
+
+import numpy as np
+from asammdf import MDF
+from PySide6.QtCore import QObject, QTimer
+
+from nodedge.dats.n_plot_data_item import NDataCurve
+
+logger = logging.getLogger(__name__)
+
+# Number of bins of the envelope kept in memory for each compared channel.
+ENVELOPE_BINS = 4096
+# Maximum number of records read at once from a log.
+CHUNK_RECORDS = 1_000_000
+# Above this number of visible records, the in-memory envelope is drawn.
+MAX_WINDOW_RECORDS = 500_000
+# Delay before reloading the visible window, to coalesce zoom and pan events.
+UPDATE_DELAY_MS = 50
+
+
+class TimeAlignment(IntEnum):
+    """
+    Time alignment of compared logs.
+    """
+
+    #: Each channel starts at 0 s.
+    Relative = 0
+    #: Channels are shifted according to the start time of their log.
+    StartTime = 1
+
+
+def computeEnvelope(
+    timestamps: np.ndarray, samples: np.ndarray, binsCount: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a signal to the min/max envelope of ``binsCount`` bins.
+
+    Each bin is drawn as a vertical segment between its minimum and its maximum, so
+    the envelope looks like the original signal at the plot resolution.
+
+    :param timestamps: timestamps of the signal
+    :type timestamps: ``np.ndarray``
+    :param samples: samples of the signal
+    :type samples: ``np.ndarray``
+    :param binsCount: number of bins of the envelope
+    :type binsCount: ``int``
+    :return: interleaved timestamps and interleaved min/max samples
+    :rtype: ``Tuple[np.ndarray, np.ndarray]``
+    """
+    if len(samples) <= 2 * binsCount:
+        return timestamps, samples
+
+    step = math.ceil(len(samples) / binsCount)
+    starts = np.arange(0, len(samples), step)
+    return _interleave(
+        timestamps[starts],
+        np.minimum.reduceat(samples, starts),
+        np.maximum.reduceat(samples, starts),
+    )
+
+
+def _interleave(binStarts, mins, maxs) -> Tuple[np.ndarray, np.ndarray]:
+    x = np.repeat(binStarts, 2)
+    y = np.empty(2 * len(mins), dtype=np.result_type(mins, maxs))
+    y[0::2] = mins
+    y[1::2] = maxs
+    return x, y
+
+
+class ChannelEnvelope:
+    """
+    :class:`~nodedge.dats.log_comparison.ChannelEnvelope` class
+
+    Give access to a channel of a log at the plot resolution, without keeping its
+    samples in memory.
+
+    A coarse min/max envelope of the whole channel is computed once, reading the log
+    chunk by chunk. When the user zooms in, only the records of the visible window are
+    read again from the log.
+    """
+
+    def __init__(self, log: MDF, logName: str, channelName: str):
+        self.log: MDF = log
+        self.logName: str = logName
+        self.channelName: str = channelName
+
+        self._group, self._index = log.channels_db[channelName][0]
+        self.recordsCount: int = log.groups[self._group].channel_group.cycles_nr
+
+        self.step: int = max(1, math.ceil(self.recordsCount / ENVELOPE_BINS))
+        binsCount = math.ceil(self.recordsCount / self.step)
+        self.binStarts: np.ndarray = np.empty(binsCount, dtype=np.float64)
+        self.mins: np.ndarray = np.empty(binsCount, dtype=np.float64)
+        self.maxs: np.ndarray = np.empty(binsCount, dtype=np.float64)
+        self.lastTimestamp: float = 0.0
+
+        self._computeCoarseEnvelope()
+
+    @property
+    def firstTimestamp(self) -> float:
+        """
+        :return: timestamp of the first record of the channel
+        :rtype: ``float``
+        """
+        return float(self.binStarts[0]) if len(self.binStarts) else 0.0
+
+    def _read(self, recordOffset: int, recordCount: int):
+        return self.log.get(
+            self.channelName,
+            self._group,
+            self._index,
+            record_offset=recordOffset,
+            record_count=recordCount,
+        )
+
+    def _computeCoarseEnvelope(self) -> None:
+        chunkRecords = self.step * max(1, CHUNK_RECORDS // self.step)
+        binIndex = 0
+        for recordOffset in range(0, self.recordsCount, chunkRecords):
+            signal = self._read(recordOffset, chunkRecords)
+            samples = signal.samples
+            if not np.issubdtype(samples.dtype, np.number):
+                raise ValueError(f"Channel {self.channelName} is not numeric")
+
+            starts = np.arange(0, len(samples), self.step)
+            nextBinIndex = binIndex + len(starts)
+            self.binStarts[binIndex:nextBinIndex] = signal.timestamps[starts]
+            self.mins[binIndex:nextBinIndex] = np.minimum.reduceat(samples, starts)
+            self.maxs[binIndex:nextBinIndex] = np.maximum.reduceat(samples, starts)
+            binIndex = nextBinIndex
+
+            if len(signal.timestamps):
+                self.lastTimestamp = float(signal.timestamps[-1])
+
+        self.binStarts = self.binStarts[:binIndex]
+        self.mins = self.mins[:binIndex]
+        self.maxs = self.maxs[:binIndex]
+
+    def window(
+        self, tMin: float, tMax: float, binsCount: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve the channel between two timestamps at the given resolution.
+
+        :param tMin: start of the window, in the log time base
+        :type tMin: ``float``
+        :param tMax: end of the window, in the log time base
+        :type tMax: ``float``
+        :param binsCount: number of bins, typically the plot width in pixels
+        :type binsCount: ``int``
+        :return: timestamps and samples to draw
+        :rtype: ``Tuple[np.ndarray, np.ndarray]``
+        """
+        firstBin = max(0, int(np.searchsorted(self.binStarts, tMin, "right")) - 1)
+        lastBin = min(
+            len(self.binStarts), int(np.searchsorted(self.binStarts, tMax, "right"))
+        )
+        if lastBin <= firstBin:
+            return np.array([]), np.array([])
+
+        recordOffset = firstBin * self.step
+        recordCount = min(lastBin * self.step, self.recordsCount) - recordOffset
+        if self.step > 1 and recordCount <= MAX_WINDOW_RECORDS:
+            signal = self._read(recordOffset, recordCount)
+            return computeEnvelope(signal.timestamps, signal.samples, binsCount)
+
+        binStarts = self.binStarts[firstBin:lastBin]
+        mins = self.mins[firstBin:lastBin]
+        maxs = self.maxs[firstBin:lastBin]
+        if len(binStarts) > binsCount:
+            starts = np.arange(0, len(binStarts), math.ceil(len(binStarts) / binsCount))
+            binStarts = binStarts[starts]
+            mins = np.minimum.reduceat(mins, starts)
+            maxs = np.maximum.reduceat(maxs, starts)
+        if self.step == 1:
+            # Bins contain a single record: draw the samples themselves.
+            return binStarts, mins
+        return _interleave(binStarts, mins, maxs)
+
+
+class LogComparison(QObject):
+    """
+    :class:`~nodedge.dats.log_comparison.LogComparison` class
+
+    Overlay the same channels of several logs in a
+    :class:`~nodedge.dats.n_plot_widget.NPlotWidget`.
+
+    Every log is aligned in time, either relatively to its first record or according
+    to its start time. Curves are downsampled envelopes which are reloaded for the
+    visible window only, so the memory does not grow with the length of the logs.
+    """
+
+    def __init__(self, plotWidget: "NPlotWidget", alignment=TimeAlignment.Relative):  # type: ignore
+        super().__init__(plotWidget)
+        self.plotWidget = plotWidget
+        self.plotItem = plotWidget.focusedPlotItem
+        self._alignment: TimeAlignment = alignment
+        self.envelopes: List[ChannelEnvelope] = []
+        self.curves: List[NDataCurve] = []
+
+        self._updateTimer = QTimer(self)
+        self._updateTimer.setSingleShot(True)
+        self._updateTimer.setInterval(UPDATE_DELAY_MS)
+        self._updateTimer.timeout.connect(self.update)
+        self.plotItem.vb.sigXRangeChanged.connect(self._updateTimer.start)
+
+    @property
+    def alignment(self) -> TimeAlignment:
+        """
+        :getter: return the time alignment of the compared logs
+        :setter: set the time alignment and redraw the curves
+        :type: :class:`~nodedge.dats.log_comparison.TimeAlignment`
+        """
+        return self._alignment
+
+    @alignment.setter
+    def alignment(self, value: TimeAlignment):
+        self._alignment = value
+        self.update(updateLimits=True)
+        self.plotItem.vb.autoRange()
+
+    def offset(self, envelope: ChannelEnvelope) -> float:
+        """
+        :param envelope: compared channel
+        :type envelope: :class:`~nodedge.dats.log_comparison.ChannelEnvelope`
+        :return: offset to add to the channel timestamps to align it with the others
+        :rtype: ``float``
+        """
+        if self._alignment == TimeAlignment.Relative:
+            return -envelope.firstTimestamp
+
+        referenceStartTime = min(e.log.start_time for e in self.envelopes)
+        return float((envelope.log.start_time - referenceStartTime).total_seconds())
+
+    def addChannel(self, log: MDF, logName: str, channelName: str) -> Optional[str]:
+        """
+        Overlay a channel of a log.
+
+        :param log: log containing the channel
+        :type log: ``MDF``
+        :param logName: name of the log, shown in the legend
+        :type logName: ``str``
+        :param channelName: name of the channel
+        :type channelName: ``str``
+        :return: name of the curve, or ``None`` if the channel cannot be compared
+        :rtype: ``Optional[str]``
+        """
+        curveName = f"{logName}: {channelName}"
+        if any(curve.name() == curveName for curve in self.curves):
+            return None
+
+        try:
+            envelope = ChannelEnvelope(log, logName, channelName)
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Cannot compare {curveName}: {e}")
+            return None
+
+        colorIndex = len(self.curves)
+        curve = NDataCurve(
+            pen=({"color": (colorIndex, 13), "width": 1}),
+            skipFiniteCheck=True,
+            name=curveName,
+        )
+        self.envelopes.append(envelope)
+        self.curves.append(curve)
+        self.plotItem.addItem(curve)
+
+        self.update(updateLimits=True)
+
+        return curveName
+
+    def update(self, updateLimits: bool = False) -> None:
+        """
+        Reload the visible window of every compared channel.
+
+        :param updateLimits: if ``True``, the axes limits are extended to the whole
+            compared channels
+        :type updateLimits: ``bool``
+        """
+        if not self.curves:
+            return
+
+        xMin, xMax = self.plotItem.vb.viewRange()[0]
+        binsCount = max(100, int(self.plotItem.vb.width()))
+
+        for envelope, curve in zip(self.envelopes, self.curves):
+            offset = self.offset(envelope)
+            if updateLimits:
+                windowMin, windowMax = envelope.firstTimestamp, envelope.lastTimestamp
+            else:
+                windowMin, windowMax = xMin - offset, xMax - offset
+            x, y = envelope.window(windowMin, windowMax, binsCount)
+            curve.setData(x=x + offset, y=y)
+
+        if updateLimits:
+            self.plotWidget.updateLimitsFromOtherItem(self.curves[0], reset=True)
+            for curve in self.curves[1:]:
+                self.plotWidget.updateLimitsFromOtherItem(curve, reset=False)
+
+    def clear(self) -> None:
+        """
+        Remove all compared curves from the plot.
+        """
+        for curve in self.curves:
+            self.plotItem.removeItem(curve)
+        self.curves = []
+        self.envelopes = []
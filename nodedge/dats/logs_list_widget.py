@@ -11,6 +11,7 @@ from asammdf import Signal as asammdfSignal
 from PySide6.QtCore import QEvent, Signal
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QInputDialog,
     QListWidget,
     QListWidgetItem,
@@ -30,6 +31,8 @@ class LogsListWidget(QListWidget):
         super().__init__(parent)
 
         self.logs = {}
+        # Several logs can be selected to compare them.
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.addLogs(logs, prependDate=False)
 
         self.itemClicked.connect(self.onItemClicked)
@@ -1,10 +1,16 @@
+from typing import Optional
+
 from pyqtgraph import PlotDataItem
 from PySide6.QtGui import QMouseEvent
 
+from nodedge.dats.channel_statistics import ChannelStatistics
+
 
 class NDataCurve(PlotDataItem):
     def __init__(self, *args, **kargs):
         super().__init__(*args, **kargs)
+        # Precomputed statistics of the plotted channel, used for the axes limits.
+        self.statistics: Optional[ChannelStatistics] = None
 
     def mouseClickEvent(self, ev: QMouseEvent):
         super().mouseClickEvent(ev)
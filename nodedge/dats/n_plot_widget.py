@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pyqtgraph as pg
@@ -128,16 +128,37 @@ class NPlotWidget(GraphicsLayoutWidget):
             self.updateLimitsFromOtherItem(dataItem, reset=False)
         self.focusedPlotItem.vb.autoRange()
 
+    @staticmethod
+    def dataItemLimits(dataItem) -> Tuple[float, float, float, float]:
+        """
+        Retrieve the extent of a curve, from the precomputed statistics of its
+        channel when available, to avoid scanning its samples.
+
+        :param dataItem: the curve
+        :type dataItem: ``PlotDataItem``
+        :return: minimum and maximum on the x axis, then on the y axis
+        :rtype: ``Tuple[float, float, float, float]``
+        """
+        statistics = getattr(dataItem, "statistics", None)
+        if statistics is not None and not np.isnan(statistics.min):
+            return statistics.tMin, statistics.tMax, statistics.min, statistics.max
+
+        xData, yData = dataItem.xData, dataItem.yData
+        if xData is None or len(xData) == 0:
+            return np.NaN, np.NaN, np.NaN, np.NaN
+        return xData[0], xData[-1], np.nanmin(yData), np.nanmax(yData)
+
     def updateLimitsFromOtherItem(self, dataItem, reset=True):
+        xMin, xMax, yMin, yMax = self.dataItemLimits(dataItem)
         for item in self.plotItems:
             vb = item.vb
             if reset is True:
                 vb.xLimits = np.array([np.NaN, np.NaN])
                 vb.yLimits = np.array([np.NaN, np.NaN])
-            vb.xLimits[0] = min(np.min(dataItem.xData), vb.xLimits[0])
-            vb.xLimits[1] = max(np.max(dataItem.xData), vb.xLimits[1])
-            vb.yLimits[0] = min(np.min(dataItem.yData), vb.yLimits[0])
-            vb.yLimits[1] = max(np.max(dataItem.yData), vb.yLimits[1])
+            vb.xLimits[0] = min(xMin, vb.xLimits[0])
+            vb.xLimits[1] = max(xMax, vb.xLimits[1])
+            vb.yLimits[0] = min(yMin, vb.yLimits[0])
+            vb.yLimits[1] = max(yMax, vb.yLimits[1])
             yRange = max(vb.yLimits[1] - vb.yLimits[0], 1e-9)
             item.setLimits(
                 xMin=vb.xLimits[0],
@@ -185,17 +206,32 @@ class NPlotWidget(GraphicsLayoutWidget):
         vb: ViewBox = self.plotItem.vb
         mousePoint = vb.mapSceneToView(pos)
 
-        x = mousePoint.x()
+        self.updateLegendValues(mousePoint.x())
+
+        if self.plotItem.vb.highlightedCurve is None:
+            return
+
+    def updateLegendValues(self, x: float) -> None:
+        """
+        Show the value of every curve at the cursor position in the legends.
 
+        The legend items are used rather than the curves of the view boxes, so that
+        the curves overlaid by a log comparison get a value too.
+
+        :param x: cursor position on the time axis
+        :type x: ``float``
+        """
         for plotItem in self.plotItems:
-            for index, (name, item) in enumerate(plotItem.vb.curves.items()):
+            if plotItem.legend is None:
+                continue
+            for sample, label in plotItem.legend.items:
+                item = sample.item
                 xData = item.xData
                 yData = item.yData
+                if xData is None or len(xData) == 0:
+                    continue
                 i = np.argmin(abs(xData - x))
-                plotItem.legend.items[index][1].setText(f"{name}: {yData[i]:.2f}")
-
-        if self.plotItem.vb.highlightedCurve is None:
-            return
+                label.setText(f"{item.name()}: {yData[i]:.2f}")
 
     def as_dict(self):
         rep = {}
@@ -327,17 +363,10 @@ class NViewBox(pg.ViewBox):
         self.vLine.setPos(mousePoint.x())
         self.hLine.setPos(mousePoint.y())
 
-        x = mousePoint.x()
-
         if not self.nPlotWidget.items:
             return
 
-        for plotItem in self.nPlotWidget.plotItems:
-            for index, (name, item) in enumerate(plotItem.vb.curves.items()):
-                xData = item.xData
-                yData = item.yData
-                i = np.argmin(abs(xData - x))
-                plotItem.legend.items[index][1].setText(f"{name}: {yData[i]:.2f}")
+        self.nPlotWidget.updateLegendValues(mousePoint.x())
 
         if self.highlightedCurve is None:
             return
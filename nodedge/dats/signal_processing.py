@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Signal processing module applying the rate and filter settings of derived curves.
+
+Every stage works chunk by chunk on preallocated outputs, so that inputs can be
+memory-mapped arrays and the memory used does not depend on the signal length
+beyond the resulting curve itself.
+"""
+
+import logging
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+from asammdf import Signal
+from scipy.signal import sosfilt, sosfilt_zi
+
+from nodedge.utils import butterLowpassSos
+
+logger = logging.getLogger(__name__)
+
+# Number of samples processed at once.
+CHUNK_SAMPLES = 1 << 20
+# Resampling must not create curves larger than this number of samples.
+MAX_RESAMPLED_SAMPLES = 100_000_000
+
+
+def resample(
+    timestamps: np.ndarray,
+    samples: np.ndarray,
+    rate: float,
+    chunkSize: int = CHUNK_SAMPLES,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Linearly interpolate a signal on a uniform time grid.
+
+    :param timestamps: increasing timestamps of the signal, in seconds
+    :type timestamps: ``np.ndarray``
+    :param samples: samples of the signal
+    :type samples: ``np.ndarray``
+    :param rate: rate of the grid, in Hz
+    :type rate: ``float``
+    :param chunkSize: number of grid points interpolated at once
+    :type chunkSize: ``int``
+    :return: grid timestamps and interpolated samples
+    :rtype: ``Tuple[np.ndarray, np.ndarray]``
+    :raises: ``ValueError`` if the rate is not positive or creates too many samples
+    """
+    if not rate > 0:
+        raise ValueError(f"Rate must be positive, got {rate}")
+    if len(timestamps) == 0:
+        return np.array([], dtype=np.float64), np.array([], dtype=np.float64)
+
+    t0 = float(timestamps[0])
+    duration = float(timestamps[-1]) - t0
+    count = int(math.floor(duration * rate + 1e-9)) + 1
+    if count > MAX_RESAMPLED_SAMPLES:
+        raise ValueError(f"Resampling at {rate} Hz creates {count} samples")
+
+    grid = t0 + np.arange(count, dtype=np.float64) / rate
+    values = np.empty(count, dtype=np.float64)
+    for start in range(0, count, chunkSize):
+        stop = min(start + chunkSize, count)
+        first = max(int(np.searchsorted(timestamps, grid[start], "right")) - 1, 0)
+        last = int(np.searchsorted(timestamps, grid[stop - 1], "left")) + 1
+        values[start:stop] = np.interp(
+            grid[start:stop], timestamps[first:last], samples[first:last]
+        )
+
+    return grid, values
+
+
+def lowpassFilter(
+    samples: np.ndarray,
+    cutoff: float,
+    fs: float,
+    order: int,
+    zeroPhase: bool = True,
+    out: Optional[np.ndarray] = None,
+    chunkSize: int = CHUNK_SAMPLES,
+) -> np.ndarray:
+    """
+    Apply a Butterworth lowpass filter, designed as second-order sections.
+
+    The filter state is carried from one chunk to the next, starting from the
+    steady state for the first sample. With ``zeroPhase``, a backward pass cancels
+    the phase shift, like ``sosfiltfilt`` without padding.
+
+    :param samples: uniformly sampled signal
+    :type samples: ``np.ndarray``
+    :param cutoff: cut off frequency, in Hz
+    :type cutoff: ``float``
+    :param fs: sampling frequency, in Hz
+    :type fs: ``float``
+    :param order: order of the filter
+    :type order: ``int``
+    :param zeroPhase: if ``True``, filter forward and backward
+    :type zeroPhase: ``bool``
+    :param out: preallocated output, may be ``samples`` itself
+    :type out: ``Optional[np.ndarray]``
+    :param chunkSize: number of samples filtered at once
+    :type chunkSize: ``int``
+    :return: filtered samples
+    :rtype: ``np.ndarray``
+    """
+    if out is None:
+        out = np.empty(len(samples), dtype=np.float64)
+    if len(samples) == 0:
+        return out
+
+    sos = butterLowpassSos(cutoff, fs, order)
+    steadyState = sosfilt_zi(sos)
+
+    zi = steadyState * samples[0]
+    for start in range(0, len(samples), chunkSize):
+        stop = min(start + chunkSize, len(samples))
+        out[start:stop], zi = sosfilt(sos, samples[start:stop], zi=zi)
+
+    if zeroPhase:
+        zi = steadyState * out[-1]
+        for stop in range(len(out), 0, -chunkSize):
+            start = max(stop - chunkSize, 0)
+            filtered, zi = sosfilt(sos, out[start:stop][::-1], zi=zi)
+            out[start:stop] = filtered[::-1]
+
+    return out
+
+
+def processCurve(signal: Signal, curveConfig: dict) -> Signal:
+    """
+    Apply the rate and filter settings of a derived curve.
+
+    The curve is resampled at the configured rate when it is filtered, since the
+    filter is designed for this sampling frequency, or when ``resample`` is set.
+
+    :param signal: curve computed from its formula
+    :type signal: ``Signal``
+    :param curveConfig: configuration of the curve, see
+        :class:`~nodedge.dats.curve_dialog.CurveDialog`
+    :type curveConfig: ``dict``
+    :return: the processed curve, or the given one if there is nothing to do
+    :rtype: ``Signal``
+    :raises: ``ValueError`` if the settings cannot be applied
+    """
+    filterOrder = curveConfig.get("filterOrder", 0)
+    if not filterOrder and not curveConfig.get("resample", False):
+        return signal
+
+    rate = curveConfig["rate"]
+    timestamps, samples = resample(signal.timestamps, signal.samples, rate)
+    if filterOrder:
+        lowpassFilter(samples, curveConfig["filter"], rate, filterOrder, out=samples)
+
+    return Signal(
+        samples=samples,
+        timestamps=timestamps,
+        name=signal.name,
+        unit=signal.unit,
+    )
@@ -1,30 +1,31 @@
-from typing import Optional
+from typing import List, Optional
 
 from asammdf import MDF
-from PySide6.QtWidgets import QAbstractItemView, QListWidget
+from PySide6.QtWidgets import QAbstractItemView, QListView
 
+from nodedge.dats.signals_table_model import (
+    NAME_COLUMN,
+    SignalsTableModel,
+    channelNames,
+)
 
-class SignalsListWidget(QListWidget):
+
+class SignalsListWidget(QListView):
     def __init__(self, parent=None, signals=[]):
         super().__init__(parent)
 
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setUniformItemSizes(True)
 
-        self.signals = signals
-        self.addItems(self.signals)
-
-    def updateList(self, log: Optional[MDF]):
-        self.clear()
+        self.signalsModel: SignalsTableModel = SignalsTableModel(self)
+        self.setModel(self.signalsModel)
+        self.setModelColumn(NAME_COLUMN)
 
-        if log is None:
-            return
+        self.signalsModel.setSignals(signals)
 
-        signals = list(log.channels_db.keys())
-        signals = [c for c in signals if c[0:3] != "CAN"]
-        signals = [c for c in signals if c[0:3] != "LIN"]
-        signals = [c for c in signals if c != "time"]
+    @property
+    def signals(self) -> List[str]:
+        return self.signalsModel.signals
 
-        self.signals = signals
-        self.signals = sorted(self.signals)
-
-        self.addItems(self.signals)
+    def updateList(self, log: Optional[MDF]):
+        self.signalsModel.setSignals(channelNames(log))
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+Signals table model module containing
+:class:`~nodedge.dats.signals_table_model.SignalsTableModel` and
+:class:`~nodedge.dats.signals_table_model.SignalsSearchIndex` classes.
+"""
+
+import logging
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Union
+
+import numpy as np
+from asammdf import MDF
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QMimeData,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+)
+
+from nodedge.dats.channel_statistics import ChannelStatistics
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ["Type", "Name", "Min", "Max", "Mean", "Std", "NaN", "Rate [Hz]"]
+TYPE_COLUMN = 0
+NAME_COLUMN = 1
+# Statistics shown in the columns following the name column.
+STATISTICS_COLUMNS = ["min", "max", "mean", "std", "nanCount", "sampleRate"]
+FIRST_STATISTICS_COLUMN = 2
+
+EXCLUDED_PREFIXES = ("CAN", "LIN")
+EXCLUDED_NAMES = ("time",)
+
+REGEX_CHARACTERS = set("\\.^$*+?{}[]|()")
+
+
+def channelNames(log: Optional[MDF]) -> np.ndarray:
+    """
+    Retrieve the names of the channels of a log which can be plotted, i.e. without
+    the bus raw frames and the time channel.
+
+    :param log: log to retrieve the channels from
+    :type log: ``Optional[MDF]``
+    :return: sorted array of unique channel names
+    :rtype: ``np.ndarray``
+    """
+    if log is None or not log.channels_db:
+        return np.array([], dtype=str)
+
+    names = np.array(list(log.channels_db.keys()), dtype=str)
+    keep = ~np.char.startswith(names, EXCLUDED_PREFIXES[0])
+    for prefix in EXCLUDED_PREFIXES[1:]:
+        keep &= ~np.char.startswith(names, prefix)
+    keep &= ~np.isin(names, EXCLUDED_NAMES)
+
+    uniqueNames: np.ndarray = np.unique(names[keep])
+    return uniqueNames
+
+
+class SignalsSearchIndex:
+    """
+    :class:`~nodedge.dats.signals_table_model.SignalsSearchIndex` class
+
+    Case insensitive search index over a sorted array of signal names.
+
+    Prefix queries (starting with ``^``) are answered by a binary search.
+    Substring queries reuse the result of the previous query when the new query
+    refines it, which is the usual case while the user is typing.
+    Other regular expressions are matched against the names one by one.
+    """
+
+    def __init__(self, names: Optional[np.ndarray] = None):
+        self.setNames(np.array([], dtype=str) if names is None else names)
+
+    def setNames(self, names: np.ndarray) -> None:
+        """
+        Index new names.
+
+        :param names: array of signal names
+        :type names: ``np.ndarray``
+        """
+        self._lowerNames: np.ndarray = np.char.lower(names.astype(str))
+        self._sortedRows: np.ndarray = np.argsort(self._lowerNames, kind="stable")
+        self._sortedLowerNames: np.ndarray = self._lowerNames[self._sortedRows]
+        self._allRows: np.ndarray = np.arange(len(names))
+        self._lastQuery: str = ""
+        self._lastRows: np.ndarray = self._allRows
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        :param query: plain text, ``^prefix`` or regular expression
+        :type query: ``str``
+        :return: sorted rows of the names matching the query
+        :rtype: ``np.ndarray``
+        """
+        lowerQuery = query.lower()
+        if lowerQuery == "":
+            rows = self._allRows
+        elif lowerQuery[0] == "^" and not REGEX_CHARACTERS & set(lowerQuery[1:]):
+            rows = self._searchPrefix(lowerQuery[1:])
+        elif not REGEX_CHARACTERS & set(lowerQuery):
+            rows = self._searchSubstring(lowerQuery)
+        else:
+            rows = self._searchRegex(query)
+
+        self._lastQuery = lowerQuery
+        self._lastRows = rows
+        return rows
+
+    def _searchPrefix(self, prefix: str) -> np.ndarray:
+        start = np.searchsorted(self._sortedLowerNames, prefix, side="left")
+        # All names starting with the prefix are sorted before prefix + max char.
+        end = np.searchsorted(
+            self._sortedLowerNames, prefix + chr(0x10FFFF), side="left"
+        )
+        return np.sort(self._sortedRows[start:end])
+
+    def _searchSubstring(self, substring: str) -> np.ndarray:
+        isRefinement = (
+            self._lastQuery != ""
+            and not REGEX_CHARACTERS & set(self._lastQuery)
+            and self._lastQuery in substring
+        )
+        candidates = self._lastRows if isRefinement else self._allRows
+        if len(candidates) == 0:
+            return candidates
+        found = np.char.find(self._lowerNames[candidates], substring) >= 0
+        rows: np.ndarray = candidates[found]
+        return rows
+
+    def _searchRegex(self, pattern: str) -> np.ndarray:
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            return self._searchSubstring(pattern.lower())
+        matches = [row for row in self._allRows if regex.search(self._lowerNames[row])]
+        return np.array(matches, dtype=self._allRows.dtype)
+
+
+class SignalsTableModel(QAbstractTableModel):
+    """
+    :class:`~nodedge.dats.signals_table_model.SignalsTableModel` class
+
+    Table model listing the signals of a log, backed by a numpy array of names.
+
+    Nothing is created per row: the cells are computed when the view asks for them,
+    so only the visible rows cost anything. The rows can be filtered through a
+    :class:`~nodedge.dats.signals_table_model.SignalsSearchIndex`.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: np.ndarray = np.array([], dtype=str)
+        self._nameSet: Set[str] = set()
+        self._derivedNames: Set[str] = set()
+        self._rows: np.ndarray = np.array([], dtype=int)
+        self._filterText: str = ""
+        self._statistics: Dict[str, ChannelStatistics] = {}
+        self.searchIndex = SignalsSearchIndex()
+
+    @property
+    def signals(self) -> List[str]:
+        """
+        :return: names of all the signals, including the filtered out ones
+        :rtype: ``List[str]``
+        """
+        names: List[str] = self._names.tolist()
+        return names
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._nameSet
+
+    def setSignals(
+        self, names: Iterable[str], derivedNames: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Replace the signals listed by the model. The current filter is kept.
+
+        :param names: names of the signals
+        :type names: ``Iterable[str]``
+        :param derivedNames: names of the signals computed with a formula
+        :type derivedNames: ``Optional[Iterable[str]]``
+        """
+        self.beginResetModel()
+        if not isinstance(names, np.ndarray):
+            names = np.array(list(names), dtype=str)
+        self._names = names
+        self._nameSet = set(self._names.tolist())
+        self._derivedNames = set(derivedNames) if derivedNames is not None else set()
+        self.searchIndex.setNames(self._names)
+        self._rows = self.searchIndex.search(self._filterText)
+        self.endResetModel()
+
+    def setFilterText(self, text: str) -> None:
+        """
+        Only show the signals matching the text.
+
+        :param text: plain text, ``^prefix`` or regular expression
+        :type text: ``str``
+        """
+        self.beginResetModel()
+        self._filterText = text
+        self._rows = self.searchIndex.search(text)
+        self.endResetModel()
+
+    def setStatistics(self, statistics: Dict[str, ChannelStatistics]) -> None:
+        """
+        Show the statistics of the signals. Signals without statistics show empty
+        cells.
+
+        :param statistics: statistics indexed by signal name
+        :type statistics: ``Dict[str, ChannelStatistics]``
+        """
+        self._statistics = statistics
+        if len(self._rows) == 0:
+            return
+        self.dataChanged.emit(
+            self.index(0, FIRST_STATISTICS_COLUMN),
+            self.index(len(self._rows) - 1, len(COLUMNS) - 1),
+            [Qt.DisplayRole],
+        )
+
+    def nameAt(self, row: int) -> str:
+        """
+        :param row: row in the model, i.e. among the signals matching the filter
+        :type row: ``int``
+        :return: name of the signal shown at this row
+        :rtype: ``str``
+        """
+        return str(self._names[self._rows[row]])
+
+    def rowCount(
+        self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()
+    ) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(
+        self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()
+    ) -> int:
+        if parent.isValid():
+            return 0
+        return len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(
+        self, index: Union[QModelIndex, QPersistentModelIndex], role=Qt.DisplayRole
+    ):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+
+        name = self.nameAt(index.row())
+        if index.column() == TYPE_COLUMN:
+            isDerived = name in self._derivedNames
+            if role == Qt.DisplayRole:
+                return "ƒ" if isDerived else "~"
+            if role == Qt.ToolTipRole:
+                return "Computed with a formula" if isDerived else "Raw signal"
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+        elif index.column() == NAME_COLUMN:
+            if role in (Qt.DisplayRole, Qt.ToolTipRole):
+                return name
+        elif role == Qt.DisplayRole:
+            statistics = self._statistics.get(name)
+            if statistics is None:
+                return None
+            field = STATISTICS_COLUMNS[index.column() - FIRST_STATISTICS_COLUMN]
+            value = getattr(statistics, field)
+            if isinstance(value, int):
+                return str(value)
+            return "" if math.isnan(value) else f"{value:.4g}"
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignRight | Qt.AlignVCenter
+
+        return None
+
+    def flags(self, index: Union[QModelIndex, QPersistentModelIndex]):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def mimeTypes(self) -> List[str]:
+        return ["text/plain"]
+
+    def mimeData(self, indexes: Sequence[QModelIndex]) -> QMimeData:
+        rows = sorted({index.row() for index in indexes})
+        mimeData = QMimeData()
+        mimeData.setText("\n".join(self.nameAt(row) for row in rows))
+        return mimeData
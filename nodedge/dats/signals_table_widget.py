@@ -1,49 +1,75 @@
 import logging
 from typing import List, Optional
 
+import numpy as np
 from asammdf import MDF
-from PySide6.QtCore import QByteArray, QMimeData, Qt
-from PySide6.QtGui import QDrag, QKeyEvent
+from PySide6.QtCore import QModelIndex, Qt
+from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QHBoxLayout,
     QHeaderView,
+    QTableView,
     QTableWidget,
-    QTableWidgetItem,
     QWidget,
 )
 
-from nodedge.utils import dumpException
+from nodedge.dats.signals_table_model import (
+    COLUMNS,
+    FIRST_STATISTICS_COLUMN,
+    NAME_COLUMN,
+    TYPE_COLUMN,
+    SignalsTableModel,
+    channelNames,
+)
 
-COLUMNS = ["Type", "Name"]
+ROW_HEIGHT = 25
 
 logger = logging.getLogger(__name__)
 
 
-class SignalsTableWidget(QTableWidget):
-    def __init__(self, parent=None, curveConfig={}, log: MDF = None):
+class SignalsTableWidget(QTableView):
+    def __init__(self, parent=None, curveConfig={}, log: Optional[MDF] = None):
         super().__init__(parent)
         self._parent = parent
-        self.setColumnCount(len(COLUMNS))
-        self.setRowCount(1)
-        self.setHorizontalHeaderLabels(COLUMNS)
-        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
-        self.setColumnWidth(0, 40)
-        self.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-
+        self.signalsModel = SignalsTableModel(self)
+        self.setModel(self.signalsModel)
+
+        self.horizontalHeader().setSectionResizeMode(TYPE_COLUMN, QHeaderView.Fixed)
+        self.setColumnWidth(TYPE_COLUMN, 40)
+        self.horizontalHeader().setSectionResizeMode(NAME_COLUMN, QHeaderView.Stretch)
+        # Statistics columns have a fixed width: resizing to contents would query
+        # every row of the model.
+        for column in range(FIRST_STATISTICS_COLUMN, len(COLUMNS)):
+            self.horizontalHeader().setSectionResizeMode(
+                column, QHeaderView.Interactive
+            )
+            self.setColumnWidth(column, 70)
+
+        # Fixed row heights let the view lay out rows without querying the model.
         self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
         self.setShowGrid(False)
 
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.setDragEnabled(True)
-
-        self.cellClicked.connect(self.onCellClicked)
+        self.setDragDropMode(QAbstractItemView.DragOnly)
 
         self.log = log
-        self.signals: List[str] = []
         self.allSignals: List[str] = []
         self.updateItems(self.log)
 
+    @property
+    def signals(self) -> List[str]:
+        """
+        :return: names of the signals of the current log
+        :rtype: ``List[str]``
+        """
+        return self.signalsModel.signals
+
     def keyPressEvent(self, event: QKeyEvent) -> None:
         super().keyPressEvent(event)
         if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
@@ -55,75 +81,50 @@ class SignalsTableWidget(QTableWidget):
             self.multiSelectionMode = False
 
     def updateItems(self, log: Optional[MDF]):
-        self.clearContents()
-        self.setRowCount(0)
+        self.log = log
         if log is None:
+            self.signalsModel.setSignals([])
+            self.signalsModel.setStatistics({})
             return
-        signals = list(log.channels_db.keys())
 
         # TODO: Fix in case of multiple signals with the same name
-        # for s in signals:
-        #     if len(log.channels_db[s]) > 1:
-        #         for i in range(len(log.channels_db[s])):
-        #             signals.append(f"{s}_{log.channels_db[s][0]}")
-        signals = [c for c in signals if c[0:3] != "CAN"]
-        signals = [c for c in signals if c[0:3] != "LIN"]
-        signals = [c for c in signals if c != "time"]
+        signals = channelNames(log)
 
-        self.signals = sorted(signals)
+        # Derived curves are cached outside the log.
+        derivedNames = self._parent.derivedCurves.computedCurveNames(log)
+        if derivedNames:
+            signals = np.union1d(signals, derivedNames)
 
         configSignals = list(self._parent.curveConfig.keys())
-        self.allSignals = sorted(list(set(self.signals + configSignals)))
-
-        for signal in self.signals:
-            typeItem = QTableWidgetItem()
-            typeItem.setTextAlignment(Qt.AlignCenter)
-            typeItem.setFlags(typeItem.flags() & ~Qt.ItemIsEditable)
-
-            # The signal is computed with a formula.
-            if signal in configSignals:
-                typeItem.setText("ƒ")
-                typeItem.setToolTip("Computed with a formula")
-            else:
-                typeItem.setText("~")
-                typeItem.setToolTip("Raw signal")
-
-            nameItem = QTableWidgetItem()
-            nameItem.setFlags(nameItem.flags() & ~Qt.ItemIsEditable)
-            nameItem.setText(signal)
-
-            row = self.rowCount()
-            self.insertRow(row)
-            self.setRowHeight(row, 25)
-            self.setItem(row, 0, typeItem)
-            self.setItem(row, 1, nameItem)
-
-    def onCellClicked(self, row, column):
-        for item in self.selectedItems():
-            if item.column() != 1:
-                item.setSelected(False)
-                self.item(row, 1).setSelected(True)
-
-    def startDrag(self, supportedActions: Qt.DropAction) -> None:
-        try:
-            items = self.selectedItems()
-            itemsNames = [item.text() for item in items if item.column() == 1]
-            itemData = QByteArray()
-
-            mimeData = QMimeData()
-            mimeData.setData("text/plain", itemData)
-            mimeData.setText("\n".join(itemsNames))
-
-            drag = QDrag(self)
-            drag.setMimeData(mimeData)
-
-            drag.exec_(Qt.MoveAction)
-
-            for item in items:
-                item.setSelected(False)
-
-        except Exception as e:
-            dumpException(e)
+        self.signalsModel.setSignals(signals, configSignals)
+        self.signalsModel.setStatistics(self._parent.channelStatistics.statistics(log))
+        self.allSignals = sorted(set(self.signals + configSignals))
+
+    def setFilterText(self, text: str) -> None:
+        """
+        Only show the signals matching the text.
+
+        :param text: plain text, ``^prefix`` or regular expression
+        :type text: ``str``
+        """
+        self.signalsModel.setFilterText(text)
+
+    def signalNameAt(self, index: QModelIndex) -> str:
+        """
+        :param index: index of any cell of the row
+        :type index: ``QModelIndex``
+        :return: name of the signal shown at the row of the index
+        :rtype: ``str``
+        """
+        return self.signalsModel.nameAt(index.row())
+
+    def selectedSignalNames(self) -> List[str]:
+        """
+        :return: names of the selected signals, in display order
+        :rtype: ``List[str]``
+        """
+        rows = sorted(index.row() for index in self.selectionModel().selectedRows())
+        return [self.signalsModel.nameAt(row) for row in rows]
 
 
 class CurveWidget(QWidget):
@@ -28,22 +28,9 @@ class SignalsWidget(QWidget):
         self.setLayout(self.layout)
 
     def updateDisplay(self):
-        allItems = self.signalsTableWidget.findItems("", Qt.MatchContains)
-        for i in allItems:
-            if i is not None:
-                self.signalsTableWidget.setRowHidden(i.row(), True)
-        items = self.signalsTableWidget.findItems(
-            self.lineEdit.text(), Qt.MatchRegularExpression
-        )
-        for i in items:
-            if i is not None:
-                self.signalsTableWidget.setRowHidden(i.row(), False)
+        self.signalsTableWidget.setFilterText(self.lineEdit.text())
 
     def onButtonClicked(self):
-        items = self.signalsTableWidget.selectedItems()
+        names = self.signalsTableWidget.selectedSignalNames()
 
-        for i in items:
-            if i.column() != 1:
-                items.remove(i)
-
-        self.plotSelectedSignals.emit(items)
+        self.plotSelectedSignals.emit(names)
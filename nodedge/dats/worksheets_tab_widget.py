@@ -183,7 +183,7 @@ class WorksheetsTabWidget(QTabWidget):
 
         return act
 
-    def addCurvePlot(self, x, y, name=""):
+    def addCurvePlot(self, x, y, name="", statistics=None):
         index = self.currentIndex()
         plotWidget: NPlotWidget = self.worksheets[index]
         colorIndex = len(plotWidget.focusedPlotItem.vb.curves.keys())
@@ -197,6 +197,7 @@ class WorksheetsTabWidget(QTabWidget):
         )
 
         dataItem.setData(x=x, y=y, name=name)
+        dataItem.statistics = statistics
         plotWidget.addDataItem(dataItem, name)
         dataItem.getViewBox().setAutoPan(x=True, y=True)
 
@@ -8,6 +8,7 @@ from enum import IntEnum
 from typing import Callable, List, Optional
 
 from nodedge.connector import Socket
+from nodedge.edge_validators import edgeSignalsAreCompatible
 from nodedge.graphics_edge import (
     GraphicsEdge,
     GraphicsEdgeBezier,
@@ -44,6 +45,15 @@ class Edge(Serializable):
     edgeValidators: List[Callable] = []  #: class variable containing list of
     # registered edge validators
 
+    __slots__ = (
+        "id",
+        "_sourceSocket",
+        "_targetSocket",
+        "scene",
+        "_edgeType",
+        "graphicsEdge",
+    )
+
     def __init__(
         self,
         scene: "Scene",  # type: ignore
@@ -190,7 +200,7 @@ class Edge(Serializable):
     @isSelected.setter
     def isSelected(self, value: bool):
         self.graphicsEdge.setSelected(value)
-        self.graphicsEdge._lastSelectedState = value
+        self.graphicsEdge.selectedState = value
         if value is True:
             self.graphicsEdge.onSelected()
 
@@ -396,3 +406,7 @@ class Edge(Serializable):
         self.edgeType = data["edgeType"]
 
         return True
+
+
+# Edges only connect signals which can be combined.
+Edge.registerEdgeValidator(edgeSignalsAreCompatible)
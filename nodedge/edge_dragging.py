@@ -106,6 +106,14 @@ class EdgeDragging:
         self.dragEdge = None
 
         try:
+            if (
+                self.dragStartSocket is not None
+                and graphicsSocket is not None
+                and not Edge.validateEdge(self.dragStartSocket, graphicsSocket.socket)
+            ):
+                self.__logger.debug("Edge is not valid.")
+                return False
+
             if self.dragStartSocket is not None:
                 if not self.dragStartSocket.allowMultiEdges:
                     self.dragStartSocket.removeAllEdges()
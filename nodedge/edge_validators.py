@@ -16,8 +16,11 @@ file or on the application start with calling this:
     Edge.registerEdgeValidator(edgeCannotConnectTwoOutputsOrTwoInputs)
     Edge.registerEdgeValidator(edgeCannotConnectInputAndOutputOfSameNode)
 
+:func:`edgeSignalsAreCompatible` is registered by default.
 """
 
+import numpy as np
+
 from nodedge.connector import Socket
 
 DEBUG = False
@@ -77,3 +80,33 @@ def edgeCannotConnectInputAndOutputOfSameNode(
         return False
 
     return True
+
+
+def edgeSignalsAreCompatible(inputSocket: Socket, outputSocket: Socket) -> bool:
+    """Edge is invalid if it connects an elementwise node to a signal whose shape or
+    data type cannot be combined with the signals of the other inputs of the node"""
+    # The edge may be dragged from either end.
+    sourceSocket, targetSocket = inputSocket, outputSocket
+    if sourceSocket.isInput:
+        sourceSocket, targetSocket = targetSocket, sourceSocket
+    if sourceSocket.isInput or targetSocket.isOutput:
+        return True
+
+    node = targetSocket.node
+    if not getattr(node, "isElementwise", False) or sourceSocket.shape is None:
+        return True
+
+    shapes = [sourceSocket.shape]
+    dtypes = [np.dtype(sourceSocket.dtype)]
+    for socket in node.inputSockets:
+        if socket is not targetSocket and socket.shape is not None:
+            shapes.append(socket.shape)
+            dtypes.append(np.dtype(socket.dtype))
+    try:
+        np.broadcast_shapes(*shapes)
+        np.result_type(*dtypes)
+    except (ValueError, TypeError):
+        printError("Incompatible signals", shapes, dtypes)
+        return False
+
+    return True
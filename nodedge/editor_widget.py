@@ -18,7 +18,6 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from nodedge.blocks.block import Block
 from nodedge.edge import Edge, EdgeType
 from nodedge.graphics_view import GraphicsView
 from nodedge.node import Node
@@ -172,12 +171,15 @@ class EditorWidget(QWidget):
         self.filename = ""
         self.scene.history.clear()
 
-    def loadFile(self, filename: str) -> bool:
+    def loadFile(self, filename: str, data: Optional[dict] = None) -> bool:
         """
         Load serialized graph from JSON file.
 
         :param filename: file to load
         :type filename: ``str``
+        :param data: content of the file, if it has already been read with
+            :func:`~nodedge.scene.Scene.readFile`
+        :type data: ``Optional[dict]``
         :return: Operation success
         :rtype: ``bool``
         """
@@ -196,7 +198,7 @@ class EditorWidget(QWidget):
                     self.newFile()
                 else:
                     raise FileNotFoundError(f"File {filename} not found.")
-            self.scene.loadFromFile(filename)
+            self.scene.loadFromFile(filename, data)
             self.filename = filename
             # Don't store initial stamp because the file has still not been changed.
             self.scene.history.clear()
@@ -240,9 +242,7 @@ class EditorWidget(QWidget):
         """
         Evaluate all the nodes present in the scene.
         """
-        for node in self.scene.nodes:
-            if isinstance(node, Block):
-                node.eval()
+        self.scene.evalAllNodes()
 
     def mouseReleaseEvent(self, ev: QMouseEvent) -> None:
         """
@@ -335,4 +335,4 @@ class EditorWidget(QWidget):
         self.scene.setNodeClassSelector(lambda data: NNode)
         node = NNode(self.scene, "A Custom Node 1", inputSocketTypes=[0, 1, 2])
 
-        self.__logger.debug("Node content:", node.content)
+        self.__logger.debug(f"Node content: {node.content}")
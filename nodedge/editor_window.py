@@ -1,10 +1,9 @@
 """
 Editor window module containing :class:`~nodedge.editor_window.EditorWindow` class.
 """
-import json
 import logging
 import os
-from typing import Callable, Dict, List, Optional, Union, cast
+from typing import Callable, Dict, List, Optional, Tuple, Union, cast
 
 from PySide6.QtCore import QSettings, QSize, QStandardPaths, Qt, Signal
 from PySide6.QtGui import (
@@ -29,6 +28,7 @@ from PySide6.QtWidgets import (
 )
 
 from nodedge.editor_widget import EditorWidget
+from nodedge.scene_clipboard import fromMimeData, mimeDataKey, toMimeData
 from nodedge.scene_coder import SceneCoder
 from nodedge.solver_dialog import SolverDialog
 
@@ -75,6 +75,9 @@ class EditorWindow(QMainWindow):
         # Pycharm does not recognise resolve connect method so the inspection is
         # noinspection PyUnresolvedReferences
         self.clipboard.dataChanged.connect(self.onClipboardChanged)
+        # Last items copied from this window, with the key put on the clipboard.
+        self._clipboardData: Tuple[Optional[str], dict] = (None, {})
+        self._clipboardDataCount: int = 0
 
         self.lastActiveEditorWidget: Optional[EditorWidget] = None
         self.debugMode: bool = False
@@ -347,8 +350,12 @@ class EditorWindow(QMainWindow):
             return
         if hasattr(self.currentEditorWidget, "scene") is False:
             return
-        self.currentEditorWidget.scene.realTimeEval = checked
+        scene = self.currentEditorWidget.scene
+        scene.realTimeEval = checked
         if checked:
+            scene.evaluator.progressed.connect(
+                self.updateEvaluationProgress, Qt.UniqueConnection
+            )
             self.currentEditorWidget.evalNodes()
 
     def onHelp(self):
@@ -391,6 +398,7 @@ class EditorWindow(QMainWindow):
         )
 
     def updateProgressLabel(self, progress):
+        simulator = self.currentEditorWidget.scene.simulator
         totalSteps = self.currentEditorWidget.scene.simulator.totalSteps
         finalTime = self.currentEditorWidget.scene.simulator.config.finalTime
         currentTime = self.currentEditorWidget.scene.simulator.currentTimeStep
@@ -406,6 +414,25 @@ class EditorWindow(QMainWindow):
             f"{currentStep:.0E}/{totalSteps:.0E} [{percentProgress:.0E}]% [{stepsPerSecond:.0E} steps/s]"
         )
 
+        statistics = simulator.realTimeStatistics
+        if statistics is not None:
+            self.simulationProgressLabel.setText(
+                f"{self.simulationProgressLabel.text()} [{statistics.summary()}]"
+            )
+            self.simulationProgressLabel.setToolTip(
+                f"{self.simulationProgressLabel.toolTip()}\n{statistics.histogram()}"
+            )
+
+    def updateEvaluationProgress(self, evaluatedCount: int, totalCount: int) -> None:
+        if evaluatedCount == totalCount:
+            self.simulationProgressLabel.setText("")
+            self.simulationProgressBar.setValue(0)
+            return
+        self.simulationProgressBar.setValue(int(evaluatedCount / totalCount * 100))
+        self.simulationProgressLabel.setText(
+            f"Evaluation: {evaluatedCount}/{totalCount} blocks"
+        )
+
     def onShowGraph(self):
         QMessageBox.information(self, "Graph", "Show graph")
 
@@ -427,8 +454,7 @@ class EditorWindow(QMainWindow):
         dialog.showMaximized()
 
     def evaluateAllNodes(self):
-        for n in self.editorWidget.scene.nodes:
-            n.eval()
+        self.editorWidget.scene.evalAllNodes()
 
     # noinspection PyArgumentList, PyAttributeOutsideInit, DuplicatedCode
     def createMenus(self) -> None:
@@ -569,7 +595,8 @@ class EditorWindow(QMainWindow):
 
         :return: ``None``
         """
-        logger.debug(f"Clipboard changed: '{self.clipboard.text()}'")
+        # The content is not logged, as it can be large.
+        logger.debug("Clipboard changed.")
 
     def OnScenePosChanged(self, x: float, y: float):
         """
@@ -773,8 +800,7 @@ class EditorWindow(QMainWindow):
             data = self.currentEditorWidget.scene.clipboard.serializeSelected(
                 delete=True
             )
-            strData = json.dumps(data, indent=4)
-            self.clipboard.setText(strData)
+            self.setClipboardData(data)
 
     def copy(self) -> None:
         """
@@ -783,9 +809,20 @@ class EditorWindow(QMainWindow):
         logger.debug("Copying selected items")
         if self.currentEditorWidget:
             data = self.currentEditorWidget.scene.clipboard.serializeSelected()
-            strData = json.dumps(data, indent=4)
-            logger.debug(strData)
-            self.clipboard.setText(strData)
+            self.setClipboardData(data)
+
+    def setClipboardData(self, data: dict) -> None:
+        """
+        Put serialized items on the system clipboard. The data are also kept by the
+        window, so that pasting them in the same window does not decode them.
+
+        :param data: serialized items
+        :type data: ``dict``
+        """
+        self._clipboardDataCount += 1
+        key = f"{os.getpid()}:{id(self)}:{self._clipboardDataCount}"
+        self._clipboardData = (key, data)
+        self.clipboard.setMimeData(toMimeData(data, key))
 
     def paste(self):
         """
@@ -793,16 +830,12 @@ class EditorWindow(QMainWindow):
         """
         logger.debug("Pasting saved items in clipboard")
         if self.currentEditorWidget:
-            rawData = self.clipboard.text()
-            try:
-                data = json.loads(rawData)
-            except ValueError as e:
-                logger.debug(f"Pasting of not valid json data: {e}")
-                return
-
-            # Check if json data are correct
-            if "nodes" not in data:
-                logger.debug("JSON does not contain any blocks!")
+            mimeData = self.clipboard.mimeData()
+            key, data = self._clipboardData
+            if key is None or mimeDataKey(mimeData) != key:
+                data = fromMimeData(mimeData)
+                if data is None:
+                    return
 
             self.currentEditorWidget.scene.clipboard.deserialize(data)
 
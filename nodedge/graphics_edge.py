@@ -24,6 +24,8 @@ from PySide6.QtWidgets import (
 from nodedge.graphics_socket import getSocketColor
 from nodedge.utils import dumpException
 
+logger = logging.getLogger(__name__)
+
 
 class GraphicsEdge(QGraphicsPathItem):
     """:class:`~nodedge.graphics_edge.GraphicsEdge` class
@@ -45,9 +47,6 @@ class GraphicsEdge(QGraphicsPathItem):
         super().__init__(parent)
         self.edge = edge
 
-        self.__logger = logging.getLogger(__file__)
-        self.__logger.setLevel(logging.INFO)
-
         self._sourcePos: QPointF = QPointF(0.0, 0.0)
         self._targetPos: QPointF = QPointF(200.0, 200.0)
         self._middlePoints: List[QPointF] = []
@@ -71,6 +70,17 @@ class GraphicsEdge(QGraphicsPathItem):
     @selectedState.setter
     def selectedState(self, value):
         self._lastSelectedState = value
+        self.edge.scene.onItemSelectedStateChanged(self, value)
+
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
+        """
+        Override Qt method to keep the selection index of the scene up to date.
+        """
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self.edge.scene.onItemSelectedChanged(self, bool(value))
+        elif change == QGraphicsItem.ItemSceneChange:
+            self.edge.scene.onItemSelectedChanged(self, False)
+        return super().itemChange(change, value)
 
     @property
     def sourcePos(self):
@@ -180,7 +190,7 @@ class GraphicsEdge(QGraphicsPathItem):
         isSelected = self.isSelected()
         if self._lastSelectedState != isSelected:
             self.edge.scene.resetLastSelectedStates()
-            self._lastSelectedState = isSelected
+            self.selectedState = isSelected
             self.onSelected()
 
     def hoverEnterEvent(self, event: QGraphicsSceneHoverEvent) -> None:
@@ -274,13 +284,9 @@ class GraphicsEdge(QGraphicsPathItem):
 
         newColor = color if isinstance(color, QColor) else QColor(color)
 
-        self.__logger.debug(
-            "Change color to:",
-            newColor.red(),
-            newColor.green(),
-            newColor.blue(),
-            "on edge:",
-            self.edge,
+        logger.debug(
+            f"Change color to: {newColor.red()}, {newColor.green()}, "
+            f"{newColor.blue()} on edge: {self.edge}"
         )
 
         self._color = newColor
@@ -499,7 +505,7 @@ class GraphicsEdgeCircuit(GraphicsEdge):
             or self.edge.scene.lastSelectedItems != self.edge.scene.selectedItems
         ):
             self.edge.scene.resetLastSelectedStates()
-            self._lastSelectedState = isSelected
+            self.selectedState = isSelected
             self.onSelected()
 
 
@@ -28,6 +28,8 @@ from nodedge.graphics_node_title_label import (
 )
 from nodedge.graphics_scene import GraphicsScene
 
+logger = logging.getLogger(__name__)
+
 
 class GraphicsNode(QGraphicsItem):
     """:class:`~nodedge.node.Node` class
@@ -47,9 +49,6 @@ class GraphicsNode(QGraphicsItem):
         super().__init__(parent)
         self.node: "Node" = node  # type: ignore
 
-        self.__logger = logging.getLogger(__file__)
-        self.__logger.setLevel(logging.INFO)
-
         self._title: str = "Unnamed"
 
         self.initUI()
@@ -88,6 +87,17 @@ class GraphicsNode(QGraphicsItem):
     @selectedState.setter
     def selectedState(self, value):
         self._lastSelectedState = value
+        self.node.scene.onItemSelectedStateChanged(self, value)
+
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
+        """
+        Override Qt method to keep the selection index of the scene up to date.
+        """
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self.node.scene.onItemSelectedChanged(self, bool(value))
+        elif change == QGraphicsItem.ItemSceneChange:
+            self.node.scene.onItemSelectedChanged(self, False)
+        return super().itemChange(change, value)
 
     @property
     def content(self):
@@ -262,11 +272,9 @@ class GraphicsNode(QGraphicsItem):
         """
         super().mouseMoveEvent(event)
 
-        # TODO: Optimize this condition. Just update the selected blocks.
         graphicsScene: GraphicsScene = cast(GraphicsScene, self.scene())
-        for node in graphicsScene.scene.nodes:
-            if node.graphicsNode.isSelected():
-                node.updateConnectedEdges()
+        for graphicsNode in graphicsScene.scene.selectedNodes:
+            graphicsNode.node.updateConnectedEdges()
 
         self._wasMoved = True
 
@@ -292,14 +300,14 @@ class GraphicsNode(QGraphicsItem):
                 dy += clipSize
 
             graphicsScene: GraphicsScene = cast(GraphicsScene, self.scene())
-            for node in graphicsScene.scene.nodes:
-                if node.graphicsNode.isSelected():
-                    nodePos = node.graphicsNode.pos()
-                    node.graphicsNode.setPos(nodePos.x() + dx, nodePos.y() + dy)
-                    node.updateConnectedEdges()
+            for graphicsNode in graphicsScene.scene.selectedNodes:
+                node = graphicsNode.node
+                nodePos = graphicsNode.pos()
+                node.pos = (nodePos.x() + dx, nodePos.y() + dy)
+                node.updateConnectedEdges()
 
-            self.__logger.debug(f"Current graphics node pos: {self.pos()}")
-            self.__logger.debug(f"Event pos: {event.scenePos()}")
+            logger.debug(f"Current graphics node pos: {self.pos()}")
+            logger.debug(f"Event pos: {event.scenePos()}")
 
             self._wasMoved = False
             self.node.scene.history.store("Move a node")
@@ -320,7 +328,7 @@ class GraphicsNode(QGraphicsItem):
             or self.node.scene.lastSelectedItems != self.node.scene.selectedItems
         ):
             self.node.scene.resetLastSelectedStates()
-            self._lastSelectedState = isSelected
+            self.selectedState = isSelected
             self.onSelected()
 
     def hoverEnterEvent(self, event: QGraphicsSceneHoverEvent) -> None:
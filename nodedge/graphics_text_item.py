@@ -32,6 +32,13 @@ class GraphicsTextItem(QGraphicsTextItem):
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
         self.setFlag(QGraphicsItem.ItemIsFocusable)
 
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self.element.scene.onItemSelectedChanged(self, bool(value))
+        elif change == QGraphicsItem.ItemSceneChange:
+            self.element.scene.onItemSelectedChanged(self, False)
+        return super().itemChange(change, value)
+
     def mouseDoubleClickEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         # Activate/deactivate/reactivate cursor to ensure it blinks properly.
         self.setTextInteractionFlags(Qt.TextEditorInteraction)
@@ -246,7 +246,7 @@ class GraphicsView(QGraphicsView):
 
             if self.rubberBandDraggingRectangle:
                 self.rubberBandDraggingRectangle = False
-                selectedItems = self.graphicsScene.selectedItems()
+                selectedItems = self.graphicsScene.scene.selectedItems
                 if selectedItems != self.graphicsScene.scene.lastSelectedItems:
                     if not selectedItems:
                         self.graphicsScene.itemsDeselected.emit()
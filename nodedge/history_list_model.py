@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+History list model module containing
+:class:`~nodedge.history_list_model.HistoryListModel` class.
+"""
+
+import logging
+import weakref
+from typing import Dict, List, Union, cast
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    Signal,
+)
+
+from nodedge.scene_history import SceneHistory
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryListModel(QAbstractListModel):
+    """
+    :class:`~nodedge.history_list_model.HistoryListModel` class
+
+    List model of the stamps of a scene history.
+
+    When a stamp is stored, the model compares the history stack with the stamps
+    it lists, and only inserts and removes the rows which differ. There is a
+    single model per history, see
+    :func:`~nodedge.history_list_model.HistoryListModel.forHistory`.
+    """
+
+    #: Emitted with the row of the stamp restored in the scene.
+    currentStepChanged = Signal(int)
+
+    _models: "weakref.WeakKeyDictionary[SceneHistory, HistoryListModel]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, history: SceneHistory, parent=None):
+        super().__init__(parent)
+        # The models are stored by history: a strong reference would keep the
+        # history, and its scene, alive forever.
+        self._historyRef: "weakref.ReferenceType[SceneHistory]" = weakref.ref(history)
+        self._stamps: List[Dict] = list(history.stack)
+        self._currentStep: int = history.currentStep
+
+        history.addHistoryModifiedListener(self.onHistoryModified)
+
+    @property
+    def history(self) -> SceneHistory:
+        """
+        :return: listed history
+        :rtype: :class:`~nodedge.scene_history.SceneHistory`
+        """
+        return cast(SceneHistory, self._historyRef())
+
+    @classmethod
+    def forHistory(cls, history: SceneHistory) -> "HistoryListModel":
+        """
+        Retrieve the model of a history, creating it on first use.
+
+        :param history: listed history
+        :type history: :class:`~nodedge.scene_history.SceneHistory`
+        :return: model listing the stamps of the history
+        :rtype: :class:`~nodedge.history_list_model.HistoryListModel`
+        """
+        model = cls._models.get(history)
+        if model is None:
+            model = cls(history)
+            cls._models[history] = model
+        return model
+
+    @property
+    def currentStep(self) -> int:
+        """
+        :return: row of the stamp restored in the scene, -1 if the history is empty
+        :rtype: ``int``
+        """
+        return self._currentStep
+
+    def onHistoryModified(self) -> None:
+        stack = self.history.stack
+
+        # Stamps dropped from the start of the stack, when it is full.
+        droppedCount = len(self._stamps)
+        if stack:
+            for row, stamp in enumerate(self._stamps):
+                if stamp is stack[0]:
+                    droppedCount = row
+                    break
+        if droppedCount > 0:
+            self.beginRemoveRows(QModelIndex(), 0, droppedCount - 1)
+            del self._stamps[:droppedCount]
+            self.endRemoveRows()
+
+        # Stamps which could have been redone, replaced by the new ones.
+        commonCount = 0
+        while (
+            commonCount < min(len(self._stamps), len(stack))
+            and self._stamps[commonCount] is stack[commonCount]
+        ):
+            commonCount += 1
+        removedCount = len(self._stamps) - commonCount
+        if removedCount > 0:
+            self.beginRemoveRows(QModelIndex(), commonCount, len(self._stamps) - 1)
+            del self._stamps[commonCount:]
+            self.endRemoveRows()
+        if commonCount < len(stack):
+            self.beginInsertRows(QModelIndex(), commonCount, len(stack) - 1)
+            self._stamps.extend(stack[commonCount:])
+            self.endInsertRows()
+
+        # The selection follows the removed rows, even if the step is unchanged.
+        if (
+            droppedCount > 0
+            or removedCount > 0
+            or self.history.currentStep != self._currentStep
+        ):
+            self._currentStep = self.history.currentStep
+            # noinspection PyUnresolvedReferences
+            self.currentStepChanged.emit(self._currentStep)
+
+    def rowCount(
+        self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()
+    ) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._stamps)
+
+    def flags(self, index: Union[QModelIndex, QPersistentModelIndex]):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def data(
+        self, index: Union[QModelIndex, QPersistentModelIndex], role=Qt.DisplayRole
+    ):
+        if not index.isValid() or index.row() >= len(self._stamps):
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._stamps[index.row()]["desc"]
+        return None
@@ -6,17 +6,23 @@ History list widget module containing
 import logging
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QItemSelectionModel, QModelIndex, Signal
 from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import QListWidget, QListWidgetItem, QMainWindow
+from PySide6.QtWidgets import QListView, QMainWindow
 
 from nodedge import DEBUG_ITEMS_PRESSED
+from nodedge.history_list_model import HistoryListModel
 from nodedge.scene_history import SceneHistory
 from nodedge.utils import widgetsAt
 
 
-class HistoryListWidget(QListWidget):
-    """:class:`~nodedge.history_list_widget.HistoryListWidget` class ."""
+class HistoryListWidget(QListView):
+    """
+    :class:`~nodedge.history_list_widget.HistoryListWidget` class
+
+    List of the stamps of a scene history, showing its
+    :class:`~nodedge.history_list_model.HistoryListModel`.
+    """
 
     itemsPressed = Signal(list)
 
@@ -26,35 +32,54 @@ class HistoryListWidget(QListWidget):
         self.__logger = logging.getLogger(__file__)
         self.__logger.setLevel(logging.INFO)
 
-        self.history: SceneHistory = history
+        self._history: Optional[SceneHistory] = None
+        self._model: Optional[HistoryListModel] = None
+        self.history = history
 
-        self.itemClicked.connect(self.onItemClicked)
+        self.setUniformItemSizes(True)
+        self.clicked.connect(self.onItemClicked)
 
-    def update(self, *__args) -> None:
+    @property
+    def history(self) -> Optional[SceneHistory]:
         """
-        Qt update callback.
-
-        :return: ``None``
+        :getter: return the listed history
+        :setter: list the stamps of another history
+        :type: ``Optional[SceneHistory]``
         """
-        if self.history is not None:
-            self.clear()
-            for index, stamp in enumerate(self.history.stack):
-                item = QListWidgetItem(stamp["desc"], self)
-                item.setData(Qt.ToolTipRole, index)
-
-                item.setFlags(
-                    Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
-                )
-
-                if index == self.history.currentStep:
-                    item.setSelected(True)
-
-        super().viewport().update()
+        return self._history
+
+    @history.setter
+    def history(self, history: Optional[SceneHistory]) -> None:
+        if history is self._history:
+            return
+        if self._model is not None:
+            self._model.currentStepChanged.disconnect(self.selectStep)
+        self._history = history
+        self._model = (
+            HistoryListModel.forHistory(history) if history is not None else None
+        )
+        self.setModel(self._model)
+        if self._model is None:
+            return
+        self._model.currentStepChanged.connect(self.selectStep)
+        self.selectStep(self._model.currentStep)
+
+    def selectStep(self, step: int) -> None:
+        """
+        Highlight the stamp restored in the scene.
 
-    def onItemClicked(self, item: QListWidgetItem):
-        if self.history is not None:
-            itemStep = item.data(Qt.ToolTipRole)
-            self.history.restoreStep(itemStep)
+        :param step: row of the restored stamp
+        :type step: ``int``
+        """
+        if self._model is None or step < 0:
+            return
+        index = self._model.index(step)
+        self.selectionModel().select(index, QItemSelectionModel.ClearAndSelect)
+        self.scrollTo(index)
+
+    def onItemClicked(self, index: QModelIndex):
+        if self._history is not None:
+            self._history.restoreStep(index.row())
 
     def mousePressEvent(self, e: QMouseEvent) -> None:
         if DEBUG_ITEMS_PRESSED:
@@ -4,7 +4,6 @@ from pathlib import Path
 
 from PySide6.QtCore import QSettings, QSize, QStandardPaths, Qt, QUrl, Signal
 from PySide6.QtGui import QPixmap
-from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -89,11 +88,19 @@ class HelpContentWidget(ContentWidget):
         # self.layout.addWidget(label)
         # label.setOpenExternalLinks(True)
 
-        view = QWebEngineView(self)
-        view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        view.load(QUrl("https://nodedge.io/#/tutorials"))
-        self.layout.addWidget(view)
-        view.show()
+        self.view = None
+
+    def showEvent(self, event) -> None:
+        # The web engine is heavy to load, so it is only loaded when help is shown.
+        if self.view is None:
+            from PySide6.QtWebEngineWidgets import QWebEngineView
+
+            self.view = QWebEngineView(self)
+            self.view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.view.load(QUrl("https://nodedge.io/#/tutorials"))
+            self.layout.addWidget(self.view)
+            self.view.show()
+        super().showEvent(event)
 
 
 class FileToolButton(QToolButton):
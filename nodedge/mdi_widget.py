@@ -18,7 +18,7 @@ from PySide6.QtGui import (
 from PySide6.QtWidgets import QGraphicsProxyWidget, QGraphicsTextItem, QMenu
 
 from nodedge.blocks.block import Block
-from nodedge.blocks.block_config import BLOCKS, getClassFromOperationCode
+from nodedge.blocks.block_config import availableBlocks, getClassFromOperationCode
 from nodedge.connector import Socket
 from nodedge.edge import EdgeType
 from nodedge.editor_widget import EditorWidget
@@ -70,20 +70,19 @@ class MdiWidget(EditorWidget):
         self.nodeActions = {}
         self.libraryMenus: Dict[str, QMenu] = {}
 
-        keys = list(BLOCKS.keys())
-        keys.sort()
+        self.availableBlocks: List[dict] = availableBlocks()
 
-        for key in keys:
-            node: Block = BLOCKS[key]
-            self.nodeActions[node.operationCode] = QAction(  # QIcon(node.icon),
-                node.operationTitle
+        for block in self.availableBlocks:
+            operationCode = block["operationCode"]
+            self.nodeActions[operationCode] = QAction(  # QIcon(block["icon"]),
+                block["operationTitle"]
             )
-            libraryTitle = node.libraryTitle
+            libraryTitle = block["libraryTitle"]
             if libraryTitle not in self.libraryMenus.keys():
                 menu = QMenu(libraryTitle.capitalize().replace("_", " "))
                 self.libraryMenus[libraryTitle] = menu
 
-            self.nodeActions[node.operationCode].setData(node.operationCode)
+            self.nodeActions[operationCode].setData(operationCode)
 
     def initNodesContextMenu(self):
         """
@@ -92,30 +91,25 @@ class MdiWidget(EditorWidget):
         :class:`~nodedge.scene.Scene`.
         """
         contextMenu = QMenu(self)
-        keys = list(BLOCKS.keys())
-        keys.sort()
         blocks = {}
-        for key in keys:
-            node = getClassFromOperationCode(key)
-            blocks.update({node.operationTitle: node})
+        for block in self.availableBlocks:
+            blocks.update({block["operationTitle"]: block})
 
         menus = {}
         libraries = []
-        for key in keys:
-            node = getClassFromOperationCode(key)
-            libraries.append(node.libraryTitle)
+        for block in self.availableBlocks:
+            libraries.append(block["libraryTitle"])
         for library in sorted(libraries):
             contextMenu.addMenu(self.libraryMenus[library])
 
         for blockTitle in sorted(list(blocks.keys())):
-            node = blocks[blockTitle]
-            # node = getClassFromOperationCode(key)
-            library = node.libraryTitle
+            block = blocks[blockTitle]
+            library = block["libraryTitle"]
             if library not in menus.keys():
                 menus[library] = self.libraryMenus[library]
             else:
                 menu = menus[library]
-            menus[library].addAction(self.nodeActions[node.operationCode])
+            menus[library].addAction(self.nodeActions[block["operationCode"]])
             # contextMenu.addAction(self.nodeActions[key])
 
         return contextMenu
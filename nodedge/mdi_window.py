@@ -2,10 +2,9 @@
 :class:`~nodedge.mdi_window.MdiWindow` class. """
 import logging
 import os
-from typing import Any, Callable, List, Optional, cast
+from typing import Any, Callable, List, Optional, Tuple, Union, cast
 
-from pyqtgraph.console import ConsoleWidget
-from PySide6.QtCore import QPointF, QSignalMapper, QSize, Qt, QTimer, Slot
+from PySide6.QtCore import QPointF, QSignalMapper, QSize, Qt, QThreadPool, QTimer, Slot
 from PySide6.QtGui import QAction, QCloseEvent, QIcon, QKeySequence, QMouseEvent
 from PySide6.QtWidgets import (
     QDockWidget,
@@ -25,13 +24,33 @@ from nodedge.home_menu import HomeMenu, MenuBar
 from nodedge.mdi_area import MdiArea
 from nodedge.mdi_widget import MdiWidget
 from nodedge.node_tree_widget import NodeTreeWidget
+from nodedge.scene import Scene
 from nodedge.scene_item_detail_widget import SceneItemDetailWidget
 from nodedge.scene_items_table_widget import SceneItemsTableWidget
 from nodedge.scene_items_tree_widget import SceneItemsTreeWidget
+from nodedge.scene_profiler_widget import SceneProfilerWidget
+from nodedge.scene_simulator import Worker
 
 logger = logging.getLogger(__name__)
 
 
+def readSceneFile(filename: str) -> Tuple[str, Union[dict, Exception]]:
+    """
+    Read a scene file, in a worker thread.
+
+    :param filename: file to read
+    :type filename: ``str``
+    :return: filename, and the serialized scene or the error raised while reading it
+    :rtype: ``Tuple[str, Union[dict, Exception]]``
+    """
+    try:
+        return filename, Scene.readFile(filename)
+    except Exception as e:
+        # Any error is returned, rather than raised: the window counts the files
+        # being read, and only updates its docks once they have all been read.
+        return filename, e
+
+
 class MdiWindow(EditorWindow):
     """
     :class:`~nodedge.mdi_window.MdiWindow` class.
@@ -41,6 +60,9 @@ class MdiWindow(EditorWindow):
 
     def __init__(self) -> None:
         self.currentEditorWidgetChangedListeners: List[Callable] = []
+        # Files being read in the thread pool, see openFile.
+        self.fileReaderPool: QThreadPool = QThreadPool()
+        self._pendingFilesCount: int = 0
         super().__init__()
 
     @property
@@ -106,6 +128,7 @@ class MdiWindow(EditorWindow):
         self.createHistoryDock()
         # self.createSceneItemsDock()
         self.createSceneItemsTreeDock()
+        self.createProfilerDock()
         self.createPythonConsole()
 
         self.createActions()
@@ -234,10 +257,19 @@ class MdiWindow(EditorWindow):
     def evaluateAllNodes(self):
         if self.currentEditorWidget is None:
             return
-        for n in self.currentEditorWidget.scene.nodes:
-            n.isDirty = True
-        for n in self.currentEditorWidget.scene.nodes:
-            n.eval()
+        scene = self.currentEditorWidget.scene
+        scene.evalAllNodes()
+        if self.debugMode:
+            caches = [
+                node.cache
+                for node in scene.nodes
+                if getattr(node, "cache", None) is not None
+            ]
+            hits = sum(cache.hits for cache in caches)
+            misses = sum(cache.misses for cache in caches)
+            self.statusBar().showMessage(
+                f"Evaluation cache of {len(caches)} blocks: {hits} hits, {misses} misses"
+            )
 
     # noinspection PyAttributeOutsideInit
     def createToolBars(self) -> None:
@@ -368,6 +400,7 @@ class MdiWindow(EditorWindow):
         hasMdiChild = active is not None
         self.windowMenu.clear()
         self.windowMenu.addAction(self.nodeToolbarAct)
+        self.windowMenu.addAction(self.profilerDock.toggleViewAction())
 
         self.windowMenu.addSeparator()
         self.windowMenu.addAction(self.closeAct)
@@ -441,16 +474,13 @@ class MdiWindow(EditorWindow):
         editor.scene.coder.notConnectedSocket.connect(
             self.onSceneCoderOutputSocketDisconnect
         )
+        editor.scene.simulator.simulationWarning.connect(self.onSimulationWarning)
         subWindow = self.mdiArea.addSubWindow(editor)
         self.mdiArea.setActiveSubWindow(subWindow)
 
         icon = QIcon(".")
         subWindow.setWindowIcon(icon)
         editor.scene.history.addHistoryModifiedListener(self.updateEditMenu)
-        editor.scene.history.addHistoryModifiedListener(self.historyListWidget.update)
-        # editor.scene.history.addHistoryModifiedListener(
-        #     self.sceneItemsTableWidget.update
-        # )
         editor.scene.addItemsDeselectedListener(self.sceneItemDetailsWidget.update)
         editor.scene.addItemSelectedListener(self.sceneItemDetailsWidget.update)
         editor.addCloseEventListener(self.onSubWindowClosed)
@@ -473,7 +503,7 @@ class MdiWindow(EditorWindow):
         self.mdiArea.setActiveSubWindow(subWindowToBeDeleted)
         # self.sceneItemsTableWidget.scene = None
         self.sceneItemsTreeWidget.scene = None
-        # self.sceneItemsTableWidget.clearContents()
+        self.profilerWidget.scene = None
 
         if self.maybeSave():
             event.accept()
@@ -540,7 +570,6 @@ class MdiWindow(EditorWindow):
         """
         self.historyListWidget = HistoryListWidget(self)
         self.historyListWidget.itemsPressed.connect(self.showItemsInStatusBar)
-        self.addCurrentEditorWidgetChangedListener(self.historyListWidget.update)
 
         self.historyDock = QDockWidget("History")
         self.historyDock.setWidget(self.historyListWidget)
@@ -555,7 +584,6 @@ class MdiWindow(EditorWindow):
         """
         self.sceneItemsTableWidget = SceneItemsTableWidget(self)
         # self.sceneItemsTableWidget.itemsPressed.connect(self.showItemsInStatusBar)
-        self.addCurrentEditorWidgetChangedListener(self.sceneItemsTableWidget.update)
 
         self.sceneItemsDock = QDockWidget("Scene items")
         self.sceneItemsDock.setWidget(self.sceneItemsTableWidget)
@@ -571,28 +599,61 @@ class MdiWindow(EditorWindow):
         """
         self.sceneItemsTreeWidget = SceneItemsTreeWidget(self)
         self.sceneItemsTreeWidget.itemsPressed.connect(self.showItemsInStatusBar)
-        self.addCurrentEditorWidgetChangedListener(self.sceneItemsTreeWidget.update)
 
         self.sceneItemsTreeDock = QDockWidget("Model tree")
         self.sceneItemsTreeDock.setWidget(self.sceneItemsTreeWidget)
         self.sceneItemsTreeDock.setFloating(False)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.sceneItemsTreeDock)
 
+    # noinspection PyAttributeOutsideInit
+    def createProfilerDock(self) -> None:
+        """
+        Create simulation profiler dock, next to the scene items.
+        """
+        self.profilerWidget = SceneProfilerWidget(self)
+        self.addCurrentEditorWidgetChangedListener(self.profilerWidget.update)
+
+        self.profilerDock = QDockWidget("Profiler")
+        self.profilerDock.setWidget(self.profilerWidget)
+        self.profilerDock.setFloating(False)
+        self.addDockWidget(Qt.LeftDockWidgetArea, self.profilerDock)
+        self.tabifyDockWidget(self.sceneItemsTreeDock, self.profilerDock)
+        self.sceneItemsTreeDock.raise_()
+
     # noinspection PyAttributeOutsideInit
     def createPythonConsole(self) -> None:
         """
         Create a python console embedded in a dock.
         :return: ``None``
         """
-        self.pythonConsoleWidget = ConsoleWidget()
-        # self.pythonConsoleWidget.eval_in_thread()
+        self.pythonConsoleWidget: Optional[QWidget] = None
 
         self.pythonConsoleDock = QDockWidget("Python console")
-        self.pythonConsoleDock.setWidget(self.pythonConsoleWidget)
         self.pythonConsoleDock.setFloating(False)
+        # The console pulls in pyqtgraph: it is built once the window is shown.
+        self.pythonConsoleDock.visibilityChanged.connect(
+            self.onPythonConsoleVisibilityChanged
+        )
 
         self.addDockWidget(Qt.BottomDockWidgetArea, self.pythonConsoleDock)
 
+    def onPythonConsoleVisibilityChanged(self, visible: bool) -> None:
+        if visible and self.pythonConsoleWidget is None:
+            QTimer.singleShot(0, self.buildPythonConsole)
+
+    def buildPythonConsole(self) -> None:
+        """
+        Build the python console widget, if it has not been built yet.
+        :return: ``None``
+        """
+        if self.pythonConsoleWidget is not None:
+            return
+        from pyqtgraph.console import ConsoleWidget
+
+        self.pythonConsoleWidget = ConsoleWidget()
+        # self.pythonConsoleWidget.eval_in_thread()
+        self.pythonConsoleDock.setWidget(self.pythonConsoleWidget)
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """
         Qt close event handle.
@@ -629,11 +690,16 @@ class MdiWindow(EditorWindow):
         TODO: Rename openFile function as it can open several files.
 
 
+        A single filename, as given by the scripts and the recent files menu, is read
+        in the calling thread: its sub window exists once this method returns.
+        Several filenames are read in the thread pool.
+
         :param filenames: TODO
         :type filenames: Optional[bool, str, List[str]]
         :return: ``None``
         """
         logger.info(f"Opening {filenames} in Nodedge.")
+        blocking = isinstance(filenames, str)
         if isinstance(filenames, bool) or filenames is None:
             filenames, ok = QFileDialog.getOpenFileNames(
                 parent=self,
@@ -649,6 +715,7 @@ class MdiWindow(EditorWindow):
             if isinstance(filenames, str):
                 filenames = [filenames]
 
+        filenamesToRead: List[str] = []
         for filename in filenames:
             logger.debug(f"Loading {filename}")
             if filename:
@@ -680,27 +747,67 @@ class MdiWindow(EditorWindow):
                 if existingSubWindow:
                     logger.debug("Existing sub window")
                     self.mdiArea.setActiveSubWindow(existingSubWindow)
-                else:
-                    # Create a new sub window and open the file
-                    editor = MdiWidget()
-                    if editor.loadFile(filename):
-                        logger.debug("Loading success")
-                        self.statusBar().showMessage(f"File {filename} loaded.", 5000)
-                        editor.updateTitle()
-                        subWindow = self._createMdiSubWindow(editor)
-                        subWindow.show()
-                        # self.sceneItemsTableWidget.update()
-                        self.sceneItemsTreeWidget.update()
-                    else:
-                        logger.debug("Loading fail")
-                        editor.close()
+                elif filename not in filenamesToRead:
+                    filenamesToRead.append(filename)
             else:
                 editor = MdiWidget()
                 editor.newFile()
                 subWindow = self._createMdiSubWindow(editor)
                 subWindow.show()
-                # self.sceneItemsTableWidget.update()
-                self.sceneItemsTreeWidget.update()
+
+        self.readFiles(filenamesToRead, blocking=blocking)
+
+    def readFiles(self, filenames: List[str], blocking: bool = False) -> None:
+        """
+        Read and decode files in a thread pool, then open each of them in a new sub
+        window as soon as it has been read. Only the scene creation runs in the GUI
+        thread. The docks are updated once all the files have been opened.
+
+        :param filenames: files to open
+        :type filenames: ``List[str]``
+        :param blocking: if ``True``, read the files in the calling thread and return
+            once they are opened, instead of reading them in the thread pool
+        :type blocking: ``bool``
+        """
+        self._pendingFilesCount += len(filenames)
+        for filename in filenames:
+            logger.debug(f"Reading {filename}")
+            if blocking:
+                self.onFileRead(readSceneFile(filename))
+                continue
+            worker = Worker(readSceneFile, filename)
+            worker.signals.result.connect(self.onFileRead)
+            self.fileReaderPool.start(worker)
+
+    def onFileRead(self, result: Tuple[str, Union[dict, Exception]]) -> None:
+        """
+        Slot called in the GUI thread when a file has been read by the thread pool.
+
+        :param result: filename, and the serialized scene or the reading error
+        :type result: ``Tuple[str, Union[dict, Exception]]``
+        """
+        filename, data = result
+        self._pendingFilesCount -= 1
+        if isinstance(data, Exception):
+            logger.warning(f"Error loading {filename}: {data}")
+            QMessageBox.warning(
+                self, f"Error loading {os.path.basename(filename)}", str(data)
+            )
+        elif self.findMdiSubWindow(filename) is None:
+            # Create a new sub window and open the file
+            editor = MdiWidget()
+            if editor.loadFile(filename, data):
+                logger.debug("Loading success")
+                self.statusBar().showMessage(f"File {filename} loaded.", 5000)
+                editor.updateTitle()
+                subWindow = self._createMdiSubWindow(editor)
+                subWindow.show()
+            else:
+                logger.debug("Loading fail")
+                editor.close()
+
+        if self._pendingFilesCount == 0:
+            self.onSubWindowActivated()
 
     def about(self) -> None:
         """
@@ -747,15 +854,19 @@ class MdiWindow(EditorWindow):
 
     def onSubWindowActivated(self) -> None:
         """
-        Slot called when a sub window is activated.
+        Slot called when a sub window is activated. While files are being opened,
+        the docks are only updated once the last one has been opened.
 
         :return: ``None``
         """
+        if self._pendingFilesCount > 0:
+            return
 
         if self.currentEditorWidget is not None:
             self.historyListWidget.history = self.currentEditorWidget.scene.history
             # self.sceneItemsTableWidget.scene = self.currentEditorWidget.scene
             self.sceneItemsTreeWidget.scene = self.currentEditorWidget.scene
+            self.profilerWidget.scene = self.currentEditorWidget.scene
             graphicsScene = self.currentEditorWidget.scene.graphicsScene
             graphicsScene.itemsPressed.connect(self.showItemsInStatusBar)
             graphicsScene.mouseMoved.connect(self.updateStatusBar)
@@ -811,6 +922,18 @@ class MdiWindow(EditorWindow):
         super().mouseMoveEvent(event)
 
     @Slot()
+    def onSimulationWarning(self, message: str) -> None:
+        """
+        Callback to deal with :class:`~nodedge.scene_simulator.SceneSimulator`
+        warning.
+
+        :param message: warning of the simulator
+        :type message: ``str``
+        :return: ``None``
+        """
+        self.statusBar().showMessage(message, 5000)
+        QMessageBox.warning(self, "Simulation warning", message)
+
     def onSceneCoderOutputSocketDisconnect(self) -> None:
         """
         Callback to deal with :class:`~nodedge.scene_coder.SceneCoder` warning.
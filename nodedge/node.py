@@ -6,7 +6,7 @@ Node module containing :class:`~nodedge.node.Node` class.
 
 import logging
 from collections import OrderedDict
-from typing import Callable, Collection, List, Optional, cast
+from typing import Callable, Collection, Dict, List, Optional, Sequence, cast
 
 from PySide6.QtCore import QPointF
 from PySide6.QtWidgets import QGraphicsSceneMouseEvent
@@ -46,6 +46,35 @@ class Node(Serializable):
     GraphicsNodeContentClass = GraphicsNodeContent
     SocketClass = Socket
     contentLabelObjectName = "undefined"
+    socketOffsets: Dict[SocketLocation, int] = {
+        SocketLocation.LEFT_BOTTOM: -1,
+        SocketLocation.LEFT_CENTER: -1,
+        SocketLocation.LEFT_TOP: -1,
+        SocketLocation.RIGHT_BOTTOM: 1,
+        SocketLocation.RIGHT_CENTER: 1,
+        SocketLocation.RIGHT_TOP: 1,
+    }
+
+    # Scenes hold many nodes, so they do not have an instance dictionary. Subclasses
+    # declare the slots of their own attributes, or an empty ``__slots__``.
+    __slots__ = (
+        "id",
+        "_title",
+        "scene",
+        "inputSockets",
+        "outputSockets",
+        "_isDirty",
+        "_isInvalid",
+        "content",
+        "graphicsNode",
+        "selectedListeners",
+        "_socketSpacing",
+        "_inputSocketPosition",
+        "_outputSocketPosition",
+        "_inputAllowMultiEdges",
+        "_outputAllowMultiEdges",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -68,8 +97,8 @@ class Node(Serializable):
         super().__init__()
         self._title: str = title
         self.scene: "Scene" = scene  # type: ignore
-        self.inputSocketTypes: Collection[SocketType] = inputSocketTypes
-        self.outputSocketTypes: Collection[SocketType] = outputSocketTypes
+        # Listeners are only stored in a list once one is added.
+        self.selectedListeners: Sequence[Callable] = ()
 
         self.initInnerClasses()
         self.initSettings()
@@ -85,8 +114,6 @@ class Node(Serializable):
         self._isDirty: bool = False
         self._isInvalid: bool = False
 
-        self.selectedListeners: List[Callable] = []
-
     def __str__(self):
         return (
             f"0x{hex(id(self))[-4:]} {self.__class__.__name__}({self.title}, "
@@ -112,14 +139,6 @@ class Node(Serializable):
         self._outputSocketPosition: SocketLocation = SocketLocation.RIGHT_TOP
         self._inputAllowMultiEdges: bool = False
         self._outputAllowMultiEdges: bool = True
-        self.socketOffsets = {
-            SocketLocation.LEFT_BOTTOM: -1,
-            SocketLocation.LEFT_CENTER: -1,
-            SocketLocation.LEFT_TOP: -1,
-            SocketLocation.RIGHT_BOTTOM: 1,
-            SocketLocation.RIGHT_CENTER: 1,
-            SocketLocation.RIGHT_TOP: 1,
-        }
 
     def initSockets(
         self,
@@ -191,6 +210,22 @@ class Node(Serializable):
         self.isDirty = True
         self.markDescendantsDirty()
 
+    @property
+    def inputSocketTypes(self) -> List[SocketType]:
+        """
+        :getter: types of the input sockets. Blocks define them as a class attribute.
+        :rtype: ``List[SocketType]``
+        """
+        return [socket.socketType for socket in self.inputSockets]
+
+    @property
+    def outputSocketTypes(self) -> List[SocketType]:
+        """
+        :getter: types of the output sockets. Blocks define them as a class attribute.
+        :rtype: ``List[SocketType]``
+        """
+        return [socket.socketType for socket in self.outputSockets]
+
     @property
     def title(self) -> str:
         """
@@ -213,6 +248,7 @@ class Node(Serializable):
 
         self._title = newTitle
         self.graphicsNode.title = newTitle
+        self.scene.onNodeChanged(self)
 
     @property
     def pos(self):
@@ -237,6 +273,7 @@ class Node(Serializable):
                 raise TypeError("Pass an iterable with two numbers.")
         elif isinstance(pos, QPointF):
             self.graphicsNode.setPos(pos)
+        self.scene.onNodeChanged(self)
 
     @property
     def isDirty(self):
@@ -290,7 +327,7 @@ class Node(Serializable):
     @isSelected.setter
     def isSelected(self, value: bool):
         self.graphicsNode.setSelected(value)
-        self.graphicsNode._lastSelectedState = value
+        self.graphicsNode.selectedState = value
         if value is True:
             self.graphicsNode.onSelected()
 
@@ -455,11 +492,14 @@ class Node(Serializable):
             otherNode.isInvalid = newValue
             otherNode.markChildrenInvalid(newValue)
 
-    def eval(self, index=0) -> float:
+    def eval(self, index=0, evalChildren: bool = True) -> float:
         """
         Evaluate this node.
         This must be overridden.
         See :ref:`evaluation` for more details.
+
+        :param evalChildren: if ``True``, the descendants are evaluated afterwards
+        :type evalChildren: ``bool``
         """
         self.isDirty = False
         self.isInvalid = False
@@ -467,11 +507,27 @@ class Node(Serializable):
 
     def evalChildren(self) -> None:
         """
-        Evaluate children of this node
+        Evaluate all-level descendants of this node, each one once, after the nodes
+        connected to its inputs.
+
+        :raises: :class:`~nodedge.scene_scheduler.AlgebraicLoopError` if this node
+            is part of a loop
+        """
+        from nodedge.scene_scheduler import descendants, scheduleNodes
+
+        schedule = scheduleNodes(descendants(self))
+        for node in schedule:
+            node.isDirty = True
+        for node in schedule:
+            node.eval(evalChildren=False)
+
+    def resetState(self) -> None:
+        """
+        Reset this node at the end of a simulation, to be evaluated again.
+        Stateful nodes must override it to restore their initial state.
         """
-        for node in self.getChildNodes():
-            # TODO: Investigate if we want to evaluate all the children of the child
-            node.eval()
+        self.isDirty = True
+        self.isInvalid = False
 
     def getChildNodes(self) -> List["Node"]:
         """
@@ -681,10 +737,9 @@ class Node(Serializable):
                 if found is None:
                     logger.debug(
                         "Deserialization of socket data has not found "
-                        "input socket with index:",
-                        socketData["index"],
+                        f"input socket with index: {socketData['index']}"
                     )
-                    logger.debug("Actual socket data:", socketData)
+                    logger.debug(f"Actual socket data: {socketData}")
 
                     # Create new socket for this
                     found = self.__class__.SocketClass(
@@ -725,8 +780,7 @@ class Node(Serializable):
                 if found is None:
                     logger.debug(
                         "Deserialization of socket data has not found output socket "
-                        "with index:",
-                        socketData["index"],
+                        f"with index: {socketData['index']}"
                     )
                     # Create new socket for this
                     found = self.__class__.SocketClass(
@@ -788,7 +842,7 @@ class Node(Serializable):
         return QPointF(nodePos.x() + socketPos.x(), nodePos.y() + socketPos.y())
 
     def addSelectedListener(self, callback):
-        self.selectedListeners.append(callback)
+        self.selectedListeners = [*self.selectedListeners, callback]
 
     def onDeserialized(self, data: dict):
         """Event manually called when this node was deserialized.
@@ -75,13 +75,13 @@ class NodeTreeWidget(QTreeWidget):
         """
         # associateOperationCodeWithBlock(operationCode, blockClass)
 
-        keys = list(BLOCKS.keys())
-        keys.sort()
-
-        for key in keys:
-            node = getClassFromOperationCode(key)
+        # Blocks are described by the manifest: their classes are not imported.
+        for block in availableBlocks():
             self.addNode(
-                node.operationTitle, node.icon, node.operationCode, node.libraryTitle
+                block["operationTitle"],
+                block["icon"],
+                block["operationCode"],
+                block["libraryTitle"],
             )
 
     def addNode(
@@ -97,14 +97,14 @@ class NodeTreeWidget(QTreeWidget):
 
         item = QTreeWidgetItem()
         item.setText(0, name)
-        pixmap = QPixmap(iconPath) if iconPath else "."
         # TODO: Investigate QIcon constructor
         # item.setIcon(0, QIcon(pixmap))  # type: ignore
         # item.setSizeHint(0, self.iconsSize)
 
         item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled)
 
-        item.setData(0, Qt.UserRole, pixmap)
+        # The icon is only loaded when the item is dragged.
+        item.setData(0, Qt.UserRole, iconPath if iconPath else ".")
         item.setData(0, Qt.UserRole + 1, operationCode)
 
         libraryName = libraryName.capitalize().replace("_", " ")
@@ -1,21 +1,54 @@
 import logging
 import os
+from typing import List
 
-from PySide6.QtCore import QEasingCurve
+from PySide6.QtCore import QEasingCurve, QSettings
 from PySide6.QtGui import QCloseEvent, QIcon, Qt
 from PySide6.QtWidgets import QMainWindow
 
 from nodedge.animated_stack_widget import AnimatedStackWidget
-from nodedge.dats.dats_window import DatsWindow
 from nodedge.homepage.homepage_window import HomePageWindow
-from nodedge.mdi_window import MdiWindow
 
 logger = logging.getLogger(__name__)
 
 examplePath = os.path.join(os.path.dirname(__file__), "../examples").replace("\\", "/")
 
 
+def readRecentFiles(companyName: str, productName: str) -> List[str]:
+    """
+    Read the recent files of an application from its settings, without having to
+    construct its window.
+
+    :param companyName: company name of the settings
+    :type companyName: ``str``
+    :param productName: product name of the settings
+    :type productName: ``str``
+    :return: recent file paths, most recent first
+    :rtype: ``List[str]``
+    """
+    settings = QSettings(companyName, productName)
+    recentFiles = settings.value("recent_files", [])
+    if not recentFiles:
+        return []
+    if isinstance(recentFiles, str):
+        return [recentFiles]
+    if not isinstance(recentFiles, (list, tuple)):
+        logger.warning(f"Invalid recent files setting: {recentFiles!r}")
+        return []
+    return [str(filename) for filename in recentFiles]
+
+
 class NodedgeAppWindow(QMainWindow):
+    """
+    :class:`~nodedge.nodedge_app_window.NodedgeAppWindow` class
+
+    Main window stacking the home page, the scene editor and DATS.
+
+    Only the home page is built at startup. The editor and DATS windows, together
+    with their heavy dependencies, are imported and built the first time they are
+    shown.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Nodedge")
@@ -39,107 +72,123 @@ class NodedgeAppWindow(QMainWindow):
         #     f"{os.path.dirname(__file__)}/../examples/calculator/calculator.json"
         # )
 
+        self._mdiWindow = None
+        self._datsWindow = None
+
         self.homepageWindow = HomePageWindow()
         self.mainWidget.addWidget(self.homepageWindow)
-        self.mdiWindow = MdiWindow()
-        self.mainWidget.addWidget(self.mdiWindow)
-        self.datsWindow = DatsWindow()
-        self.mainWidget.addWidget(self.datsWindow)
-        # self.setCentralWidget(self.mainWidget)
-        self.homepageWindow.mainWidget.headerFrame.nodedgeButton.clicked.connect(
-            lambda: self.mainWidget.setCurrentWidget(self.mdiWindow)
-        )
-        self.mdiWindow.homeMenu.pressed.connect(
-            lambda: self.mainWidget.setCurrentWidget(self.homepageWindow)
-        )
+        homeContentWidget = self.homepageWindow.homeContentWidget
 
-        self.mdiWindow.recentFilesUpdated.connect(
-            self.homepageWindow.homeContentWidget.updateNodedgeRecentFilesButtons
+        homeContentWidget.updateNodedgeRecentFilesButtons(
+            readRecentFiles("Nodedge", "Nodedge")
         )
-        self.mdiWindow.recentFilesUpdated.emit(self.mdiWindow.recentFiles)
-
-        def openNodeEdgeFile(text=None):
-            self.mainWidget.setCurrentWidget(self.mdiWindow)
-            self.mdiWindow.openFile(text)
-
-        self.homepageWindow.homeContentWidget.nodedgeFileClicked.connect(
-            openNodeEdgeFile
+        homeContentWidget.updateDatsRecentFilesWidget(
+            readRecentFiles("Nodedge", "Dats")
         )
 
-        self.homepageWindow.homeContentWidget.nodedgeNewFile.clicked.connect(
-            lambda: openNodeEdgeFile("")
+        self.homepageWindow.mainWidget.headerFrame.nodedgeButton.clicked.connect(
+            lambda: self.mainWidget.setCurrentWidget(self.mdiWindow)
         )
-        self.homepageWindow.homeContentWidget.nodedgeOpenExample.clicked.connect(
-            lambda: openNodeEdgeFile(examplePath)
+
+        homeContentWidget.nodedgeFileClicked.connect(self.openNodeEdgeFile)
+        homeContentWidget.nodedgeNewFile.clicked.connect(
+            lambda: self.openNodeEdgeFile("")
         )
-        self.homepageWindow.homeContentWidget.nodedgeOpenFile.clicked.connect(
-            lambda: openNodeEdgeFile("")
+        homeContentWidget.nodedgeOpenExample.clicked.connect(
+            lambda: self.openNodeEdgeFile(examplePath)
         )
-
-        self.datsWindow.recentFilesUpdated.connect(
-            self.homepageWindow.homeContentWidget.updateDatsRecentFilesWidget
+        homeContentWidget.nodedgeOpenFile.clicked.connect(
+            lambda: self.openNodeEdgeFile("")
         )
-        self.datsWindow.recentFilesUpdated.emit(self.datsWindow.recentFiles)
-
-        def openDatsFile(text):
-            if self.datsWindow.openLog(text):
-                self.mainWidget.setCurrentWidget(self.datsWindow)
 
-        # self.homepageWindow.homeContentWidget.datsNewFile.clicked.connect(
-        #     lambda: openDatsFile("")
+        # homeContentWidget.datsNewFile.clicked.connect(
+        #     lambda: self.openDatsFile("")
         # )
-        self.homepageWindow.homeContentWidget.datsOpenExample.clicked.connect(
-            lambda: openDatsFile(examplePath)
-        )
-        self.homepageWindow.homeContentWidget.datsOpenFile.clicked.connect(
-            lambda: openDatsFile("")
+        homeContentWidget.datsOpenExample.clicked.connect(
+            lambda: self.openDatsFile(examplePath)
         )
-
-        self.homepageWindow.homeContentWidget.datsFileClicked.connect(openDatsFile)
+        homeContentWidget.datsOpenFile.clicked.connect(lambda: self.openDatsFile(""))
+        homeContentWidget.datsFileClicked.connect(self.openDatsFile)
 
         self.homepageWindow.mainWidget.headerFrame.datsButton.clicked.connect(
             lambda: self.mainWidget.setCurrentWidget(self.datsWindow)
         )
-        self.mdiWindow.homeMenu.pressed.connect(
-            lambda: self.mainWidget.setCurrentWidget(self.homepageWindow)
-        )
-
-        self.datsWindow.homeMenu.pressed.connect(
-            lambda: self.mainWidget.setCurrentWidget(self.homepageWindow)
-        )
         self.mainWidget.setCurrentIndex(0)
 
-        def showHelp():
-            self.mainWidget.setCurrentWidget(self.homepageWindow)
-            self.homepageWindow.showHelp()
-
-        self.mdiWindow.helpAct.triggered.connect(showHelp)
-        self.datsWindow.helpAct.triggered.connect(showHelp)
+    @property
+    def mdiWindow(self):
+        """
+        :getter: return the scene editor window, building it on first access
+        :type: :class:`~nodedge.mdi_window.MdiWindow`
+        """
+        if self._mdiWindow is None:
+            from nodedge.mdi_window import MdiWindow
+
+            logger.debug("Building the editor window.")
+            self._mdiWindow = MdiWindow()
+            self.mainWidget.addWidget(self._mdiWindow)
+            self._mdiWindow.homeMenu.pressed.connect(
+                lambda: self.mainWidget.setCurrentWidget(self.homepageWindow)
+            )
+            self._mdiWindow.recentFilesUpdated.connect(
+                self.homepageWindow.homeContentWidget.updateNodedgeRecentFilesButtons
+            )
+            self._mdiWindow.helpAct.triggered.connect(self.showHelp)
+        return self._mdiWindow
+
+    @property
+    def datsWindow(self):
+        """
+        :getter: return the DATS window, building it on first access
+        :type: :class:`~nodedge.dats.dats_window.DatsWindow`
+        """
+        if self._datsWindow is None:
+            from nodedge.dats.dats_window import DatsWindow
+
+            logger.debug("Building the DATS window.")
+            self._datsWindow = DatsWindow()
+            self.mainWidget.addWidget(self._datsWindow)
+            self._datsWindow.homeMenu.pressed.connect(
+                lambda: self.mainWidget.setCurrentWidget(self.homepageWindow)
+            )
+            self._datsWindow.recentFilesUpdated.connect(
+                self.homepageWindow.homeContentWidget.updateDatsRecentFilesWidget
+            )
+            self._datsWindow.helpAct.triggered.connect(self.showHelp)
+        return self._datsWindow
+
+    def openNodeEdgeFile(self, text=None):
+        self.mainWidget.setCurrentWidget(self.mdiWindow)
+        self.mdiWindow.openFile(text)
+
+    def openDatsFile(self, text):
+        if self.datsWindow.openLog(text):
+            self.mainWidget.setCurrentWidget(self.datsWindow)
+
+    def showHelp(self):
+        self.mainWidget.setCurrentWidget(self.homepageWindow)
+        self.homepageWindow.showHelp()
 
     def closeEvent(self, event: QCloseEvent) -> None:
-        ret = self.mdiWindow.maybeSave()
-        if not ret:
-            event.ignore()
-            return
-        logger.debug("Mdi window ready to close.")
-
-        ret = self.datsWindow.maybeSave()
-        if not ret:
-            event.ignore()
-            return
-        logger.debug("Dats window ready to close.")
-
-        ok = self.mdiWindow.close()
-        if not ok:
-            event.ignore()
-            return
-        logger.debug("MDI window closed.")
-
-        ok = self.datsWindow.close()
-        if not ok:
-            event.ignore()
-            return
-        logger.debug("Dats window closed.")
+        builtWindows = [
+            (name, window)
+            for name, window in (("Mdi", self._mdiWindow), ("Dats", self._datsWindow))
+            if window is not None
+        ]
+
+        for name, window in builtWindows:
+            ret = window.maybeSave()
+            if not ret:
+                event.ignore()
+                return
+            logger.debug(f"{name} window ready to close.")
+
+        for name, window in builtWindows:
+            ok = window.close()
+            if not ok:
+                event.ignore()
+                return
+            logger.debug(f"{name} window closed.")
 
         self.homepageWindow.close()
         logger.debug("Homepage window closed.")
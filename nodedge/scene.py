@@ -7,7 +7,7 @@ import json
 import logging
 import os
 from collections import OrderedDict
-from typing import Callable, List, Optional, cast
+from typing import Callable, Dict, List, Optional, Set, cast
 
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import QGraphicsItem, QMessageBox
@@ -22,7 +22,9 @@ from nodedge.graphics_view import GraphicsView
 from nodedge.node import Node
 from nodedge.scene_clipboard import SceneClipboard
 from nodedge.scene_coder import SceneCoder
+from nodedge.scene_evaluator import SceneEvaluator
 from nodedge.scene_history import SceneHistory
+from nodedge.scene_scheduler import AlgebraicLoopError, scheduleNodes
 from nodedge.scene_simulator import SceneSimulator
 from nodedge.serializable import Serializable
 from nodedge.utils import dumpException
@@ -62,13 +64,22 @@ class Scene(Serializable):
         self.isModified: bool = False
 
         self._lastSelectedItems: List[QGraphicsItem] = []
+        # Selected items, in selection order, updated by the items themselves.
+        self._selectedItems: Dict[QGraphicsItem, None] = {}
+        # Items whose last selected state is set, see resetLastSelectedStates.
+        self._lastSelectedStateItems: Set[QGraphicsItem] = set()
 
         self._hasBeenModifiedListeners: List[Callable] = []
         self._itemSelectedListeners: List[Callable] = []
         self._itemsDeselectedListeners: List[Callable] = []
+        self._nodeAddedListeners: List[Callable] = []
+        self._nodeRemovedListeners: List[Callable] = []
+        self._nodeChangedListeners: List[Callable] = []
 
         self._silentSelectionEvents: bool = False
 
+        self.evaluator: SceneEvaluator = SceneEvaluator(self)
+
         # Store callback for retrieving the nodes classes
         self.nodeClassSelector = None
 
@@ -134,27 +145,59 @@ class Scene(Serializable):
     @property
     def selectedItems(self) -> List[QGraphicsItem]:
         """
-        Returns currently selected Graphics Items
+        Returns currently selected Graphics Items, from the selection index
+        maintained by :func:`~nodedge.scene.Scene.onItemSelectedChanged`.
 
         :return: list of ``QGraphicsItems``
         :rtype: list[QGraphicsItem]
         """
 
-        return self.graphicsScene.selectedItems()
+        return list(self._selectedItems)
 
     @property
     def selectedNode(self) -> Optional[Node]:
         ret = None
-        logger.debug(self.selectedItems)
-        if len(self.selectedItems) == 1:
-            if isinstance(self.selectedItems[0], GraphicsNode):
-                ret = self.selectedItems[0].node
+        logger.debug(self._selectedItems)
+        if len(self._selectedItems) == 1:
+            item = next(iter(self._selectedItems))
+            if isinstance(item, GraphicsNode):
+                ret = item.node
 
         return ret
 
     @property
     def selectedNodes(self) -> List[GraphicsNode]:
-        return [item for item in self.selectedItems if isinstance(item, GraphicsNode)]
+        return [item for item in self._selectedItems if isinstance(item, GraphicsNode)]
+
+    def onItemSelectedChanged(self, item: QGraphicsItem, isSelected: bool) -> None:
+        """
+        Update the selection index, when an item of the graphics scene is selected
+        or deselected, or leaves the graphics scene.
+
+        :param item: selected or deselected item
+        :type item: ``QGraphicsItem``
+        :param isSelected: new selection state of the item
+        :type isSelected: ``bool``
+        """
+        if isSelected:
+            self._selectedItems[item] = None
+        else:
+            self._selectedItems.pop(item, None)
+
+    def onItemSelectedStateChanged(self, item: QGraphicsItem, value: bool) -> None:
+        """
+        Keep track of the items whose last selected state is set, so that
+        :func:`~nodedge.scene.Scene.resetLastSelectedStates` only resets them.
+
+        :param item: graphics node or edge
+        :type item: ``QGraphicsItem``
+        :param value: new last selected state of the item
+        :type value: ``bool``
+        """
+        if value:
+            self._lastSelectedStateItems.add(item)
+        else:
+            self._lastSelectedStateItems.discard(item)
 
     @property
     def graphicsView(self) -> GraphicsView:
@@ -192,11 +235,11 @@ class Scene(Serializable):
             return
 
         selectedItems = self.selectedItems
-        logger.debug(f"Selected items in scene: {selectedItems}")
-        logger.debug(f"Last selected items in scene: {self._lastSelectedItems}")
+        logger.debug(f"Selected items in scene: {len(selectedItems)}")
+        logger.debug(f"Last selected items in scene: {len(self._lastSelectedItems)}")
 
-        if self.selectedItems != self._lastSelectedItems:
-            self.lastSelectedItems = self.selectedItems
+        if selectedItems != self._lastSelectedItems:
+            self.lastSelectedItems = selectedItems
             if not silent:
                 # we could create some kind of UI which could be serialized,
                 # therefore first run all callbacks...
@@ -214,11 +257,12 @@ class Scene(Serializable):
         :type silent: ``bool``
         """
 
-        if self.selectedItems == self.lastSelectedItems:
+        selectedItems = self.selectedItems
+        if selectedItems == self.lastSelectedItems:
             return
 
         self.resetLastSelectedStates()
-        if not self.selectedItems:
+        if not selectedItems:
             self.lastSelectedItems = []
 
             if not silent:
@@ -233,7 +277,7 @@ class Scene(Serializable):
         :param silent: If ``True`` scene's onItemsDeselected won't be called
         :type silent: ``bool``
         """
-        for item in self.selectedItems:
+        for item in list(self._selectedItems):
             item.setSelected(False)
         if not silent:
             self.onItemsDeselected()
@@ -264,6 +308,44 @@ class Scene(Serializable):
         """
         self._itemsDeselectedListeners.append(callback)
 
+    def addNodeAddedListener(self, callback: Callable[[Node], None]):
+        """
+        Register callback for `Node Added` event
+
+        :param callback: callback function, called with the added node
+        :type callback: ``Callable[[Node], None]``
+        """
+        self._nodeAddedListeners.append(callback)
+
+    def addNodeRemovedListener(self, callback: Callable[[Node], None]):
+        """
+        Register callback for `Node Removed` event
+
+        :param callback: callback function, called with the removed node
+        :type callback: ``Callable[[Node], None]``
+        """
+        self._nodeRemovedListeners.append(callback)
+
+    def addNodeChangedListener(self, callback: Callable[[Node], None]):
+        """
+        Register callback for `Node Changed` event, triggered when a node is renamed
+        or moved.
+
+        :param callback: callback function, called with the changed node
+        :type callback: ``Callable[[Node], None]``
+        """
+        self._nodeChangedListeners.append(callback)
+
+    def onNodeChanged(self, node: Node):
+        """
+        Handle the renaming or the move of a node and trigger event `Node Changed`
+
+        :param node: renamed or moved node
+        :type node: :class:`~nodedge.node.Node`
+        """
+        for callback in self._nodeChangedListeners:
+            callback(node)
+
     def addDragEnterListener(self, callback: Callable[[QDragEnterEvent], None]):
         """
         Register callback for `Drag Enter` event
@@ -283,11 +365,10 @@ class Scene(Serializable):
     def resetLastSelectedStates(self) -> None:
         """Resets internal `selected flags` in all `Nodes` and `Edges` in the `Scene`"""
 
-        for node in self.nodes:
-            node.graphicsNode.selectedState = False
-
-        for edge in self.edges:
-            edge.graphicsEdge.selectedState = False
+        items = self._lastSelectedStateItems
+        self._lastSelectedStateItems = set()
+        for item in items:
+            item.selectedState = False
 
     def addNode(self, node: Node):
         """Add :class:`~nodedge.node.Node` to this `Scene`
@@ -296,6 +377,8 @@ class Scene(Serializable):
         :type node: :class:`~nodedge.node.Node`
         """
         self.nodes.append(node)
+        for callback in self._nodeAddedListeners:
+            callback(node)
 
     def addElement(self):
         element = CommentElement(self)
@@ -319,6 +402,8 @@ class Scene(Serializable):
         """
         if nodeToRemove in self.nodes:
             self.nodes.remove(nodeToRemove)
+            for callback in self._nodeRemovedListeners:
+                callback(nodeToRemove)
         else:
             logger.warning(
                 f"Trying to remove {nodeToRemove} from {self} but is it not in the "
@@ -377,28 +462,47 @@ class Scene(Serializable):
             self.isModified = False
             self.filename = filename
 
-    def loadFromFile(self, filename: str) -> None:
+    @staticmethod
+    def readFile(filename: str) -> dict:
         """
-        Load `Scene` from a file on disk
+        Read and decode a file saved by :func:`~nodedge.scene.Scene.saveToFile`.
+        It does not create any Qt object, so it can run outside of the GUI thread.
 
-        :param filename: from what file to load the `Scene`
+        :param filename: file to read
         :type filename: ``str``
+        :return: serialized scene
+        :rtype: ``dict``
         :raises: :class:`~nodedge.scene.InvalidFile` if there was an error
             decoding JSON file.
         """
         with open(filename) as file:
             rawData = file.read()
-            try:
-                data = json.loads(rawData)
-                self.deserialize(data)
-                self.isModified = False
-                self.filename = filename
-            except json.JSONDecodeError:
-                raise InvalidFile(
-                    f"{os.path.basename(filename)} is not a valid JSON file"
-                )
-            except Exception as e:
-                dumpException(e)
+        try:
+            data: dict = json.loads(rawData)
+        except json.JSONDecodeError:
+            raise InvalidFile(f"{os.path.basename(filename)} is not a valid JSON file")
+        return data
+
+    def loadFromFile(self, filename: str, data: Optional[dict] = None) -> None:
+        """
+        Load `Scene` from a file on disk
+
+        :param filename: from what file to load the `Scene`
+        :type filename: ``str``
+        :param data: content of the file if it has already been read with
+            :func:`~nodedge.scene.Scene.readFile`, e.g. in a worker thread
+        :type data: ``Optional[dict]``
+        :raises: :class:`~nodedge.scene.InvalidFile` if there was an error
+            decoding JSON file.
+        """
+        if data is None:
+            data = self.readFile(filename)
+        try:
+            self.deserialize(data)
+            self.isModified = False
+            self.filename = filename
+        except Exception as e:
+            dumpException(e)
 
     def serialize(self) -> OrderedDict:
         """
@@ -598,6 +702,30 @@ class Scene(Serializable):
                 return node
         return None
 
+    def evalAllNodes(self) -> bool:
+        """
+        Evaluate every node of the scene once, after the nodes connected to its
+        inputs.
+
+        :return: ``False`` if the scene contains an algebraic loop, whose nodes are
+            then marked invalid
+        :rtype: ``bool``
+        """
+        try:
+            schedule = scheduleNodes(self.nodes)
+        except AlgebraicLoopError as e:
+            logger.warning(e)
+            for node in e.nodes:
+                node.isInvalid = True
+                node.graphicsNode.setToolTip(str(e))
+            return False
+
+        for node in schedule:
+            node.isDirty = True
+        for node in schedule:
+            node.eval(evalChildren=False)
+        return True
+
     def resetAllNodes(self):
         for node in self.nodes:
             node.resetState()
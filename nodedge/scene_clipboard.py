@@ -3,16 +3,87 @@
 Scene clipboard module containing :class:`~nodedge.scene_clipboard.SceneClipboard`.
 """
 
+import json
 import logging
+import zlib
 from collections import OrderedDict
+from typing import Optional
 
-from PySide6.QtCore import QPointF
+from PySide6.QtCore import QByteArray, QMimeData, QPointF
 
 from nodedge.edge import Edge
 from nodedge.graphics_edge import GraphicsEdge
 
 logger = logging.getLogger(__file__)
 
+#: Compact MIME type of the copied items: zlib compressed JSON.
+MIME_TYPE = "application/x-nodedge-items"
+#: MIME type of the key of the copied items, for pasting in the same process.
+MIME_TYPE_KEY = "application/x-nodedge-items-key"
+
+
+def toMimeData(data: dict, key: Optional[str] = None) -> QMimeData:
+    """
+    Encode serialized items for the system clipboard, in the compact binary MIME
+    type, with plain JSON text as a fallback for other applications.
+
+    :param data: items serialized by
+        :func:`~nodedge.scene_clipboard.SceneClipboard.serializeSelected`
+    :type data: ``dict``
+    :param key: key of the data kept by the copying window, to paste them without
+        decoding them again
+    :type key: ``Optional[str]``
+    :return: clipboard content
+    :rtype: ``QMimeData``
+    """
+    text = json.dumps(data, separators=(",", ":"))
+    mimeData = QMimeData()
+    mimeData.setData(MIME_TYPE, QByteArray(zlib.compress(text.encode("utf-8"), 1)))
+    mimeData.setText(text)
+    if key is not None:
+        mimeData.setData(MIME_TYPE_KEY, QByteArray(key.encode("utf-8")))
+    return mimeData
+
+
+def mimeDataKey(mimeData: QMimeData) -> Optional[str]:
+    """
+    :param mimeData: clipboard content
+    :type mimeData: ``QMimeData``
+    :return: key given to :func:`~nodedge.scene_clipboard.toMimeData`, if any
+    :rtype: ``Optional[str]``
+    """
+    if not mimeData.hasFormat(MIME_TYPE_KEY):
+        return None
+    return bytes(mimeData.data(MIME_TYPE_KEY).data()).decode("utf-8")
+
+
+def fromMimeData(mimeData: QMimeData) -> Optional[dict]:
+    """
+    Decode serialized items from the system clipboard, from the binary MIME type
+    or else from the JSON text.
+
+    :param mimeData: clipboard content
+    :type mimeData: ``QMimeData``
+    :return: serialized items, ``None`` if the clipboard does not contain any
+    :rtype: ``Optional[dict]``
+    """
+    try:
+        if mimeData.hasFormat(MIME_TYPE):
+            rawData = zlib.decompress(bytes(mimeData.data(MIME_TYPE).data()))
+        elif mimeData.hasText():
+            rawData = mimeData.text().encode("utf-8")
+        else:
+            return None
+        data = json.loads(rawData)
+    except (ValueError, zlib.error) as e:
+        logger.debug(f"Pasting of not valid json data: {e}")
+        return None
+
+    if not isinstance(data, dict) or "nodes" not in data:
+        logger.debug("JSON does not contain any blocks!")
+        return None
+    return data
+
 
 class SceneClipboard:
     """
@@ -36,35 +107,27 @@ class SceneClipboard:
         """
         logger.debug("Copying to clipboard")
 
-        serializedSelectedNodes, selectedEdges, selectedSocket = [], [], {}
+        serializedSelectedNodes, selectedEdges, selectedSocketIds = [], [], set()
 
         # Sort edges and blocks
-        for item in self.scene.graphicsScene.selectedItems():
+        for item in self.scene.selectedItems:
             if hasattr(item, "node"):
                 serializedSelectedNodes.append(item.node.serialize())
                 for socket in item.node.inputSockets + item.node.outputSockets:
-                    selectedSocket[socket.id] = socket
+                    selectedSocketIds.add(socket.id)
             elif isinstance(item, GraphicsEdge):
                 selectedEdges.append(item.edge)
 
-        logger.debug(f"Nodes: {serializedSelectedNodes}")
-        logger.debug(f"Edges: {selectedEdges}")
-        logger.debug(f"Sockets: {selectedSocket}")
-
-        # Remove all edges which are not connected to a node in our list
-        edgesToRemove = []
-        for edge in selectedEdges:
-            if (
-                edge.sourceSocket.id not in selectedSocket
-                or edge.targetSocket.id not in selectedSocket
-            ):
-                logger.debug(f"Edge: {edge} is not connected with both sides")
-                edgesToRemove.append(edge)
-
-        for edge in edgesToRemove:
-            selectedEdges.remove(edge)
+        logger.debug(f"Nodes: {len(serializedSelectedNodes)}")
+        logger.debug(f"Edges: {len(selectedEdges)}")
 
-        serializedEdgesToKeep = [edge.serialize() for edge in selectedEdges]
+        # Only keep the edges connected to a node in our list on both sides
+        serializedEdgesToKeep = [
+            edge.serialize()
+            for edge in selectedEdges
+            if edge.sourceSocket.id in selectedSocketIds
+            and edge.targetSocket.id in selectedSocketIds
+        ]
         # Create data
         data = OrderedDict(
             [("nodes", serializedSelectedNodes), ("edges", serializedEdgesToKeep)]
@@ -144,6 +207,6 @@ class SceneClipboard:
 
         # Store history
         self.scene.history.store("Paste items in scene.")
-        logger.debug(f"Deserializing from clipboard: {data}")
+        logger.debug(f"Deserialized {len(createdNodes)} nodes from clipboard.")
 
         return createdNodes
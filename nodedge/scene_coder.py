@@ -2,18 +2,55 @@
 """
 Scene Coder module containing :class:`~nodedge.scene_coder.SceneCoder` class.
 """
+import hashlib
+import json
+import linecache
 import logging
+import textwrap
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
+import numpy as np
 from PySide6.QtCore import QObject, QSettings, QStandardPaths, Signal
 from PySide6.QtWidgets import QFileDialog
 
-from nodedge.blocks import OP_NODE_CUSTOM_OUTPUT
+from nodedge.blocks import OP_NODE_CUSTOM_CONSTANT, OP_NODE_CUSTOM_OUTPUT
 from nodedge.connector import Socket
 from nodedge.node import Node
+from nodedge.scene_scheduler import Schedule, ancestors, descendants, scheduleNodes
 from nodedge.utils import indentCode
 
+logger = logging.getLogger(__name__)
+
+# Name of the function evaluating the scene once, when compiled in memory.
+COMPILED_FUNCTION_NAME = "evaluate"
+# Number of compiled scenes kept in memory.
+COMPILED_SCENES_CACHE_SIZE = 16
+# Blocks from these libraries only call numeric functions supported by numba.
+NUMERIC_LIBRARIES = ("numpy",)
+
+
+class CompiledScene:
+    """
+    :class:`~nodedge.scene_coder.CompiledScene` class
+
+    Functions compiled from the code generated for a scene, see
+    :meth:`~nodedge.scene_coder.SceneCoder.compileCode`.
+    """
+
+    def __init__(self, namespace: dict, source: str, hasArrayStages: bool = False):
+        #: Evaluate the scene once, returning the values of the output blocks.
+        self.evaluate: Callable[..., list] = namespace[COMPILED_FUNCTION_NAME]
+        #: Generator yielding the values of the output blocks at each time step.
+        self.steps: Callable[[float], Iterator[list]] = namespace["steps"]
+        #: Run a whole simulation, returning the times and the output arrays.
+        self.simulate: Callable[[float, float], tuple] = namespace["simulate"]
+        self.source: str = source
+        #: If ``True``, the scene contains vectorized blocks: only
+        #: :attr:`simulate` can run it over time.
+        self.hasArrayStages: bool = hasArrayStages
+
 
 class SceneCoder(QObject):
     """:class:`~nodedge.scene_coder.SceneCoder` class ."""
@@ -30,10 +67,16 @@ class SceneCoder(QObject):
 
         self.generatedCode = ""
 
+        self._compiledScenes: "OrderedDict[str, CompiledScene]" = OrderedDict()
+
     def generateCodeAndSave(self):
 
         orderedNodeList, generatedCode = self.generateCode()
-        self.generatedCode = self.addImports(orderedNodeList, generatedCode)
+        self.generatedCode = self.addImports(
+            orderedNodeList,
+            generatedCode,
+            simulationCode=self.generateSimulationCode(),
+        )
         self.saveFileAs(self.generatedCode)
         return
 
@@ -41,13 +84,219 @@ class SceneCoder(QObject):
         """
         Generate a python function corresponding to the content of the scene.
 
+        The function evaluates the scene once. Stateful blocks start from their
+        initial state, see :meth:`generateSimulationCode` to run several steps.
+
         :return: The function as a string
         :rtype: ``str``
         """
+        orderedNodeList, blocksCode, _, outputVarNames = self._generateBlocksCode()
+
         generatedCode: str = ""
-        orderedNodeList: List[Node] = []
-        outputNodes: List[Node] = []
+        for stateCode, _, _ in blocksCode:
+            generatedCode += stateCode
+        for _, stepCode, _ in blocksCode:
+            generatedCode += stepCode
+        generatedCode += "return [" + ", ".join(outputVarNames) + "]"
 
+        return orderedNodeList, generatedCode
+
+    def generateSimulationCode(self) -> str:
+        """
+        Generate the functions simulating the scene over time:
+
+        - ``steps(dt)`` is a generator yielding the values of the output blocks at
+          each time step,
+        - ``simulate(final_time, dt)`` runs all the steps at once, and returns the
+          times and the values of every output block in preallocated arrays.
+
+        The states of the blocks are initialized once, and blocks which do not
+        depend on a stateful block are evaluated before the first step.
+
+        Vectorized blocks, and the blocks depending on them, are array stages: they
+        are evaluated once after the last step, on the signals recorded during the
+        steps. Only ``simulate`` supports them.
+
+        :return: The functions as a string
+        :rtype: ``str``
+        :raises: ``NotImplementedError`` if a block depending on a vectorized block
+            is neither pure nor vectorized
+        """
+        blocks = self._generateBlocksCode()
+        orderedNodeList, blocksCode, updateCode, outputVarNames = blocks
+        arrayStageIds = self._arrayStageIds(orderedNodeList)
+        bufferedIds = self._bufferedIds(orderedNodeList, outputVarNames)
+
+        initCode: str = ""
+        stepCode: str = ""
+        arrayCode: str = ""
+        recordedVarIndexes: List[int] = []
+        isInvariant: List[bool] = []
+        for currentVarIndex, node in enumerate(orderedNodeList):
+            blockStateCode, blockStepCode, inputVarIndexes = blocksCode[currentVarIndex]
+            initCode += blockStateCode
+            if node.id in arrayStageIds:
+                isInvariant.append(False)
+                if node.isVectorized:
+                    arrayCode += node.generateArrayCode(
+                        currentVarIndex, inputVarIndexes
+                    )
+                elif self._isPure(node):
+                    # Numeric blocks broadcast over the time axis.
+                    arrayCode += blockStepCode
+                else:
+                    raise NotImplementedError(
+                        f"{node.title} cannot depend on a vectorized block"
+                    )
+                for index in inputVarIndexes:
+                    # Invariant inputs broadcast, unless given to user code.
+                    if (
+                        orderedNodeList[index].id not in arrayStageIds
+                        and index not in recordedVarIndexes
+                        and (node.isVectorized or not isInvariant[index])
+                    ):
+                        recordedVarIndexes.append(index)
+                continue
+            invariant = self._isPure(node) and all(
+                isInvariant[index] for index in inputVarIndexes
+            )
+            isInvariant.append(invariant)
+            if invariant:
+                initCode += blockStepCode
+            elif node.id in bufferedIds:
+                # The output buffer is allocated once, and filled at every step.
+                outputSocket = node.outputSockets[0]
+                initCode += (
+                    f"buffer_{currentVarIndex} = empty({outputSocket.shape}, "
+                    f"dtype='{np.dtype(outputSocket.dtype).name}')\n"
+                )
+                inputVarNames = [f"var_{index}" for index in inputVarIndexes]
+                stepCode += (
+                    f"var_{currentVarIndex} = {node.evalString}("
+                    f"{', '.join(inputVarNames)}, buffer_{currentVarIndex})\n"
+                )
+            else:
+                stepCode += blockStepCode
+        stepCode += updateCode
+
+        if arrayStageIds:
+            stepsFunction = (
+                "def steps(dt):\n"
+                + "    raise NotImplementedError("
+                + '"Vectorized blocks are only evaluated by simulate")\n'
+            )
+        else:
+            yieldCode = "yield [" + ", ".join(outputVarNames) + "]\n"
+            stepsFunction = (
+                "def steps(dt):\n"
+                + textwrap.indent(initCode, "    ")
+                + "    while True:\n"
+                + textwrap.indent(stepCode + yieldCode, "        ")
+            )
+
+        # Signals are recorded during the steps, in preallocated arrays.
+        arrayVarNames = [f"var_{index}" for index in recordedVarIndexes]
+        arrayNames = [f"signal_{index}" for index in recordedVarIndexes]
+        arrayStageVarNames = {
+            f"var_{index}"
+            for index, node in enumerate(orderedNodeList)
+            if node.id in arrayStageIds
+        }
+        outputsAfterSteps: str = ""
+        for outputIndex, outputVarName in enumerate(outputVarNames):
+            outputName = f"output_{outputIndex}"
+            if outputVarName in arrayStageVarNames:
+                outputsAfterSteps += f"{outputName} = {outputVarName}\n"
+            else:
+                arrayVarNames.append(outputVarName)
+                arrayNames.append(outputName)
+
+        arraysInit: str = ""
+        arraysStore: str = ""
+        arraysAllocation: str = ""
+        for arrayName, varName in zip(arrayNames, arrayVarNames):
+            arraysInit += f"{arrayName} = empty(0)\n"
+            arraysAllocation += (
+                f"{arrayName} = empty((steps_count,) + shape({varName}), "
+                f"dtype=result_type({varName}))\n"
+            )
+            arraysStore += f"{arrayName}[step_index] = {varName}\n"
+        outputNames = ", ".join(
+            f"output_{outputIndex}" for outputIndex in range(len(outputVarNames))
+        )
+        loopCode = stepCode
+        if arrayNames:
+            loopCode += (
+                "if step_index == 0:\n"
+                + textwrap.indent(arraysAllocation, "    ")
+                + arraysStore
+            )
+        for index in recordedVarIndexes:
+            arrayCode = f"var_{index} = signal_{index}\n" + arrayCode
+        simulateFunction = (
+            "def simulate(final_time, dt):\n"
+            + "    steps_count = int(round(final_time / dt))\n"
+            + textwrap.indent(initCode + arraysInit, "    ")
+            + "    for step_index in range(steps_count):\n"
+            + textwrap.indent(loopCode or "pass\n", "        ")
+            + textwrap.indent(arrayCode + outputsAfterSteps, "    ")
+            + f"    return arange(1, steps_count + 1) * dt, [{outputNames}]\n"
+        )
+
+        return stepsFunction + "\n\n" + simulateFunction
+
+    @staticmethod
+    def _arrayStageIds(orderedNodeList: List[Node]) -> Set[int]:
+        # Vectorized blocks need their whole input signals, and so do their
+        # descendants.
+        nodeIds = {node.id for node in orderedNodeList}
+        vectorizedNodes = [node for node in orderedNodeList if node.isVectorized]
+        arrayStageIds = {node.id for node in vectorizedNodes}
+        for node in vectorizedNodes:
+            arrayStageIds.update(
+                descendant.id
+                for descendant in descendants(node)
+                if descendant.id in nodeIds
+            )
+        return arrayStageIds
+
+    def _bufferedIds(
+        self, orderedNodeList: List[Node], outputVarNames: List[str]
+    ) -> Set[int]:
+        # Array outputs of ufuncs are written in place when the values of the
+        # previous step are not kept: only pure blocks read them.
+        nodeIds = {node.id for node in orderedNodeList}
+        bufferedIds: Set[int] = set()
+        for currentVarIndex, node in enumerate(orderedNodeList):
+            ufunc = getattr(np, node.evalString, None) if node.isElementwise else None
+            if (
+                not isinstance(ufunc, np.ufunc)
+                or ufunc.nout != 1
+                or ufunc.nin != len(node.inputSockets)
+                or len(node.outputSockets) != 1
+                or not node.outputSockets[0].shape
+                or f"var_{currentVarIndex}" in outputVarNames
+            ):
+                continue
+            if all(
+                self._isPure(child)
+                for child in node.getChildNodes()
+                if child.id in nodeIds
+            ):
+                bufferedIds.add(node.id)
+        return bufferedIds
+
+    def _generateBlocksCode(
+        self,
+    ) -> Tuple[List[Node], List[Tuple[str, str, List[int]]], str, List[str]]:
+        """
+        Generate the code of every block of the scene.
+
+        :return: blocks in evaluation order; their state initialization, their step
+            and the variable indexes of their inputs; the state updates of the
+            blocks breaking feedback loops; the variables of the outputs
+        :rtype: ``Tuple[List[Node], List[Tuple[str, str, List[int]]], str, List[str]]``
+        """
         nodes = self.scene.nodes
 
         # check if scene is incomplete (i.e., disconnected node)
@@ -61,52 +310,234 @@ class SceneCoder(QObject):
                     )
                     self.notConnectedSocket.emit()
 
-        # if scene is not codable: raise a warning and exit
-
         # find all output nodes
-        for node in nodes:
-            if node.operationCode is OP_NODE_CUSTOM_OUTPUT:
-                outputNodes.append(node)
+        outputNodes = self.outputNodes()
         if not outputNodes:
             # raise error: the scene has no output
             pass
 
-        # determine coding order
-        for outputNode in outputNodes:
-            # find complete hierarchy of an output node
-            nodesToAdd: List[Node] = self._appendHierarchyUntilRoot(
-                outputNode, orderedNodeList, []
-            )
-
-            # remove output node from the list, reverse order of the nodes to add and append
-            nodesToAdd.pop(0)
-            if nodesToAdd:
-                nodesToAdd.reverse()
-                orderedNodeList.extend(nodesToAdd)
+        # determine coding order, feedback loops are broken at stateful blocks
+        schedule = self.schedule(outputNodes)
+        orderedNodeList: List[Node] = schedule.nodes
 
         # generate code for all nodes
+        blocksCode: List[Tuple[str, str, List[int]]] = []
+        updateCode: str = ""
         for currentVarIndex, node in enumerate(orderedNodeList):
-            inputNodes = node.getParentNodes()
-            inputVarIndexes: List[int] = []
-            for inputNode in inputNodes:
-                inputVarIndexes.append(orderedNodeList.index(inputNode))
-            generatedCode += node.generateCode(currentVarIndex, inputVarIndexes)
+            inputVarIndexes = self._inputVarIndexes(node, schedule)
+            stateCode = node.generateStateCode(currentVarIndex)
+            if schedule.isDelayed(node):
+                blocksCode.append(
+                    (stateCode, node.generateOutputCode(currentVarIndex), [])
+                )
+                updateCode += node.generateUpdateCode(currentVarIndex, inputVarIndexes)
+            else:
+                blocksCode.append(
+                    (
+                        stateCode,
+                        node.generateCode(currentVarIndex, inputVarIndexes),
+                        inputVarIndexes,
+                    )
+                )
 
         # add returned output list
         outputVarNames: List[str] = []
         for node in outputNodes:
-            inputNode = node.getParentNodes()
-            inputVarIndex = orderedNodeList.index(inputNode[0])
-            outputVarNames.append(node.generateCode())
-        generatedCode += "return [" + ", ".join(outputVarNames) + "]"
+            outputVarNames.append(
+                node.generateCode(0, self._inputVarIndexes(node, schedule))
+            )
         self.__logger.debug(orderedNodeList)
 
-        return orderedNodeList, generatedCode
+        return orderedNodeList, blocksCode, updateCode, outputVarNames
 
-    def addImports(self, orderedNodeList, generatedCode):
-        # add imports on top
-        importedLibraries = {}
-        for currentVarIndex, node in enumerate(orderedNodeList):
+    def outputNodes(self) -> List[Node]:
+        """
+        Retrieve the output blocks connected to another block.
+
+        :return: output blocks, in the order of the values returned by the
+            generated function
+        :rtype: List[:class:`~nodedge.node.Node`]
+        """
+        return [
+            node
+            for node in self.scene.nodes
+            if node.operationCode is OP_NODE_CUSTOM_OUTPUT and node.getParentNodes()
+        ]
+
+    def schedule(self, outputNodes: Optional[List[Node]] = None) -> Schedule:
+        """
+        Order the blocks the output blocks depend on, feedback loops being broken
+        at stateful blocks.
+
+        :param outputNodes: output blocks, all the connected ones by default
+        :type outputNodes: ``Optional[List[Node]]``
+        :return: evaluation order, without the output blocks
+        :rtype: :class:`~nodedge.scene_scheduler.Schedule`
+        :raises: :class:`~nodedge.scene_scheduler.AlgebraicLoopError` if a loop
+            cannot be broken
+        """
+        if outputNodes is None:
+            outputNodes = self.outputNodes()
+        outputIds = {node.id for node in outputNodes}
+        nodes = [node for node in ancestors(outputNodes) if node.id not in outputIds]
+        # Keep the order of the scene for independent blocks.
+        nodeIds = {node.id for node in nodes}
+        nodes = [node for node in self.scene.nodes if node.id in nodeIds]
+        return scheduleNodes(nodes, breakLoops=True)
+
+    @staticmethod
+    def _inputVarIndexes(node: Node, schedule: Schedule) -> List[int]:
+        inputVarIndexes: List[int] = []
+        for index in range(len(node.inputSockets)):
+            inputNode = node.inputNodeAt(index)
+            if inputNode is not None and inputNode in schedule:
+                inputVarIndexes.append(schedule.index(inputNode))
+        return inputVarIndexes
+
+    def sceneHash(self) -> str:
+        """
+        Compute a hash of the topology of the scene and of the parameters of its
+        blocks, i.e. of everything the generated code depends on.
+
+        :return: hexadecimal digest
+        :rtype: ``str``
+        """
+        fingerprint: list = []
+        for node in self.scene.nodes:
+            content = getattr(node, "content", None)
+            fingerprint.append(
+                [
+                    node.id,
+                    node.title,
+                    getattr(node, "operationCode", None),
+                    content.serialize() if content is not None else None,
+                    [param.value for param in getattr(node, "params", [])],
+                    # Array outputs are preallocated according to their shape.
+                    [(socket.shape, socket.dtype) for socket in node.outputSockets],
+                ]
+            )
+        for edge in self.scene.edges:
+            source, target = edge.sourceSocket, edge.targetSocket
+            if source is None or target is None:
+                continue
+            fingerprint.append(
+                [source.node.id, source.index, target.node.id, target.index]
+            )
+
+        # The time step is the default argument of the generated function.
+        fingerprint.append(self.scene.simulator.config.timeStep)
+
+        serializedFingerprint = json.dumps(fingerprint, default=str)
+        return hashlib.sha1(serializedFingerprint.encode()).hexdigest()
+
+    def compileCode(self, useNumba: bool = True) -> "CompiledScene":
+        """
+        Compile the code generated for the scene, see :meth:`generateCode` and
+        :meth:`generateSimulationCode`.
+
+        Compiled scenes are cached by :meth:`sceneHash`: the scene is only compiled
+        again when its topology or the parameters of its blocks change.
+        If numba is installed and the scene only contains numeric blocks, the
+        simulation is also compiled to machine code.
+
+        :param useNumba: if ``False``, numba is never used
+        :type useNumba: ``bool``
+        :return: compiled functions
+        :rtype: :class:`~nodedge.scene_coder.CompiledScene`
+        :raises: ``NotImplementedError`` if a block does not support code generation
+        """
+        key = self.sceneHash()
+        compiledScene = self._compiledScenes.get(key)
+        if compiledScene is not None:
+            self._compiledScenes.move_to_end(key)
+            return compiledScene
+
+        orderedNodeList, generatedCode = self.generateCode()
+        source = self.addImports(
+            orderedNodeList,
+            generatedCode,
+            COMPILED_FUNCTION_NAME,
+            self.generateSimulationCode(),
+        )
+        # Generating the code may evaluate blocks, which sets the shapes of their
+        # outputs: the compiled scene is cached by the hash of the compiled scene.
+        key = self.sceneHash()
+
+        # Register the source, so that tracebacks show the generated lines.
+        filename = f"<nodedge-scene-{key[:12]}>"
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            filename,
+        )
+        namespace: dict = {"__name__": "nodedge.generated"}
+        exec(compile(source, filename, "exec"), namespace)
+        compiledScene = CompiledScene(
+            namespace, source, any(node.isVectorized for node in orderedNodeList)
+        )
+
+        if useNumba and self._isNumeric(orderedNodeList):
+            timeStep = self.scene.simulator.config.timeStep or 1.0
+            compiledScene.simulate = self._jit(compiledScene.simulate, timeStep)
+
+        self._compiledScenes[key] = compiledScene
+        while len(self._compiledScenes) > COMPILED_SCENES_CACHE_SIZE:
+            self._compiledScenes.popitem(last=False)
+        logger.debug(f"Compiled scene {key}")
+
+        return compiledScene
+
+    @staticmethod
+    def _isPure(node: Node) -> bool:
+        # The output of a pure block only depends on its inputs.
+        return not node.isStateful and (
+            node.operationCode == OP_NODE_CUSTOM_CONSTANT
+            or node.library in NUMERIC_LIBRARIES
+        )
+
+    @staticmethod
+    def _isNumeric(orderedNodeList: List[Node]) -> bool:
+        for node in orderedNodeList:
+            if node.operationCode == OP_NODE_CUSTOM_CONSTANT:
+                if not np.issubdtype(np.asarray(node.value).dtype, np.number):
+                    return False
+            elif node.library not in NUMERIC_LIBRARIES and not node.isStateful:
+                # Stateful blocks generate array arithmetic only.
+                return False
+        return True
+
+    @staticmethod
+    def _jit(simulate: Callable, timeStep: float) -> Callable:
+        try:
+            import numba
+        except ImportError:
+            return simulate
+
+        jittedSimulate: Callable = numba.njit(simulate)
+        try:
+            # numba compiles the function at its first call.
+            jittedSimulate(timeStep, timeStep)
+        except Exception as e:
+            logger.info(f"Scene cannot be compiled with numba: {e}")
+            return simulate
+        return jittedSimulate
+
+    @staticmethod
+    def generateImports(orderedNodeList: List[Node], simulation: bool = False) -> str:
+        """
+        Generate the imports of the functions called by the code of the blocks.
+
+        :param orderedNodeList: blocks whose code is generated
+        :type orderedNodeList: List[:class:`~nodedge.node.Node`]
+        :param simulation: if ``True``, also import the functions used by
+            :meth:`generateSimulationCode`
+        :type simulation: ``bool``
+        :return: import lines
+        :rtype: ``str``
+        """
+        importedLibraries: Dict[str, List[str]] = {}
+        for node in orderedNodeList:
             if node.evalString and node.library:
                 if node.library not in importedLibraries:
                     importedLibraries[node.library] = []
@@ -118,17 +549,81 @@ class SceneCoder(QObject):
                 f"from {key} import {', '.join(importedLibraries[key])}\n"
             )
         generatedImport += "from numpy import array\n"
+        if simulation:
+            generatedImport += "from numpy import arange, empty, result_type, shape\n"
+        return generatedImport
+
+    def generateFunctionCode(self, functionName: str, inputNodes: List[Node]) -> str:
+        """
+        Generate a python function evaluating the scene once, whose arguments
+        ``input_0``, ``input_1``, ... replace the values of the given blocks. It is
+        used to evaluate a scene as a block of another scene, see
+        :class:`~nodedge.blocks.custom.subsystem_block.SubsystemBlock`.
+
+        :param functionName: name of the generated function
+        :type functionName: ``str``
+        :param inputNodes: blocks whose values are given as arguments
+        :type inputNodes: List[:class:`~nodedge.node.Node`]
+        :return: the imports and the function, as a string
+        :rtype: ``str``
+        :raises: ``NotImplementedError`` if the scene contains stateful or
+            vectorized blocks
+        """
+        orderedNodeList, blocksCode, _, outputVarNames = self._generateBlocksCode()
+        for node in orderedNodeList:
+            if node.isStateful or node.isVectorized:
+                raise NotImplementedError(
+                    f"{node.title} cannot be evaluated once per call of a function"
+                )
+
+        inputIndexes = {node.id: index for index, node in enumerate(inputNodes)}
+        generatedCode: str = ""
+        for currentVarIndex, node in enumerate(orderedNodeList):
+            stateCode, stepCode, _ = blocksCode[currentVarIndex]
+            inputIndex = inputIndexes.get(node.id)
+            if inputIndex is None:
+                generatedCode += stateCode + stepCode
+            else:
+                generatedCode += f"var_{currentVarIndex} = input_{inputIndex}\n"
+        generatedCode += "return [" + ", ".join(outputVarNames) + "]"
+
+        arguments = ", ".join(f"input_{index}" for index in range(len(inputNodes)))
+        return (
+            self.generateImports(orderedNodeList)
+            + f"\n\ndef {functionName}({arguments}):"
+            + indentCode(generatedCode)
+            + "\n"
+        )
+
+    def addImports(
+        self,
+        orderedNodeList,
+        generatedCode,
+        functionName: Optional[str] = None,
+        simulationCode: str = "",
+    ):
+        # add imports on top
+        generatedImport = self.generateImports(orderedNodeList, bool(simulationCode))
         generatedImport += "\n\n"
 
         # put code into a function
-        functionName = self._getFunctionName()
-        generatedFunctionDef = f"def {functionName}():"
+        if functionName is None:
+            functionName = self._getFunctionName()
+        if any(node.isStateful for node in orderedNodeList):
+            # Stateful blocks are updated according to the time step.
+            timeStep = self.scene.simulator.config.timeStep
+            generatedFunctionDef = f"def {functionName}(dt={timeStep}):"
+        else:
+            generatedFunctionDef = f"def {functionName}():"
+        if simulationCode:
+            simulationCode = "\n\n\n" + simulationCode.rstrip("\n")
         generatedFunctionCall = f"\n\n\nif __name__ == '__main__':\n    result = {functionName}()\n    print(result)"
 
         outputFileString = (
             generatedImport
             + generatedFunctionDef
             + indentCode(generatedCode)
+            + simulationCode
             + generatedFunctionCall
         )
 
@@ -173,17 +668,6 @@ class SceneCoder(QObject):
 
         return
 
-    def _appendHierarchyUntilRoot(
-        self, currentNode: Node, appendedNodes: List[Node], nodesToAdd: List[Node]
-    ):
-        nodesToAdd.append(currentNode)
-        parentNodes = currentNode.getParentNodes()
-        if parentNodes:
-            for parent in parentNodes:
-                if parent not in appendedNodes and parent not in nodesToAdd:
-                    self._appendHierarchyUntilRoot(parent, appendedNodes, nodesToAdd)
-        return nodesToAdd
-
     def _getFunctionName(self):
         filename = self.scene.filename
         if filename is None:
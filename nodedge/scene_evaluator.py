@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Scene evaluator module containing :class:`~nodedge.scene_evaluator.SceneEvaluator`
+class.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Set
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from nodedge.node import Node
+from nodedge.scene_scheduler import AlgebraicLoopError, descendants, scheduleNodes
+
+logger = logging.getLogger(__name__)
+
+# Maximum duration of an evaluation slice, in seconds, before the events of the user
+# interface are processed.
+EVALUATION_SLICE_PERIOD = 0.02
+
+
+class SceneEvaluator(QObject):
+    """
+    :class:`~nodedge.scene_evaluator.SceneEvaluator` class
+
+    Real-time evaluation of a scene.
+
+    The nodes whose inputs or parameters change during an iteration of the event
+    loop are collected, then evaluated once with their descendants, after the
+    nodes connected to their inputs. Long evaluations are split into slices,
+    between which the event loop processes the events of the user interface.
+    """
+
+    #: Emitted after each slice with the number of evaluated nodes and the number of
+    #: nodes to evaluate.
+    progressed = Signal(int, int)
+    #: Emitted when all the scheduled nodes have been evaluated.
+    finished = Signal()
+
+    def __init__(self, scene: "Scene", parent=None):  # type: ignore
+        super().__init__(parent)
+        self.scene = scene
+
+        # Nodes which changed since the last slice, by id.
+        self._roots: Dict[int, Node] = {}
+        # Nodes left to evaluate, in evaluation order.
+        self._pending: Deque[Node] = deque()
+        self._evaluatedCount: int = 0
+        self._removedIds: Set[int] = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.evaluateSlice)
+
+        scene.addNodeRemovedListener(self.onNodeRemoved)
+
+    @property
+    def isBusy(self) -> bool:
+        """
+        :getter: ``True`` if nodes are waiting to be evaluated
+        :rtype: ``bool``
+        """
+        return bool(self._roots or self._pending)
+
+    def scheduleEvaluation(self, node: Node) -> None:
+        """
+        Evaluate a node and its descendants once the current events are processed.
+
+        :param node: node whose inputs or parameters changed
+        :type node: :class:`~nodedge.node.Node`
+        """
+        self._roots[node.id] = node
+        self._removedIds.discard(node.id)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def onNodeRemoved(self, node: Node) -> None:
+        if self.isBusy:
+            self._roots.pop(node.id, None)
+            self._removedIds.add(node.id)
+
+    def evaluateSlice(self) -> None:
+        """
+        Evaluate the scheduled nodes, until all of them are evaluated or the slice
+        period is over.
+        """
+        if self._roots:
+            self._schedule()
+
+        startTime = time.perf_counter()
+        while self._pending:
+            node = self._pending.popleft()
+            if node.id in self._removedIds:
+                continue
+            node.eval(evalChildren=False)
+            self._evaluatedCount += 1
+            if time.perf_counter() - startTime > EVALUATION_SLICE_PERIOD:
+                break
+
+        # noinspection PyUnresolvedReferences
+        self.progressed.emit(
+            self._evaluatedCount, self._evaluatedCount + len(self._pending)
+        )
+        if self.isBusy:
+            self._timer.start()
+            return
+        self._evaluatedCount = 0
+        self._removedIds.clear()
+        # noinspection PyUnresolvedReferences
+        self.finished.emit()
+
+    def _schedule(self) -> None:
+        # The nodes left from the previous slices are ordered with the new ones.
+        nodes: Dict[int, Node] = {
+            node.id: node for node in self._pending if node.id not in self._removedIds
+        }
+        for root in self._roots.values():
+            nodes[root.id] = root
+            for node in descendants(root):
+                nodes[node.id] = node
+        self._roots.clear()
+
+        try:
+            schedule = scheduleNodes(nodes.values())
+        except AlgebraicLoopError as e:
+            logger.warning(e)
+            for node in e.nodes:
+                node.isInvalid = True
+                node.graphicsNode.setToolTip(str(e))
+            self._pending.clear()
+            return
+
+        for node in schedule:
+            node.isDirty = True
+        self._pending = deque(schedule)
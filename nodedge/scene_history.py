@@ -262,7 +262,7 @@ class SceneHistory:
         """
         selectedObjects: dict = {"nodes": [], "edges": []}
 
-        for item in self.scene.graphicsScene.selectedItems():
+        for item in self.scene.selectedItems:
             if isinstance(item, GraphicsNode):  # hasattr(item, "node")
                 selectedObjects["nodes"].append(item.node.id)
             elif isinstance(item, GraphicsEdge):
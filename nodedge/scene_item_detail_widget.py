@@ -49,6 +49,7 @@ class SceneItemDetailWidget(QFrame):
         self.typeLabel: QLabel = cast(QLabel, self.addRow("Type"))
         self.inputsTypeLabel = cast(QLabel, self.addRow("Inputs type"))
         self.outputsTypeLabel = cast(QLabel, self.addRow("Outputs type"))
+        self.cacheLabel = cast(QLabel, self.addRow("Cache"))
         self.paramsFrame = QFrame()
         self.paramsFrame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.paramsLayout = QFormLayout()
@@ -115,6 +116,8 @@ class SceneItemDetailWidget(QFrame):
                 outputs = [i.name for i in selectedNode.outputSocketTypes]
                 self.inputsTypeLabel.setText(str(inputs))
                 self.outputsTypeLabel.setText(str(outputs))
+                cache = getattr(selectedNode, "cache", None)
+                self.cacheLabel.setText("" if cache is None else cache.summary())
                 if hasattr(selectedNode, "params"):
                     self.updateParams(selectedNode.params)
             else:
@@ -122,6 +125,7 @@ class SceneItemDetailWidget(QFrame):
                 self.typeLabel.setText("")
                 self.inputsTypeLabel.setText("")
                 self.outputsTypeLabel.setText("")
+                self.cacheLabel.setText("")
                 self.updateParams([])
 
     def updateParams(self, params: List[BlockParam]):
@@ -220,7 +224,7 @@ class SceneItemDetailWidget(QFrame):
 
                 w.stateChanged.connect(
                     lambda value, paramName=n: self.onParamWidgetChanged(
-                        paramName, value
+                        paramName, bool(value)
                     )
                 )
 
@@ -233,6 +237,8 @@ class SceneItemDetailWidget(QFrame):
                 if p.name == paramName:
                     p.value = paramValue
                     logger.debug(f"Param {paramName} changed to {paramValue}")
+                    if hasattr(selectedNode, "onParamChanged"):
+                        selectedNode.onParamChanged(p)
                     break
         except KeyError:
             logger.error(f"Param {paramName} not found")
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+Scene items model module containing
+:class:`~nodedge.scene_items_model.SceneItemsModel` class.
+"""
+
+import logging
+import weakref
+from typing import Dict, Iterable, List, Optional, Set, Union, cast
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QItemSelection,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    Signal,
+)
+
+from nodedge.node import Node
+from nodedge.scene import Scene
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ["Name", "Type", "PosX", "PosY"]
+NAME_COLUMN = 0
+TYPE_COLUMN = 1
+POS_X_COLUMN = 2
+POS_Y_COLUMN = 3
+
+# Internal ids of the indexes, telling the scene row from the node rows.
+SCENE_ID = 0
+NODE_ID = 1
+
+
+class SceneItemsModel(QAbstractItemModel):
+    """
+    :class:`~nodedge.scene_items_model.SceneItemsModel` class
+
+    Item model listing the nodes of a scene, as the children of a single row
+    standing for the scene itself.
+
+    The model follows the `Node Added`, `Node Removed`, `Node Changed` and
+    selection events of the scene, and only notifies the views about the rows
+    concerned, so that an edit does not depend on the size of the scene.
+    There is a single model per scene, shared by the views, see
+    :func:`~nodedge.scene_items_model.SceneItemsModel.forScene`.
+    """
+
+    #: Emitted with the newly selected and the newly deselected nodes.
+    nodesSelectionChanged = Signal(list, list)
+
+    _models: "weakref.WeakKeyDictionary[Scene, SceneItemsModel]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self, scene: Scene, parent=None):
+        super().__init__(parent)
+        # The models are stored by scene: a strong reference would keep the scene
+        # alive forever.
+        self._sceneRef: "weakref.ReferenceType[Scene]" = weakref.ref(scene)
+        self._nodes: List[Node] = list(scene.nodes)
+        # Row of each node, rebuilt lazily when rows have been removed.
+        self._rows: Optional[Dict[Node, int]] = None
+        self._selectedNodes: Set[Node] = set()
+
+        scene.addNodeAddedListener(self.onNodeAdded)
+        scene.addNodeRemovedListener(self.onNodeRemoved)
+        scene.addNodeChangedListener(self.onNodeChanged)
+        scene.addItemSelectedListener(self.onSelectionChanged)
+        scene.addItemsDeselectedListener(self.onSelectionChanged)
+
+    @classmethod
+    def forScene(cls, scene: Scene) -> "SceneItemsModel":
+        """
+        Retrieve the model of a scene, creating it on first use.
+
+        :param scene: listed scene
+        :type scene: :class:`~nodedge.scene.Scene`
+        :return: model listing the nodes of the scene
+        :rtype: :class:`~nodedge.scene_items_model.SceneItemsModel`
+        """
+        model = cls._models.get(scene)
+        if model is None:
+            model = cls(scene)
+            cls._models[scene] = model
+        return model
+
+    @property
+    def scene(self) -> Scene:
+        """
+        :return: listed scene
+        :rtype: :class:`~nodedge.scene.Scene`
+        """
+        return cast(Scene, self._sceneRef())
+
+    @property
+    def selectedNodes(self) -> Set[Node]:
+        """
+        :return: nodes selected in the scene
+        :rtype: ``Set[Node]``
+        """
+        return self._selectedNodes
+
+    def sceneIndex(self) -> QModelIndex:
+        """
+        :return: index of the row standing for the scene, parent of the node rows
+        :rtype: ``QModelIndex``
+        """
+        return self.createIndex(0, 0, SCENE_ID)
+
+    def nodeIndex(self, node: Node, column: int = 0) -> QModelIndex:
+        """
+        :param node: listed node
+        :type node: :class:`~nodedge.node.Node`
+        :param column: column of the index
+        :type column: ``int``
+        :return: index of the node, invalid if the node is not listed
+        :rtype: ``QModelIndex``
+        """
+        row = self._rowOf(node)
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row, column, NODE_ID)
+
+    def nodesSelection(self, nodes: Iterable[Node]) -> QItemSelection:
+        """
+        :param nodes: listed nodes
+        :type nodes: ``Iterable[Node]``
+        :return: selection of the rows of the nodes
+        :rtype: ``QItemSelection``
+        """
+        selection = QItemSelection()
+        for node in nodes:
+            index = self.nodeIndex(node)
+            if index.isValid():
+                selection.select(index, index)
+        return selection
+
+    def nodeAt(self, index: QModelIndex) -> Optional[Node]:
+        """
+        :param index: index of a node row
+        :type index: ``QModelIndex``
+        :return: node listed at this index, ``None`` for the scene row
+        :rtype: ``Optional[Node]``
+        """
+        if not index.isValid() or index.internalId() != NODE_ID:
+            return None
+        return self._nodes[index.row()]
+
+    def _rowOf(self, node: Node) -> Optional[int]:
+        if self._rows is None:
+            self._rows = {node: row for row, node in enumerate(self._nodes)}
+        return self._rows.get(node)
+
+    def onNodeAdded(self, node: Node) -> None:
+        row = len(self._nodes)
+        self.beginInsertRows(self.sceneIndex(), row, row)
+        self._nodes.append(node)
+        if self._rows is not None:
+            self._rows[node] = row
+        self.endInsertRows()
+
+    def onNodeRemoved(self, node: Node) -> None:
+        try:
+            # Nodes are usually removed from the start, when the scene is cleared.
+            row = self._nodes.index(node)
+        except ValueError:
+            return
+        self.beginRemoveRows(self.sceneIndex(), row, row)
+        del self._nodes[row]
+        self._rows = None
+        self._selectedNodes.discard(node)
+        self.endRemoveRows()
+
+    def onNodeChanged(self, node: Node) -> None:
+        row = self._rowOf(node)
+        if row is None:
+            return
+        self.dataChanged.emit(
+            self.createIndex(row, 0, NODE_ID),
+            self.createIndex(row, len(COLUMNS) - 1, NODE_ID),
+            [Qt.DisplayRole],
+        )
+
+    def onSelectionChanged(self) -> None:
+        selectedNodes = {graphicsNode.node for graphicsNode in self.scene.selectedNodes}
+        newlySelected = list(selectedNodes - self._selectedNodes)
+        newlyDeselected = list(self._selectedNodes - selectedNodes)
+        self._selectedNodes = selectedNodes
+        if newlySelected or newlyDeselected:
+            # noinspection PyUnresolvedReferences
+            self.nodesSelectionChanged.emit(newlySelected, newlyDeselected)
+
+    def index(
+        self,
+        row: int,
+        column: int,
+        parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex(),
+    ):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, SCENE_ID)
+        return self.createIndex(row, column, NODE_ID)
+
+    def parent(self, index: QModelIndex = QModelIndex()):  # type: ignore
+        if not index.isValid() or index.internalId() == SCENE_ID:
+            return QModelIndex()
+        return self.sceneIndex()
+
+    def rowCount(
+        self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()
+    ) -> int:
+        if not parent.isValid():
+            return 1
+        if parent.internalId() == SCENE_ID and parent.column() == 0:
+            return len(self._nodes)
+        return 0
+
+    def columnCount(
+        self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()
+    ) -> int:
+        return len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def flags(self, index: Union[QModelIndex, QPersistentModelIndex]):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(
+        self, index: Union[QModelIndex, QPersistentModelIndex], role=Qt.DisplayRole
+    ):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if index.internalId() == SCENE_ID:
+            if role == Qt.DisplayRole and column == NAME_COLUMN:
+                return self.scene.shortName
+            return None
+
+        if index.row() >= len(self._nodes):
+            return None
+        node = self._nodes[index.row()]
+        if role == Qt.DisplayRole:
+            if column == NAME_COLUMN:
+                return node.title
+            if column == TYPE_COLUMN:
+                return node.__class__.__name__
+            if column == POS_X_COLUMN:
+                return f"{node.pos.x()}"
+            if column == POS_Y_COLUMN:
+                return f"{node.pos.y()}"
+        elif role == Qt.TextAlignmentRole and column != NAME_COLUMN:
+            return Qt.AlignVCenter | Qt.AlignRight
+        return None
@@ -4,25 +4,26 @@ Scene items table widget module containing
 :class:`~nodedge.scene_items_table_widget.SceneItemsTableWidget` class.
 """
 import logging
-from typing import Optional
+from typing import List, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QItemSelectionModel, QModelIndex, Signal
 from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import (
-    QAbstractItemView,
-    QHeaderView,
-    QMainWindow,
-    QTableWidget,
-    QTableWidgetItem,
-)
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QMainWindow, QTableView
 
 from nodedge import DEBUG_ITEMS_PRESSED
+from nodedge.node import Node
 from nodedge.scene import Scene
+from nodedge.scene_items_model import SceneItemsModel
 from nodedge.utils import widgetsAt
 
 
-class SceneItemsTableWidget(QTableWidget):
-    """:class:`~nodedge.scene_items_table_widget.SceneItemsTableWidget` class ."""
+class SceneItemsTableWidget(QTableView):
+    """
+    :class:`~nodedge.scene_items_table_widget.SceneItemsTableWidget` class
+
+    Table of the nodes of a scene, showing the node rows of its
+    :class:`~nodedge.scene_items_model.SceneItemsModel`.
+    """
 
     itemsPressed = Signal(list)
 
@@ -32,69 +33,81 @@ class SceneItemsTableWidget(QTableWidget):
         self.__logger = logging.getLogger(__file__)
         self.__logger.setLevel(logging.INFO)
 
-        self.setColumnCount(4)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
-        self.scene: Optional[Scene] = None
+        self._scene: Optional[Scene] = None
+        self._model: Optional[SceneItemsModel] = None
 
-        headerNames = ("Name", "Type", "PosX", "PosY")
-        self.setHorizontalHeaderLabels(headerNames)
-        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.verticalHeader().hide()
+        # Fixed row heights, so that the view never measures the rows.
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(30)
         self.setShowGrid(True)
-        self.cellClicked.connect(self.onCellClicked)
-        self.cellDoubleClicked.connect(self.onCellDoubleClicked)
-
-    def update(self, *__args) -> None:
-        self.setRowCount(0)
-
-        if self.scene is not None:
-            for node in self.scene.nodes:
-                nameItem = QTableWidgetItem(node.title)
-                nameItem.setFlags(nameItem.flags() ^ Qt.ItemIsEditable)
-
-                typeItem = QTableWidgetItem(f"{node.__class__.__name__}")
-                typeItem.setTextAlignment(Qt.AlignVCenter | Qt.AlignRight)
-                typeItem.setFlags(typeItem.flags() ^ Qt.ItemIsEditable)
-
-                posXItem = QTableWidgetItem(f"{node.pos.x()}")
-                posXItem.setTextAlignment(Qt.AlignVCenter | Qt.AlignRight)
-                posXItem.setFlags(posXItem.flags() ^ Qt.ItemIsEditable)
-
-                posYItem = QTableWidgetItem(f"{node.pos.y()}")
-                posYItem.setTextAlignment(Qt.AlignVCenter | Qt.AlignRight)
-                posYItem.setFlags(posYItem.flags() ^ Qt.ItemIsEditable)
-
-                row = self.rowCount()
-                self.insertRow(row)
-                self.setItem(row, 0, nameItem)
-                self.setItem(row, 1, typeItem)
-                self.setItem(row, 2, posXItem)
-                self.setItem(row, 3, posYItem)
-
-                if node.graphicsNode in self.scene.selectedItems:
-                    nameItem.setSelected(True)
-                    typeItem.setSelected(True)
-                    posXItem.setSelected(True)
-                    posYItem.setSelected(True)
-
-                self.setRowHeight(row, 30)
-
-        super().viewport().update()
-
-    def onCellClicked(self, row: int, column: int):
-        if self.scene is not None:
-            self.scene.doDeselectItems(True)
-            self.scene.nodes[row].isSelected = True
-        self.item(row, column).setSelected(True)
-
-    def onCellDoubleClicked(self, row, column):
-        self.scene.graphicsView.centerOn(
-            float(self.item(row, 2).text()), float(self.item(row, 3).text())
-        )
+        self.clicked.connect(self.onCellClicked)
+        self.doubleClicked.connect(self.onCellDoubleClicked)
+
+    @property
+    def scene(self) -> Optional[Scene]:
+        """
+        :getter: return the listed scene
+        :setter: list the nodes of another scene
+        :type: ``Optional[Scene]``
+        """
+        return self._scene
+
+    @scene.setter
+    def scene(self, scene: Optional[Scene]) -> None:
+        if scene is self._scene:
+            return
+        if self._model is not None:
+            self._model.nodesSelectionChanged.disconnect(self.highlightSelectedItems)
+        self._scene = scene
+        self._model = SceneItemsModel.forScene(scene) if scene is not None else None
+        self.setModel(self._model)
+        if self._model is None:
+            return
+        self.setRootIndex(self._model.sceneIndex())
+        self._model.nodesSelectionChanged.connect(self.highlightSelectedItems)
+        self.clearSelection()
+        self.highlightSelectedItems(list(self._model.selectedNodes), [])
+
+    def highlightSelectedItems(self, selected: List[Node], deselected: List[Node]):
+        """
+        Update the selection of the rows of the nodes whose selection changed.
+
+        :param selected: newly selected nodes
+        :type selected: ``List[Node]``
+        :param deselected: newly deselected nodes
+        :type deselected: ``List[Node]``
+        """
+        if self._model is None:
+            return
+        for nodes, command in (
+            (deselected, QItemSelectionModel.Deselect),
+            (selected, QItemSelectionModel.Select),
+        ):
+            if nodes:
+                self.selectionModel().select(
+                    self._model.nodesSelection(nodes),
+                    command | QItemSelectionModel.Rows,
+                )
+
+    def onCellClicked(self, index: QModelIndex):
+        if self._scene is None or self._model is None:
+            return
+        node = self._model.nodeAt(index)
+        if node is not None:
+            self._scene.doDeselectItems(True)
+            node.isSelected = True
+
+    def onCellDoubleClicked(self, index: QModelIndex):
+        if self._scene is None or self._model is None:
+            return
+        node = self._model.nodeAt(index)
+        if node is not None:
+            self._scene.graphicsView.centerOn(node.pos)
 
     def mousePressEvent(self, e: QMouseEvent) -> None:
         pos = e.globalPos()
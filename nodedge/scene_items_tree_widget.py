@@ -4,131 +4,119 @@ Scene items tree widget module containing
 :class:`~nodedge.scene_items_tree_widget.SceneItemsTreeWidget` class.
 """
 import logging
-from typing import Optional
-
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import (
-    QAbstractItemView,
-    QHeaderView,
-    QMainWindow,
-    QTableWidget,
-    QTableWidgetItem,
-    QTreeWidget,
-    QTreeWidgetItem,
-)
-
-from nodedge import DEBUG_ITEMS_PRESSED
+from typing import List, Optional
+
+from PySide6.QtCore import QItemSelectionModel, QModelIndex, Signal
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QMainWindow, QTreeView
+
+from nodedge.node import Node
 from nodedge.scene import Scene
-from nodedge.utils import widgetsAt
+from nodedge.scene_items_model import NAME_COLUMN, TYPE_COLUMN, SceneItemsModel
 
 logger = logging.getLogger(__name__)
 
 
-class SceneItemsTreeWidget(QTreeWidget):
+class SceneItemsTreeWidget(QTreeView):
+    """
+    :class:`~nodedge.scene_items_tree_widget.SceneItemsTreeWidget` class
+
+    Tree of the nodes of a scene, below the scene itself, showing its
+    :class:`~nodedge.scene_items_model.SceneItemsModel`.
+    """
+
     itemsPressed = Signal(list)
 
     def __init__(self, parent: Optional[QMainWindow] = None):
         super().__init__(parent)
 
         self._scene: Optional[Scene] = None
+        self._model: Optional[SceneItemsModel] = None
 
-        headerNames = ("Name", "Type")
-        self.setColumnCount(len(headerNames))
-        for i in range(len(headerNames)):
-            self.header().setSectionResizeMode(i, QHeaderView.Stretch)
-        self.setHeaderLabels(headerNames)
-
-        self.itemClicked.connect(self.onItemClicked)
-        self.itemDoubleClicked.connect(self.onItemDoubleClicked)
-
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # All rows have the same height, so that the view never measures them.
+        self.setUniformRowHeights(True)
         self.setIndentation(6)
 
-        self.nodeItems = {}  # type: ignore
+        self.clicked.connect(self.onItemClicked)
+        self.doubleClicked.connect(self.onItemDoubleClicked)
 
     @property
     def scene(self) -> Optional[Scene]:
+        """
+        :getter: return the listed scene
+        :setter: list the nodes of another scene
+        :type: ``Optional[Scene]``
+        """
         return self._scene
 
     @scene.setter
     def scene(self, scene: Optional[Scene]) -> None:
+        if scene is self._scene:
+            return
+        if self._model is not None:
+            self._model.nodesSelectionChanged.disconnect(self.highlightSelectedItems)
         self._scene = scene
-        self.update()
-        if self._scene is None:
+        self._model = SceneItemsModel.forScene(scene) if scene is not None else None
+        self.setModel(self._model)
+        if self._model is None:
             return
-        self._scene.history.addHistoryModifiedListener(self.update)
-        self._scene.addItemSelectedListener(self.highlightSelectedItems)
-        self._scene.addItemsDeselectedListener(self.highlightSelectedItems)
-
-    def update(self, *__args) -> None:
-        self.clear()
-        self.nodeItems = {}
-        logger.debug("Scene items tree widget updating.")
-
-        if self._scene is not None:
-            self.rootItem = QTreeWidgetItem()
-            self.rootItem.setText(0, self._scene.shortName)
-            self.addTopLevelItem(self.rootItem)
-            for node in self._scene.nodes:
-                nameItem = QTreeWidgetItem()
-                nameItem.setText(0, node.title)
-                nameItem.setText(1, f"{node.__class__.__name__}")
-                self.nodeItems.update({node.title: nameItem})
-                # nameItem.setText(2, f"{node.pos.x()}")
-                # nameItem.setText(3, f"{node.pos.y()}")
-                # nameItem.setFlags(nameItem.flags() ^ Qt.ItemIsEditable)
-
-                self.rootItem.addChild(nameItem)
-        self.expandAll()
-
-        self.highlightSelectedItems()
-
-        # super().viewport().update()
-
-    def highlightSelectedItems(self):
+        logger.debug("Scene items tree widget showing a new scene.")
+
+        header = self.header()
+        for column in range(self._model.columnCount()):
+            isShown = column in (NAME_COLUMN, TYPE_COLUMN)
+            self.setColumnHidden(column, not isShown)
+            if isShown:
+                header.setSectionResizeMode(column, QHeaderView.Stretch)
+        self.expand(self._model.sceneIndex())
+
+        self._model.nodesSelectionChanged.connect(self.highlightSelectedItems)
+        self.highlightSelectedItems(list(self._model.selectedNodes), [])
+
+    def highlightSelectedItems(self, selected: List[Node], deselected: List[Node]):
+        """
+        Update the selection of the rows of the nodes whose selection changed, and
+        scroll to the last selected one.
+
+        :param selected: newly selected nodes
+        :type selected: ``List[Node]``
+        :param deselected: newly deselected nodes
+        :type deselected: ``List[Node]``
+        """
         logger.debug("Highlighting selected items.")
-        if self._scene is None:
+        if self._model is None:
             return
-
-        self.clearSelection()
-        for node in self._scene.selectedNodes:
-
-            if node.title in list(self.nodeItems.keys()):
-                self.nodeItems[node.title].setSelected(True)
-                self.scrollToItem(self.nodeItems[node.title])
-
-    def onItemClicked(self, item: QTreeWidgetItem, column: int):
+        for nodes, command in (
+            (deselected, QItemSelectionModel.Deselect),
+            (selected, QItemSelectionModel.Select),
+        ):
+            if nodes:
+                self.selectionModel().select(
+                    self._model.nodesSelection(nodes),
+                    command | QItemSelectionModel.Rows,
+                )
+        if selected:
+            self.scrollTo(self._model.nodeIndex(selected[-1]))
+
+    def onItemClicked(self, index: QModelIndex):
         scene = self.scene
-        if scene is None:
+        if scene is None or self._model is None:
+            return
+        node = self._model.nodeAt(index)
+        if node is None:
             return
         scene.doDeselectItems(True)
-        nodeTitles = {node.title: node for node in scene.nodes}
-        if item.text(0) in list(nodeTitles.keys()):
-            nodeTitles[item.text(0)].isSelected = True
+        node.isSelected = True
 
-    def onItemDoubleClicked(self, item: QTreeWidgetItem, column: int):
+    def onItemDoubleClicked(self, index: QModelIndex):
         scene = self.scene
-        if scene is None:
+        if scene is None or self._model is None:
+            return
+        node = self._model.nodeAt(index)
+        if node is None:
             return
         scene.doDeselectItems(True)
-        nodeTitles = {node.title: node for node in scene.nodes}
-        if item.text(0) in list(nodeTitles.keys()):
-            node = nodeTitles[item.text(0)]
-            node.isSelected = True
-            logger.debug(f"Double clicked on {node.title}")
-            scene.graphicsView.centerOn(node.pos)
-
-    #
-    # def onCellDoubleClicked(self, row, column):
-    #     self.scene.graphicsView.centerOn(
-    #         float(self.item(row, 2).text()), float(self.item(row, 3).text())
-    #     )
-    #
-    # def mousePressEvent(self, e: QMouseEvent) -> None:
-    #     pos = e.globalPos()
-    #     if DEBUG_ITEMS_PRESSED:
-    #         itemsPressed = [w.__class__.__name__ for w in widgetsAt(pos)]
-    #         self.__logger.debug(itemsPressed)
-    #         # noinspection PyUnresolvedReferences
-    #         self.itemsPressed.emit(itemsPressed)
-    #     super().mousePressEvent(e)
+        node.isSelected = True
+        logger.debug(f"Double clicked on {node.title}")
+        scene.graphicsView.centerOn(node.pos)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Scene profiler module containing :class:`~nodedge.scene_profiler.BlockTiming` and
+:class:`~nodedge.scene_profiler.SceneProfiler` classes.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List
+
+from nodedge.node import Node
+
+logger = logging.getLogger(__name__)
+
+
+class BlockTiming:
+    """
+    :class:`~nodedge.scene_profiler.BlockTiming` class
+
+    Evaluation times of a block during a simulation.
+    """
+
+    def __init__(self, node: Node):
+        self.nodeId: int = node.id
+        self.title: str = node.title
+        self.type: str = node.__class__.__name__
+        self.callsCount: int = 0
+        self.totalNs: int = 0
+        self.maxNs: int = 0
+
+    @property
+    def meanNs(self) -> float:
+        """
+        :getter: return the mean evaluation time, in ns
+        :type: ``float``
+        """
+        return self.totalNs / self.callsCount if self.callsCount else 0.0
+
+    def toDict(self) -> OrderedDict:
+        """
+        :return: timing as a JSON serializable dictionary
+        :rtype: ``OrderedDict``
+        """
+        return OrderedDict(
+            [
+                ("id", self.nodeId),
+                ("title", self.title),
+                ("type", self.type),
+                ("calls", self.callsCount),
+                ("totalNs", self.totalNs),
+                ("meanNs", self.meanNs),
+                ("maxNs", self.maxNs),
+            ]
+        )
+
+
+class SceneProfiler:
+    """
+    :class:`~nodedge.scene_profiler.SceneProfiler` class
+
+    Opt-in profiler recording the evaluation time of each block of a scene during a
+    simulation, with ``time.perf_counter_ns``.
+    """
+
+    def __init__(self):
+        #: If ``False``, nothing is recorded.
+        self.enabled: bool = False
+        self.timings: Dict[int, BlockTiming] = {}
+
+    def reset(self) -> None:
+        """
+        Forget the recorded timings.
+        """
+        self.timings = {}
+
+    def evalNode(self, node: Node):
+        """
+        Evaluate a node without its children, recording its evaluation time.
+
+        :param node: node to evaluate
+        :type node: :class:`~nodedge.node.Node`
+        :return: value of the node
+        """
+        startNs = time.perf_counter_ns()
+        value = node.eval(evalChildren=False)
+        self.record(node, time.perf_counter_ns() - startNs)
+        return value
+
+    def record(self, node: Node, durationNs: int) -> None:
+        """
+        Add an evaluation of a node.
+
+        :param node: evaluated node
+        :type node: :class:`~nodedge.node.Node`
+        :param durationNs: evaluation time, in ns
+        :type durationNs: ``int``
+        """
+        timing = self.timings.get(node.id)
+        if timing is None:
+            timing = BlockTiming(node)
+            self.timings[node.id] = timing
+        timing.callsCount += 1
+        timing.totalNs += durationNs
+        if durationNs > timing.maxNs:
+            timing.maxNs = durationNs
+
+    def sortedTimings(self) -> List[BlockTiming]:
+        """
+        :return: timings, the most expensive block first
+        :rtype: ``List[BlockTiming]``
+        """
+        return sorted(self.timings.values(), key=lambda t: t.totalNs, reverse=True)
+
+    def heat(self, node: Node) -> float:
+        """
+        :param node: profiled node
+        :type node: :class:`~nodedge.node.Node`
+        :return: total evaluation time of the node relatively to the most expensive
+            one, between 0 and 1
+        :rtype: ``float``
+        """
+        timing = self.timings.get(node.id)
+        maxTotalNs = max((t.totalNs for t in self.timings.values()), default=0)
+        if timing is None or maxTotalNs == 0:
+            return 0.0
+        return timing.totalNs / maxTotalNs
+
+    def toDict(self) -> OrderedDict:
+        """
+        :return: timings as a JSON serializable dictionary, the most expensive
+            block first
+        :rtype: ``OrderedDict``
+        """
+        return OrderedDict(
+            [
+                ("totalNs", sum(t.totalNs for t in self.timings.values())),
+                ("blocks", [timing.toDict() for timing in self.sortedTimings()]),
+            ]
+        )
+
+    def exportJson(self, filename: str) -> None:
+        """
+        Save the timings to a JSON file, to compare runs.
+
+        :param filename: path of the JSON file
+        :type filename: ``str``
+        """
+        with open(filename, "w") as file:
+            json.dump(self.toDict(), file, indent=4)
+        logger.info(f"Profile exported to {filename}")
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Scene profiler widget module containing
+:class:`~nodedge.scene_profiler_widget.SceneProfilerWidget` class.
+"""
+import logging
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QMainWindow,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from nodedge.scene import Scene
+
+logger = logging.getLogger(__name__)
+
+
+class SceneProfilerWidget(QWidget):
+    """
+    :class:`~nodedge.scene_profiler_widget.SceneProfilerWidget` class
+
+    Sortable table of the evaluation times of the blocks of the current scene,
+    recorded by :class:`~nodedge.scene_profiler.SceneProfiler` during the last
+    simulation. While profiling, blocks are colored according to their share of the
+    simulation time.
+    """
+
+    def __init__(self, parent: Optional[QMainWindow] = None):
+        super().__init__(parent)
+
+        self._scene: Optional[Scene] = None
+
+        self.enabledCheckBox = QCheckBox("Profile simulations")
+        self.enabledCheckBox.toggled.connect(self.onEnabledToggled)
+        self.exportButton = QPushButton("Export JSON")
+        self.exportButton.clicked.connect(self.onExportClicked)
+
+        headerNames = ("Name", "Type", "Calls", "Total [ms]", "Mean [µs]", "Max [µs]")
+        self.table = QTableWidget(0, len(headerNames))
+        self.table.setHorizontalHeaderLabels(headerNames)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+
+        buttonsLayout = QHBoxLayout()
+        buttonsLayout.addWidget(self.enabledCheckBox)
+        buttonsLayout.addStretch()
+        buttonsLayout.addWidget(self.exportButton)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(buttonsLayout)
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+
+        self.update()
+
+    @property
+    def scene(self) -> Optional[Scene]:
+        """
+        :getter: return the profiled scene
+        :setter: profile another scene, refreshing the table when its simulations end
+        :type: ``Optional[Scene]``
+        """
+        return self._scene
+
+    @scene.setter
+    def scene(self, value: Optional[Scene]):
+        if value is self._scene:
+            return
+        if self._scene is not None:
+            self._scene.simulator.profileUpdated.disconnect(self.update)
+        self._scene = value
+        if value is not None:
+            value.simulator.profileUpdated.connect(self.update)
+
+    def update(self, *__args) -> None:
+        profiler = self._scene.simulator.profiler if self._scene is not None else None
+        self.enabledCheckBox.blockSignals(True)
+        self.enabledCheckBox.setChecked(profiler is not None and profiler.enabled)
+        self.enabledCheckBox.blockSignals(False)
+        self.enabledCheckBox.setEnabled(profiler is not None)
+        self.exportButton.setEnabled(profiler is not None and bool(profiler.timings))
+
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        if profiler is not None:
+            timings = profiler.sortedTimings()
+            self.table.setRowCount(len(timings))
+            for row, timing in enumerate(timings):
+                values = (
+                    timing.title,
+                    timing.type,
+                    timing.callsCount,
+                    timing.totalNs / 1e6,
+                    timing.meanNs / 1e3,
+                    timing.maxNs / 1e3,
+                )
+                for column, value in enumerate(values):
+                    item = QTableWidgetItem()
+                    # Numbers are stored as such, to be sorted numerically.
+                    if isinstance(value, float):
+                        value = round(value, 3)
+                    item.setData(Qt.DisplayRole, value)
+                    if column >= 2:
+                        item.setTextAlignment(Qt.AlignVCenter | Qt.AlignRight)
+                    self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+
+        self.updateHeatmap()
+        super().update()
+
+    def updateHeatmap(self) -> None:
+        """
+        Color the blocks of the scene according to their evaluation time, or restore
+        their colors if profiling is disabled.
+        """
+        if self._scene is None:
+            return
+        profiler = self._scene.simulator.profiler
+        for node in self._scene.nodes:
+            if not hasattr(node.graphicsNode, "setHeat"):
+                continue
+            if profiler.enabled and node.id in profiler.timings:
+                node.graphicsNode.setHeat(profiler.heat(node))
+            else:
+                node.graphicsNode.setHeat(None)
+
+    def onEnabledToggled(self, checked: bool) -> None:
+        if self._scene is None:
+            return
+        self._scene.simulator.profiler.enabled = checked
+        self.updateHeatmap()
+
+    def onExportClicked(self) -> None:
+        if self._scene is None:
+            return
+        filename, _ = QFileDialog.getSaveFileName(
+            parent=self,
+            caption="Export profile",
+            filter="JSON (*.json)",
+        )
+        if not filename:
+            return
+        self._scene.simulator.profiler.exportJson(filename)
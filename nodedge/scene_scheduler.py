@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Scene scheduler module containing :class:`~nodedge.scene_scheduler.Schedule` class,
+:class:`~nodedge.scene_scheduler.AlgebraicLoopError` exception and the scheduling
+functions shared by the scene coder, the scene simulator and the node evaluation.
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set
+
+from nodedge.blocks.block_exception import EvaluationError
+from nodedge.node import Node
+
+logger = logging.getLogger(__name__)
+
+
+class AlgebraicLoopError(EvaluationError):
+    """
+    :class:`~nodedge.scene_scheduler.AlgebraicLoopError` class
+
+    If the value of a block depends on itself within the same time step, raise this
+    error.
+    """
+
+    def __init__(self, nodes: List[Node]):
+        #: Nodes of the loop, in the direction of the data flow.
+        self.nodes: List[Node] = nodes
+        titles = [node.title for node in nodes] + [nodes[0].title]
+        super().__init__(
+            f"Algebraic loop: {' -> '.join(titles)}. "
+            f"Insert a stateful block, such as an integral, to break it."
+        )
+
+
+class Schedule:
+    """
+    :class:`~nodedge.scene_scheduler.Schedule` class
+
+    Evaluation order of nodes: every node comes after the nodes connected to its
+    inputs, except for the delayed nodes.
+
+    Delayed nodes are stateful blocks breaking a feedback loop. Their output only
+    depends on their state, and their state is updated from their inputs at the end
+    of the time step.
+    """
+
+    def __init__(self, nodes: List[Node], delayedNodes: List[Node]):
+        #: Nodes in evaluation order.
+        self.nodes: List[Node] = nodes
+        #: Stateful nodes whose inputs are read at the end of the time step.
+        self.delayedNodes: List[Node] = delayedNodes
+        self._indexes: Dict[int, int] = {
+            node.id: index for index, node in enumerate(nodes)
+        }
+        self._delayedIds: Set[int] = {node.id for node in delayedNodes}
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: Node) -> bool:
+        return node.id in self._indexes
+
+    def index(self, node: Node) -> int:
+        """
+        :param node: scheduled node
+        :type node: :class:`~nodedge.node.Node`
+        :return: position of the node in the evaluation order
+        :rtype: ``int``
+        :raises: ``KeyError`` if the node is not scheduled
+        """
+        return self._indexes[node.id]
+
+    def isDelayed(self, node: Node) -> bool:
+        """
+        :param node: scheduled node
+        :type node: :class:`~nodedge.node.Node`
+        :return: ``True`` if the node breaks a feedback loop
+        :rtype: ``bool``
+        """
+        return node.id in self._delayedIds
+
+
+def _parentsIndexes(nodes: List[Node], indexes: Dict[int, int]) -> List[List[int]]:
+    # Edges from nodes which are not scheduled are ignored.
+    parents: List[List[int]] = []
+    for node in nodes:
+        nodeParents: List[int] = []
+        for socket in node.inputSockets:
+            for edge in socket.edges:
+                otherSocket = edge.getOtherSocket(socket)
+                if otherSocket is None:
+                    continue
+                parentIndex = indexes.get(otherSocket.node.id)
+                if parentIndex is not None:
+                    nodeParents.append(parentIndex)
+        parents.append(nodeParents)
+    return parents
+
+
+def _kahn(parents: List[List[int]]) -> List[int]:
+    count = len(parents)
+    children: List[List[int]] = [[] for _ in range(count)]
+    inDegrees: List[int] = [0] * count
+    for index, nodeParents in enumerate(parents):
+        inDegrees[index] = len(nodeParents)
+        for parentIndex in nodeParents:
+            children[parentIndex].append(index)
+
+    queue = deque(index for index in range(count) if inDegrees[index] == 0)
+    order: List[int] = []
+    while queue:
+        index = queue.popleft()
+        order.append(index)
+        for childIndex in children[index]:
+            inDegrees[childIndex] -= 1
+            if inDegrees[childIndex] == 0:
+                queue.append(childIndex)
+    return order
+
+
+def _stronglyConnectedComponents(parents: List[List[int]]) -> List[List[int]]:
+    # Iterative Tarjan algorithm, on the reversed graph which has the same components.
+    count = len(parents)
+    indexes: List[int] = [-1] * count
+    lowLinks: List[int] = [0] * count
+    onStack: List[bool] = [False] * count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    nextIndex = 0
+
+    for root in range(count):
+        if indexes[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, parentPosition = work.pop()
+            if parentPosition == 0:
+                indexes[node] = lowLinks[node] = nextIndex
+                nextIndex += 1
+                stack.append(node)
+                onStack[node] = True
+            recurse = False
+            for position in range(parentPosition, len(parents[node])):
+                parent = parents[node][position]
+                if indexes[parent] == -1:
+                    work.append((node, position + 1))
+                    work.append((parent, 0))
+                    recurse = True
+                    break
+                if onStack[parent]:
+                    lowLinks[node] = min(lowLinks[node], indexes[parent])
+            if recurse:
+                continue
+            if lowLinks[node] == indexes[node]:
+                component: List[int] = []
+                while True:
+                    member = stack.pop()
+                    onStack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+            if work:
+                caller = work[-1][0]
+                lowLinks[caller] = min(lowLinks[caller], lowLinks[node])
+    return components
+
+
+def _findLoop(parents: List[List[int]], remaining: Set[int]) -> List[int]:
+    # Every remaining node has a remaining parent: walk up until a node repeats.
+    path: List[int] = []
+    positions: Dict[int, int] = {}
+    index = min(remaining)
+    while index not in positions:
+        positions[index] = len(path)
+        path.append(index)
+        index = next(parent for parent in parents[index] if parent in remaining)
+    loop = path[positions[index] :]
+    loop.reverse()
+    return loop
+
+
+def scheduleNodes(nodes: Iterable[Node], breakLoops: bool = False) -> Schedule:
+    """
+    Order nodes so that every node comes after the nodes connected to its inputs,
+    with Kahn's algorithm. Only the edges between the given nodes are considered.
+    Independent nodes keep their relative order.
+
+    :param nodes: nodes to schedule
+    :type nodes: ``Iterable[Node]``
+    :param breakLoops: if ``True``, feedback loops containing a stateful block are
+        broken at this block, see :class:`~nodedge.scene_scheduler.Schedule`
+    :type breakLoops: ``bool``
+    :return: evaluation order of the nodes
+    :rtype: :class:`~nodedge.scene_scheduler.Schedule`
+    :raises: :class:`~nodedge.scene_scheduler.AlgebraicLoopError` if the nodes
+        contain a loop which cannot be broken
+    """
+    nodes = list(nodes)
+    indexes: Dict[int, int] = {node.id: index for index, node in enumerate(nodes)}
+    parents = _parentsIndexes(nodes, indexes)
+
+    order = _kahn(parents)
+    delayed: List[int] = []
+    if len(order) < len(nodes) and breakLoops:
+        for component in _stronglyConnectedComponents(parents):
+            members = set(component)
+            if len(component) == 1 and component[0] not in parents[component[0]]:
+                continue
+            for index in sorted(component):
+                if getattr(nodes[index], "isStateful", False):
+                    delayed.append(index)
+                    # The state is updated from the loop at the end of the step.
+                    parents[index] = [p for p in parents[index] if p not in members]
+        if delayed:
+            logger.debug(f"Feedback loops broken at {[nodes[i] for i in delayed]}")
+            order = _kahn(parents)
+
+    if len(order) < len(nodes):
+        remaining = set(range(len(nodes))) - set(order)
+        raise AlgebraicLoopError([nodes[i] for i in _findLoop(parents, remaining)])
+
+    return Schedule([nodes[i] for i in order], [nodes[i] for i in delayed])
+
+
+def ancestors(nodes: Iterable[Node]) -> List[Node]:
+    """
+    Retrieve nodes and all the nodes connected, directly or not, to their inputs.
+
+    :param nodes: nodes to start from
+    :type nodes: ``Iterable[Node]``
+    :return: the given nodes and their ancestors, each one once
+    :rtype: List[:class:`~nodedge.node.Node`]
+    """
+    return _reachable(nodes, "parent")
+
+
+def descendants(node: Node) -> List[Node]:
+    """
+    Retrieve all the nodes connected, directly or not, to the outputs of a node.
+
+    :param node: node to start from
+    :type node: :class:`~nodedge.node.Node`
+    :return: descendants of the node, including itself only if it is in a loop
+    :rtype: List[:class:`~nodedge.node.Node`]
+    """
+    return _reachable(node.getChildNodes(), "child")
+
+
+def _reachable(nodes: Iterable[Node], relationship: str) -> List[Node]:
+    reachedIds: Set[int] = set()
+    reached: List[Node] = []
+    queue = deque(nodes)
+    while queue:
+        node = queue.popleft()
+        if node.id in reachedIds:
+            continue
+        reachedIds.add(node.id)
+        reached.append(node)
+        if relationship == "parent":
+            queue.extend(node.getParentNodes())
+        else:
+            queue.extend(node.getChildNodes())
+    return reached
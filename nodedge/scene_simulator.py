@@ -1,9 +1,11 @@
+import bisect
 import logging
 import sys
+import threading
 import time
 import traceback
 from collections import OrderedDict
-from typing import List, Optional
+from typing import Any, Callable, Iterator, List, Optional
 
 import numpy as np
 from PySide6.QtCore import (
@@ -17,13 +19,20 @@ from PySide6.QtCore import (
 )
 from PySide6.QtWidgets import QApplication
 
-from nodedge.blocks import OP_NODE_CUSTOM_OUTPUT, Block
 from nodedge.connector import Socket
 from nodedge.node import Node
+from nodedge.scene_coder import CompiledScene
+from nodedge.scene_profiler import SceneProfiler
+from nodedge.scene_scheduler import AlgebraicLoopError, Schedule, scheduleNodes
 from nodedge.serializable import Serializable
 
 logger = logging.getLogger(__name__)
 
+# Minimum period between two progress and output updates of a compiled simulation.
+PROGRESS_UPDATE_PERIOD = 0.05
+# Upper bounds of the jitter histogram bins of real-time simulations, in seconds.
+JITTER_HISTOGRAM_BOUNDS = (1e-4, 5e-4, 1e-3, 5e-3, 1e-2, float("inf"))
+
 
 class WorkerSignals(QObject):
     """
@@ -94,6 +103,68 @@ class Worker(QRunnable):
             self.signals.finished.emit()  # Done
 
 
+class RealTimeStatistics:
+    """
+    :class:`~nodedge.scene_simulator.RealTimeStatistics` class
+
+    Timing statistics of a real-time simulation. Each step has a deadline on the
+    monotonic clock:
+
+    - the jitter is the delay between the deadline and the start of the step,
+    - the latency is the delay between the deadline and the end of the step,
+    - a step overruns when its latency exceeds the time step, i.e. when it ends
+      after the deadline of the next step.
+    """
+
+    def __init__(self, timeStep: float):
+        self.timeStep: float = timeStep
+        self.stepsCount: int = 0
+        self.overrunsCount: int = 0
+        self.worstLatency: float = 0.0
+        #: Number of steps per jitter bin, see ``JITTER_HISTOGRAM_BOUNDS``.
+        self.jitterHistogram: List[int] = [0] * len(JITTER_HISTOGRAM_BOUNDS)
+
+    def record(self, jitter: float, latency: float) -> None:
+        """
+        Add a step to the statistics.
+
+        :param jitter: delay between the deadline and the start of the step, in s
+        :type jitter: ``float``
+        :param latency: delay between the deadline and the end of the step, in s
+        :type latency: ``float``
+        """
+        self.stepsCount += 1
+        if latency > self.timeStep:
+            self.overrunsCount += 1
+        self.worstLatency = max(self.worstLatency, latency)
+        binIndex = bisect.bisect_left(JITTER_HISTOGRAM_BOUNDS, max(jitter, 0.0))
+        self.jitterHistogram[binIndex] += 1
+
+    def summary(self) -> str:
+        """
+        :return: overruns and worst latency, in a single line
+        :rtype: ``str``
+        """
+        return (
+            f"Overruns: {self.overrunsCount}/{self.stepsCount}, "
+            f"worst latency: {self.worstLatency * 1e3:.2f} ms"
+        )
+
+    def histogram(self) -> str:
+        """
+        :return: jitter histogram, one line per bin
+        :rtype: ``str``
+        """
+        lines: List[str] = []
+        lowerBound = 0.0
+        for upperBound, count in zip(JITTER_HISTOGRAM_BOUNDS, self.jitterHistogram):
+            lines.append(
+                f"Jitter {lowerBound * 1e3:g}-{upperBound * 1e3:g} ms: {count}"
+            )
+            lowerBound = upperBound
+        return "\n".join(lines)
+
+
 class SolverConfiguration:
     def __init__(self):
         self.solver = None
@@ -103,6 +174,9 @@ class SolverConfiguration:
         self.maxIterations = None
         self.tolerance = None
         self._finalTime = None
+        # Pace the simulation steps on the wall clock. Scenes with vectorized blocks
+        # are simulated at once, without pacing.
+        self.realTime: bool = False
 
     @property
     def finalTime(self):
@@ -121,6 +195,7 @@ class SolverConfiguration:
             "maxIterations": self.maxIterations,
             "tolerance": self.tolerance,
             "finalTime": self.finalTime,
+            "realTime": self.realTime,
         }
 
     def from_dict(self, data: dict) -> bool:
@@ -131,6 +206,7 @@ class SolverConfiguration:
         self.maxIterations = data["maxIterations"]
         self.tolerance = data["tolerance"]
         self.finalTime = data["finalTime"]
+        self.realTime = data.get("realTime", False)
 
         return True
 
@@ -138,6 +214,10 @@ class SolverConfiguration:
 class SceneSimulator(QObject, Serializable):
     notConnectedSocket = Signal()
     progressed = Signal(float)
+    outputsUpdated = Signal(list)
+    profileUpdated = Signal()
+    #: emitted with a message when the simulation cannot be run as configured
+    simulationWarning = Signal(str)
 
     def __init__(self, scene: "Scene"):  # type: ignore
         super().__init__()
@@ -145,15 +225,25 @@ class SceneSimulator(QObject, Serializable):
         self.scene: "Scene" = scene  # type: ignore
 
         self.threadpool = QThreadPool()
-        self.isPaused = False
-        self.isStopped = False
-        self.currentTimeStep = 0
+        # Running simulations wait on these events instead of polling.
+        self._resumeEvent = threading.Event()
+        self._resumeEvent.set()
+        self._stopEvent = threading.Event()
+        self.realTimeStatistics: Optional[RealTimeStatistics] = None
+        self.profiler: SceneProfiler = SceneProfiler()
+        self.currentTimeStep: float = 0.0
         self.stepsPerSecond = 0
         self.lastCurrentStep = 0
         self.stepPerSecondTimer = QTimer()
         self.stepPerSecondTimer.timeout.connect(self._updateStepPerSecond)
         self.stepPerSecondTimer.start(1000)
 
+        # Run the code generated for the scene instead of evaluating its nodes,
+        # when all its blocks support code generation.
+        self.useCompiledCode: bool = True
+        self._outputNodes: List[Node] = []
+        self.outputsUpdated.connect(self._showOutputs)
+
     def _updateStepPerSecond(self):
         self.stepsPerSecond = self.currentTimeStep - self.lastCurrentStep
         self.lastCurrentStep = self.currentTimeStep
@@ -161,6 +251,40 @@ class SceneSimulator(QObject, Serializable):
     def __del__(self):
         self.isStopped = True
 
+    @property
+    def isPaused(self) -> bool:
+        """
+        :getter: return ``True`` if the simulation is paused
+        :setter: pause or resume the simulation
+        :type: ``bool``
+        """
+        return not self._resumeEvent.is_set()
+
+    @isPaused.setter
+    def isPaused(self, value: bool):
+        if value:
+            self._resumeEvent.clear()
+        else:
+            self._resumeEvent.set()
+
+    @property
+    def isStopped(self) -> bool:
+        """
+        :getter: return ``True`` if the simulation has been stopped
+        :setter: stop the simulation, waking it up if it is paused or waiting for
+            a deadline
+        :type: ``bool``
+        """
+        return self._stopEvent.is_set()
+
+    @isStopped.setter
+    def isStopped(self, value: bool):
+        if value:
+            self._stopEvent.set()
+            self._resumeEvent.set()
+        else:
+            self._stopEvent.clear()
+
     @property
     def totalSteps(self):
         return int(float(self.config.finalTime) / self.config.timeStep)
@@ -169,10 +293,17 @@ class SceneSimulator(QObject, Serializable):
     def currentStep(self):
         return self.currentTimeStep / self.config.timeStep
 
-    def generateOrderedNodeList(self) -> List[Node]:
-        orderedNodeList: List[Node] = []
-        outputNodes: List[Node] = []
-
+    def generateOrderedNodeList(self) -> Schedule:
+        """
+        Order the nodes of the scene, see
+        :func:`~nodedge.scene_scheduler.scheduleNodes`. Feedback loops are broken at
+        stateful blocks, as in the compiled simulation.
+
+        :return: nodes of the scene, each one after the nodes connected to its inputs
+        :rtype: :class:`~nodedge.scene_scheduler.Schedule`
+        :raises: :class:`~nodedge.scene_scheduler.AlgebraicLoopError` if the scene
+            contains a loop without stateful block
+        """
         nodes = self.scene.nodes
 
         # check if scene is incomplete (i.e., disconnected node)
@@ -186,35 +317,18 @@ class SceneSimulator(QObject, Serializable):
                     )
                     self.notConnectedSocket.emit()
 
-        # if scene is not codable: raise a warning and exit
-
-        # find all output nodes
-        for node in nodes:
-            if node.operationCode is OP_NODE_CUSTOM_OUTPUT:
-                outputNodes.append(node)
-        if not outputNodes:
-            # raise error: the scene has no output
-            pass
-
-        # determine coding order
-        for outputNode in outputNodes:
-            # find complete hierarchy of an output node
-            nodesToAdd: List[Node] = self._appendHierarchyUntilRoot(
-                outputNode, orderedNodeList, []
-            )
-
-            # remove output node from the list, reverse order of the nodes to add and append
-            nodesToAdd.pop(0)
-            if nodesToAdd:
-                nodesToAdd.reverse()
-                orderedNodeList.extend(nodesToAdd)
+        return scheduleNodes(nodes, breakLoops=True)
 
-        return orderedNodeList
+    def run(self, blocking: bool = False):
+        """
+        Run the simulation of the scene, compiled if possible.
 
-    def run(self):
+        :param blocking: if ``True``, run in the calling thread and return once the
+            simulation is over, instead of running in the thread pool
+        :type blocking: ``bool``
+        """
         self.isPaused = False
         self.isStopped = False
-        self.generateOrderedNodeList()
         if self.config.finalTime is None:
             raise ValueError("Final time must be defined")
 
@@ -238,40 +352,237 @@ class SceneSimulator(QObject, Serializable):
         except ValueError:
             raise ValueError("Final time must be a number")
 
-        worker = Worker(self.runIterations, finalTime)
+        # Evaluated step by step, vectorized blocks would only get one sample of a
+        # signal: they are only simulated by the compiled scene.
+        vectorizedNodes = [
+            node.title
+            for node in self.scene.nodes
+            if getattr(node, "isVectorized", False)
+        ]
+        # Compiled code fuses the blocks: the profiler times the evaluated nodes.
+        profile = self.profiler.enabled
+        if profile and vectorizedNodes:
+            self.warn(
+                f"Vectorized blocks {', '.join(vectorizedNodes)} cannot be profiled: "
+                "the compiled scene is simulated without profile."
+            )
+            profile = False
+        useCompiledCode = self.useCompiledCode and not profile
+        compiledScene = self.compileScene() if useCompiledCode else None
+        if compiledScene is not None and compiledScene.hasArrayStages:
+            if self.config.realTime:
+                self.warn(
+                    "Scenes with vectorized blocks are simulated at once: the "
+                    "simulation is not paced in real time, and cannot be paused or "
+                    "stopped."
+                )
+            worker = Worker(self.runCompiledSimulation, finalTime, compiledScene)
+        elif compiledScene is None:
+            if vectorizedNodes:
+                self.warn(
+                    f"Vectorized blocks {', '.join(vectorizedNodes)} are only "
+                    "simulated by the compiled scene, which is not available: the "
+                    "simulation is not run."
+                )
+                return
+            try:
+                schedule = self.generateOrderedNodeList()
+            except AlgebraicLoopError as e:
+                logger.warning(e)
+                return
+            worker = Worker(self.runIterations, finalTime, schedule)
+        else:
+            # The generator keeps the states of the blocks from one step to the next.
+            step = compiledScene.steps(self.config.timeStep).__next__
+            worker = Worker(self.runCompiledIterations, finalTime, step)
 
         app = QApplication.instance()
-        app.aboutToQuit.connect(self.stop)
+        app.aboutToQuit.connect(self.stop)  # type: ignore
         # worker.signals.result.connect(self.print_output)
         worker.signals.finished.connect(self.scene.resetAllNodes)
         # worker.signals.progress.connect(self.progress_fn)
 
         # Execute
-        self.threadpool.start(worker)
+        if blocking:
+            worker.run()
+        else:
+            self.threadpool.start(worker)
 
         # self.runIterations(finalTime)
 
-    def runIterations(self, finalTime):
+    def runIterations(self, finalTime, schedule: Optional[Schedule] = None):
         logger.info(f"Final time: {finalTime}")
         logger.info(f"Time step: {self.config.timeStep}")
-        for i in np.arange(
-            self.config.timeStep, finalTime + self.config.timeStep, self.config.timeStep
-        ):
+        if schedule is None:
+            schedule = self.generateOrderedNodeList()
+        profiler = self.profiler if self.profiler.enabled else None
+        if profiler is not None:
+            profiler.reset()
+        evalNode: Callable[[Node], Any] = (
+            profiler.evalNode
+            if profiler is not None
+            else lambda node: node.eval(evalChildren=False)
+        )
+        lastUpdateTime = time.monotonic()
+        for i in self.timeSteps(finalTime):
             logger.info(f"Running iteration {i}")
-            self.currentTimeStep = i
-            self.progressed.emit(i)
+            currentTime = time.monotonic()
+            if currentTime - lastUpdateTime > PROGRESS_UPDATE_PERIOD:
+                self.progressed.emit(float(i))
+                lastUpdateTime = currentTime
+
+            self.evalStep(schedule, evalNode)
 
-            while self.isPaused:
-                time.sleep(0)
+        self.progressed.emit(float(self.currentTimeStep))
+        if profiler is not None:
+            self.profileUpdated.emit()
 
+    @staticmethod
+    def evalStep(schedule: Schedule, evalNode: Callable[[Node], Any]) -> None:
+        """
+        Evaluate every node once, for one simulation step, after its inputs.
+
+        Blocks breaking a feedback loop output their state, which is updated from
+        their inputs at the end of the step.
+
+        :param schedule: nodes of the scene, see :meth:`generateOrderedNodeList`
+        :type schedule: :class:`~nodedge.scene_scheduler.Schedule`
+        :param evalNode: function evaluating a node without its children
+        :type evalNode: ``Callable[[Node], Any]``
+        """
+        delayedNodes = schedule.delayedNodes
+        for node in schedule:
+            node.isDirty = True
+        for node in delayedNodes:
+            node.value = node.evalOutput()
+            # Evaluated nodes mark their children dirty, but the delayed nodes keep
+            # their output until the end of the step.
+            node.isHoldingOutput = True
+        try:
+            for node in schedule:
+                evalNode(node)
+        finally:
+            for node in delayedNodes:
+                node.isHoldingOutput = False
+        for node in delayedNodes:
+            node.isDirty = True
+            evalNode(node)
+
+    def timeSteps(self, finalTime: float) -> Iterator[float]:
+        """
+        Iterate over the times of the simulation steps, waiting while the
+        simulation is paused, until it ends or is stopped.
+
+        In real-time mode, each step starts at its deadline on the monotonic clock,
+        the time spent paused being excluded. Deadlines do not drift: after an
+        overrun, the next steps start as soon as possible to catch up. Timing
+        statistics are kept in :attr:`realTimeStatistics`.
+
+        :param finalTime: final time of the simulation
+        :type finalTime: ``float``
+        :return: time of each step, the step being run between two iterations
+        :rtype: ``Iterator[float]``
+        """
+        timeStep = self.config.timeStep
+        realTime = self.config.realTime
+        statistics = RealTimeStatistics(timeStep) if realTime else None
+        self.realTimeStatistics = statistics
+        startTime = time.monotonic()
+
+        times = np.arange(timeStep, finalTime + timeStep, timeStep)
+        for stepIndex, currentTime in enumerate(times):
+            if self.isPaused:
+                pauseTime = time.monotonic()
+                self._resumeEvent.wait()
+                startTime += time.monotonic() - pauseTime
             if self.isStopped:
                 break
 
-            for node in self.generateOrderedNodeList():
-                if not node.getParentNodes():
-                    node.isDirty = True
-                    node.eval()
-                    node.evalChildren()
+            if statistics is not None:
+                deadline = startTime + stepIndex * timeStep
+                delay = deadline - time.monotonic()
+                if delay > 0 and self._stopEvent.wait(delay):
+                    break
+                jitter = time.monotonic() - deadline
+
+            self.currentTimeStep = currentTime
+            yield currentTime
+
+            if statistics is not None:
+                statistics.record(jitter, time.monotonic() - deadline)
+
+    def compileScene(self) -> Optional[CompiledScene]:
+        """
+        Compile the scene, see :meth:`~nodedge.scene_coder.SceneCoder.compileCode`.
+
+        :return: compiled scene, or ``None`` if the scene cannot be compiled
+        :rtype: ``Optional[CompiledScene]``
+        """
+        try:
+            compiledScene: CompiledScene = self.scene.coder.compileCode()
+        except Exception as e:
+            logger.info(f"Scene nodes are evaluated, it cannot be compiled: {e}")
+            return None
+
+        self._outputNodes = self.scene.coder.outputNodes()
+        return compiledScene
+
+    def warn(self, message: str) -> None:
+        """
+        Log a warning about the simulation and notify the user, see
+        :attr:`simulationWarning`.
+
+        :param message: warning shown to the user
+        :type message: ``str``
+        """
+        logger.warning(message)
+        self.simulationWarning.emit(message)
+
+    def runCompiledSimulation(self, finalTime, compiledScene: CompiledScene):
+        """
+        Run the whole simulation at once, vectorized blocks being evaluated on the
+        complete signals of their inputs. The output blocks show the last values.
+
+        The simulation is not paced in real time, see
+        :attr:`SolverConfiguration.realTime`, and is not paused or stopped: the
+        complete signals are needed before the vectorized blocks are evaluated.
+
+        :param finalTime: final time of the simulation
+        :type finalTime: ``float``
+        :param compiledScene: compiled scene
+        :type compiledScene: :class:`~nodedge.scene_coder.CompiledScene`
+        """
+        logger.info(f"Final time: {finalTime}")
+        logger.info(f"Time step: {self.config.timeStep}")
+        times, outputs = compiledScene.simulate(finalTime, self.config.timeStep)
+        if not len(times):
+            return
+
+        self.currentTimeStep = float(times[-1])
+        self.progressed.emit(self.currentTimeStep)
+        self.outputsUpdated.emit([output[-1] for output in outputs])
+
+    def runCompiledIterations(self, finalTime, step: Callable[[], list]):
+        logger.info(f"Final time: {finalTime}")
+        logger.info(f"Time step: {self.config.timeStep}")
+        outputs: list = []
+        lastUpdateTime = time.monotonic()
+        for i in self.timeSteps(finalTime):
+            outputs = step()
+
+            # Signals are throttled, the step rate is not limited by the GUI.
+            currentTime = time.monotonic()
+            if currentTime - lastUpdateTime > PROGRESS_UPDATE_PERIOD:
+                self.progressed.emit(float(i))
+                self.outputsUpdated.emit(outputs)
+                lastUpdateTime = currentTime
+
+        self.progressed.emit(float(self.currentTimeStep))
+        self.outputsUpdated.emit(outputs)
+
+    def _showOutputs(self, outputs: list):
+        for outputNode, value in zip(self._outputNodes, outputs):
+            outputNode.showValue(value)
 
     def pause(self):
         self.isPaused = not self.isPaused
@@ -300,14 +611,3 @@ class SceneSimulator(QObject, Serializable):
 
     def updateConfig(self, config: SolverConfiguration):
         self.config = config
-
-    def _appendHierarchyUntilRoot(
-        self, currentNode: Node, appendedNodes: List[Node], nodesToAdd: List[Node]
-    ):
-        nodesToAdd.append(currentNode)
-        parentNodes = currentNode.getParentNodes()
-        if parentNodes:
-            for parent in parentNodes:
-                if parent not in appendedNodes and parent not in nodesToAdd:
-                    self._appendHierarchyUntilRoot(parent, appendedNodes, nodesToAdd)
-        return nodesToAdd
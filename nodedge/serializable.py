@@ -10,8 +10,13 @@ from typing import Optional
 class Serializable:
     """
     :class:`~nodedge.serializable.Serializable` class
+
+    The class has no instance layout, so that the subclasses can declare
+    ``__slots__``, including ``id``, and can also inherit from Qt classes.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """
         Create data which are common to any serializable object.
@@ -3,6 +3,7 @@ import os
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
@@ -51,6 +52,8 @@ class SolverDialog(QDialog):
         self.maxIterationsSpinBox = QDoubleSpinBox()
         self.toleranceSpinBox = QDoubleSpinBox()
         self.finalTimeEdit = QLineEdit()
+        self.realTimeCheckBox = QCheckBox()
+        self.realTimeCheckBox.setToolTip("Pace the simulation steps on the wall clock")
 
         self.configLayout.addRow("Solver name", self.solverName)
         self.configLayout.addRow("Solver", self.solverCombo)
@@ -59,12 +62,14 @@ class SolverDialog(QDialog):
         self.configLayout.addRow("Max iterations", self.maxIterationsSpinBox)
         self.configLayout.addRow("Tolerance", self.toleranceSpinBox)
         self.configLayout.addRow("Final time", self.finalTimeEdit)
+        self.configLayout.addRow("Real time", self.realTimeCheckBox)
         self.solverName.textChanged.connect(self.updateSolverConfig)
         self.solverOptions.textChanged.connect(self.updateSolverConfig)
         self.timestepSpinBox.valueChanged.connect(self.updateSolverConfig)
         self.maxIterationsSpinBox.valueChanged.connect(self.updateSolverConfig)
         self.toleranceSpinBox.valueChanged.connect(self.updateSolverConfig)
         self.finalTimeEdit.textChanged.connect(self.updateSolverConfig)
+        self.realTimeCheckBox.stateChanged.connect(self.onRealTimeChanged)
 
         buttons = QDialogButtonBox.Ok | QDialogButtonBox.Cancel
         self.buttonBox = QDialogButtonBox(buttons)
@@ -81,6 +86,7 @@ class SolverDialog(QDialog):
         self.maxIterationsSpinBox.valueChanged.disconnect(self.updateSolverConfig)
         self.toleranceSpinBox.valueChanged.disconnect(self.updateSolverConfig)
         self.finalTimeEdit.textChanged.disconnect(self.updateSolverConfig)
+        self.realTimeCheckBox.stateChanged.disconnect(self.onRealTimeChanged)
 
         if self.solverConfiguration.solver is not None:
             self.solverCombo.setCurrentText(self.solverConfiguration.solver)
@@ -96,6 +102,7 @@ class SolverDialog(QDialog):
             self.toleranceSpinBox.setValue(self.solverConfiguration.tolerance)
         if self.solverConfiguration.finalTime is not None:
             self.finalTimeEdit.setText(str(self.solverConfiguration.finalTime))
+        self.realTimeCheckBox.setChecked(self.solverConfiguration.realTime)
 
         self.solverCombo.currentIndexChanged.connect(self.updateSolverConfig)
         self.solverName.textChanged.connect(self.updateSolverConfig)
@@ -104,6 +111,7 @@ class SolverDialog(QDialog):
         self.maxIterationsSpinBox.valueChanged.connect(self.updateSolverConfig)
         self.toleranceSpinBox.valueChanged.connect(self.updateSolverConfig)
         self.finalTimeEdit.textChanged.connect(self.updateSolverConfig)
+        self.realTimeCheckBox.stateChanged.connect(self.onRealTimeChanged)
 
     def updateSolverConfig(self, index):
         if index == 0:
@@ -120,6 +128,10 @@ class SolverDialog(QDialog):
         self.solverConfiguration.maxIterations = self.maxIterationsSpinBox.value()
         self.solverConfiguration.tolerance = self.toleranceSpinBox.value()
         self.solverConfiguration.finalTime = self.finalTimeEdit.text()
+        self.solverConfiguration.realTime = self.realTimeCheckBox.isChecked()
+
+    def onRealTimeChanged(self, state):
+        self.solverConfiguration.realTime = self.realTimeCheckBox.isChecked()
 
     def onAccepted(self):
         self.accept()
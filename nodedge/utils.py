@@ -6,6 +6,7 @@ Utils module with some helper functions.
 import logging
 import re
 import traceback
+from functools import lru_cache
 from pprint import PrettyPrinter
 from typing import Callable, Optional, Union
 
@@ -14,7 +15,6 @@ from PySide6 import QtCore, QtWidgets
 from PySide6.QtCore import QFile, QPoint
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import QApplication, QWidget
-from scipy.signal import butter, filtfilt
 
 pp = PrettyPrinter(indent=4).pprint
 
@@ -110,7 +110,7 @@ def widgetsAt(pos):
     return widgets
 
 
-def indentCode(string: str):
+def indentCode(string: str) -> str:
     lines = string.split("\n")
     indentedLines = ["\n    " + line for line in lines]
     indentedCode = "".join(indentedLines)
@@ -204,8 +204,32 @@ def butterLowpassFilter(
     :type order: `int`
     :return: `np.ndarray`
     """
+    from scipy.signal import sosfiltfilt
+
+    sos = butterLowpassSos(cutoff, fs, order)
+    y: np.ndarray = sosfiltfilt(sos, data)
+    return y
+
+
+@lru_cache(maxsize=64)
+def butterLowpassSos(cutoff: float, fs: float, order: int) -> np.ndarray:
+    """
+    Design a Butterworth lowpass filter as second-order sections, which stay
+    numerically stable at high orders. Designs are cached per (cutoff, fs, order),
+    so the returned array is shared and must not be modified.
+    :param cutoff: Cut off frequency of the filter
+    :type cutoff: `float`
+    :param fs: Sampling frequency of the data
+    :type fs: `float`
+    :param order: Order of the filter
+    :type order: `int`
+    :return: `np.ndarray` of shape (sections, 6)
+    """
+    from scipy.signal import butter
+
     nyquistFrequency = 0.5 * fs
     normal_cutoff = cutoff / nyquistFrequency
-    b, a = butter(order, normal_cutoff, btype="low", analog=False)
-    y: np.ndarray = filtfilt(b, a, data)
-    return y
+    sos: np.ndarray = butter(
+        order, normal_cutoff, btype="low", analog=False, output="sos"
+    )
+    return sos
@@ -96,7 +96,7 @@ setup(
     platforms=PLATFORMS,
     packages=find_packages(include="nodedge*", exclude=["tests"]),
     include_package_data=True,
-    package_data={"": ["*.qss"]},
+    package_data={"": ["*.qss", "block_manifest.json"]},
     exclude_package_data={"": ["*/icons/*", "*.pyc"]},
     setup_requires=setup_requirements,
     test_suite="tests",
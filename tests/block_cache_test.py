@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.blocks.autogen.advanced_maths.sin_block import NumpySinBlock
+from nodedge.blocks.block_cache import CACHE_MISS, BlockCache, fingerprint
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+
+
+@pytest.fixture
+def emptyScene(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+
+    yield editor.scene
+    window.close()
+
+
+def test_fingerprint():
+    readOnly = np.arange(3.0)
+    readOnly.flags.writeable = False
+
+    assert fingerprint(1) != fingerprint(1.0)
+    assert fingerprint(readOnly) == id(readOnly)
+    assert fingerprint(np.arange(3.0)) == fingerprint(np.arange(3.0))
+    assert fingerprint(np.zeros(10000)) is None
+
+
+def test_leastRecentlyUsedEviction():
+    cache = BlockCache(size=2)
+    keys = [cache.key([value]) for value in range(3)]
+    for value, key in enumerate(keys[:2]):
+        cache.put(key, [value], value)
+
+    assert cache.get(keys[0]) == 0
+    cache.put(keys[2], [2], 2)
+
+    assert cache.get(keys[1]) is CACHE_MISS
+    assert cache.get(keys[0]) == 0
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 2)
+
+
+def test_cachedNone():
+    cache = BlockCache()
+    key = cache.key([1.0])
+    cache.put(key, [1.0], None)
+
+    assert cache.get(key) is None
+    assert cache.hits == 1
+
+
+def test_memoizedEvaluation(emptyScene):
+    constantBlock = ConstantBlock(emptyScene)
+    constantBlock.content.edit.setText("[0.0, 1.0]")
+    sinBlock = NumpySinBlock(emptyScene)
+    Edge(emptyScene, constantBlock.outputSockets[0], sinBlock.inputSockets[0])
+
+    value = sinBlock.eval()
+    emptyScene.evalAllNodes()
+
+    assert sinBlock.eval().tolist() == value.tolist()
+    assert (sinBlock.cache.hits, sinBlock.cache.misses) == (1, 1)
+
+    # The blocks using the value can modify it without altering the cache.
+    sinBlock.value += 1.0
+    sinBlock.isDirty = True
+    assert sinBlock.eval().tolist() == np.sin([0.0, 1.0]).tolist()
+
+    constantBlock.content.edit.setText("[2.0]")
+    emptyScene.evalAllNodes()
+
+    assert sinBlock.value.tolist() == [np.sin(2.0)]
+    assert sinBlock.cache.misses == 2
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+
+from nodedge.blocks.block_config import (
+    BLOCKS,
+    availableBlocks,
+    blockEntryFromClass,
+    getClassFromOperationCode,
+    importBlockModules,
+    loadBlockManifest,
+)
+from nodedge.blocks.op_node import OP_NODE_CUSTOM_GAIN
+
+ROOT_PATH = os.path.join(os.path.dirname(__file__), "..")
+
+
+def test_manifestMatchesRegisteredBlocks():
+    importBlockModules()
+    manifest = loadBlockManifest()
+
+    assert manifest
+    for operationCode, entry in manifest.items():
+        assert blockEntryFromClass(BLOCKS[operationCode]) == entry
+
+
+def test_availableBlocks():
+    blocks = availableBlocks()
+
+    operationCodes = [block["operationCode"] for block in blocks]
+    assert operationCodes == sorted(operationCodes)
+    assert set(loadBlockManifest().keys()) <= set(operationCodes)
+    for block in blocks:
+        assert block["icon"] == "" or os.path.isabs(block["icon"])
+
+
+def test_getClassFromOperationCode():
+    blockClass = getClassFromOperationCode(OP_NODE_CUSTOM_GAIN)
+
+    assert blockClass.operationCode == OP_NODE_CUSTOM_GAIN
+    assert blockClass.__module__ == "nodedge.blocks.custom.gain_block"
+
+
+def test_blocksImportedOnFirstUse():
+    script = (
+        "import sys\n"
+        "from nodedge.blocks.block_config import availableBlocks, "
+        "getClassFromOperationCode\n"
+        "from nodedge.blocks.op_node import OP_NODE_CUSTOM_GAIN\n"
+        "availableBlocks()\n"
+        "assert not any(m.endswith('_block') for m in sys.modules "
+        "if m.startswith(('nodedge.blocks.autogen.', 'nodedge.blocks.custom.')))\n"
+        "getClassFromOperationCode(OP_NODE_CUSTOM_GAIN)\n"
+        "assert 'nodedge.blocks.custom.gain_block' in sys.modules\n"
+        "assert 'nodedge.blocks.custom.python_block' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT_PATH, check=True)
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from asammdf import MDF, Signal
+
+from nodedge.dats import channel_statistics
+from nodedge.dats.channel_statistics import (
+    ChannelStatistics,
+    ChannelStatisticsIndex,
+    computeLogStatistics,
+    computeStatistics,
+    readSidecar,
+    sidecarPath,
+)
+
+
+@pytest.fixture
+def log():
+    timestamps = np.arange(1000, dtype=np.float64) * 0.01
+    samples = np.arange(1000, dtype=np.float64)
+    samples[10] = np.nan
+    log = MDF()
+    log.append(
+        [
+            Signal(samples=samples, timestamps=timestamps, name="ramp"),
+            Signal(samples=np.ones(1000), timestamps=timestamps, name="ones"),
+        ]
+    )
+    return log
+
+
+def test_computeStatistics():
+    timestamps = np.arange(5, dtype=np.float64)
+    samples = np.array([1.0, np.nan, 3.0, -1.0, 2.0])
+
+    statistics = computeStatistics(Signal(samples, timestamps, name="s"))
+
+    assert statistics.min == -1.0
+    assert statistics.max == 3.0
+    assert statistics.mean == pytest.approx(1.25)
+    assert statistics.std == pytest.approx(np.nanstd(samples))
+    assert statistics.nanCount == 1
+    assert statistics.sampleRate == pytest.approx(1.0)
+
+
+def test_computeLogStatisticsInChunks(log, monkeypatch):
+    monkeypatch.setattr(channel_statistics, "CHUNK_RECORDS", 64)
+
+    statistics = computeLogStatistics(log, ["ramp", "ones", "missing"])
+
+    assert set(statistics.keys()) == {"ramp", "ones"}
+    ramp = statistics["ramp"]
+    assert (ramp.min, ramp.max, ramp.nanCount, ramp.count) == (0.0, 999.0, 1, 1000)
+    assert ramp.tMax == pytest.approx(9.99)
+    assert ramp.sampleRate == pytest.approx(100.0)
+    assert statistics["ones"].std == pytest.approx(0.0)
+
+
+def test_computeLogStatisticsWithOffset(monkeypatch):
+    monkeypatch.setattr(channel_statistics, "CHUNK_RECORDS", 64)
+    samples = 1e9 + np.random.default_rng(0).normal(0.0, 0.1, 1000)
+    log = MDF()
+    log.append(Signal(samples, np.arange(1000, dtype=np.float64), name="offset"))
+
+    statistics = computeLogStatistics(log, ["offset"])["offset"]
+
+    assert statistics.mean == pytest.approx(samples.mean(), abs=1e-6)
+    assert statistics.std == pytest.approx(samples.std(), rel=1e-6)
+
+
+def test_asDictRoundTrip():
+    statistics = ChannelStatistics(0.0, 1.0, nanCount=3, count=3)
+
+    values = statistics.as_dict()
+
+    assert values["min"] is None
+    assert ChannelStatistics.from_dict(values) == statistics
+    assert statistics.sampleRate == pytest.approx(2.0)
+
+
+def test_sidecar(log, tmp_path, qtbot):
+    filename = tmp_path / "log.mf4"
+    log.save(filename)
+    fileLog = MDF(filename)
+    index = ChannelStatisticsIndex()
+
+    with qtbot.waitSignal(index.statisticsUpdated, timeout=5000):
+        assert index.update(fileLog, ["ramp", "ones"]) is False
+
+    assert index.get(fileLog, "ramp").max == 999.0
+    assert sidecarPath(fileLog).is_file()
+    assert readSidecar(fileLog)["ones"] == index.get(fileLog, "ones")
+
+    otherIndex = ChannelStatisticsIndex()
+    assert otherIndex.update(fileLog, ["ramp", "ones"]) is True
+    fileLog.close()
+
+
+def test_inMemoryLog(log, qtbot):
+    index = ChannelStatisticsIndex()
+
+    with qtbot.waitSignal(index.statisticsUpdated):
+        assert index.update(log, ["ramp", "ones"]) is True
+
+    assert index.get(log, "ramp").max == 999.0
+    assert index.waitForDone(0)
+
+
+def test_workerError(log, tmp_path, qtbot, monkeypatch):
+    def failingStatistics(*args):
+        raise ValueError("Corrupted log")
+
+    filename = tmp_path / "log.mf4"
+    log.save(filename)
+    fileLog = MDF(filename)
+    monkeypatch.setattr(channel_statistics, "computeLogStatistics", failingStatistics)
+    index = ChannelStatisticsIndex()
+    assert index.update(fileLog, ["ramp"]) is False
+    index.waitForDone()
+    monkeypatch.undo()
+
+    # The failed pass does not prevent the next one.
+    qtbot.waitUntil(lambda: index.update(fileLog, ["ramp"]) is True, timeout=5000)
+
+    assert index.get(fileLog, "ramp").max == 999.0
+    fileLog.close()
@@ -0,0 +1,50 @@
+import pytest
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.blocks.custom.gain_block import GainBlock
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+
+
+@pytest.fixture
+def constantBlock(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+
+    yield ConstantBlock(editor.scene)
+    window.close()
+
+
+def test_parsedOnce(constantBlock):
+    constantBlock.content.edit.setText("[1.5, 2.5]")
+    value = constantBlock.eval()
+
+    assert value.tolist() == [1.5, 2.5]
+    assert not value.flags.writeable
+    constantBlock.isDirty = True
+    assert constantBlock.eval() is value
+
+
+def test_invalidLiteral(constantBlock):
+    constantBlock.content.edit.setText("__import__('os')")
+
+    assert constantBlock.eval() is None
+    assert constantBlock.isInvalid
+
+
+def test_evaluatedOnceTypingPauses(constantBlock, qtbot):
+    scene = constantBlock.scene
+    scene.realTimeEval = True
+    gainBlock = GainBlock(scene)
+    Edge(scene, constantBlock.outputSockets[0], gainBlock.inputSockets[0])
+    gainBlock.eval()
+
+    constantBlock.content.edit.setText("2")
+    constantBlock.content.edit.setText("20")
+
+    assert constantBlock.isDirty
+    assert gainBlock.isDirty
+    assert gainBlock.value == 1
+    qtbot.waitUntil(lambda: gainBlock.value == 20)
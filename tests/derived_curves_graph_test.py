@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from asammdf import MDF, Signal
+
+from nodedge.dats.derived_curves_graph import DerivedCurvesGraph
+
+
+@pytest.fixture
+def rawChannels():
+    timestamps = np.arange(10, dtype=np.float64)
+    return {
+        "a": Signal(samples=np.ones(10), timestamps=timestamps, name="a"),
+        "b": Signal(samples=2 * np.ones(10), timestamps=timestamps, name="b"),
+    }
+
+
+@pytest.fixture
+def curveConfig():
+    return {
+        "c": {"formula": "a + b"},
+        "d": {"formula": "c * 2"},
+        "e": {"formula": "b * 3"},
+    }
+
+
+@pytest.fixture
+def countingGetChannel(rawChannels):
+    calls = []
+
+    def getChannel(name):
+        calls.append(name)
+        return rawChannels[name]
+
+    getChannel.calls = calls
+    return getChannel
+
+
+def test_evaluationLevels(curveConfig):
+    graph = DerivedCurvesGraph()
+    graph.setCurveConfig(curveConfig)
+
+    assert graph.evaluationLevels(graph.curveNames) == [["c", "e"], ["d"]]
+
+
+def test_update(curveConfig, countingGetChannel):
+    log = MDF()
+    graph = DerivedCurvesGraph()
+    graph.setCurveConfig(curveConfig)
+
+    errors = graph.update(log, countingGetChannel)
+
+    assert errors == {}
+    assert sorted(graph.computedCurveNames(log)) == ["c", "d", "e"]
+    assert np.allclose(graph.get(log, "d").samples, 6.0)
+    assert sorted(countingGetChannel.calls) == ["a", "b"]
+
+
+def test_onlyDownstreamCurvesAreRecomputed(curveConfig, countingGetChannel):
+    log = MDF()
+    graph = DerivedCurvesGraph()
+    graph.setCurveConfig(curveConfig)
+    graph.update(log, countingGetChannel)
+    eCurve = graph.get(log, "e")
+
+    curveConfig["c"] = {"formula": "a - b"}
+    invalidatedNames = graph.setCurveConfig(curveConfig)
+    graph.update(log, countingGetChannel)
+
+    assert invalidatedNames == {"c", "d"}
+    assert graph.get(log, "e") is eCurve
+    assert np.allclose(graph.get(log, "d").samples, -2.0)
+
+
+def test_missingChannel(countingGetChannel):
+    log = MDF()
+    graph = DerivedCurvesGraph()
+    graph.setCurveConfig({"c": {"formula": "a + z"}, "d": {"formula": "c + a"}})
+
+    errors = graph.update(log, countingGetChannel)
+
+    assert set(errors.keys()) == {"c", "d"}
+    assert graph.computedCurveNames(log) == []
+
+
+def test_circularDependency(countingGetChannel):
+    log = MDF()
+    graph = DerivedCurvesGraph()
+    graph.setCurveConfig({"c": {"formula": "d + a"}, "d": {"formula": "c + a"}})
+
+    errors = graph.update(log, countingGetChannel)
+
+    assert set(errors.keys()) == {"c", "d"}
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from asammdf import MDF, Signal
+
+from nodedge.dats import log_comparison
+from nodedge.dats.log_comparison import ChannelEnvelope, computeEnvelope
+
+
+@pytest.fixture
+def log():
+    timestamps = np.arange(100_000, dtype=np.float64) * 0.001
+    samples = np.sin(2 * np.pi * timestamps)
+    log = MDF()
+    log.append([Signal(samples=samples, timestamps=timestamps, name="sine")])
+    return log
+
+
+def test_computeEnvelope():
+    timestamps = np.arange(10, dtype=np.float64)
+    samples = np.array([0, 5, 1, 2, -3, 4, 0, 0, 1, 1], dtype=np.float64)
+
+    x, y = computeEnvelope(timestamps, samples, 2)
+
+    assert np.array_equal(x, [0, 0, 5, 5])
+    assert np.array_equal(y, [-3, 5, 0, 4])
+
+
+def test_computeEnvelopeShortSignal():
+    timestamps = np.arange(4, dtype=np.float64)
+
+    x, y = computeEnvelope(timestamps, timestamps, 2)
+
+    assert x is timestamps
+    assert y is timestamps
+
+
+def test_channelEnvelopeIsReadInChunks(log, monkeypatch):
+    monkeypatch.setattr(log_comparison, "CHUNK_RECORDS", 10_000)
+    envelope = ChannelEnvelope(log, "log", "sine")
+
+    assert envelope.firstTimestamp == 0.0
+    assert envelope.lastTimestamp == pytest.approx(99.999)
+    assert len(envelope.binStarts) <= log_comparison.ENVELOPE_BINS
+    assert envelope.mins.min() == pytest.approx(-1.0)
+    assert envelope.maxs.max() == pytest.approx(1.0)
+
+
+def test_channelEnvelopeWindow(log, monkeypatch):
+    envelope = ChannelEnvelope(log, "log", "sine")
+
+    x, y = envelope.window(10.0, 11.0, 2000)
+
+    # Few visible records: the samples are read back from the log.
+    assert len(x) == len(y)
+    assert x[0] <= 10.0 and x[-1] >= 10.99
+    assert x[-1] - x[0] < 1.1
+
+    monkeypatch.setattr(log_comparison, "MAX_WINDOW_RECORDS", 0)
+    x, y = envelope.window(0.0, 100.0, 500)
+
+    # Many visible records: the coarse envelope is drawn.
+    assert len(x) <= 2 * 500
+    assert y.min() == pytest.approx(-1.0)
+    assert y.max() == pytest.approx(1.0)
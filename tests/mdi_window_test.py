@@ -1,9 +1,13 @@
+import os
+
 import pytest
 from PySide6.QtWidgets import QMessageBox
 from pytestqt.qtbot import QtBot
 
 from nodedge.mdi_window import MdiWindow
 
+EXAMPLES_PATH = os.path.join(os.path.dirname(__file__), "../examples")
+
 
 @pytest.fixture
 def emptyMdiWindow(qtbot: QtBot):
@@ -44,3 +48,31 @@ def test_closeSubWindow(qtbot: QtBot, mocker):
     window.close()
 
     assert window.mdiArea.subWindowList() == []
+
+
+def test_openFiles(qtbot: QtBot, emptyMdiWindow: MdiWindow):
+    filenames = [
+        os.path.join(EXAMPLES_PATH, "calculator/calculator.json"),
+        os.path.join(EXAMPLES_PATH, "discrete/discrete_transfer_function_example.json"),
+    ]
+    emptyMdiWindow.openFile(filenames)
+
+    qtbot.waitUntil(lambda: len(emptyMdiWindow.mdiArea.subWindowList()) == 2)
+    openedFilenames = {
+        subWindow.widget().filename
+        for subWindow in emptyMdiWindow.mdiArea.subWindowList()
+    }
+    assert openedFilenames == set(filenames)
+    currentScene = emptyMdiWindow.currentEditorWidget.scene
+    assert emptyMdiWindow.sceneItemsTreeWidget.scene is currentScene
+    emptyMdiWindow.mdiArea.closeAllSubWindows()
+
+
+def test_openFileBlocking(emptyMdiWindow: MdiWindow):
+    filename = os.path.join(EXAMPLES_PATH, "calculator/calculator.json")
+    emptyMdiWindow.show()
+    emptyMdiWindow.openFile(filename)
+
+    assert len(emptyMdiWindow.mdiArea.subWindowList()) == 1
+    assert emptyMdiWindow.currentEditorWidget.filename == filename
+    emptyMdiWindow.mdiArea.closeAllSubWindows()
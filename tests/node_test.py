@@ -2,6 +2,7 @@ import pytest
 from PySide6.QtCore import QPointF
 from PySide6.QtWidgets import QMainWindow
 
+from nodedge.blocks.block_config import BLOCKS, importBlockModules
 from nodedge.connector import SocketLocation
 from nodedge.edge import Edge
 from nodedge.editor_widget import EditorWidget
@@ -187,8 +188,8 @@ def test_evalChildren(connectedNode: Node):
     grandChildNode = childNode.getChildNodes()[0]
     assert childNode.isDirty is False
     assert childNode.isInvalid is False
-    assert grandChildNode.isDirty is True
-    assert grandChildNode.isInvalid is True
+    assert grandChildNode.isDirty is False
+    assert grandChildNode.isInvalid is False
 
 
 def test_getChildNodes(emptyScene):
@@ -257,3 +258,14 @@ def test_outputNodesAt(connectedNode: Node):
         == grandChildNode.inputSockets[0]
     )
     assert connectedNode.outputNodesAt(0) == [grandChildNode]
+
+
+def test_slots(emptyScene):
+    importBlockModules()
+
+    for blockClass in BLOCKS.values():
+        block = blockClass(emptyScene)
+        assert not hasattr(block, "__dict__"), blockClass.__name__
+    node = Node(emptyScene, inputSocketTypes=[SocketType.Number])
+    assert not hasattr(node, "__dict__")
+    assert node.inputSocketTypes == [SocketType.Number]
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+from PySide6.QtWidgets import QMainWindow
+
+import nodedge.blocks.custom.python_block as pythonBlockModule
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.blocks.custom.output_block import OutputBlock
+from nodedge.blocks.custom.python_block import PythonBlock
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+
+
+@pytest.fixture
+def pythonBlock(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+    scene = editor.scene
+
+    constantBlock = ConstantBlock(scene)
+    constantBlock.content.edit.setText(str(3))
+    constantBlock.title = "x"
+    block = PythonBlock(scene)
+    Edge(scene, constantBlock.outputSockets[0], block.inputSockets[0])
+
+    yield block
+    window.close()
+
+
+def setCode(block: PythonBlock, code: str):
+    block.params[0].value = code
+    block.onParamChanged(block.params[0])
+
+
+def test_eval(pythonBlock):
+    setCode(pythonBlock, "return x * 2")
+
+    assert pythonBlock.eval() == 6
+
+
+def test_compiledOnce(pythonBlock):
+    setCode(pythonBlock, "return x * 2")
+    function = pythonBlock.compileFunction()
+
+    pythonBlock.isDirty = True
+    pythonBlock.eval()
+
+    assert pythonBlock.compileFunction() is function
+    setCode(pythonBlock, "return x + 1")
+    assert pythonBlock.compileFunction() is not function
+    assert pythonBlock.eval() == 4
+
+
+def test_privateNamespace(pythonBlock):
+    setCode(pythonBlock, "global leaked\nleaked = x\nreturn x")
+
+    pythonBlock.eval()
+
+    assert not hasattr(pythonBlockModule, "leaked")
+
+
+def test_compileErrorAtEditTime(pythonBlock):
+    setCode(pythonBlock, "return x +")
+
+    assert pythonBlock.isInvalid
+    assert "Invalid code" in pythonBlock.graphicsNode.toolTip()
+    assert pythonBlock.eval() is None
+
+
+def test_vectorizedSimulation(pythonBlock):
+    scene = pythonBlock.scene
+    setCode(pythonBlock, "return x.cumsum()")
+    pythonBlock.params[1].value = True
+    pythonBlock.onParamChanged(pythonBlock.params[1])
+    outputBlock = OutputBlock(scene)
+    Edge(scene, pythonBlock.outputSockets[0], outputBlock.inputSockets[0])
+
+    compiledScene = scene.coder.compileCode(useNumba=False)
+    times, outputs = compiledScene.simulate(0.5, 0.1)
+
+    assert compiledScene.hasArrayStages
+    assert np.allclose(times, np.arange(1, 6) * 0.1)
+    assert np.allclose(outputs[0], [3, 6, 9, 12, 15])
+    assert compiledScene.evaluate() == [3]
+
+
+def setVectorizedSimulation(block: PythonBlock):
+    setCode(block, "return x.cumsum()")
+    block.params[1].value = True
+    block.onParamChanged(block.params[1])
+    scene = block.scene
+    outputBlock = OutputBlock(scene)
+    Edge(scene, block.outputSockets[0], outputBlock.inputSockets[0])
+    config = scene.simulator.config
+    config.solver = "Basic solver"
+    config.solverName = ""
+    config.maxIterations = 1
+    config.tolerance = 0.0
+    config.timeStep = 0.1
+    config.finalTime = 0.5
+
+
+def test_vectorizedSimulationNotEvaluated(pythonBlock, qtbot):
+    setVectorizedSimulation(pythonBlock)
+    simulator = pythonBlock.scene.simulator
+    simulator.useCompiledCode = False
+
+    with qtbot.waitSignal(simulator.simulationWarning) as blocker:
+        simulator.run(blocking=True)
+
+    assert simulator.currentTimeStep == 0
+    assert "Vectorized blocks" in blocker.args[0]
+
+
+def test_vectorizedSimulationNotProfiled(pythonBlock, qtbot):
+    setVectorizedSimulation(pythonBlock)
+    simulator = pythonBlock.scene.simulator
+    simulator.profiler.enabled = True
+
+    with qtbot.waitSignal(simulator.simulationWarning) as blocker:
+        simulator.run(blocking=True)
+
+    assert simulator.currentTimeStep == pytest.approx(0.5)
+    assert "cannot be profiled" in blocker.args[0]
+
+
+def test_vectorizedSimulationNotRealTime(pythonBlock, qtbot):
+    setVectorizedSimulation(pythonBlock)
+    simulator = pythonBlock.scene.simulator
+    simulator.config.realTime = True
+
+    with qtbot.waitSignal(simulator.simulationWarning) as blocker:
+        simulator.run(blocking=True)
+
+    assert simulator.currentTimeStep == pytest.approx(0.5)
+    assert "real time" in blocker.args[0]
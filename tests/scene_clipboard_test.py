@@ -0,0 +1,62 @@
+import pytest
+from PySide6.QtCore import QMimeData
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+from nodedge.node import Node
+from nodedge.scene_clipboard import MIME_TYPE, fromMimeData, mimeDataKey, toMimeData
+from nodedge.socket_type import SocketType
+
+
+@pytest.fixture
+def emptyScene(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+
+    yield editor.scene
+    window.close()
+
+
+def test_serializeSelectedEdges(emptyScene):
+    nodes = [
+        Node(emptyScene, f"Node {index}", [SocketType.Any], [SocketType.Any])
+        for index in range(3)
+    ]
+    innerEdge = Edge(emptyScene, nodes[0].outputSockets[0], nodes[1].inputSockets[0])
+    outerEdge = Edge(emptyScene, nodes[1].outputSockets[0], nodes[2].inputSockets[0])
+    for item in (
+        nodes[0].graphicsNode,
+        nodes[1].graphicsNode,
+        innerEdge.graphicsEdge,
+        outerEdge.graphicsEdge,
+    ):
+        item.setSelected(True)
+
+    data = emptyScene.clipboard.serializeSelected()
+
+    assert len(data["nodes"]) == 2
+    assert [edge["id"] for edge in data["edges"]] == [innerEdge.id]
+
+
+def test_mimeData():
+    data = {"nodes": [{"id": 1, "title": "node"}], "edges": []}
+
+    mimeData = toMimeData(data, "key")
+
+    assert mimeData.hasFormat(MIME_TYPE)
+    assert fromMimeData(mimeData) == data
+    assert mimeDataKey(mimeData) == "key"
+
+
+def test_mimeDataTextFallback():
+    mimeData = QMimeData()
+    mimeData.setText('{"nodes": [], "edges": []}')
+
+    assert fromMimeData(mimeData) == {"nodes": [], "edges": []}
+    assert mimeDataKey(mimeData) is None
+
+    mimeData.setText("not json")
+
+    assert fromMimeData(mimeData) is None
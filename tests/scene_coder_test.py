@@ -1,8 +1,17 @@
+import re
+
+import numpy as np
 import pytest
 from PySide6.QtWidgets import QMainWindow
 
+from nodedge.blocks.autogen.advanced_maths.sin_block import NumpySinBlock
 from nodedge.blocks.autogen.maths.add_block import NumpyAddBlock
+from nodedge.blocks.autogen.maths.multiply_block import NumpyMultiplyBlock
 from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.blocks.custom.discrete_transfer_function_block import (
+    DiscreteTransferFunctionBlock,
+)
+from nodedge.blocks.custom.integral_block import IntegralBlock
 from nodedge.blocks.custom.output_block import OutputBlock
 from nodedge.edge import Edge
 from nodedge.editor_widget import EditorWidget
@@ -46,10 +55,10 @@ def filledScene(emptyScene):
 
 def test_generateCode(filledScene):
     expectedResult = (
-        "var_constant = array(2)\n"
-        "var_constant = array(1)\n"
-        "var_addition = add(var_constant, var_constant)\n"
-        "return [var_addition]"
+        "var_0 = array(1)\n"
+        "var_1 = array(2)\n"
+        "var_2 = add(var_0, var_1)\n"
+        "return [var_2]"
     )
 
     _, generatedCode = filledScene.coder.generateCode()
@@ -73,3 +82,123 @@ def test_addImports(filledScene):
     generatedFileString = filledScene.coder.addImports(orderedNodeList, generatedCode)
 
     assert generatedFileString == expectedResult
+
+
+@pytest.fixture
+def integralScene(emptyScene):
+    emptyScene.simulator.config.timeStep = 0.1
+    inputBlock: ConstantBlock = ConstantBlock(emptyScene)
+    inputBlock.content.edit.setText(str(2))
+    integralBlock: IntegralBlock = IntegralBlock(emptyScene)
+    Edge(emptyScene, inputBlock.outputSockets[0], integralBlock.inputSockets[0])
+    outputBlock: OutputBlock = OutputBlock(emptyScene)
+    Edge(emptyScene, integralBlock.outputSockets[0], outputBlock.inputSockets[0])
+
+    return emptyScene
+
+
+def test_compileCode(filledScene):
+    compiledScene = filledScene.coder.compileCode(useNumba=False)
+
+    assert compiledScene.evaluate() == [3]
+    assert filledScene.coder.compileCode(useNumba=False) is compiledScene
+
+
+def test_compileCodeAfterChange(filledScene):
+    compiledScene = filledScene.coder.compileCode(useNumba=False)
+    constantBlock = filledScene.nodes[0]
+    constantBlock.content.edit.setText(str(5))
+
+    newCompiledScene = filledScene.coder.compileCode(useNumba=False)
+
+    assert newCompiledScene is not compiledScene
+    assert newCompiledScene.evaluate() == [7]
+
+
+def test_generateStatefulCode(integralScene):
+    expectedResult = (
+        "state_1 = 0.0\n"
+        "var_0 = array(2)\n"
+        "state_1 = state_1 + var_0 * dt\n"
+        "var_1 = state_1\n"
+        "return [var_1]"
+    )
+
+    _, generatedCode = integralScene.coder.generateCode()
+
+    assert generatedCode == expectedResult
+
+
+def test_simulate(integralScene):
+    compiledScene = integralScene.coder.compileCode(useNumba=False)
+
+    times, outputs = compiledScene.simulate(1.0, 0.1)
+
+    assert np.allclose(times, np.arange(1, 11) * 0.1)
+    assert len(outputs) == 1
+    assert np.allclose(outputs[0], np.arange(1, 11) * 0.2)
+
+    steps = compiledScene.steps(0.1)
+    assert [next(steps)[0] for _ in range(3)] == pytest.approx([0.2, 0.4, 0.6])
+
+
+def test_generatedSimulationModule(integralScene):
+    orderedNodeList, generatedCode = integralScene.coder.generateCode()
+    simulationCode = integralScene.coder.generateSimulationCode()
+    generatedFileString = integralScene.coder.addImports(
+        orderedNodeList, generatedCode, simulationCode=simulationCode
+    )
+    namespace = {}
+
+    exec(generatedFileString, namespace)
+
+    assert namespace["unnamed"]() == [pytest.approx(0.2)]
+    times, outputs = namespace["simulate"](0.5, 0.1)
+    assert np.allclose(outputs[0], np.arange(1, 6) * 0.2)
+
+
+def test_simulateDiscreteTransferFunction(emptyScene):
+    from scipy.signal import dlsim
+
+    emptyScene.simulator.config.timeStep = 0.1
+    inputBlock: ConstantBlock = ConstantBlock(emptyScene)
+    inputBlock.content.edit.setText(str(1))
+    transferFunctionBlock = DiscreteTransferFunctionBlock(emptyScene)
+    transferFunctionBlock.params[0].value = "[1, 0.2]"
+    transferFunctionBlock.params[1].value = "[1, -0.5]"
+    Edge(emptyScene, inputBlock.outputSockets[0], transferFunctionBlock.inputSockets[0])
+    outputBlock: OutputBlock = OutputBlock(emptyScene)
+    Edge(
+        emptyScene, transferFunctionBlock.outputSockets[0], outputBlock.inputSockets[0]
+    )
+
+    _, outputs = emptyScene.coder.compileCode(useNumba=False).simulate(1.0, 0.1)
+
+    _, expectedOutput = dlsim(([1, 0.2], [1, -0.5], 0.1), np.ones(10))
+    assert np.allclose(outputs[0], expectedOutput[:, 0])
+
+
+def test_simulateArrays(integralScene):
+    integralBlock, outputBlock = integralScene.nodes[1], integralScene.nodes[2]
+    gainsBlock: ConstantBlock = ConstantBlock(integralScene)
+    gainsBlock.content.edit.setText("[1, 2, 3]")
+    multiplyBlock = NumpyMultiplyBlock(integralScene)
+    Edge(integralScene, integralBlock.outputSockets[0], multiplyBlock.inputSockets[0])
+    Edge(integralScene, gainsBlock.outputSockets[0], multiplyBlock.inputSockets[1])
+    sinBlock = NumpySinBlock(integralScene)
+    Edge(integralScene, multiplyBlock.outputSockets[0], sinBlock.inputSockets[0])
+    outputBlock.inputSockets[0].removeAllEdges()
+    Edge(integralScene, sinBlock.outputSockets[0], outputBlock.inputSockets[0])
+    outputBlock.eval()
+
+    assert multiplyBlock.outputSockets[0].shape == (3,)
+    compiledScene = integralScene.coder.compileCode(useNumba=False)
+
+    # The output of the multiplication is only read by the sine.
+    assert re.search(
+        r"var_3 = multiply\(var_\d+, var_\d+, buffer_3\)", compiledScene.source
+    )
+    assert "buffer_4" not in compiledScene.source
+    _, outputs = compiledScene.simulate(1.0, 0.1)
+    expectedOutput = np.sin(np.arange(1, 11)[:, None] * 0.2 * np.array([1, 2, 3]))
+    assert np.allclose(outputs[0], expectedOutput)
@@ -0,0 +1,82 @@
+import pytest
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.blocks.autogen.maths.add_block import NumpyAddBlock
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+
+
+@pytest.fixture
+def emptyScene(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+
+    editor.scene.realTimeEval = True
+    yield editor.scene
+    window.close()
+
+
+@pytest.fixture
+def addedConstants(emptyScene):
+    """
+    Two constant blocks connected to an add block.
+    """
+    addBlock = NumpyAddBlock(emptyScene)
+    constantBlocks = []
+    for index in range(2):
+        constantBlock = ConstantBlock(emptyScene)
+        Edge(emptyScene, constantBlock.outputSockets[0], addBlock.inputSockets[index])
+        constantBlocks.append(constantBlock)
+    addBlock.eval()
+    return constantBlocks, addBlock
+
+
+def countEvaluations(block, monkeypatch):
+    # Blocks are slotted: the method is counted on their class.
+    calls = []
+    blockClass = type(block)
+    evalImplementation = blockClass.evalImplementation
+
+    def countedEvalImplementation(self):
+        if self is block:
+            calls.append(block)
+        return evalImplementation(self)
+
+    monkeypatch.setattr(blockClass, "evalImplementation", countedEvalImplementation)
+    return calls
+
+
+def test_coalescedEvaluation(emptyScene, addedConstants, qtbot, monkeypatch):
+    constantBlocks, addBlock = addedConstants
+    calls = countEvaluations(addBlock, monkeypatch)
+    evaluator = emptyScene.evaluator
+
+    for value, constantBlock in zip(["2", "3"], constantBlocks):
+        constantBlock.content.edit.setText(value)
+        constantBlock.onInputChanged()
+
+    assert evaluator.isBusy
+    assert calls == []
+
+    with qtbot.waitSignal(evaluator.finished):
+        pass
+
+    assert addBlock.value == 5
+    assert len(calls) == 1
+
+
+def test_removedNode(emptyScene, addedConstants, qtbot, monkeypatch):
+    constantBlocks, addBlock = addedConstants
+    calls = countEvaluations(addBlock, monkeypatch)
+    evaluator = emptyScene.evaluator
+
+    constantBlocks[0].onInputChanged()
+    addBlock.remove()
+
+    with qtbot.waitSignal(evaluator.finished):
+        pass
+
+    assert calls == []
+    assert not evaluator.isBusy
@@ -0,0 +1,134 @@
+import gc
+import weakref
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.editor_widget import EditorWidget
+from nodedge.history_list_model import HistoryListModel
+from nodedge.scene import Scene
+from nodedge.scene_items_model import NAME_COLUMN, POS_X_COLUMN, SceneItemsModel
+
+
+@pytest.fixture
+def emptyScene(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+
+    yield editor.scene
+    window.close()
+
+
+@pytest.fixture
+def modelEvents(emptyScene):
+    """
+    Events sent by the model of the scene to its views.
+    """
+    model = SceneItemsModel.forScene(emptyScene)
+    events = []
+    model.rowsInserted.connect(
+        lambda parent, first, last: events.append(("inserted", first, last))
+    )
+    model.rowsRemoved.connect(
+        lambda parent, first, last: events.append(("removed", first, last))
+    )
+    model.dataChanged.connect(
+        lambda topLeft, bottomRight, roles: events.append(
+            ("changed", topLeft.row(), bottomRight.row())
+        )
+    )
+    return events
+
+
+def test_forScene(emptyScene):
+    assert SceneItemsModel.forScene(emptyScene) is SceneItemsModel.forScene(emptyScene)
+
+
+def test_addAndRemoveNodes(emptyScene, modelEvents):
+    model = SceneItemsModel.forScene(emptyScene)
+    blocks = [ConstantBlock(emptyScene) for _ in range(3)]
+    sceneIndex = model.sceneIndex()
+
+    assert model.rowCount(sceneIndex) == 3
+    assert [event[0] for event in modelEvents].count("inserted") == 3
+
+    modelEvents.clear()
+    blocks[1].remove()
+
+    assert modelEvents == [("removed", 1, 1)]
+    assert model.rowCount(sceneIndex) == 2
+    assert model.nodeAt(model.index(1, 0, sceneIndex)) is blocks[2]
+
+
+def test_renameAndMoveNode(emptyScene, modelEvents):
+    model = SceneItemsModel.forScene(emptyScene)
+    blocks = [ConstantBlock(emptyScene) for _ in range(3)]
+    modelEvents.clear()
+
+    blocks[2].title = "renamed"
+    blocks[2].pos = (10.0, 20.0)
+
+    assert modelEvents == [("changed", 2, 2), ("changed", 2, 2)]
+    assert model.data(model.nodeIndex(blocks[2], NAME_COLUMN)) == "renamed"
+    assert model.data(model.nodeIndex(blocks[2], POS_X_COLUMN)) == "10.0"
+
+
+def test_selection(emptyScene):
+    model = SceneItemsModel.forScene(emptyScene)
+    blocks = [ConstantBlock(emptyScene) for _ in range(3)]
+    changes = []
+    model.nodesSelectionChanged.connect(
+        lambda selected, deselected: changes.append((selected, deselected))
+    )
+
+    blocks[0].isSelected = True
+    blocks[1].isSelected = True
+
+    assert changes[-1] == ([blocks[1]], [])
+    assert model.selectedNodes == {blocks[0], blocks[1]}
+
+    emptyScene.doDeselectItems()
+
+    assert set(changes[-1][1]) == {blocks[0], blocks[1]}
+    assert model.selectedNodes == set()
+
+
+def test_historyListModel(emptyScene):
+    history = emptyScene.history
+    history.clear()
+    model = HistoryListModel.forHistory(history)
+    removed = []
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+
+    for index in range(3):
+        history.store(f"Action {index}")
+
+    assert model.rowCount() == 4
+    assert model.currentStep == 3
+
+    history.undo()
+    history.undo()
+
+    assert model.currentStep == 1
+    assert removed == []
+
+    history.store("New action")
+
+    assert removed == [(2, 3)]
+    assert model.data(model.index(2), Qt.DisplayRole) == "New action"
+    assert model.currentStep == 2
+
+
+def test_modelsDoNotKeepSceneAlive(qtbot):
+    scene = Scene()
+    SceneItemsModel.forScene(scene)
+    HistoryListModel.forHistory(scene.history)
+    sceneRef = weakref.ref(scene)
+
+    del scene
+    gc.collect()
+
+    assert sceneRef() is None
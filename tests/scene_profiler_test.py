@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.blocks.autogen.maths.add_block import NumpyAddBlock
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.blocks.custom.output_block import OutputBlock
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+from nodedge.scene_profiler_widget import SceneProfilerWidget
+
+
+@pytest.fixture
+def profiledScene(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+    scene = editor.scene
+
+    constantBlock = ConstantBlock(scene)
+    constantBlock.content.edit.setText(str(1))
+    addBlock = NumpyAddBlock(scene)
+    Edge(scene, constantBlock.outputSockets[0], addBlock.inputSockets[0])
+    Edge(scene, constantBlock.outputSockets[0], addBlock.inputSockets[1])
+    outputBlock = OutputBlock(scene)
+    Edge(scene, addBlock.outputSockets[0], outputBlock.inputSockets[0])
+
+    scene.simulator.config.timeStep = 0.1
+    scene.simulator.profiler.enabled = True
+    scene.simulator.runIterations(0.5)
+
+    yield scene
+    window.close()
+
+
+def test_profile(profiledScene):
+    profiler = profiledScene.simulator.profiler
+
+    assert set(profiler.timings) == {node.id for node in profiledScene.nodes}
+    assert all(timing.callsCount == 5 for timing in profiler.timings.values())
+    assert max(profiler.heat(node) for node in profiledScene.nodes) == 1.0
+
+
+def test_exportJson(profiledScene, tmp_path):
+    filename = tmp_path / "profile.json"
+
+    profiledScene.simulator.profiler.exportJson(str(filename))
+
+    with open(filename) as file:
+        profile = json.load(file)
+    assert len(profile["blocks"]) == 3
+    totals = [block["totalNs"] for block in profile["blocks"]]
+    assert totals == sorted(totals, reverse=True)
+    assert profile["totalNs"] == sum(totals)
+
+
+def test_profilerWidget(profiledScene, qtbot):
+    widget = SceneProfilerWidget()
+    qtbot.addWidget(widget)
+
+    widget.scene = profiledScene
+    widget.update()
+
+    assert widget.table.rowCount() == 3
+    assert widget.enabledCheckBox.isChecked()
+    graphicsNode = profiledScene.nodes[0].graphicsNode
+    assert graphicsNode._brushBackground is not graphicsNode._brushDefaultBackground
+
+    widget.enabledCheckBox.setChecked(False)
+
+    assert graphicsNode._brushBackground is graphicsNode._brushDefaultBackground
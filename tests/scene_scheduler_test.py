@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.blocks.autogen.maths.add_block import NumpyAddBlock
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.blocks.custom.gain_block import GainBlock
+from nodedge.blocks.custom.integral_block import IntegralBlock
+from nodedge.blocks.custom.output_block import OutputBlock
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+from nodedge.node import Node
+from nodedge.scene_scheduler import AlgebraicLoopError, descendants, scheduleNodes
+from nodedge.socket_type import SocketType
+
+
+@pytest.fixture
+def emptyScene(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+
+    yield editor.scene
+    window.close()
+
+
+def createNode(scene, title: str) -> Node:
+    node = Node(
+        scene,
+        title,
+        inputSocketTypes=[SocketType.Any, SocketType.Any],
+        outputSocketTypes=[SocketType.Any],
+    )
+    return node
+
+
+def test_scheduleNodes(emptyScene):
+    node1 = createNode(emptyScene, "Node 1")
+    node2 = createNode(emptyScene, "Node 2")
+    node3 = createNode(emptyScene, "Node 3")
+    unconnectedNode = createNode(emptyScene, "Node 4")
+    Edge(emptyScene, node3.outputSockets[0], node2.inputSockets[0])
+    Edge(emptyScene, node2.outputSockets[0], node1.inputSockets[0])
+    Edge(emptyScene, node3.outputSockets[0], node1.inputSockets[1])
+
+    schedule = scheduleNodes(emptyScene.nodes)
+
+    assert schedule.nodes == [node3, unconnectedNode, node2, node1]
+    assert schedule.index(node1) == 3
+    assert unconnectedNode in schedule
+    assert not schedule.delayedNodes
+
+
+def test_descendants(emptyScene):
+    node1 = createNode(emptyScene, "Node 1")
+    node2 = createNode(emptyScene, "Node 2")
+    node3 = createNode(emptyScene, "Node 3")
+    Edge(emptyScene, node1.outputSockets[0], node2.inputSockets[0])
+    Edge(emptyScene, node1.outputSockets[0], node3.inputSockets[0])
+    Edge(emptyScene, node2.outputSockets[0], node3.inputSockets[1])
+
+    assert descendants(node1) == [node2, node3]
+    assert scheduleNodes(descendants(node1)).nodes == [node2, node3]
+
+
+def test_algebraicLoop(emptyScene):
+    node1 = createNode(emptyScene, "Node 1")
+    node2 = createNode(emptyScene, "Node 2")
+    node3 = createNode(emptyScene, "Node 3")
+    Edge(emptyScene, node1.outputSockets[0], node2.inputSockets[0])
+    Edge(emptyScene, node2.outputSockets[0], node3.inputSockets[0])
+    Edge(emptyScene, node3.outputSockets[0], node2.inputSockets[1])
+
+    with pytest.raises(AlgebraicLoopError) as error:
+        scheduleNodes(emptyScene.nodes, breakLoops=True)
+
+    assert set(error.value.nodes) == {node2, node3}
+    assert "Algebraic loop: " in str(error.value)
+    assert emptyScene.evalAllNodes() is False
+    assert node2.isInvalid and node3.isInvalid
+
+
+def test_feedbackLoopBrokenAtIntegral(emptyScene, monkeypatch):
+    # x' = 1 - x, integrated with explicit Euler.
+    emptyScene.simulator.config.timeStep = 0.1
+    constantBlock = ConstantBlock(emptyScene)
+    constantBlock.content.edit.setText(str(1))
+    addBlock = NumpyAddBlock(emptyScene)
+    integralBlock = IntegralBlock(emptyScene)
+    gainBlock = GainBlock(emptyScene)
+    gainBlock.content.edit.setText(str(-1))
+    outputBlock = OutputBlock(emptyScene)
+    Edge(emptyScene, constantBlock.outputSockets[0], addBlock.inputSockets[0])
+    Edge(emptyScene, gainBlock.outputSockets[0], addBlock.inputSockets[1])
+    Edge(emptyScene, addBlock.outputSockets[0], integralBlock.inputSockets[0])
+    Edge(emptyScene, integralBlock.outputSockets[0], gainBlock.inputSockets[0])
+    Edge(emptyScene, integralBlock.outputSockets[0], outputBlock.inputSockets[0])
+
+    schedule = emptyScene.coder.schedule()
+    _, outputs = emptyScene.coder.compileCode(useNumba=False).simulate(1.0, 0.1)
+
+    assert schedule.delayedNodes == [integralBlock]
+    assert schedule.index(integralBlock) < schedule.index(gainBlock)
+    assert np.allclose(outputs[0], 1 - 0.9 ** np.arange(10))
+
+    # The evaluated simulation breaks the loop at the same block.
+    emptyScene.simulator.runIterations(1.0)
+
+    assert np.isclose(gainBlock.value, -outputs[0][-1])
+
+    # The delayed block holds its output during the step and updates its state once.
+    evaluations = []
+    evalImplementation = IntegralBlock.evalImplementation
+
+    def countEvaluations(block):
+        evaluations.append(block)
+        return evalImplementation(block)
+
+    monkeypatch.setattr(IntegralBlock, "evalImplementation", countEvaluations)
+    state = integralBlock.state[0]
+    emptyScene.simulator.evalStep(schedule, lambda node: node.eval(evalChildren=False))
+
+    assert evaluations == [integralBlock]
+    assert not integralBlock.isHoldingOutput
+    assert np.isclose(gainBlock.value, -state)
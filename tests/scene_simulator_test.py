@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.editor_widget import EditorWidget
+from nodedge.scene_simulator import RealTimeStatistics, SolverConfiguration
+from nodedge.solver_dialog import SolverDialog
+
+
+@pytest.fixture
+def simulator(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+    simulator = editor.scene.simulator
+    simulator.config.timeStep = 0.01
+
+    yield simulator
+    simulator.stop()
+    window.close()
+
+
+def test_realTimeStatistics():
+    statistics = RealTimeStatistics(0.01)
+
+    statistics.record(0.0002, 0.005)
+    statistics.record(0.002, 0.015)
+
+    assert statistics.stepsCount == 2
+    assert statistics.overrunsCount == 1
+    assert statistics.worstLatency == pytest.approx(0.015)
+    assert statistics.jitterHistogram == [0, 1, 0, 1, 0, 0]
+    assert "Overruns: 1/2" in statistics.summary()
+
+
+def test_solverConfigurationRealTime():
+    config = SolverConfiguration()
+    config.finalTime = 1.0
+    config.realTime = True
+
+    restoredConfig = SolverConfiguration()
+    restoredConfig.from_dict(config.to_dict())
+
+    assert restoredConfig.realTime is True
+
+
+def test_solverDialogRealTime(qtbot):
+    config = SolverConfiguration()
+    config.finalTime = 1.0
+    dialog = SolverDialog(config)
+    qtbot.addWidget(dialog)
+    dialog.updateSolverConfig(0)
+
+    dialog.realTimeCheckBox.setChecked(True)
+
+    assert config.realTime is True
+    assert not dialog.solverOptions.isEnabled()
+
+
+def test_timeSteps(simulator):
+    assert len(list(simulator.timeSteps(0.05))) == 5
+    assert simulator.realTimeStatistics is None
+
+
+def test_realTimeTimeSteps(simulator):
+    simulator.config.realTime = True
+
+    startTime = time.monotonic()
+    steps = list(simulator.timeSteps(0.05))
+    duration = time.monotonic() - startTime
+
+    assert len(steps) == 5
+    # The first step starts immediately, the last one 4 time steps later.
+    assert duration >= 0.04
+    assert simulator.realTimeStatistics.stepsCount == 5
+
+
+def test_pauseAndStop(simulator):
+    simulator.pause()
+    steps = []
+    thread = threading.Thread(target=lambda: steps.extend(simulator.timeSteps(1.0)))
+    thread.start()
+
+    time.sleep(0.05)
+    assert steps == []
+    simulator.stop()
+    thread.join(1.0)
+
+    assert not thread.is_alive()
+    assert steps == []
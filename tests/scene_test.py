@@ -134,6 +134,28 @@ def test_resetLastSelectedStates(filledScene):
     assert filledScene.edges[0].graphicsEdge.selectedState is False
 
 
+def test_selectionIndex(filledScene):
+    node = filledScene.nodes[0]
+    edge = filledScene.edges[0]
+
+    node.graphicsNode.setSelected(True)
+    edge.graphicsEdge.setSelected(True)
+
+    assert filledScene.selectedItems == [node.graphicsNode, edge.graphicsEdge]
+    assert filledScene.selectedNodes == [node.graphicsNode]
+    assert set(filledScene.selectedItems) == set(
+        filledScene.graphicsScene.selectedItems()
+    )
+
+    edge.remove()
+
+    assert filledScene.selectedItems == [node.graphicsNode]
+
+    filledScene.doDeselectItems(silent=True)
+
+    assert filledScene.selectedItems == []
+
+
 @pytest.mark.serial
 def test_serializeSelected(qtbot):
     window = QMainWindow()
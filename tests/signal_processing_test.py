@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from asammdf import Signal
+from scipy.signal import sosfiltfilt
+
+from nodedge.dats.signal_processing import lowpassFilter, processCurve, resample
+from nodedge.utils import butterLowpassSos
+
+
+@pytest.fixture
+def noisySine():
+    rng = np.random.default_rng(0)
+    timestamps = np.sort(rng.uniform(0, 10, 5000))
+    samples = np.sin(2 * np.pi * 0.2 * timestamps) + rng.normal(0, 0.1, 5000)
+    return timestamps, samples
+
+
+def test_resample():
+    timestamps = np.array([0.0, 1.0, 3.0])
+    samples = np.array([0.0, 1.0, 5.0])
+
+    grid, values = resample(timestamps, samples, 2.0, chunkSize=2)
+
+    assert np.allclose(grid, np.arange(7) * 0.5)
+    assert np.allclose(values, [0.0, 0.5, 1.0, 2.0, 3.0, 4.0, 5.0])
+
+
+def test_resampleInvalidRate():
+    with pytest.raises(ValueError):
+        resample(np.arange(3.0), np.arange(3.0), 0.0)
+
+
+def test_chunkedFilterMatchesSosfiltfilt(noisySine):
+    _, samples = noisySine
+    sos = butterLowpassSos(1.0, 50.0, 8)
+
+    filtered = lowpassFilter(samples, 1.0, 50.0, 8, chunkSize=333)
+
+    assert np.allclose(filtered, sosfiltfilt(sos, samples, padtype=None))
+
+
+def test_sosCoefficientsAreCached():
+    assert butterLowpassSos(1.0, 50.0, 4) is butterLowpassSos(1.0, 50.0, 4)
+
+
+def test_processCurve(noisySine):
+    timestamps, samples = noisySine
+    signal = Signal(samples=samples, timestamps=timestamps, name="s", unit="m")
+
+    assert processCurve(signal, {"rate": 20.0}) is signal
+
+    processed = processCurve(signal, {"rate": 20.0, "filter": 1.0, "filterOrder": 4})
+
+    assert processed.name == "s"
+    assert np.allclose(np.diff(processed.timestamps), 0.05)
+    assert np.std(np.diff(processed.samples)) < np.std(np.diff(samples))
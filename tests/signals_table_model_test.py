@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from asammdf import MDF, Signal
+
+from nodedge.dats.signals_table_model import (
+    NAME_COLUMN,
+    TYPE_COLUMN,
+    SignalsSearchIndex,
+    SignalsTableModel,
+    channelNames,
+)
+
+
+@pytest.fixture
+def names():
+    return np.array(["EngineSpeed", "engine_torque", "VehicleSpeed", "Gear", "speed"])
+
+
+def test_channelNames():
+    log = MDF()
+    timestamps = np.arange(3, dtype=np.float64)
+    log.append(
+        [
+            Signal(np.zeros(3), timestamps, name=name)
+            for name in ["b", "CAN_DataFrame", "LIN_Frame", "a"]
+        ]
+    )
+
+    assert channelNames(log).tolist() == ["a", "b"]
+    assert channelNames(None).tolist() == []
+
+
+def test_searchSubstring(names):
+    index = SignalsSearchIndex(names)
+
+    assert names[index.search("speed")].tolist() == [
+        "EngineSpeed",
+        "VehicleSpeed",
+        "speed",
+    ]
+    assert names[index.search("speedx")].tolist() == []
+    assert len(index.search("")) == len(names)
+
+
+def test_searchPrefix(names):
+    index = SignalsSearchIndex(names)
+
+    assert names[index.search("^engine")].tolist() == ["EngineSpeed", "engine_torque"]
+
+
+def test_searchRegex(names):
+    index = SignalsSearchIndex(names)
+
+    assert names[index.search("speed$")].tolist() == [
+        "EngineSpeed",
+        "VehicleSpeed",
+        "speed",
+    ]
+    assert names[index.search("^(gear|speed)$")].tolist() == ["Gear", "speed"]
+
+
+def test_modelFilter(qtbot, names):
+    model = SignalsTableModel()
+    model.setSignals(names, derivedNames=["speed"])
+    model.setFilterText("speed")
+
+    assert model.rowCount() == 3
+    assert model.data(model.index(2, NAME_COLUMN)) == "speed"
+    assert model.data(model.index(2, TYPE_COLUMN)) == "ƒ"
+    assert model.data(model.index(0, TYPE_COLUMN)) == "~"
+    assert "Gear" in model
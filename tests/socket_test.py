@@ -1,9 +1,15 @@
+import numpy as np
 import pytest
 from PySide6.QtWidgets import QMainWindow
 
+from nodedge.blocks.autogen.maths.add_block import NumpyAddBlock
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.edge import Edge
+from nodedge.edge_validators import edgeSignalsAreCompatible
 from nodedge.editor_widget import EditorWidget
 from nodedge.node import Node
 from nodedge.scene import Scene
+from nodedge.socket_type import SocketType
 
 
 @pytest.fixture
@@ -21,3 +27,59 @@ def undefinedNode(emptyScene: Scene) -> Node:
     node = Node(emptyScene)  # noqa: F841
 
     return emptyScene.nodes[0]
+
+
+def test_signal(emptyScene):
+    vectorBlock = ConstantBlock(emptyScene)
+    vectorBlock.content.edit.setText("[1.0, 2.0, 3.0]")
+    vectorBlock.eval()
+    addBlock = NumpyAddBlock(emptyScene)
+    Edge(emptyScene, vectorBlock.outputSockets[0], addBlock.inputSockets[0])
+
+    assert vectorBlock.outputSockets[0].shape == (3,)
+    assert addBlock.inputSockets[0].shape == (3,)
+    assert addBlock.inputSockets[0].dtype == "<f8"
+    assert vectorBlock.outputSockets[0].serialize()["shape"] == [3]
+
+    otherVectorBlock = ConstantBlock(emptyScene)
+    otherVectorBlock.content.edit.setText("[1, 2]")
+    otherVectorBlock.eval()
+    assert not edgeSignalsAreCompatible(
+        otherVectorBlock.outputSockets[0], addBlock.inputSockets[1]
+    )
+    otherVectorBlock.content.edit.setText("[[1], [2]]")
+    otherVectorBlock.eval()
+    assert edgeSignalsAreCompatible(
+        addBlock.inputSockets[1], otherVectorBlock.outputSockets[0]
+    )
+
+
+def test_setSignal(emptyScene, monkeypatch):
+    socket = Node(emptyScene, outputSocketTypes=[SocketType.Any]).outputSockets[0]
+    conversions = []
+    asarray = np.asarray
+    monkeypatch.setattr(
+        np, "asarray", lambda value: conversions.append(value) or asarray(value)
+    )
+
+    for value in [1.0, 2.0, 3.0]:
+        socket.setSignal(value)
+    assert (socket.shape, socket.dtype, len(conversions)) == ((), "<f8", 1)
+
+    socket.setSignal(np.zeros((2, 3), dtype=np.float32))
+    assert (socket.shape, socket.dtype, len(conversions)) == ((2, 3), "<f4", 1)
+
+    socket.setSignal(np.int8(1))
+    socket.setSignal(np.int8(2))
+    assert (socket.shape, socket.dtype, len(conversions)) == ((), "|i1", 2)
+
+
+def test_slots(emptyScene):
+    sourceNode = Node(emptyScene, outputSocketTypes=[SocketType.Any])
+    targetNode = Node(emptyScene, inputSocketTypes=[SocketType.Any])
+    edge = Edge(emptyScene, sourceNode.outputSockets[0], targetNode.inputSockets[0])
+
+    assert not hasattr(edge.sourceSocket, "__dict__")
+    assert not hasattr(edge, "__dict__")
+    with pytest.raises(AttributeError):
+        edge.sourceSocket.undeclaredAttribute = None
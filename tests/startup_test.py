@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time allowed for the modules needed to show the editor, in µs.
+IMPORT_BUDGET_US = 1_000_000
+
+HEAVY_MODULES = [
+    "asammdf",
+    "nptdms",
+    "pandas",
+    "pyqtgraph",
+    "scipy",
+    "PySide6.QtWebEngineWidgets",
+]
+
+ROOT_PATH = os.path.join(os.path.dirname(__file__), "..")
+
+
+def importTimes(moduleName):
+    """
+    Import a module in a fresh interpreter and return the cumulative import time of
+    every imported module, in µs.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {moduleName}"],
+        cwd=ROOT_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "moduleName", ["nodedge.nodedge_app_window", "nodedge.mdi_window"]
+)
+def test_startupImports(moduleName):
+    times = importTimes(moduleName)
+
+    heavyModules = [m for m in HEAVY_MODULES if m in times]
+    assert heavyModules == []
+    assert times[moduleName] < IMPORT_BUDGET_US
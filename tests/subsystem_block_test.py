@@ -0,0 +1,142 @@
+import os
+
+import pytest
+from PySide6.QtWidgets import QMainWindow
+
+from nodedge.blocks.autogen.maths.add_block import NumpyAddBlock
+from nodedge.blocks.custom.constant_block import ConstantBlock
+from nodedge.blocks.custom.output_block import OutputBlock
+from nodedge.blocks.custom.subsystem_block import SubsystemBlock, SubsystemDefinition
+from nodedge.edge import Edge
+from nodedge.editor_widget import EditorWidget
+
+
+@pytest.fixture
+def emptyScene(qtbot):
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+
+    yield editor.scene
+    window.close()
+
+
+@pytest.fixture
+def subsystemFile(qtbot, tmp_path):
+    """
+    File of a scene adding its two constant blocks, 1 and 2.
+    """
+    window = QMainWindow()
+    editor = EditorWidget(window)
+    qtbot.addWidget(editor)
+    scene = editor.scene
+
+    addBlock = NumpyAddBlock(scene)
+    for index in range(2):
+        constantBlock = ConstantBlock(scene)
+        constantBlock.content.edit.setText(str(index + 1))
+        Edge(scene, constantBlock.outputSockets[0], addBlock.inputSockets[index])
+    outputBlock = OutputBlock(scene)
+    Edge(scene, addBlock.outputSockets[0], outputBlock.inputSockets[0])
+
+    filename = str(tmp_path / "subsystem.json")
+    scene.saveToFile(filename)
+    window.close()
+
+    return filename
+
+
+def setFile(block: SubsystemBlock, filename: str):
+    block.params[0].value = filename
+    block.onParamChanged(block.params[0])
+
+
+def test_eval(emptyScene, subsystemFile):
+    block = SubsystemBlock(emptyScene)
+    setFile(block, subsystemFile)
+
+    assert len(block.inputSockets) == 2
+    assert block.eval() == 3
+
+    constantBlock = ConstantBlock(emptyScene)
+    constantBlock.content.edit.setText(str(10))
+    Edge(emptyScene, constantBlock.outputSockets[0], block.inputSockets[0])
+    block.isDirty = True
+
+    assert block.eval() == 12
+
+
+def test_evaluatedOnInputChange(emptyScene, subsystemFile):
+    block = SubsystemBlock(emptyScene)
+    setFile(block, subsystemFile)
+    block.eval()
+    definition = SubsystemDefinition.fromFile(subsystemFile)
+    calls = []
+    function = definition.function
+    definition.function = lambda *inputs: calls.append(inputs) or function(*inputs)
+
+    block.isDirty = True
+    block.eval()
+
+    assert calls == []
+
+    constantBlock = ConstantBlock(emptyScene)
+    constantBlock.content.edit.setText(str(10))
+    Edge(emptyScene, constantBlock.outputSockets[0], block.inputSockets[0])
+    block.isDirty = True
+
+    assert block.eval() == 12
+    assert len(calls) == 1
+
+
+def test_fileNotCheckedOnEval(emptyScene, subsystemFile, monkeypatch):
+    block = SubsystemBlock(emptyScene)
+    setFile(block, subsystemFile)
+    calls = []
+    getmtime = os.path.getmtime
+    monkeypatch.setattr(
+        os.path, "getmtime", lambda path: calls.append(path) or getmtime(path)
+    )
+
+    for _ in range(3):
+        block.isDirty = True
+        block.eval()
+
+    assert calls == []
+
+
+def test_sharedDefinition(emptyScene, subsystemFile):
+    blocks = [SubsystemBlock(emptyScene) for _ in range(2)]
+    for block in blocks:
+        setFile(block, subsystemFile)
+
+    assert blocks[0].loadDefinition() is blocks[1].loadDefinition()
+
+
+def test_generateCode(emptyScene, subsystemFile):
+    block = SubsystemBlock(emptyScene)
+    setFile(block, subsystemFile)
+    constantBlock = ConstantBlock(emptyScene)
+    constantBlock.content.edit.setText(str(10))
+    Edge(emptyScene, constantBlock.outputSockets[0], block.inputSockets[1])
+    outputBlock = OutputBlock(emptyScene)
+    Edge(emptyScene, block.outputSockets[0], outputBlock.inputSockets[0])
+
+    compiledScene = emptyScene.coder.compileCode(useNumba=False)
+
+    assert compiledScene.evaluate() == [11]
+
+
+def test_recursiveSubsystem(emptyScene, tmp_path):
+    filename = str(tmp_path / "recursive.json")
+    block = SubsystemBlock(emptyScene)
+    block.params[0].value = filename
+    outputBlock = OutputBlock(emptyScene)
+    Edge(emptyScene, block.outputSockets[0], outputBlock.inputSockets[0])
+    emptyScene.saveToFile(filename)
+
+    otherBlock = SubsystemBlock(emptyScene)
+    setFile(otherBlock, filename)
+
+    assert otherBlock.isInvalid
+    assert "Recursive subsystem" in otherBlock.graphicsNode.toolTip()
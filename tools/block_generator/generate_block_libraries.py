@@ -44,14 +44,18 @@ def _generate_common_init_file(libraryDict, savePath, initFilename):
 
 
 def _generate_init_files(libraryDict, savePath, initFilename):
-    # Create init file for each autogenerated library
-    initFileString = ""
-    for lib, blockList in libraryDict.items():
-        for blockName in sorted(blockList):
-            initFileString += f"from .{blockName}_block import *\n"
+    # Create init file for each autogenerated library. Block modules are not
+    # imported by the package: they are listed in the block manifest instead.
+    initFileString = (
+        "# -*- coding: utf-8 -*-\n"
+        '"""\n'
+        "Block modules are imported on first use, see\n"
+        ":func:`~nodedge.blocks.block_config.getClassFromOperationCode`.\n"
+        '"""\n'
+    )
+    for lib in libraryDict.keys():
         initFilePath = os.path.join(savePath, lib, initFilename)
         initFile = open(initFilePath, "w")
-        initFileString = format_str(initFileString, mode=FileMode())
         initFile.write(initFileString)
         initFile.close()
 
@@ -154,4 +158,9 @@ if __name__ == "__main__":
         _generate_init_files(libraries, savePath, initFilename)
         # _generate_config_file(opBlockNames, opNodeFilename, firstCode)
 
+    # The palette is populated from the manifest, without importing the blocks.
+    from nodedge.blocks.block_config import generateBlockManifest
+
+    generateBlockManifest()
+
 # TODO: Generate test for each block in a separated file